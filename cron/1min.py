@@ -185,6 +185,23 @@ class RealtimeDataCollector:
             print(f"⚠️  DB save error for {stock_code}: {e}")
             return False
 
+    async def prefetch_global_macro(self):
+        """해외 시장 스냅샷 선반영 (다른 cron 프로세스와 디스크 스냅샷 공유)"""
+        try:
+            from src.aegis.global_macro import get_global_market_fetcher
+            from src.aegis.optimization.real_world import get_integrity_manager
+
+            # 두 소비자의 추적 심볼 등록 후 1회 일괄 다운로드
+            get_integrity_manager()
+            snapshot = get_global_market_fetcher().snapshot
+            data = await snapshot.prefetch()
+            if data is not None:
+                nq = data.quotes.get('NQ=F')
+                if nq:
+                    print(f"🌐 Globex 선반영: NQ {nq.price:,.2f} ({nq.change_pct:+.2f}%)")
+        except Exception as e:
+            print(f"⚠️  해외 스냅샷 선반영 실패: {e}")
+
     async def collect_all(self):
         """모든 보유 종목의 실시간 데이터 수집"""
         print(f"\n{'='*60}")
@@ -196,6 +213,9 @@ class RealtimeDataCollector:
             print("⏸️  활성 시간이 아닙니다 (05:00-21:00). 수집을 건너뜁니다.")
             return
 
+        # KRX 개장 전 Globex 선물 스냅샷 선반영 (08:40-09:00, 구간 밖에서는 no-op)
+        await self.prefetch_global_macro()
+
         # 거래 시간 여부 표시
         if self.is_trading_hours():
             print("📊 거래 시간 (08:50-16:00) - 활발한 데이터 수집")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+DART Disclosure Feed Daemon
+시장 전체 DART 공시 증분 수집 상주 프로세스
+
+- DisclosureFeed.run(): 평일 07-19시 30초마다, 그 외 15분마다 워터마크 이후 공시 조회 → dart_disclosures 저장
+- 거래정지 공시는 수신 즉시 해당 종목 분석 캐시 무효화 + 거래정지 표시
+- 다른 프로세스(1min, 5min_dashboard, 스캐너)는 DART를 직접 조회하지 않고 테이블을 읽음
+
+crontab에서 flock으로 1개만 유지 (죽으면 다음 분에 재시작):
+    * * * * * cd /Users/wonny/Dev/joungwon.stocks && flock -n /tmp/disclosure_feed.lock venv/bin/python cron/disclosure_feed.py >> logs/disclosure_feed.log 2>&1
+"""
+import asyncio
+import logging
+import signal
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, '/Users/wonny/Dev/joungwon.stocks')
+
+from src.aegis.fusion.disclosure import get_disclosure_analyzer
+
+POLL_INTERVAL = 30   # 초
+
+
+def on_halt(filing):
+    """거래정지 공시 알림 (캐시 무효화/표시는 DisclosureAnalyzer 구독자가 처리)"""
+    print(
+        f"🚨 [{datetime.now().strftime('%H:%M:%S')}] 거래정지 공시: "
+        f"{filing['corp_name']}({filing['stock_code']}) {filing['report_nm']}",
+        flush=True
+    )
+
+
+async def main():
+    """메인 함수"""
+    analyzer = get_disclosure_analyzer()
+    feed = analyzer.feed
+    feed.subscribe(on_halt, halts_only=True)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"📡 DART 공시 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} (interval {POLL_INTERVAL}s)", flush=True)
+    await feed.run(interval=POLL_INTERVAL, stop=stop)
+    print(f"⏹️  DART 공시 수집 종료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", flush=True)
+
+
+if __name__ == '__main__':
+    # 로그 디렉토리 생성
+    log_dir = Path('/Users/wonny/Dev/joungwon.stocks/logs')
+    log_dir.mkdir(exist_ok=True)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+
+    # asyncio 실행
+    asyncio.run(main())
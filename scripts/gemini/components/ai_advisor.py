@@ -1,21 +1,23 @@
 
-import google.generativeai as genai
 import os
 import json
 import logging
+from datetime import timedelta
 from typing import List, Dict
 
+from src.gemini.client import GeminiClient
+
 logger = logging.getLogger(__name__)
 
 class AIInvestmentAdvisor:
     def __init__(self):
         # Assuming GEMINI_API_KEY is in env or we rely on default config if set elsewhere
-        api_key = os.getenv('GEMINI_API_KEY')
-        if api_key:
-            genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
+        self.client = GeminiClient('gemini-pro', api_key=os.getenv('GEMINI_API_KEY'))
+
+    # 같은 포트폴리오/시장 스냅샷이면 1시간 동안 응답 재사용
+    CACHE_TTL = timedelta(hours=1)
 
-    def get_investment_advice(self, portfolio: List[Dict], market_status: Dict) -> List[Dict]:
+    async def get_investment_advice(self, portfolio: List[Dict], market_status: Dict) -> List[Dict]:
         """
         Analyze portfolio and market status to generate buy/sell recommendations.
         Output: List of dicts {action, stock, price, qty, reason}
@@ -25,8 +27,9 @@ class AIInvestmentAdvisor:
             prompt = self._create_prompt(portfolio, market_status)
             
             # 2. Call Gemini
-            response = self.model.generate_content(prompt)
-            text = response.text
+            text = await self.client.generate_content(prompt, cache_ttl=self.CACHE_TTL)
+            if not text:
+                return []
             
             # 3. Parse JSON
             # Clean up markdown code blocks if present
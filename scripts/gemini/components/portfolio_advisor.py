@@ -11,11 +11,10 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional, Dict, Any, List
 
-import google.generativeai as genai
-
 import sys
 sys.path.insert(0, '/Users/wonny/Dev/joungwon.stocks')
 from src.config.database import db
+from src.gemini.client import GeminiClient
 
 
 class PortfolioAdvisor:
@@ -36,13 +35,11 @@ class PortfolioAdvisor:
     }
 
     def __init__(self):
-        # Configure Gemini API
+        # Configure Gemini API (비동기 클라이언트: 모델별 RPM/TPM 예산 공유)
         api_key = os.getenv('GEMINI_API_KEY')
-        if api_key:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-lite')
-        else:
-            self.model = None
+        self.client = GeminiClient('gemini-2.0-flash-lite', api_key=api_key) if api_key else None
+        self.model = self.client.model if self.client else None
+        if not self.model:
             print("⚠️ GEMINI_API_KEY not set - PortfolioAdvisor will not work")
 
     async def check_cache(self, stock_code: str) -> Optional[Dict[str, Any]]:
@@ -301,8 +298,10 @@ JSON만 출력하세요. 다른 텍스트는 출력하지 마세요.
 """
 
         try:
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
+            response_text = await self.client.generate_content(prompt, cache_ttl=timedelta(days=1))
+            if not response_text:
+                raise RuntimeError("empty response")
+            response_text = response_text.strip()
 
             # JSON 파싱
             import json
@@ -60,7 +60,7 @@ class DashboardGenerator:
             
         # 3. AI Analysis
         try:
-            self.ai_advice = self.ai_advisor.get_investment_advice(self.portfolio, self.market_status)
+            self.ai_advice = await self.ai_advisor.get_investment_advice(self.portfolio, self.market_status)
         except:
             self.ai_advice = []
 
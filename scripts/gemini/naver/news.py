@@ -1,9 +1,12 @@
 import aiohttp
 import logging
+from datetime import timedelta
 from typing import List, Dict, Any
 import os
 from dotenv import load_dotenv
-import google.generativeai as genai
+
+from src.gemini.client import GeminiClient
+from src.utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +18,18 @@ GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
 
 
 class NaverNewsFetcher:
+    # 헤드라인 분석 결과는 바뀌지 않으므로 1주일 동안 Gemini 응답 재사용
+    AI_CACHE_TTL = timedelta(days=7)
+
+    # Fallback keyword sentiment (one automaton for both tables)
+    SENTIMENT_MATCHER = KeywordMatcher.from_tables({
+        'positive': ['상승', '증가', '호실적', '신고가', '매수', '상향', '개선', '성장', '확대', '수주'],
+        'negative': ['하락', '감소', '악화', '하향', '적자', '손실', '매도', '부진', '감소', '우려'],
+    })
+
     def __init__(self):
-        if GEMINI_API_KEY:
-            genai.configure(api_key=GEMINI_API_KEY)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-lite')
-        else:
-            self.model = None
+        self.client = GeminiClient('gemini-2.0-flash-lite', api_key=GEMINI_API_KEY) if GEMINI_API_KEY else None
+        self.model = self.client.model if self.client else None
 
     async def fetch_news(self, stock_code: str) -> List[Dict[str, str]]:
         """Fetch real-time news headlines using Naver Mobile API."""
@@ -109,8 +118,10 @@ class NaverNewsFetcher:
 """
 
                 try:
-                    response = self.model.generate_content(prompt)
-                    result_text = response.text.strip()
+                    result_text = await self.client.generate_content(prompt, cache_ttl=self.AI_CACHE_TTL)
+                    if not result_text:
+                        raise RuntimeError("empty Gemini response")
+                    result_text = result_text.strip()
 
                     # Parse response
                     sentiment = '중립'
@@ -148,13 +159,10 @@ class NaverNewsFetcher:
 
     def _simple_sentiment_analysis(self, title: str) -> str:
         """Simple keyword-based sentiment analysis as fallback"""
-        positive_keywords = ['상승', '증가', '호실적', '신고가', '매수', '상향', '개선', '성장', '확대', '수주']
-        negative_keywords = ['하락', '감소', '악화', '하향', '적자', '손실', '매도', '부진', '감소', '우려']
-
-        title_lower = title.lower()
+        matches = self.SENTIMENT_MATCHER.unique(title)
 
-        pos_count = sum(1 for kw in positive_keywords if kw in title)
-        neg_count = sum(1 for kw in negative_keywords if kw in title)
+        pos_count = sum(1 for m in matches if m.category == 'positive')
+        neg_count = len(matches) - pos_count
 
         if pos_count > neg_count:
             return '호재'
@@ -33,7 +33,8 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # AEGIS 모듈 임포트
-from src.aegis.analysis.signal import Signal, calculate_signal_score, score_to_signal
+from src.aegis.analysis.signal import Signal, score_to_signal
+from src.aegis.analysis.streaming import StreamingSignal, get_streaming_state_store
 
 # Phase 4.5~6 모듈 임포트
 try:
@@ -452,9 +453,71 @@ def create_terminal_style_content(data):
     return "\n".join(lines)
 
 
+AEGIS_HISTORY_DAYS = 100   # 워밍업 일봉 수 = VWAP 계산 구간 (기존 최근 100일 일봉 VWAP과 동일)
+
+
+async def _load_aegis_tracker(conn, stock_code: str):
+    """
+    종목별 StreamingSignal 조회 (증분 갱신)
+
+    - 저장된 상태가 있으면 마지막 봉 이후 데이터만 조회하여 O(1) 갱신
+    - 없으면 최근 100일 일봉으로 1회 워밍업 (VWAP은 최근 100봉 롤링)
+    - 상태 파일 저장은 호출부에서 실행당 1회
+    """
+    store = get_streaming_state_store()
+    tracker = store.get(stock_code)
+
+    # VWAP 구간이 다른 예전 상태(전체 누적)는 재워밍업
+    if tracker is not None and tracker.vwap.window != AEGIS_HISTORY_DAYS:
+        tracker = None
+
+    if tracker is not None and tracker.last_timestamp:
+        last_date = datetime.fromisoformat(tracker.last_timestamp).date()
+        rows = await conn.fetch('''
+            SELECT date, open, high, low, close, volume
+            FROM daily_ohlcv
+            WHERE stock_code = $1 AND date >= $2
+            ORDER BY date
+            LIMIT 5
+        ''', stock_code, last_date)
+
+        # 마지막 봉(장중 갱신분 포함) + 신규 봉만 반영, 공백이 길면 재워밍업
+        if rows and rows[0]['date'] == last_date and len(rows) < 5:
+            for r in rows:
+                tracker.update(dict(r))
+            return tracker
+
+    # 일봉 데이터 조회 (최소 60일 필요)
+    rows = await conn.fetch('''
+        SELECT date, open, high, low, close, volume
+        FROM daily_ohlcv
+        WHERE stock_code = $1
+        ORDER BY date DESC
+        LIMIT $2
+    ''', stock_code, AEGIS_HISTORY_DAYS)
+
+    if not rows or len(rows) < 60:
+        return None
+
+    # DataFrame 변환
+    df = pd.DataFrame([dict(r) for r in rows])
+    df = df.sort_values('date').reset_index(drop=True)
+
+    # Decimal → float 변환
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        df[col] = df[col].astype(float)
+
+    # RangeIndex 일봉 → calculate_signal_score()와 동일하게 VWAP 누적 (최근 100봉 롤링)
+    tracker = StreamingSignal.from_history(
+        df, vwap_session_reset=False, vwap_window=AEGIS_HISTORY_DAYS
+    )
+    store.put(stock_code, tracker)
+    return tracker
+
+
 async def get_aegis_signal(stock_code: str) -> tuple:
     """
-    AEGIS 신호 계산 (일봉 데이터 기반)
+    AEGIS 신호 계산 (일봉 데이터 기반, 증분 지표)
 
     Returns:
         (signal_text, signal_emoji, signal_color, score)
@@ -462,29 +525,13 @@ async def get_aegis_signal(stock_code: str) -> tuple:
     conn = await asyncpg.connect(**DB_CONFIG)
 
     try:
-        # 일봉 데이터 조회 (최소 60일 필요)
-        rows = await conn.fetch('''
-            SELECT date, open, high, low, close, volume
-            FROM daily_ohlcv
-            WHERE stock_code = $1
-            ORDER BY date DESC
-            LIMIT 100
-        ''', stock_code)
+        tracker = await _load_aegis_tracker(conn, stock_code)
 
-        if not rows or len(rows) < 60:
+        if tracker is None:
             return "부족", "➖", COLOR_BLACK, 0
 
-        # DataFrame 변환
-        df = pd.DataFrame([dict(r) for r in rows])
-        df = df.sort_values('date').reset_index(drop=True)
-
-        # Decimal → float 변환
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = df[col].astype(float)
-
         # 신호 점수 계산
-        scored_df = calculate_signal_score(df)
-        latest_score = int(scored_df['total_score'].iloc[-1])
+        latest_score = tracker.snapshot()['total_score']
         signal = score_to_signal(latest_score)
 
         # 신호별 표시
@@ -1946,6 +1993,12 @@ async def main():
         sig_text, _, _, sig_score = aegis_signal
         print(f"      AEGIS: {sig_text} ({sig_score:+d})")
 
+    # 증분 지표 상태는 실행당 1회 저장
+    try:
+        get_streaming_state_store().save()
+    except Exception as e:
+        print(f"   ⚠️ AEGIS 지표 상태 저장 실패: {e}")
+
     print(f"\n✅ 모든 종목 데이터 수집 완료\n")
 
     # AEGIS 신호 히스토리 조회
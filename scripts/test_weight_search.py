@@ -0,0 +1,102 @@
+"""
+PROJECT AEGIS - Weight Search Termination Test
+===============================================
+Sobol/Hyperband searches must exhaust the budget (or stop) without scipy
+
+scipy가 없으면 Sobol 대신 Halton 수열을 사용합니다. 반복 호출마다 같은 점이 나오면
+메모 적중(비용 0)만 반복되어 탐색이 끝나지 않으므로, 이를 회귀 테스트로 확인합니다.
+
+Run:
+    python -m pytest scripts/test_weight_search.py -q
+    python scripts/test_weight_search.py
+"""
+
+import signal
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from src.aegis.optimization import weight_search
+from src.aegis.optimization.weight_search import (
+    HyperbandSearch,
+    RandomSearch,
+    SearchBudget,
+    sample_simplex,
+)
+
+
+KEYS = ['aegis_swing', 'mean_reversion', 'momentum']
+
+
+def objective(weights, fidelity=1.0):
+    """백테스트 없이 가중치만으로 계산하는 가짜 목적함수"""
+    return {'sharpe_ratio': weights.get('aegis_swing', 0.0) - abs(weights.get('momentum', 0.0) - 0.3)}
+
+
+@contextmanager
+def no_scipy():
+    saved = weight_search.qmc
+    weight_search.qmc = None
+    try:
+        yield
+    finally:
+        weight_search.qmc = saved
+
+
+@contextmanager
+def deadline(seconds: int):
+    def _timeout(signum, frame):
+        raise TimeoutError(f"search did not finish within {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, _timeout)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def test_halton_batches_advance():
+    with no_scipy():
+        first = sample_simplex(16, 3, "sobol", seed=1, offset=0)
+        second = sample_simplex(16, 3, "sobol", seed=1, offset=16)
+    assert np.allclose(first.sum(axis=1), 1.0)
+    assert not np.allclose(first, second)
+
+
+def test_sobol_search_exhausts_budget_without_scipy():
+    with no_scipy(), deadline(30):
+        result = RandomSearch(method='sobol', batch=8, seed=None).search(
+            objective, KEYS, SearchBudget(max_cost=40)
+        )
+    assert result.evaluations == 40
+
+
+def test_hyperband_default_seed_finishes_without_scipy():
+    with no_scipy(), deadline(30):
+        result = HyperbandSearch(seed=None).search(objective, KEYS, SearchBudget(max_cost=30))
+    assert result.cost <= 30 + 1e-9
+    assert result.best_weights
+
+
+def test_search_stops_when_no_new_points():
+    # 가중치 1개면 모든 표본이 {key: 1.0} → 두 번째 바퀴부터 전부 메모 적중
+    with no_scipy(), deadline(30):
+        random_result = RandomSearch(method='sobol', batch=4).search(
+            objective, ['aegis_swing'], SearchBudget(max_cost=100)
+        )
+        hyperband_result = HyperbandSearch().search(objective, ['aegis_swing'], SearchBudget(max_cost=100))
+    assert random_result.evaluations == 1
+    assert hyperband_result.cost < 100
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
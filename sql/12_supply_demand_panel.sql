@@ -0,0 +1,9 @@
+-- Investor Flow Panel (시장 전체 수급 패널)
+-- stock_supply_demand를 거래일 단위로 적재/조회 (InvestorFlowPanel)
+-- 날짜 기준 조회: WHERE date = ANY(...) → 기존 (stock_code, date DESC) 인덱스로는 전체 스캔
+
+CREATE INDEX IF NOT EXISTS idx_supply_demand_date
+ON stock_supply_demand (date);
+
+COMMENT ON INDEX idx_supply_demand_date IS
+'InvestorFlowPanel: 거래일 단위 시장 전체 수급 로드';
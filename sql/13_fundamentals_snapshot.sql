@@ -0,0 +1,24 @@
+-- Fundamental Snapshot (시장 전체 재무지표 일별 스냅샷)
+-- FundamentalSnapshot이 거래일마다 pykrx get_market_fundamental(KOSPI/KOSDAQ)로 적재
+-- stock_fundamentals(종목별 최신 1행, stocks FK)와 달리 기준일별 전 종목 보관 (FK 없음)
+
+CREATE TABLE IF NOT EXISTS stock_fundamentals_daily (
+    date DATE NOT NULL,
+    stock_code VARCHAR(10) NOT NULL,
+    market VARCHAR(10),
+    per DOUBLE PRECISION,
+    pbr DOUBLE PRECISION,
+    eps DOUBLE PRECISION,
+    bps DOUBLE PRECISION,
+    div_yield DOUBLE PRECISION,
+    dps DOUBLE PRECISION,
+    PRIMARY KEY (date, stock_code)
+);
+
+-- Smart Value Finder 1차 필터: 최근 기준일 PBR/PER 범위 조회
+CREATE INDEX IF NOT EXISTS idx_fundamentals_daily_value
+ON stock_fundamentals_daily (date, pbr, per);
+
+COMMENT ON TABLE stock_fundamentals_daily IS '시장 전체 재무지표 일별 스냅샷 (FundamentalSnapshot)';
+COMMENT ON COLUMN stock_fundamentals_daily.div_yield IS '배당수익률 (%)';
+COMMENT ON COLUMN stock_fundamentals_daily.dps IS '주당배당금 (원)';
@@ -0,0 +1,40 @@
+-- DART Disclosure Feed (시장 전체 공시 증분 수집)
+-- DisclosureFeed가 워터마크(MAX(rcept_no))의 접수일부터 시장 전체 공시 목록을 주기적으로 조회해 적재
+-- DisclosureAnalyzer는 종목별 DART 호출 대신 (stock_code, rcept_dt) 인덱스 조회
+
+CREATE TABLE IF NOT EXISTS dart_disclosures (
+    rcept_no VARCHAR(14) PRIMARY KEY,      -- 접수번호 (YYYYMMDD + 일련번호)
+    rcept_dt DATE NOT NULL,
+    stock_code VARCHAR(10) NOT NULL,
+    corp_code VARCHAR(8),
+    corp_name VARCHAR(100),
+    corp_cls VARCHAR(1),                   -- Y: 유가, K: 코스닥, N: 코넥스, E: 기타
+    report_nm TEXT NOT NULL,
+    flr_nm VARCHAR(100),
+    rm VARCHAR(20),
+    -- 수집 시 제목 분류 결과 (DisclosureAnalyzer._analyze_title)
+    score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    impact VARCHAR(20) NOT NULL DEFAULT 'neutral',
+    keyword VARCHAR(50),
+    ingested_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_dart_disclosures_stock_date
+ON dart_disclosures (stock_code, rcept_dt DESC);
+
+CREATE INDEX IF NOT EXISTS idx_dart_disclosures_halt
+ON dart_disclosures (rcept_dt DESC)
+WHERE impact = 'trading_halt';
+
+COMMENT ON TABLE dart_disclosures IS 'DART 시장 전체 공시 (DisclosureFeed 증분 수집)';
+COMMENT ON COLUMN dart_disclosures.score IS '제목 키워드 점수 (거래정지 공시는 -999)';
+
+-- 수집기 상태 (상주 프로세스가 조회마다 갱신, 다른 프로세스는 polled_at으로 테이블 신선도 판단)
+CREATE TABLE IF NOT EXISTS dart_feed_status (
+    feed VARCHAR(20) PRIMARY KEY,
+    polled_at TIMESTAMP,                   -- 마지막 성공 조회
+    failed_at TIMESTAMP,                   -- 마지막 실패 조회
+    error TEXT                             -- 마지막 조회 오류 (성공 시 NULL)
+);
+
+COMMENT ON TABLE dart_feed_status IS 'DisclosureFeed 조회 상태 (cron/disclosure_feed.py)';
@@ -2,18 +2,50 @@
 PROJECT AEGIS - Backtest Engine
 ================================
 Pandas-based lightweight backtesting engine with risk management
+
+run(fast=True) uses an array-based path: close/ATR/strategy conditions are
+extracted once as NumPy arrays and the per-bar loop only touches scalars.
+Results are identical to the default per-bar path. With fast=None (default)
+the path is chosen from strategy.supports_vectorized().
 """
 
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from .strategy import StrategyInterface, OrderType, Order, Position
 from .performance import PerformanceMonitor, TradeRecord
 from ...risk import RiskManager, RiskConfig, CircuitBreaker, TradingHaltedException
 
 
+class _SignalLog:
+    """Compact signal event log for the fast path (materialized at the end)"""
+
+    __slots__ = ('timestamp', 'kind', 'price', 'stop_loss')
+
+    def __init__(self):
+        self.timestamp = []
+        self.kind = []
+        self.price = []
+        self.stop_loss = []
+
+    def append(self, timestamp: Any, kind: str, price: float, stop_loss: Optional[float] = None):
+        self.timestamp.append(timestamp)
+        self.kind.append(kind)
+        self.price.append(price)
+        self.stop_loss.append(stop_loss)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        signals = []
+        for ts, kind, price, stop_loss in zip(self.timestamp, self.kind, self.price, self.stop_loss):
+            record = {'timestamp': ts, 'signal': kind, 'price': price}
+            if kind == 'BUY':
+                record['stop_loss'] = stop_loss
+            signals.append(record)
+        return signals
+
+
 class BacktestEngine:
     """Backtesting Engine with Risk Management"""
 
@@ -116,9 +148,52 @@ class BacktestEngine:
         self._entry_quantity = None
         return trade
 
-    def run(self, df: pd.DataFrame, strategy: StrategyInterface, stock_code: str = "TEST") -> Dict[str, Any]:
+    @staticmethod
+    def _get_start_index(df: pd.DataFrame) -> int:
+        start_idx = 60
+        if 'ma_60' in df.columns:
+            valid_idx = df['ma_60'].first_valid_index()
+            if valid_idx is not None:
+                if isinstance(valid_idx, pd.Timestamp):
+                    start_idx = df.index.get_loc(valid_idx)
+                else:
+                    start_idx = max(60, valid_idx)
+        return start_idx
+
+    def _build_result(self, signals: List[Dict[str, Any]], stop_loss_hits: int, circuit_breaker_hits: int) -> Dict[str, Any]:
+        report = self.monitor.generate_report()
+        return {
+            'initial_capital': self.initial_capital,
+            'final_capital': self.capital,
+            'total_return_pct': (self.capital - self.initial_capital) / self.initial_capital * 100,
+            'signals': signals,
+            'equity_curve': self.monitor.equity_curve,
+            'report': report,
+            'trades': self.monitor.trades,
+            'risk_stats': {
+                'stop_loss_hits': stop_loss_hits,
+                'circuit_breaker_hits': circuit_breaker_hits,
+            }
+        }
+
+    def run(
+        self,
+        df: pd.DataFrame,
+        strategy: StrategyInterface,
+        stock_code: str = "TEST",
+        fast: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        if stock_code != "TEST":
+            # IndicatorEngine memoizes per df.attrs['ticker'] (strategies/risk manager read it)
+            df.attrs.setdefault('ticker', stock_code)
+        if fast is None:
+            fast = strategy.supports_vectorized()
+        if fast:
+            return self._run_fast(df, strategy, stock_code)
+
         self.reset()
         strategy.reset()
+        strategy.prepare(df)
         signals = []
         equity_history = []
         stop_loss_hits = 0
@@ -128,14 +203,7 @@ class BacktestEngine:
         if 'total_score' not in df.columns:
             raise ValueError("DataFrame must contain 'total_score' column. Run calculate_signal_score() first.")
 
-        start_idx = 60
-        if 'ma_60' in df.columns:
-            valid_idx = df['ma_60'].first_valid_index()
-            if valid_idx is not None:
-                if isinstance(valid_idx, pd.Timestamp):
-                    start_idx = df.index.get_loc(valid_idx)
-                else:
-                    start_idx = max(60, valid_idx)
+        start_idx = self._get_start_index(df)
 
         for i in range(start_idx, len(df)):
             row = df.iloc[i]
@@ -231,20 +299,166 @@ class BacktestEngine:
                 self.monitor.record_trade(trade)
                 signals.append({'timestamp': final_timestamp, 'signal': 'FORCE_SELL', 'price': final_price})
 
-        report = self.monitor.generate_report()
-        return {
-            'initial_capital': self.initial_capital,
-            'final_capital': self.capital,
-            'total_return_pct': (self.capital - self.initial_capital) / self.initial_capital * 100,
-            'signals': signals,
-            'equity_curve': self.monitor.equity_curve,
-            'report': report,
-            'trades': self.monitor.trades,
-            'risk_stats': {
-                'stop_loss_hits': stop_loss_hits,
-                'circuit_breaker_hits': circuit_breaker_hits,
-            }
-        }
+        return self._build_result(signals, stop_loss_hits, circuit_breaker_hits)
+
+    def _run_fast(self, df: pd.DataFrame, strategy: StrategyInterface, stock_code: str = "TEST") -> Dict[str, Any]:
+        """
+        Array-based backtest (same semantics as the per-bar path)
+
+        - close, ATR and strategy conditions are extracted once as arrays
+        - ATR stop-loss uses the precomputed ATR at bar i instead of
+          recomputing ATR over df.iloc[:i+1] on every entry
+        - equity is written into a preallocated array, signals into a compact log
+        - strategies without signal_arrays() fall back to per-bar calculate_signal()
+        """
+        self.reset()
+        strategy.reset()
+        strategy.prepare(df)
+        stop_loss_hits = 0
+        circuit_breaker_hits = 0
+
+        if 'total_score' not in df.columns:
+            raise ValueError("DataFrame must contain 'total_score' column. Run calculate_signal_score() first.")
+
+        n = len(df)
+        start_idx = self._get_start_index(df)
+        prices = df['close'].to_numpy(dtype=float).tolist()
+
+        conditions = strategy.signal_arrays(df)
+        if conditions is not None:
+            buy_cond = np.asarray(conditions[0], dtype=bool).tolist()
+            sell_cond = np.asarray(conditions[1], dtype=bool).tolist()
+
+        risk_manager = self.risk_manager
+        if risk_manager:
+            atr = risk_manager.calculate_atr(df).to_numpy(dtype=float).tolist()
+
+        # Timestamps are only materialized on trade events
+        index = df.index
+        is_dt_index = isinstance(index, pd.DatetimeIndex)
+        if is_dt_index:
+            def timestamp_at(i):
+                return index[i]
+        else:
+            def timestamp_at(i):
+                return index[i] if isinstance(index[i], datetime) else datetime.now()
+
+        # Day keys for the circuit breaker daily reset
+        circuit_breaker = self.circuit_breaker
+        if circuit_breaker:
+            if is_dt_index:
+                day_keys = index.normalize().asi8.tolist()
+            else:
+                day_keys = [
+                    ts.date() if isinstance(ts, datetime) else None
+                    for ts in index
+                ]
+            current_day = None
+
+        log = _SignalLog()
+        equity_curve = np.empty(max(n - start_idx, 0), dtype=float)
+        n_equity = 0
+        BUY, SELL, HOLD = OrderType.BUY, OrderType.SELL, OrderType.HOLD
+
+        for i in range(start_idx, n):
+            price = prices[i]
+
+            # Daily reset for circuit breaker
+            if circuit_breaker:
+                day = day_keys[i]
+                if day is None:
+                    day = datetime.now().date()
+                if day != current_day:
+                    current_day = day
+                    trade_date = index[i].date() if is_dt_index else day
+                    circuit_breaker.start_day(self.capital, trade_date)
+
+            position = self.position
+            if position:
+                position.current_price = price
+                if self._highest_price is None or price > self._highest_price:
+                    self._highest_price = price
+
+                # Check stop-loss (Risk Management)
+                if self._stop_loss_price and price <= self._stop_loss_price:
+                    timestamp = timestamp_at(i)
+                    trade = self._execute_sell(price, timestamp)
+                    if trade:
+                        self.monitor.record_trade(trade)
+                        log.append(timestamp, 'STOP_LOSS', price)
+                        strategy.position = None
+                        stop_loss_hits += 1
+                        if circuit_breaker:
+                            circuit_breaker.record_trade(trade.pnl, trade.pnl > 0)
+                    continue
+
+            if conditions is not None:
+                if position is None:
+                    signal = BUY if buy_cond[i] else HOLD
+                else:
+                    signal = SELL if sell_cond[i] else HOLD
+            else:
+                signal = strategy.calculate_signal(df, i)
+                strategy.position = position
+
+            if signal is BUY:
+                can_trade = True
+                if circuit_breaker:
+                    try:
+                        circuit_breaker.check_can_trade()
+                    except TradingHaltedException:
+                        can_trade = False
+                        circuit_breaker_hits += 1
+
+                if can_trade:
+                    if risk_manager:
+                        stop_loss = risk_manager.calculate_stop_loss_from_atr(price, atr[i])
+                        quantity, stop_loss = risk_manager.calculate_position_size(
+                            capital=self.capital,
+                            entry_price=price,
+                            stop_loss_price=stop_loss
+                        )
+                        self._stop_loss_price = stop_loss
+                    else:
+                        quantity = strategy.calculate_quantity(self.capital, price, signal)
+                        self._stop_loss_price = price * 0.97  # Default 3% stop
+
+                    timestamp = timestamp_at(i)
+                    if quantity > 0 and self._execute_buy(price, quantity, timestamp, stock_code):
+                        self._highest_price = price
+                        log.append(timestamp, 'BUY', price, self._stop_loss_price)
+                        strategy.position = self.position
+
+            elif signal is SELL:
+                timestamp = timestamp_at(i)
+                trade = self._execute_sell(price, timestamp)
+                if trade:
+                    self.monitor.record_trade(trade)
+                    log.append(timestamp, 'SELL', price)
+                    strategy.position = None
+                    if circuit_breaker:
+                        circuit_breaker.record_trade(trade.pnl, trade.pnl > 0)
+
+            position = self.position
+            if position:
+                equity_curve[n_equity] = self.capital + position.market_value
+                if circuit_breaker:
+                    circuit_breaker.update_unrealized_pnl(position.unrealized_pnl)
+            else:
+                equity_curve[n_equity] = self.capital
+            n_equity += 1
+
+        self.monitor.equity_curve.extend(equity_curve[:n_equity].tolist())
+
+        if self.position:
+            final_price = prices[-1]
+            final_timestamp = timestamp_at(n - 1)
+            trade = self._execute_sell(final_price, final_timestamp)
+            if trade:
+                self.monitor.record_trade(trade)
+                log.append(final_timestamp, 'FORCE_SELL', final_price)
+
+        return self._build_result(log.to_dicts(), stop_loss_hits, circuit_breaker_hits)
 
     def print_summary(self, result: Dict[str, Any]):
         print("\n" + "=" * 50)
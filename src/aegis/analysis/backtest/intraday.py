@@ -0,0 +1,555 @@
+"""
+PROJECT AEGIS - Intraday Backtest Engine
+=========================================
+Event-driven 1-minute backtesting streamed from min_ticks
+
+- MinTicksStream: server-side cursor over min_ticks (or a pre-built minute bar
+  table) yielding bounded DataFrame chunks, so months of data for all holdings
+  never sit in memory at once
+- MinuteBarBuilder: ticks -> 1-minute OHLCV bars (cumulative daily volume ->
+  per-bar volume); the still-open minute of each ticker is carried to the next chunk
+- IntradayBacktestEngine: one account per ticker; entry/exit conditions from
+  strategy.signal_arrays() over a rolling lookback window, fills from
+  ExecutionSimulator's vectorized cost model (KRX tick sizes, time-segment
+  slippage, tax/fee) computed for whole chunks of orders
+
+Usage:
+    async with db.pool.acquire() as conn:
+        stream = await MinTicksStream.for_holdings(conn, start, end)
+        engine = IntradayBacktestEngine(capital_per_ticker=10_000_000)
+        result = await engine.run_stream(stream, strategy, prepare=calculate_signal_score)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .performance import PerformanceMonitor
+from .portfolio import PortfolioTradeRecord
+from .strategy import StrategyInterface, OrderType
+from ...optimization.real_world.simulator import ExecutionSimulator, get_execution_simulator
+from ...risk import RiskManager, RiskConfig, CircuitBreaker, TradingHaltedException
+
+BAR_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class MinTicksStream:
+    """
+    Server-side cursor over min_ticks (asyncpg)
+
+    Rows are fetched chunk_rows at a time inside a read-only transaction and
+    yielded as DataFrames (timestamp order). With bar_table set, the table is
+    expected to hold built bars (stock_code, timestamp, open, high, low, close, volume).
+    """
+
+    TICK_QUERY = """
+        SELECT stock_code, timestamp, price, volume
+        FROM min_ticks
+        WHERE stock_code = ANY($1::text[])
+          AND timestamp >= $2 AND timestamp < $3
+        ORDER BY timestamp, stock_code
+    """
+
+    BAR_QUERY = """
+        SELECT stock_code, timestamp, open, high, low, close, volume
+        FROM {table}
+        WHERE stock_code = ANY($1::text[])
+          AND timestamp >= $2 AND timestamp < $3
+        ORDER BY timestamp, stock_code
+    """
+
+    def __init__(
+        self,
+        conn,
+        tickers: Sequence[str],
+        start: datetime,
+        end: datetime,
+        chunk_rows: int = 50_000,
+        bar_table: Optional[str] = None
+    ):
+        self.conn = conn
+        self.tickers = list(tickers)
+        self.start = start
+        self.end = end
+        self.chunk_rows = chunk_rows
+        self.bar_table = bar_table
+
+    @classmethod
+    async def for_holdings(cls, conn, start: datetime, end: datetime, **kwargs) -> "MinTicksStream":
+        """보유 종목 전체 (stock_assets.quantity > 0)"""
+        rows = await conn.fetch("SELECT stock_code FROM stock_assets WHERE quantity > 0")
+        return cls(conn, [r['stock_code'] for r in rows], start, end, **kwargs)
+
+    @property
+    def columns(self) -> List[str]:
+        if self.bar_table:
+            return ['stock_code', 'timestamp'] + BAR_COLUMNS
+        return ['stock_code', 'timestamp', 'price', 'volume']
+
+    def _query(self) -> str:
+        if self.bar_table:
+            return self.BAR_QUERY.format(table=self.bar_table)
+        return self.TICK_QUERY
+
+    async def __aiter__(self) -> AsyncIterator[pd.DataFrame]:
+        columns = self.columns
+        async with self.conn.transaction(readonly=True):
+            cursor = await self.conn.cursor(self._query(), self.tickers, self.start, self.end)
+            while True:
+                rows = await cursor.fetch(self.chunk_rows)
+                if not rows:
+                    break
+                chunk = pd.DataFrame.from_records([tuple(r) for r in rows], columns=columns)
+                # Decimal → float (PostgreSQL numeric)
+                numeric = columns[2:]
+                chunk[numeric] = chunk[numeric].astype(float)
+                yield chunk
+
+
+class MinuteBarBuilder:
+    """
+    Ticks -> 1-minute OHLCV bars
+
+    min_ticks.volume is the cumulative daily volume, so bar volume is the
+    difference of the last cumulative value per minute (first minute of a day
+    takes the cumulative value itself). The last minute of each ticker may
+    still receive ticks, so it is held back until a later minute arrives
+    (or flush()).
+    """
+
+    def __init__(self):
+        self._pending: Optional[pd.DataFrame] = None
+        self._last_cum_volume: Dict[str, tuple] = {}   # ticker -> (day, cumulative volume)
+
+    def push(self, ticks: pd.DataFrame) -> pd.DataFrame:
+        """Add a tick chunk; returns completed bars (long format)"""
+        if self._pending is not None:
+            ticks = pd.concat([self._pending, ticks], ignore_index=True)
+        if ticks.empty:
+            self._pending = None
+            return self._empty()
+
+        minute = pd.to_datetime(ticks['timestamp']).dt.floor('min')
+        last_minute = minute.groupby(ticks['stock_code']).transform('max')
+        open_minute = minute == last_minute
+        self._pending = ticks[open_minute]
+        return self._build(ticks[~open_minute], minute[~open_minute])
+
+    def flush(self) -> pd.DataFrame:
+        """Close the held-back minutes"""
+        if self._pending is None or self._pending.empty:
+            self._pending = None
+            return self._empty()
+        ticks, self._pending = self._pending, None
+        return self._build(ticks, pd.to_datetime(ticks['timestamp']).dt.floor('min'))
+
+    @staticmethod
+    def _empty() -> pd.DataFrame:
+        return pd.DataFrame(columns=['stock_code', 'timestamp'] + BAR_COLUMNS)
+
+    def _build(self, ticks: pd.DataFrame, minute: pd.Series) -> pd.DataFrame:
+        if ticks.empty:
+            return self._empty()
+        ticks = ticks.assign(minute=minute).sort_values(['stock_code', 'timestamp'], kind='stable')
+        grouped = ticks.groupby(['stock_code', 'minute'], sort=True)
+        bars = grouped['price'].agg(open='first', high='max', low='min', close='last')
+        bars['cum_volume'] = grouped['volume'].last()
+        bars = bars.reset_index().rename(columns={'minute': 'timestamp'})
+
+        day = bars['timestamp'].dt.normalize()
+        prev_cum = bars.groupby(['stock_code', day])['cum_volume'].shift(1)
+
+        # 첫 분봉: 이전 청크에서 이어지는 같은 날의 누적 거래량 기준
+        first = prev_cum.isna()
+        if first.any():
+            carried = [
+                self._last_cum_volume.get(code, (None, 0.0))
+                for code in bars.loc[first, 'stock_code']
+            ]
+            prev_cum[first] = [
+                cum if carried_day == d else 0.0
+                for (carried_day, cum), d in zip(carried, day[first])
+            ]
+        bars['volume'] = (bars['cum_volume'] - prev_cum).clip(lower=0.0)
+
+        last = bars.groupby('stock_code').tail(1)
+        for code, d, cum in zip(last['stock_code'], last['timestamp'].dt.normalize(), last['cum_volume']):
+            self._last_cum_volume[code] = (d, cum)
+
+        return bars[['stock_code', 'timestamp'] + BAR_COLUMNS]
+
+
+@dataclass
+class _Account:
+    """Per-ticker account state (carried across chunks)"""
+    capital: float
+    quantity: int = 0
+    entry_price: float = 0.0
+    entry_cost: float = 0.0
+    entry_time: Optional[datetime] = None
+    stop_loss: float = 0.0
+    bars_seen: int = 0
+    last_price: float = 0.0
+    last_time: Optional[datetime] = None
+    last_day: Any = None
+    window: Optional[pd.DataFrame] = None
+    circuit_breaker: Optional[CircuitBreaker] = None
+
+    @property
+    def equity(self) -> float:
+        return self.capital + self.quantity * self.last_price
+
+
+class IntradayBacktestEngine:
+    """
+    Intraday (1-minute) Backtesting Engine
+
+    - Per ticker: independent account of capital_per_ticker
+    - Conditions: strategy.signal_arrays() on [lookback tail + new bars]
+      (optionally after prepare(), e.g. calculate_signal_score)
+    - Fills: ExecutionSimulator.fill_prices() for the whole chunk, buy cost
+      = commission, sell cost = tax + commission (ExecutionSimulator.COSTS)
+    - Stops: ATR stop (RiskManager.calculate_stop_loss_from_atr) checked on the bar low
+    - Memory: lookback window + open positions + daily equity per ticker
+    """
+
+    def __init__(
+        self,
+        capital_per_ticker: float = 10_000_000,
+        risk_config: Optional[RiskConfig] = None,
+        use_risk_management: bool = True,
+        simulator: Optional[ExecutionSimulator] = None,
+        slippage_ticks: Optional[int] = None,
+        lookback_bars: int = 390,
+        warmup_bars: int = 60,
+        flatten_daily: bool = False
+    ):
+        self.capital_per_ticker = capital_per_ticker
+        self.risk_config = risk_config or RiskConfig()
+        self.use_risk_management = use_risk_management
+        self.risk_manager = RiskManager(self.risk_config) if use_risk_management else None
+        self.simulator = simulator or get_execution_simulator()
+        self.slippage_ticks = slippage_ticks      # None = 시간대별 호가 수
+        self.lookback_bars = lookback_bars
+        self.warmup_bars = warmup_bars
+        self.flatten_daily = flatten_daily
+        self.reset()
+
+    def reset(self):
+        self._accounts: Dict[str, _Account] = {}
+        self._daily_equity: Dict[str, Dict[Any, float]] = {}
+        self._trades: List[PortfolioTradeRecord] = []
+        self._orders: Dict[str, List[float]] = {'price': [], 'quantity': [], 'side': [], 'slippage_ticks': []}
+        self._builder = MinuteBarBuilder()
+        self._bars_processed = 0
+        self.stats = {'stop_loss_hits': 0, 'circuit_breaker_hits': 0, 'eod_exits': 0}
+
+    def _account(self, ticker: str) -> _Account:
+        account = self._accounts.get(ticker)
+        if account is None:
+            account = _Account(capital=float(self.capital_per_ticker))
+            if self.use_risk_management:
+                account.circuit_breaker = CircuitBreaker(
+                    max_daily_loss_pct=self.risk_config.max_daily_loss_pct,
+                    max_trades=self.risk_config.max_daily_trades
+                )
+            self._accounts[ticker] = account
+            self._daily_equity[ticker] = {}
+        return account
+
+    # ------------------------------------------------------------------
+    # Entry points
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        strategy: StrategyInterface,
+        prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ) -> Dict[str, Any]:
+        """Replay an iterable of tick or bar chunks (long format, timestamp order)"""
+        self.reset()
+        for chunk in chunks:
+            self.process_chunk(chunk, strategy, prepare)
+        return self.finish(strategy, prepare)
+
+    async def run_stream(
+        self,
+        stream: AsyncIterator[pd.DataFrame],
+        strategy: StrategyInterface,
+        prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ) -> Dict[str, Any]:
+        """Replay an async chunk source (e.g. MinTicksStream)"""
+        self.reset()
+        async for chunk in stream:
+            self.process_chunk(chunk, strategy, prepare)
+        return self.finish(strategy, prepare)
+
+    def process_chunk(
+        self,
+        chunk: pd.DataFrame,
+        strategy: StrategyInterface,
+        prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ) -> None:
+        """Ticks (price column) are built into bars first; bars are used as-is"""
+        bars = self._builder.push(chunk) if 'price' in chunk.columns else chunk
+        self._process_bars(bars, strategy, prepare)
+
+    def finish(
+        self,
+        strategy: StrategyInterface,
+        prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ) -> Dict[str, Any]:
+        """Flush held-back minutes, close open positions, build the result"""
+        self._process_bars(self._builder.flush(), strategy, prepare)
+        for ticker, account in self._accounts.items():
+            if account.quantity > 0:
+                ticks = self.slippage_ticks or 1
+                signal_price = account.last_price
+                fill_price = self.simulator.fill_prices([signal_price], -1, slippage_ticks=ticks)[0][0]
+                self._close(ticker, account, signal_price, fill_price, account.last_time, 'FORCE_SELL', ticks)
+                self._daily_equity[ticker][account.last_day] = account.equity
+        return self._build_result()
+
+    # ------------------------------------------------------------------
+    # Event loop
+    # ------------------------------------------------------------------
+
+    def _process_bars(
+        self,
+        bars: pd.DataFrame,
+        strategy: StrategyInterface,
+        prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]]
+    ) -> None:
+        if bars.empty:
+            return
+        for ticker, group in bars.groupby('stock_code', sort=False):
+            new_bars = group.set_index(pd.DatetimeIndex(group['timestamp']))[BAR_COLUMNS]
+            new_bars = new_bars.astype(float).sort_index()
+            new_bars.attrs['ticker'] = ticker
+            self._run_ticker(ticker, new_bars, strategy, prepare)
+            self._bars_processed += len(new_bars)
+
+    def _conditions(
+        self,
+        account: _Account,
+        new_bars: pd.DataFrame,
+        strategy: StrategyInterface,
+        prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]]
+    ):
+        """Strategy conditions for new_bars, computed over [lookback tail + new bars]"""
+        window = new_bars if account.window is None else pd.concat([account.window, new_bars])
+        window.attrs['ticker'] = new_bars.attrs.get('ticker')
+        account.window = window.iloc[-self.lookback_bars:]
+
+        frame = prepare(window) if prepare else window
+        strategy.reset()
+        conditions = strategy.signal_arrays(frame)
+        if conditions is None:
+            raise ValueError(f"{strategy.name} does not provide signal_arrays(); "
+                             "intraday backtest requires vectorized conditions")
+        n_new = len(new_bars)
+        buy = np.asarray(conditions[0], dtype=bool)[-n_new:]
+        sell = np.asarray(conditions[1], dtype=bool)[-n_new:]
+
+        atr = None
+        if self.risk_manager:
+            atr = self.risk_manager.calculate_atr(window).to_numpy(dtype=float)[-n_new:]
+        return buy, sell, atr
+
+    def _run_ticker(
+        self,
+        ticker: str,
+        new_bars: pd.DataFrame,
+        strategy: StrategyInterface,
+        prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]]
+    ) -> None:
+        account = self._account(ticker)
+        buy_cond, sell_cond, atr = self._conditions(account, new_bars, strategy, prepare)
+
+        index = new_bars.index
+        close = new_bars['close'].to_numpy()
+        low = new_bars['low'].to_numpy()
+        day_keys = index.normalize()
+
+        # 체결가: 청크 전체를 한 번에 (매수/매도 후보 가격 배열)
+        ticks = self.slippage_ticks
+        if ticks is None:
+            ticks = self.simulator.get_slippage_ticks(index)
+        buy_fill, _ = self.simulator.fill_prices(close, 1, slippage_ticks=ticks)
+        sell_fill, _ = self.simulator.fill_prices(close, -1, slippage_ticks=ticks)
+        ticks = np.broadcast_to(ticks, close.shape)
+
+        last_bar_of_day = np.append(day_keys[1:] != day_keys[:-1], True)
+        # 청크 마지막 봉은 다음 청크가 같은 날일 수 있으므로 장 마감 판단에서 제외
+        last_bar_of_day[-1] = False
+
+        circuit_breaker = account.circuit_breaker
+        warmup_left = max(self.warmup_bars - account.bars_seen, 0)
+        account.bars_seen += len(close)
+
+        for i in range(len(close)):
+            day = day_keys[i]
+            if day != account.last_day:
+                if account.last_day is not None:
+                    self._daily_equity[ticker][account.last_day] = account.equity
+                account.last_day = day
+                if circuit_breaker:
+                    circuit_breaker.start_day(account.equity, day.date())
+            account.last_price = close[i]
+            account.last_time = index[i]
+
+            if account.quantity > 0:
+                if account.stop_loss and low[i] <= account.stop_loss:
+                    # 갭 하락 시 시가(종가) 기준 체결
+                    stop_price = min(account.stop_loss, new_bars['open'].iat[i])
+                    stop_fill = self.simulator.fill_prices([stop_price], -1, slippage_ticks=ticks[i])[0][0]
+                    self._close(ticker, account, stop_price, stop_fill, index[i], 'STOP_LOSS', ticks[i])
+                    self.stats['stop_loss_hits'] += 1
+                    continue
+                if sell_cond[i]:
+                    self._close(ticker, account, close[i], sell_fill[i], index[i], 'SELL', ticks[i])
+                elif self.flatten_daily and last_bar_of_day[i]:
+                    self._close(ticker, account, close[i], sell_fill[i], index[i], 'EOD', ticks[i])
+                    self.stats['eod_exits'] += 1
+                elif circuit_breaker:
+                    circuit_breaker.update_unrealized_pnl(
+                        account.quantity * close[i] - account.entry_cost
+                    )
+
+            elif buy_cond[i] and i >= warmup_left and not (self.flatten_daily and last_bar_of_day[i]):
+                if circuit_breaker:
+                    try:
+                        circuit_breaker.check_can_trade()
+                    except TradingHaltedException:
+                        self.stats['circuit_breaker_hits'] += 1
+                        continue
+                self._open(account, close[i], buy_fill[i], atr[i] if atr is not None else np.nan,
+                           index[i], ticks[i], strategy)
+
+        self._daily_equity[ticker][account.last_day] = account.equity
+
+    def _open(
+        self,
+        account: _Account,
+        signal_price: float,
+        fill_price: float,
+        atr: float,
+        timestamp: datetime,
+        slippage_ticks: int,
+        strategy: StrategyInterface
+    ) -> None:
+        buy_cost = self.simulator.COSTS['total_buy_cost']
+        if self.risk_manager:
+            stop_loss = self.risk_manager.calculate_stop_loss_from_atr(fill_price, atr)
+            quantity, stop_loss = self.risk_manager.calculate_position_size(
+                capital=account.capital,
+                entry_price=fill_price,
+                stop_loss_price=stop_loss
+            )
+        else:
+            quantity = strategy.calculate_quantity(account.capital, fill_price, OrderType.BUY)
+            stop_loss = fill_price * 0.97  # Default 3% stop
+
+        quantity = min(int(quantity), int(account.capital / (fill_price * (1 + buy_cost))))
+        if quantity <= 0:
+            return
+        cost = fill_price * quantity * (1 + buy_cost)
+        account.capital -= cost
+        account.quantity = quantity
+        account.entry_price = fill_price
+        account.entry_cost = cost
+        account.entry_time = timestamp
+        account.stop_loss = stop_loss
+        self._log_order(signal_price, quantity, 1, slippage_ticks)
+
+    def _close(
+        self,
+        ticker: str,
+        account: _Account,
+        signal_price: float,
+        fill_price: float,
+        timestamp: datetime,
+        reason: str,
+        slippage_ticks: int
+    ) -> None:
+        quantity = account.quantity
+        proceeds = fill_price * quantity * (1 - self.simulator.COSTS['total_sell_cost'])
+        pnl = proceeds - account.entry_cost
+        account.capital += proceeds
+        self._trades.append(PortfolioTradeRecord(
+            entry_time=account.entry_time,
+            exit_time=timestamp,
+            entry_price=account.entry_price,
+            exit_price=fill_price,
+            quantity=quantity,
+            pnl=pnl,
+            pnl_pct=pnl / account.entry_cost * 100,
+            holding_period=int((timestamp - account.entry_time).total_seconds() / 60),
+            stock_code=ticker,
+            exit_reason=reason
+        ))
+        if account.circuit_breaker:
+            account.circuit_breaker.record_trade(pnl, pnl > 0)
+        account.quantity = 0
+        account.entry_price = account.entry_cost = account.stop_loss = 0.0
+        account.entry_time = None
+        self._log_order(signal_price, quantity, -1, slippage_ticks)
+
+    def _log_order(self, price: float, quantity: int, side: int, slippage_ticks: int) -> None:
+        self._orders['price'].append(price)
+        self._orders['quantity'].append(quantity)
+        self._orders['side'].append(side)
+        self._orders['slippage_ticks'].append(slippage_ticks)
+
+    # ------------------------------------------------------------------
+    # Result
+    # ------------------------------------------------------------------
+
+    def execution_costs(self) -> Dict[str, float]:
+        """Slippage / tax / fee totals over all executed orders (vectorized)"""
+        orders = {k: np.asarray(v, dtype=float) for k, v in self._orders.items()}
+        if not len(orders['price']):
+            return {'orders': 0, 'slippage': 0.0, 'tax_fee': 0.0, 'turnover': 0.0}
+        sides = orders['side']
+        fills = self.simulator.simulate_fills(
+            orders['price'], orders['quantity'], sides, slippage_ticks=orders['slippage_ticks']
+        )
+        return {
+            'orders': int(len(sides)),
+            'slippage': float((fills['slippage'] * orders['quantity']).sum()),
+            'tax_fee': float(fills['tax_fee'].sum()),
+            'turnover': float(fills['gross_amount'].sum()),
+        }
+
+    def _build_result(self) -> Dict[str, Any]:
+        daily = pd.DataFrame(self._daily_equity).sort_index()
+        # 데이터가 없는 날은 직전 평가액 유지, 시작 전은 초기 자본
+        daily = daily.ffill().fillna(float(self.capital_per_ticker))
+        equity = daily.sum(axis=1)
+
+        initial_capital = float(self.capital_per_ticker) * len(self._accounts)
+        final_capital = float(sum(a.capital for a in self._accounts.values()))
+
+        monitor = PerformanceMonitor()
+        monitor.reset(initial_capital)
+        for trade in self._trades:
+            monitor.record_trade(trade)
+        monitor.equity_curve.extend(equity.tolist())
+
+        return {
+            'initial_capital': initial_capital,
+            'final_capital': final_capital,
+            'total_return_pct': (final_capital - initial_capital) / initial_capital * 100 if initial_capital else 0.0,
+            'tickers': list(self._accounts),
+            'bars_processed': self._bars_processed,
+            'daily_equity': daily,
+            'equity_curve': monitor.equity_curve,
+            'report': monitor.generate_report(),
+            'trades': self._trades,
+            'execution_costs': self.execution_costs(),
+            'risk_stats': dict(self.stats),
+        }
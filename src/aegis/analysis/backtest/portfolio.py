@@ -0,0 +1,399 @@
+"""
+PROJECT AEGIS - Portfolio Backtest Engine
+==========================================
+Multi-asset backtesting on a shared cash pool
+
+- N tickers on a common calendar (PricePanel: field -> dates x tickers)
+- One cash pool, RiskConfig position limits and a portfolio-level CircuitBreaker
+- Entry/exit conditions are taken once per ticker from strategy.signal_arrays();
+  the per-bar loop rebalances all tickers with vectorized NumPy operations
+
+Usage:
+    panel = PricePanel.from_frames({'005930': df1, '000660': df2})
+    engine = PortfolioBacktestEngine(initial_capital=100_000_000)
+    result = engine.run(panel, AegisSwingStrategy())
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .engine import BacktestEngine
+from .performance import PerformanceMonitor, TradeRecord
+from .strategy import StrategyInterface
+from ...risk import RiskManager, RiskConfig, CircuitBreaker, TradingHaltedException
+
+
+@dataclass
+class PortfolioTradeRecord(TradeRecord):
+    """Trade record with ticker and exit reason"""
+    stock_code: str = ""
+    exit_reason: str = "SELL"
+
+
+@dataclass
+class PricePanel:
+    """
+    Price panel (field -> DataFrame[dates x tickers])
+
+    All fields share the same index (common calendar) and columns (tickers).
+    Missing bars (suspension, not yet listed) are NaN.
+    """
+    fields: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> "PricePanel":
+        """Build from per-ticker OHLCV DataFrames (outer join on the index)"""
+        frames = {ticker: df.select_dtypes('number') for ticker, df in frames.items()}
+        names = set()
+        for df in frames.values():
+            names.update(df.columns)
+
+        fields = {}
+        for name in sorted(names):
+            columns = {
+                ticker: df[name] for ticker, df in frames.items() if name in df.columns
+            }
+            fields[name] = pd.DataFrame(columns).sort_index()
+
+        panel = cls(fields)
+        panel._align()
+        return panel
+
+    @classmethod
+    def from_long(
+        cls,
+        df: pd.DataFrame,
+        ticker_col: str = 'stock_code',
+        date_col: str = 'date'
+    ) -> "PricePanel":
+        """Build from long-format rows (e.g. daily_ohlcv query result)"""
+        values = [c for c in df.select_dtypes('number').columns if c not in (ticker_col, date_col)]
+        wide = df.pivot(index=date_col, columns=ticker_col, values=values)
+        fields = {
+            name: wide[name].sort_index()
+            for name in wide.columns.get_level_values(0).unique()
+        }
+        panel = cls(fields)
+        panel._align()
+        return panel
+
+    def _align(self):
+        if not self.fields:
+            return
+        index = None
+        columns = None
+        for df in self.fields.values():
+            index = df.index if index is None else index.union(df.index)
+            columns = df.columns if columns is None else columns.union(df.columns)
+        self.fields = {
+            name: df.reindex(index=index, columns=columns).astype(float)
+            for name, df in self.fields.items()
+        }
+
+    @property
+    def index(self) -> pd.Index:
+        return self.close.index
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self.close.columns)
+
+    @property
+    def close(self) -> pd.DataFrame:
+        if 'close' not in self.fields:
+            raise ValueError("PricePanel requires a 'close' field")
+        return self.fields['close']
+
+    def frame(self, ticker: str) -> pd.DataFrame:
+        """Single-ticker OHLCV DataFrame (valid bars only, tagged for the indicator memo)"""
+        df = pd.DataFrame({name: panel[ticker] for name, panel in self.fields.items()})
+        df = df[df['close'].notna()]
+        df.attrs['ticker'] = ticker
+        return df
+
+
+class PortfolioBacktestEngine:
+    """Portfolio Backtesting Engine (shared capital)"""
+
+    SLIPPAGE_PCT = BacktestEngine.SLIPPAGE_PCT
+    COMMISSION_PCT = BacktestEngine.COMMISSION_PCT
+
+    def __init__(
+        self,
+        initial_capital: float = 100_000_000,
+        risk_config: Optional[RiskConfig] = None,
+        use_risk_management: bool = True
+    ):
+        self.initial_capital = initial_capital
+        self.risk_config = risk_config or RiskConfig()
+        self.risk_manager = RiskManager(self.risk_config)
+        self.use_risk_management = use_risk_management
+        self.circuit_breaker = CircuitBreaker(
+            max_daily_loss_pct=self.risk_config.max_daily_loss_pct,
+            max_trades=self.risk_config.max_daily_trades
+        ) if use_risk_management else None
+        self.monitor = PerformanceMonitor()
+
+    def _prepare(self, panel: PricePanel, strategy: StrategyInterface):
+        """Per-ticker conditions / ATR scattered onto the panel grid (one pass)"""
+        close = panel.close
+        n_bars, n_tickers = close.shape
+        buy = np.zeros((n_bars, n_tickers), dtype=bool)
+        sell = np.zeros((n_bars, n_tickers), dtype=bool)
+        atr = np.full((n_bars, n_tickers), np.nan)
+        score = np.zeros((n_bars, n_tickers))
+
+        for j, ticker in enumerate(panel.tickers):
+            df = panel.frame(ticker)
+            if df.empty:
+                continue
+            rows = close.index.get_indexer(df.index)
+
+            strategy.reset()
+            conditions = strategy.signal_arrays(df)
+            if conditions is None:
+                raise ValueError(f"{strategy.name} does not provide signal_arrays(); "
+                                 "portfolio backtest requires vectorized conditions")
+            buy[rows, j] = np.asarray(conditions[0], dtype=bool)
+            sell[rows, j] = np.asarray(conditions[1], dtype=bool)
+
+            # Warm-up: ma_60 첫 유효값 이전(없으면 60봉)은 진입 금지 (단일 엔진과 동일한 기준)
+            start = 60
+            if 'ma_60' in df.columns and df['ma_60'].notna().any():
+                start = int(np.argmax(df['ma_60'].notna().to_numpy()))
+            buy[rows[:start], j] = False
+
+            if self.use_risk_management and {'high', 'low'} <= set(df.columns):
+                atr[rows, j] = self.risk_manager.calculate_atr(df).to_numpy(dtype=float)
+            if 'total_score' in df.columns:
+                score[rows, j] = df['total_score'].fillna(0).to_numpy(dtype=float)
+
+        return buy, sell, atr, score
+
+    def _stop_loss_from_atr(self, price: np.ndarray, atr: np.ndarray) -> np.ndarray:
+        """Vectorized RiskManager.calculate_stop_loss_from_atr"""
+        config = self.risk_config
+        fixed = price * (1 - config.fixed_stop_loss_pct)
+        if not self.use_risk_management:
+            return price * 0.97  # Default 3% stop
+        atr_stop = np.minimum(price - atr * config.atr_multiplier, price * 0.99)
+        return np.where(np.isnan(atr) | (atr <= 0), fixed, atr_stop)
+
+    def _size_positions(
+        self,
+        equity: float,
+        price: np.ndarray,
+        stop_loss: np.ndarray,
+        strategy: StrategyInterface
+    ) -> np.ndarray:
+        """Vectorized RiskManager.calculate_position_size (portfolio equity 기준)"""
+        config = self.risk_config
+        if not self.use_risk_management:
+            alloc = getattr(strategy, 'capital_per_trade_pct', config.max_capital_per_trade_pct)
+            return np.floor(equity * alloc / price).astype(np.int64)
+
+        risk_per_share = price - stop_loss
+        risk_per_share = np.where(risk_per_share <= 0, price * config.fixed_stop_loss_pct, risk_per_share)
+
+        if config.use_kelly:
+            allocation_pct = self.risk_manager.calculate_kelly_fraction()
+        else:
+            allocation_pct = config.risk_per_trade_pct
+
+        quantity = np.floor(equity * allocation_pct / risk_per_share)
+        max_quantity = np.floor(equity * config.max_capital_per_trade_pct / price)
+        quantity = np.minimum(quantity, max_quantity)
+        quantity = np.where((quantity <= 0) & (equity >= price), 1, quantity)
+        return quantity.astype(np.int64)
+
+    def run(self, panel: PricePanel, strategy: StrategyInterface) -> Dict[str, Any]:
+        """
+        Run portfolio backtest
+
+        Per bar: stop-loss / exit signals first (cash released), then new entries
+        ranked by total_score, limited by max_positions, per-position capital cap,
+        available cash and the portfolio circuit breaker.
+        """
+        close_df = panel.close
+        index = close_df.index
+        tickers = panel.tickers
+        n_bars, n_tickers = close_df.shape
+
+        buy_cond, sell_cond, atr, score = self._prepare(panel, strategy)
+        strategy.reset()
+
+        raw_close = close_df.to_numpy(dtype=float)
+        tradable = ~np.isnan(raw_close)
+        marks = close_df.ffill().fillna(0.0).to_numpy(dtype=float)
+
+        is_dt_index = isinstance(index, pd.DatetimeIndex)
+        day_keys = index.normalize().asi8 if is_dt_index else None
+
+        self.monitor.reset(self.initial_capital)
+        if self.circuit_breaker:
+            self.circuit_breaker.reset()
+            if not is_dt_index:
+                self.circuit_breaker.start_day(self.initial_capital)
+
+        cash = float(self.initial_capital)
+        qty = np.zeros(n_tickers, dtype=np.int64)
+        entry_price = np.zeros(n_tickers)
+        stop_price = np.zeros(n_tickers)
+        entry_bar = np.zeros(n_tickers, dtype=np.int64)
+
+        equity_curve = np.empty(n_bars)
+        holdings = np.zeros((n_bars, n_tickers), dtype=np.int64)
+        max_positions = self.risk_config.max_positions
+        stop_loss_hits = 0
+        circuit_breaker_hits = 0
+        signal_count = 0
+
+        def timestamp_at(i):
+            return index[i] if isinstance(index[i], datetime) else datetime.now()
+
+        def close_positions(i, idx, reason):
+            nonlocal cash
+            exec_price = marks[i, idx] * (1 - self.SLIPPAGE_PCT)
+            quantity = qty[idx]
+            proceeds = exec_price * quantity
+            net_proceeds = proceeds - proceeds * self.COMMISSION_PCT
+            entry_cost = entry_price[idx] * quantity
+            pnl = net_proceeds - entry_cost
+            cash += float(net_proceeds.sum())
+
+            exit_time = timestamp_at(i)
+            for k, j in enumerate(idx):
+                entry_time = timestamp_at(entry_bar[j])
+                trade = PortfolioTradeRecord(
+                    entry_time=entry_time,
+                    exit_time=exit_time,
+                    entry_price=float(entry_price[j]),
+                    exit_price=float(exec_price[k]),
+                    quantity=int(quantity[k]),
+                    pnl=float(pnl[k]),
+                    pnl_pct=float(pnl[k] / entry_cost[k] * 100),
+                    holding_period=int((exit_time - entry_time).total_seconds() / 60),
+                    stock_code=tickers[j],
+                    exit_reason=reason,
+                )
+                self.monitor.record_trade(trade)
+                if self.circuit_breaker and reason != 'FORCE_SELL':
+                    self.circuit_breaker.record_trade(trade.pnl, trade.pnl > 0)
+            qty[idx] = 0
+
+        for i in range(n_bars):
+            price = marks[i]
+            held = qty > 0
+
+            # Daily reset for circuit breaker (portfolio equity 기준)
+            if self.circuit_breaker and is_dt_index and (i == 0 or day_keys[i] != day_keys[i - 1]):
+                self.circuit_breaker.start_day(cash + float(qty @ price), index[i].date())
+
+            # Exits: stop-loss first, then strategy exit conditions
+            open_now = held & tradable[i]
+            stop_hit = open_now & (price <= stop_price)
+            if stop_hit.any():
+                idx = np.flatnonzero(stop_hit)
+                close_positions(i, idx, 'STOP_LOSS')
+                stop_loss_hits += len(idx)
+                signal_count += len(idx)
+
+            exits = open_now & ~stop_hit & sell_cond[i]
+            if exits.any():
+                idx = np.flatnonzero(exits)
+                close_positions(i, idx, 'SELL')
+                signal_count += len(idx)
+
+            # Entries: rank candidates by score, respect limits and cash
+            # (같은 봉에 청산된 종목은 재진입하지 않음)
+            candidates = (qty == 0) & tradable[i] & buy_cond[i] & ~(stop_hit | exits)
+            slots = max_positions - int(np.count_nonzero(qty))
+            if slots > 0 and candidates.any():
+                can_trade = True
+                if self.circuit_breaker:
+                    try:
+                        self.circuit_breaker.check_can_trade()
+                    except TradingHaltedException:
+                        can_trade = False
+                        circuit_breaker_hits += 1
+
+                if can_trade:
+                    idx = np.flatnonzero(candidates)
+                    idx = idx[np.argsort(-score[i, idx], kind='stable')]
+
+                    equity = cash + float(qty @ price)
+                    buy_price = price[idx]
+                    stop_loss = self._stop_loss_from_atr(buy_price, atr[i, idx])
+                    quantity = self._size_positions(equity, buy_price, stop_loss, strategy)
+
+                    exec_price = buy_price * (1 + self.SLIPPAGE_PCT)
+                    total_cost = exec_price * quantity * (1 + self.COMMISSION_PCT)
+                    # 순위대로 현금 한도 내에서 slots개까지 체결 (남은 현금을 넘는 종목은 건너뛰고 다음 순위)
+                    affordable = np.zeros(len(idx), dtype=bool)
+                    remaining = cash
+                    for k in np.flatnonzero(quantity > 0):
+                        if total_cost[k] <= remaining:
+                            affordable[k] = True
+                            remaining -= total_cost[k]
+                            slots -= 1
+                            if slots == 0:
+                                break
+                    if affordable.any():
+                        idx = idx[affordable]
+                        qty[idx] = quantity[affordable]
+                        entry_price[idx] = exec_price[affordable]
+                        stop_price[idx] = stop_loss[affordable]
+                        entry_bar[idx] = i
+                        cash -= float(total_cost[affordable].sum())
+                        signal_count += len(idx)
+
+            held = qty > 0
+            equity_curve[i] = cash + float(qty @ price)
+            holdings[i] = qty
+            if self.circuit_breaker and held.any():
+                self.circuit_breaker.update_unrealized_pnl(
+                    float(((price - entry_price) * qty)[held].sum())
+                )
+
+        self.monitor.equity_curve.extend(equity_curve.tolist())
+
+        # Force-sell remaining positions at the last valid price
+        if n_bars and (qty > 0).any():
+            idx = np.flatnonzero(qty > 0)
+            close_positions(n_bars - 1, idx, 'FORCE_SELL')
+            signal_count += len(idx)
+
+        report = self.monitor.generate_report()
+        return {
+            'initial_capital': self.initial_capital,
+            'final_capital': cash,
+            'total_return_pct': (cash - self.initial_capital) / self.initial_capital * 100,
+            'equity_curve': self.monitor.equity_curve,
+            'holdings': pd.DataFrame(holdings, index=index, columns=tickers),
+            'report': report,
+            'trades': self.monitor.trades,
+            'signal_count': signal_count,
+            'risk_stats': {
+                'stop_loss_hits': stop_loss_hits,
+                'circuit_breaker_hits': circuit_breaker_hits,
+                'max_positions': max_positions,
+            }
+        }
+
+    def pnl_by_ticker(self, result: Dict[str, Any]) -> pd.DataFrame:
+        """종목별 실현 손익 요약"""
+        trades = result['trades']
+        if not trades:
+            return pd.DataFrame(columns=['trades', 'pnl', 'win_rate'])
+        df = pd.DataFrame({
+            'stock_code': [t.stock_code for t in trades],
+            'pnl': [t.pnl for t in trades],
+            'win': [t.pnl > 0 for t in trades],
+        })
+        summary = df.groupby('stock_code').agg(trades=('pnl', 'size'), pnl=('pnl', 'sum'), win_rate=('win', 'mean'))
+        summary['win_rate'] *= 100
+        return summary.sort_values('pnl', ascending=False)
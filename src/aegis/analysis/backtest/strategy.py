@@ -5,10 +5,15 @@ Strategy interface for backtesting
 """
 
 from abc import ABC, abstractmethod
+import itertools
+import weakref
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
+
+from ..indicator_graph import get_indicator_engine
 
 
 class OrderType(Enum):
@@ -51,6 +56,67 @@ class Position:
         return (self.current_price - self.avg_price) / self.avg_price * 100
 
 
+# generate_signals() codes
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+SIGNAL_HOLD = 0
+
+SIGNAL_CODES = {
+    SIGNAL_BUY: OrderType.BUY,
+    SIGNAL_SELL: OrderType.SELL,
+    SIGNAL_HOLD: OrderType.HOLD,
+}
+
+
+def resolve_signals(buy: np.ndarray, sell: np.ndarray, holding: bool = False) -> np.ndarray:
+    """
+    Position state machine over condition arrays
+
+    BUY fires on a buy condition while flat, SELL on a sell condition while
+    holding; everything else is HOLD. Only bars with a condition are visited.
+
+    Returns:
+        int8 array of SIGNAL_BUY / SIGNAL_SELL / SIGNAL_HOLD
+    """
+    buy = np.asarray(buy, dtype=bool)
+    sell = np.asarray(sell, dtype=bool)
+    signals = np.zeros(len(buy), dtype=np.int8)
+    for i in np.flatnonzero(buy | sell):
+        if not holding and buy[i]:
+            signals[i] = SIGNAL_BUY
+            holding = True
+        elif holding and sell[i]:
+            signals[i] = SIGNAL_SELL
+            holding = False
+    return signals
+
+
+_frame_tokens: Dict[int, Tuple[weakref.ref, int]] = {}
+_token_counter = itertools.count()
+
+
+def frame_token(df: pd.DataFrame) -> int:
+    """
+    Per-object token for a DataFrame
+
+    Unlike id(), a token is never reused: the entry is dropped when the frame
+    is garbage collected, and a later frame at the same address gets a new one.
+    """
+    key = id(df)
+    entry = _frame_tokens.get(key)
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+
+    def _drop(ref: weakref.ref, key: int = key) -> None:
+        current = _frame_tokens.get(key)
+        if current is not None and current[0] is ref:
+            del _frame_tokens[key]
+
+    token = next(_token_counter)
+    _frame_tokens[key] = (weakref.ref(df, _drop), token)
+    return token
+
+
 class StrategyInterface(ABC):
     """Strategy Abstract Base Class"""
 
@@ -58,6 +124,7 @@ class StrategyInterface(ABC):
         self.name = name
         self.position: Optional[Position] = None
         self.orders: List[Order] = []
+        self._prepared_key: Optional[tuple] = None
 
     @abstractmethod
     def calculate_signal(self, df: pd.DataFrame, index: int) -> OrderType:
@@ -67,12 +134,57 @@ class StrategyInterface(ABC):
     def calculate_quantity(self, capital: float, price: float, signal: OrderType) -> int:
         pass
 
+    def signal_arrays(self, df: pd.DataFrame) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Vectorized entry/exit conditions for the array-based backtest path
+
+        Returns (buy_condition, sell_condition) boolean arrays aligned with df.
+        Conditions must not depend on the position; the engine applies them
+        as BUY when flat and SELL when holding, same as calculate_signal().
+        Return None to fall back to per-bar calculate_signal().
+        """
+        return None
+
+    def supports_vectorized(self) -> bool:
+        """True if signal_arrays() is implemented (engine picks the fast path)"""
+        return type(self).signal_arrays is not StrategyInterface.signal_arrays
+
+    @staticmethod
+    def _frame_key(df: pd.DataFrame) -> tuple:
+        return (frame_token(df), len(df), df.index[-1] if len(df) else None)
+
+    def prepare(self, df: pd.DataFrame) -> None:
+        """
+        Precompute per-frame state (indicators etc.) once before a backtest
+
+        Subclasses override and call super().prepare(df). calculate_signal()
+        can then use is_prepared(df) instead of re-detecting a stale frame.
+        """
+        self._prepared_key = self._frame_key(df)
+
+    def is_prepared(self, df: pd.DataFrame) -> bool:
+        return getattr(self, '_prepared_key', None) == self._frame_key(df)
+
+    def generate_signals(self, df: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Signals for every bar (SIGNAL_BUY / SIGNAL_SELL / SIGNAL_HOLD)
+
+        Position-dependent logic is resolved by resolve_signals() over
+        signal_arrays(), assuming every signal is filled. Returns None if the
+        strategy has no vectorized conditions.
+        """
+        conditions = self.signal_arrays(df)
+        if conditions is None:
+            return None
+        return resolve_signals(*conditions)
+
     def on_order_filled(self, order: Order) -> None:
         self.orders.append(order)
 
     def reset(self) -> None:
         self.position = None
         self.orders = []
+        self._prepared_key = None
 
 
 class AegisSwingStrategy(StrategyInterface):
@@ -101,6 +213,13 @@ class AegisSwingStrategy(StrategyInterface):
             return OrderType.SELL
         return OrderType.HOLD
 
+    def signal_arrays(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        if 'total_score' not in df.columns:
+            raise ValueError("DataFrame must contain 'total_score' column")
+
+        score = df['total_score'].to_numpy(dtype=float)
+        return score >= self.buy_threshold, score <= self.sell_threshold
+
     def calculate_quantity(self, capital: float, price: float, signal: OrderType) -> int:
         if signal == OrderType.BUY:
             available = capital * self.capital_per_trade_pct
@@ -138,17 +257,25 @@ class MeanReversionStrategy(StrategyInterface):
 
     def _calculate_bollinger_bands(self, df: pd.DataFrame) -> None:
         """Calculate Bollinger Bands"""
-        close = df['close'].astype(float)
-        self._bb_middle = close.rolling(window=self.bb_period).mean()
-        bb_std = close.rolling(window=self.bb_period).std()
-        self._bb_upper = self._bb_middle + (bb_std * self.bb_std)
-        self._bb_lower = self._bb_middle - (bb_std * self.bb_std)
+        params = {'period': self.bb_period, 'num_std': self.bb_std}
+        bands = get_indicator_engine().compute(df, {
+            'middle': ('bb_middle', {'period': self.bb_period}),
+            'upper': ('bb_upper', params),
+            'lower': ('bb_lower', params),
+        })
+        self._bb_middle = bands['middle']
+        self._bb_upper = bands['upper']
+        self._bb_lower = bands['lower']
         self._bb_calculated = True
 
+    def prepare(self, df: pd.DataFrame) -> None:
+        self._calculate_bollinger_bands(df)
+        super().prepare(df)
+
     def calculate_signal(self, df: pd.DataFrame, index: int) -> OrderType:
-        # Calculate Bollinger Bands if not done
-        if not self._bb_calculated or len(df) != len(self._bb_middle):
-            self._calculate_bollinger_bands(df)
+        # Calculate Bollinger Bands if not prepared for this frame
+        if not self.is_prepared(df):
+            self.prepare(df)
 
         price = float(df['close'].iloc[index])
         upper = self._bb_upper.iloc[index]
@@ -173,6 +300,21 @@ class MeanReversionStrategy(StrategyInterface):
 
         return OrderType.HOLD
 
+    def signal_arrays(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        if not self.is_prepared(df):
+            self.prepare(df)
+
+        price = df['close'].to_numpy(dtype=float)
+        upper = self._bb_upper.to_numpy(dtype=float)
+        lower = self._bb_lower.to_numpy(dtype=float)
+        middle = self._bb_middle.to_numpy(dtype=float)
+
+        # NaN 밴드 구간은 HOLD (NaN 비교는 False)
+        valid = ~(np.isnan(upper) | np.isnan(lower))
+        buy = valid & (price <= lower)
+        sell = valid & ((price >= upper) | (~np.isnan(middle) & (price >= middle)))
+        return buy, sell
+
     def calculate_quantity(self, capital: float, price: float, signal: OrderType) -> int:
         if signal == OrderType.BUY:
             available = capital * self.capital_per_trade_pct
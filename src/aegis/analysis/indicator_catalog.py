@@ -0,0 +1,692 @@
+"""
+PROJECT AEGIS - Indicator Catalog
+==================================
+45 technical indicators registered on the default IndicatorRegistry
+
+공유 중간값 (intermediate):
+- col / prev_close / delta / returns / log_returns / gain / loss
+- true_range / typical_price / plus_dm / minus_dm / money_flow_volume
+- rolling_mean / rolling_std / rolling_sum / rolling_max / rolling_min
+- ema_of / wilder_of
+
+Note: rsi, vwap, sma, atr, bb_* 은 기존 calculate_rsi / calculate_vwap /
+calculate_ma / RiskManager.calculate_atr / MeanReversionStrategy 와 동일한 정의입니다.
+"""
+
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from .indicator_graph import DEFAULT_REGISTRY, NodeKey, node
+
+registry = DEFAULT_REGISTRY
+indicator = registry.indicator
+
+OHLCV_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+Source = Union[str, NodeKey]
+
+
+def _src(source: Source) -> NodeKey:
+    """source 파라미터 → NodeKey (OHLCV 컬럼명, 중간값 이름, NodeKey 허용)"""
+    if isinstance(source, NodeKey):
+        return source
+    if source in OHLCV_FIELDS:
+        return node('col', field=source)
+    return NodeKey(source)
+
+
+def _close():
+    return node('col', field='close')
+
+
+def _high():
+    return node('col', field='high')
+
+
+def _low():
+    return node('col', field='low')
+
+
+def _volume():
+    return node('col', field='volume')
+
+
+def _sma(source: Source, window: int) -> NodeKey:
+    return node('rolling_mean', source=source, window=window)
+
+
+def _ema(source: Source, span: int, min_periods: int = 0) -> NodeKey:
+    return node('ema_of', source=source, span=span, min_periods=min_periods)
+
+
+# ============================================================
+# Shared intermediates
+# ============================================================
+
+@indicator('col', needs_frame=True, intermediate=True, field='close')
+def col(df, field):
+    """OHLCV 컬럼 (float64 변환, Decimal 등 object 타입 처리)"""
+    return df[field].astype(float)
+
+
+@indicator('prev_close', inputs=lambda p: {'close': _close()}, intermediate=True)
+def prev_close(close):
+    return close.shift(1)
+
+
+@indicator('delta', inputs=lambda p: {'close': _close()}, intermediate=True)
+def delta(close):
+    return close.diff()
+
+
+@indicator('returns', inputs=lambda p: {'close': _close()}, intermediate=True)
+def returns(close):
+    return close.pct_change()
+
+
+@indicator('log_returns', inputs=lambda p: {'close': _close()}, intermediate=True)
+def log_returns(close):
+    return np.log(close / close.shift(1))
+
+
+@indicator('gain', inputs=('delta',), intermediate=True)
+def gain(delta):
+    return delta.where(delta > 0, 0)
+
+
+@indicator('loss', inputs=('delta',), intermediate=True)
+def loss(delta):
+    return (-delta).where(delta < 0, 0)
+
+
+@indicator('up_day', inputs=('delta',), intermediate=True)
+def up_day(delta):
+    return (delta > 0).astype(float)
+
+
+@indicator(
+    'true_range',
+    inputs=lambda p: {'high': _high(), 'low': _low(), 'prev_close': NodeKey('prev_close')},
+    intermediate=True
+)
+def true_range(high, low, prev_close):
+    """True Range = max(High-Low, |High-PrevClose|, |Low-PrevClose|)"""
+    tr1 = high - low
+    tr2 = abs(high - prev_close)
+    tr3 = abs(low - prev_close)
+    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+
+@indicator(
+    'typical_price',
+    inputs=lambda p: {'high': _high(), 'low': _low(), 'close': _close()},
+    intermediate=True
+)
+def typical_price(high, low, close):
+    return (high + low + close) / 3
+
+
+@indicator('plus_dm', inputs=lambda p: {'high': _high(), 'low': _low()}, intermediate=True)
+def plus_dm(high, low):
+    up_move = high.diff()
+    down_move = -low.diff()
+    return up_move.where((up_move > down_move) & (up_move > 0), 0.0)
+
+
+@indicator('minus_dm', inputs=lambda p: {'high': _high(), 'low': _low()}, intermediate=True)
+def minus_dm(high, low):
+    up_move = high.diff()
+    down_move = -low.diff()
+    return down_move.where((down_move > up_move) & (down_move > 0), 0.0)
+
+
+@indicator(
+    'money_flow_volume',
+    inputs=lambda p: {'high': _high(), 'low': _low(), 'close': _close(), 'volume': _volume()},
+    intermediate=True
+)
+def money_flow_volume(high, low, close, volume):
+    hl_range = (high - low).replace(0, np.nan)
+    clv = ((close - low) - (high - close)) / hl_range
+    return clv.fillna(0) * volume
+
+
+@indicator('rolling_mean', inputs=lambda p: {'x': _src(p['source'])}, intermediate=True,
+           source='close', window=20)
+def rolling_mean(x, source, window):
+    return x.rolling(window=window).mean()
+
+
+@indicator('rolling_std', inputs=lambda p: {'x': _src(p['source'])}, intermediate=True,
+           source='close', window=20)
+def rolling_std(x, source, window):
+    return x.rolling(window=window).std()
+
+
+@indicator('rolling_sum', inputs=lambda p: {'x': _src(p['source'])}, intermediate=True,
+           source='close', window=20)
+def rolling_sum(x, source, window):
+    return x.rolling(window=window).sum()
+
+
+@indicator('rolling_max', inputs=lambda p: {'x': _src(p['source'])}, intermediate=True,
+           source='high', window=20)
+def rolling_max(x, source, window):
+    return x.rolling(window=window).max()
+
+
+@indicator('rolling_min', inputs=lambda p: {'x': _src(p['source'])}, intermediate=True,
+           source='low', window=20)
+def rolling_min(x, source, window):
+    return x.rolling(window=window).min()
+
+
+@indicator('ema_of', inputs=lambda p: {'x': _src(p['source'])}, intermediate=True,
+           source='close', span=20, min_periods=0)
+def ema_of(x, source, span, min_periods):
+    return x.ewm(span=span, adjust=False, min_periods=min_periods).mean()
+
+
+@indicator('wilder_of', inputs=lambda p: {'x': _src(p['source'])}, intermediate=True,
+           source='close', period=14)
+def wilder_of(x, source, period):
+    """Wilder smoothing (alpha = 1/period)"""
+    return x.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
+
+
+@indicator(
+    'dx',
+    inputs=lambda p: {
+        'plus_di': node('plus_di', period=p['period']),
+        'minus_di': node('minus_di', period=p['period']),
+    },
+    intermediate=True,
+    period=14
+)
+def dx(plus_di, minus_di, period):
+    di_sum = (plus_di + minus_di).replace(0, np.nan)
+    return 100 * (plus_di - minus_di).abs() / di_sum
+
+
+# ============================================================
+# Trend (Moving Averages)
+# ============================================================
+
+@indicator('sma', inputs=lambda p: {'x': _sma('close', p['period'])}, period=20)
+def sma(x, period):
+    """Simple Moving Average"""
+    return x
+
+
+@indicator('ema', inputs=lambda p: {'x': _ema('close', p['period'], p['period'])}, period=20)
+def ema(x, period):
+    """Exponential Moving Average"""
+    return x
+
+
+@indicator('wma', inputs=lambda p: {'close': _close()}, period=20)
+def wma(close, period):
+    """Weighted Moving Average (linear weights)"""
+    weights = np.arange(1, period + 1, dtype=float)
+    weights /= weights.sum()
+    return close.rolling(window=period).apply(lambda x: np.dot(x, weights), raw=True)
+
+
+@indicator(
+    'dema',
+    inputs=lambda p: {
+        'ema1': _ema('close', p['period']),
+        'ema2': _ema(_ema('close', p['period']), p['period']),
+    },
+    period=20
+)
+def dema(ema1, ema2, period):
+    """Double EMA"""
+    return 2 * ema1 - ema2
+
+
+@indicator(
+    'tema',
+    inputs=lambda p: {
+        'ema1': _ema('close', p['period']),
+        'ema2': _ema(_ema('close', p['period']), p['period']),
+        'ema3': _ema(_ema(_ema('close', p['period']), p['period']), p['period']),
+    },
+    period=20
+)
+def tema(ema1, ema2, ema3, period):
+    """Triple EMA"""
+    return 3 * ema1 - 3 * ema2 + ema3
+
+
+@indicator(
+    'trix',
+    inputs=lambda p: {
+        'ema3': _ema(_ema(_ema('close', p['period']), p['period']), p['period']),
+    },
+    period=15
+)
+def trix(ema3, period):
+    """TRIX (triple-smoothed EMA rate of change, %)"""
+    return ema3.pct_change() * 100
+
+
+@indicator(
+    'vwap',
+    inputs=lambda p: {'typical_price': NodeKey('typical_price'), 'volume': _volume()},
+    needs_frame=True
+)
+def vwap(df, typical_price, volume):
+    """VWAP (DatetimeIndex면 날짜별 리셋)"""
+    tp_vol = typical_price * volume
+    if hasattr(df.index, 'date'):
+        dates = df.index.date
+        cumsum_tp_vol = tp_vol.groupby(dates).cumsum()
+        cumsum_vol = volume.groupby(dates).cumsum()
+    else:
+        cumsum_tp_vol = tp_vol.cumsum()
+        cumsum_vol = volume.cumsum()
+    return cumsum_tp_vol / cumsum_vol
+
+
+@indicator(
+    'ma_gap',
+    inputs=lambda p: {'short_ma': _sma('close', p['short']), 'long_ma': _sma('close', p['long'])},
+    short=20, long=60
+)
+def ma_gap(short_ma, long_ma, short, long):
+    """(MA_short - MA_long) / MA_long"""
+    return (short_ma - long_ma) / long_ma
+
+
+@indicator('ma_slope', inputs=lambda p: {'ma': _sma('close', p['period'])}, period=20, lag=5)
+def ma_slope(ma, period, lag):
+    """MA slope over `lag` bars (ratio)"""
+    return ma.diff(lag) / ma.shift(lag)
+
+
+@indicator(
+    'ma_alignment',
+    inputs=lambda p: {
+        'ma_s': _sma('close', p['short']),
+        'ma_m': _sma('close', p['mid']),
+        'ma_l': _sma('close', p['long']),
+    },
+    short=5, mid=20, long=60
+)
+def ma_alignment(ma_s, ma_m, ma_l, short, mid, long):
+    """정배열 +1 / 역배열 -1 / 그 외 0"""
+    golden = (ma_s > ma_m) & (ma_m > ma_l)
+    death = (ma_s < ma_m) & (ma_m < ma_l)
+    alignment = pd.Series(0, index=ma_s.index)
+    alignment[golden] = 1
+    alignment[death] = -1
+    return alignment
+
+
+@indicator(
+    'disparity',
+    inputs=lambda p: {'close': _close(), 'ma': _sma('close', p['period'])},
+    period=20
+)
+def disparity(close, ma, period):
+    """이격도 (Close / MA * 100)"""
+    return close / ma * 100
+
+
+# ============================================================
+# Momentum / Oscillators
+# ============================================================
+
+@indicator(
+    'rsi',
+    inputs=lambda p: {
+        'avg_gain': node('wilder_of', source='gain', period=p['period']),
+        'avg_loss': node('wilder_of', source='loss', period=p['period']),
+    },
+    period=14
+)
+def rsi(avg_gain, avg_loss, period):
+    """RSI (초기 NaN은 중립값 50)"""
+    rs = avg_gain / avg_loss
+    result = 100 - (100 / (1 + rs))
+    result = result.replace([np.inf, -np.inf], 100)
+    return result.fillna(50)
+
+
+@indicator(
+    'macd',
+    inputs=lambda p: {'fast_ema': _ema('close', p['fast']), 'slow_ema': _ema('close', p['slow'])},
+    fast=12, slow=26
+)
+def macd(fast_ema, slow_ema, fast, slow):
+    """MACD line"""
+    return fast_ema - slow_ema
+
+
+@indicator(
+    'macd_signal',
+    inputs=lambda p: {'x': _ema(node('macd', fast=p['fast'], slow=p['slow']), p['signal'])},
+    fast=12, slow=26, signal=9
+)
+def macd_signal(x, fast, slow, signal):
+    """MACD signal line"""
+    return x
+
+
+@indicator(
+    'macd_hist',
+    inputs=lambda p: {
+        'line': node('macd', fast=p['fast'], slow=p['slow']),
+        'sig': node('macd_signal', fast=p['fast'], slow=p['slow'], signal=p['signal']),
+    },
+    fast=12, slow=26, signal=9
+)
+def macd_hist(line, sig, fast, slow, signal):
+    """MACD histogram"""
+    return line - sig
+
+
+@indicator(
+    'ppo',
+    inputs=lambda p: {'fast_ema': _ema('close', p['fast']), 'slow_ema': _ema('close', p['slow'])},
+    fast=12, slow=26
+)
+def ppo(fast_ema, slow_ema, fast, slow):
+    """Percentage Price Oscillator"""
+    return (fast_ema - slow_ema) / slow_ema * 100
+
+
+@indicator(
+    'stoch_k',
+    inputs=lambda p: {
+        'close': _close(),
+        'highest': node('rolling_max', source='high', window=p['period']),
+        'lowest': node('rolling_min', source='low', window=p['period']),
+    },
+    period=14
+)
+def stoch_k(close, highest, lowest, period):
+    """Stochastic %K"""
+    return 100 * (close - lowest) / (highest - lowest).replace(0, np.nan)
+
+
+@indicator(
+    'stoch_d',
+    inputs=lambda p: {'x': _sma(node('stoch_k', period=p['period']), p['smooth'])},
+    period=14, smooth=3
+)
+def stoch_d(x, period, smooth):
+    """Stochastic %D"""
+    return x
+
+
+@indicator(
+    'williams_r',
+    inputs=lambda p: {
+        'close': _close(),
+        'highest': node('rolling_max', source='high', window=p['period']),
+        'lowest': node('rolling_min', source='low', window=p['period']),
+    },
+    period=14
+)
+def williams_r(close, highest, lowest, period):
+    """Williams %R"""
+    return -100 * (highest - close) / (highest - lowest).replace(0, np.nan)
+
+
+@indicator(
+    'cci',
+    inputs=lambda p: {'tp': NodeKey('typical_price'), 'tp_ma': _sma('typical_price', p['period'])},
+    period=20
+)
+def cci(tp, tp_ma, period):
+    """Commodity Channel Index"""
+    mean_dev = tp.rolling(window=period).apply(
+        lambda x: np.abs(x - x.mean()).mean(), raw=True
+    )
+    return (tp - tp_ma) / (0.015 * mean_dev.replace(0, np.nan))
+
+
+@indicator('roc', inputs=lambda p: {'close': _close()}, period=12)
+def roc(close, period):
+    """Rate of Change (%)"""
+    return (close / close.shift(period) - 1) * 100
+
+
+@indicator('momentum', inputs=lambda p: {'close': _close()}, period=10)
+def momentum(close, period):
+    """Momentum (Close - Close[n])"""
+    return close - close.shift(period)
+
+
+@indicator(
+    'mfi',
+    inputs=lambda p: {'tp': NodeKey('typical_price'), 'volume': _volume()},
+    period=14
+)
+def mfi(tp, volume, period):
+    """Money Flow Index"""
+    raw_flow = tp * volume
+    tp_delta = tp.diff()
+    pos_flow = raw_flow.where(tp_delta > 0, 0.0).rolling(window=period).sum()
+    neg_flow = raw_flow.where(tp_delta < 0, 0.0).rolling(window=period).sum()
+    money_ratio = pos_flow / neg_flow
+    return 100 - 100 / (1 + money_ratio)
+
+
+@indicator('psy_line', inputs=lambda p: {'ups': node('rolling_sum', source='up_day', window=p['period'])},
+           period=12)
+def psy_line(ups, period):
+    """투자심리선 (최근 n일 중 상승일 비율, %)"""
+    return ups / period * 100
+
+
+# ============================================================
+# Trend Strength (Directional Movement)
+# ============================================================
+
+@indicator(
+    'plus_di',
+    inputs=lambda p: {
+        'dm': node('wilder_of', source='plus_dm', period=p['period']),
+        'tr': node('wilder_of', source='true_range', period=p['period']),
+    },
+    period=14
+)
+def plus_di(dm, tr, period):
+    """+DI"""
+    return 100 * dm / tr.replace(0, np.nan)
+
+
+@indicator(
+    'minus_di',
+    inputs=lambda p: {
+        'dm': node('wilder_of', source='minus_dm', period=p['period']),
+        'tr': node('wilder_of', source='true_range', period=p['period']),
+    },
+    period=14
+)
+def minus_di(dm, tr, period):
+    """-DI"""
+    return 100 * dm / tr.replace(0, np.nan)
+
+
+@indicator('adx', inputs=lambda p: {'x': node('wilder_of', source=node('dx', period=p['period']),
+                                              period=p['period'])},
+           period=14)
+def adx(x, period):
+    """Average Directional Index"""
+    return x
+
+
+# ============================================================
+# Volatility
+# ============================================================
+
+@indicator('atr', inputs=lambda p: {'x': _sma('true_range', p['period'])}, period=14)
+def atr(x, period):
+    """ATR (True Range 단순 이동평균, RiskManager 기준)"""
+    return x
+
+
+@indicator('natr', inputs=lambda p: {'atr': node('atr', period=p['period']), 'close': _close()},
+           period=14)
+def natr(atr, close, period):
+    """Normalized ATR (%)"""
+    return atr / close * 100
+
+
+@indicator('atr_ratio', inputs=lambda p: {'atr': node('atr', period=p['period']), 'close': _close()},
+           period=14)
+def atr_ratio(atr, close, period):
+    """ATR / Close (MarketRegimeClassifier 변동성)"""
+    return atr / close
+
+
+@indicator('bb_middle', inputs=lambda p: {'x': _sma('close', p['period'])}, period=20)
+def bb_middle(x, period):
+    """Bollinger middle band"""
+    return x
+
+
+@indicator(
+    'bb_upper',
+    inputs=lambda p: {
+        'middle': _sma('close', p['period']),
+        'std': node('rolling_std', source='close', window=p['period']),
+    },
+    period=20, num_std=2.0
+)
+def bb_upper(middle, std, period, num_std):
+    """Bollinger upper band"""
+    return middle + (std * num_std)
+
+
+@indicator(
+    'bb_lower',
+    inputs=lambda p: {
+        'middle': _sma('close', p['period']),
+        'std': node('rolling_std', source='close', window=p['period']),
+    },
+    period=20, num_std=2.0
+)
+def bb_lower(middle, std, period, num_std):
+    """Bollinger lower band"""
+    return middle - (std * num_std)
+
+
+@indicator(
+    'bb_width',
+    inputs=lambda p: {
+        'upper': node('bb_upper', period=p['period'], num_std=p['num_std']),
+        'lower': node('bb_lower', period=p['period'], num_std=p['num_std']),
+        'middle': _sma('close', p['period']),
+    },
+    period=20, num_std=2.0
+)
+def bb_width(upper, lower, middle, period, num_std):
+    """Bollinger band width ((upper - lower) / middle)"""
+    return (upper - lower) / middle
+
+
+@indicator(
+    'bb_percent_b',
+    inputs=lambda p: {
+        'close': _close(),
+        'upper': node('bb_upper', period=p['period'], num_std=p['num_std']),
+        'lower': node('bb_lower', period=p['period'], num_std=p['num_std']),
+    },
+    period=20, num_std=2.0
+)
+def bb_percent_b(close, upper, lower, period, num_std):
+    """Bollinger %B"""
+    return (close - lower) / (upper - lower).replace(0, np.nan)
+
+
+@indicator(
+    'keltner_upper',
+    inputs=lambda p: {'mid': _ema('close', p['period']), 'atr': node('atr', period=p['period'])},
+    period=20, multiplier=2.0
+)
+def keltner_upper(mid, atr, period, multiplier):
+    """Keltner channel upper"""
+    return mid + multiplier * atr
+
+
+@indicator(
+    'keltner_lower',
+    inputs=lambda p: {'mid': _ema('close', p['period']), 'atr': node('atr', period=p['period'])},
+    period=20, multiplier=2.0
+)
+def keltner_lower(mid, atr, period, multiplier):
+    """Keltner channel lower"""
+    return mid - multiplier * atr
+
+
+@indicator('donchian_upper', inputs=lambda p: {'x': node('rolling_max', source='high', window=p['period'])},
+           period=20)
+def donchian_upper(x, period):
+    """Donchian channel upper (n-bar high)"""
+    return x
+
+
+@indicator('donchian_lower', inputs=lambda p: {'x': node('rolling_min', source='low', window=p['period'])},
+           period=20)
+def donchian_lower(x, period):
+    """Donchian channel lower (n-bar low)"""
+    return x
+
+
+@indicator('hist_volatility', inputs=lambda p: {'x': node('rolling_std', source='returns', window=p['period'])},
+           period=20, annualization=252)
+def hist_volatility(x, period, annualization):
+    """Historical volatility (annualized std of returns)"""
+    return x * np.sqrt(annualization)
+
+
+# ============================================================
+# Volume
+# ============================================================
+
+@indicator('obv', inputs=lambda p: {'delta': NodeKey('delta'), 'volume': _volume()})
+def obv(delta, volume):
+    """On-Balance Volume"""
+    return (np.sign(delta).fillna(0) * volume).cumsum()
+
+
+@indicator('ad_line', inputs=('money_flow_volume',))
+def ad_line(money_flow_volume):
+    """Accumulation/Distribution line"""
+    return money_flow_volume.cumsum()
+
+
+@indicator(
+    'cmf',
+    inputs=lambda p: {
+        'mfv_sum': node('rolling_sum', source='money_flow_volume', window=p['period']),
+        'vol_sum': node('rolling_sum', source='volume', window=p['period']),
+    },
+    period=20
+)
+def cmf(mfv_sum, vol_sum, period):
+    """Chaikin Money Flow"""
+    return mfv_sum / vol_sum.replace(0, np.nan)
+
+
+@indicator('volume_sma', inputs=lambda p: {'x': _sma('volume', p['period'])}, period=20)
+def volume_sma(x, period):
+    """Volume moving average"""
+    return x
+
+
+@indicator(
+    'volume_ratio',
+    inputs=lambda p: {'volume': _volume(), 'avg': _sma('volume', p['period'])},
+    period=20
+)
+def volume_ratio(volume, avg, period):
+    """Volume / Volume MA"""
+    return volume / avg.replace(0, np.nan)
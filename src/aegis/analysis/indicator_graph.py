@@ -0,0 +1,278 @@
+"""
+PROJECT AEGIS - Indicator Graph
+================================
+Declarative indicator registry + DAG evaluator
+
+각 지표는 입력(다른 지표/중간값)과 파라미터를 선언적으로 등록합니다.
+평가기는 요청된 지표에 필요한 노드만 DAG로 풀어서 계산하며,
+True Range, 수익률, rolling 합계/평균/표준편차 같은 공유 중간값은
+한 번만 계산됩니다. 결과는 (ticker, last_timestamp, params) 단위로 메모이즈됩니다.
+
+Usage:
+    engine = get_indicator_engine()
+    result = engine.compute(df, ['rsi', ('sma', {'period': 20}), 'atr'], ticker='005930')
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class NodeKey:
+    """DAG 노드 식별자 (지표명 + 정렬된 파라미터)"""
+    name: str
+    params: Tuple[Tuple[str, Any], ...] = ()
+
+    @property
+    def label(self) -> str:
+        if not self.params:
+            return self.name
+        return self.name + "_" + "_".join(str(v) for _, v in self.params)
+
+
+def node(name: str, **params) -> NodeKey:
+    """NodeKey 생성 헬퍼"""
+    return NodeKey(name, tuple(sorted(params.items())))
+
+
+InputsSpec = Union[Tuple[str, ...], Callable[[Dict[str, Any]], Dict[str, NodeKey]]]
+
+
+@dataclass
+class IndicatorSpec:
+    """지표 정의"""
+    name: str
+    func: Callable[..., pd.Series]
+    inputs: InputsSpec = ()
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    description: str = ""
+    intermediate: bool = False     # 공유 중간값 (카탈로그에서 제외)
+    needs_frame: bool = False      # 원본 DataFrame 필요 (컬럼/인덱스 접근)
+
+    def resolve_params(self, params: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+        resolved = dict(self.defaults)
+        if params:
+            unknown = set(params) - set(self.defaults)
+            if unknown:
+                raise ValueError(f"Unknown parameters for '{self.name}': {sorted(unknown)}")
+            resolved.update(params)
+        return resolved
+
+    def dependencies(self, params: Dict[str, Any]) -> Dict[str, NodeKey]:
+        if callable(self.inputs):
+            return self.inputs(params)
+        return {name: NodeKey(name) for name in self.inputs}
+
+
+class IndicatorRegistry:
+    """
+    지표 레지스트리
+
+    Usage:
+        registry = IndicatorRegistry()
+
+        @registry.indicator('sma', period=20,
+                            inputs=lambda p: {'x': node('rolling_mean', field='close', window=p['period'])})
+        def sma(x, period):
+            return x
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, IndicatorSpec] = {}
+
+    def register(self, spec: IndicatorSpec) -> IndicatorSpec:
+        if spec.name in self._specs:
+            raise ValueError(f"Indicator already registered: {spec.name}")
+        self._specs[spec.name] = spec
+        return spec
+
+    def indicator(
+        self,
+        name: str,
+        inputs: InputsSpec = (),
+        description: str = "",
+        intermediate: bool = False,
+        needs_frame: bool = False,
+        **defaults
+    ) -> Callable:
+        """데코레이터 형태의 등록"""
+        def decorator(func: Callable[..., pd.Series]) -> Callable[..., pd.Series]:
+            self.register(IndicatorSpec(
+                name=name,
+                func=func,
+                inputs=inputs,
+                defaults=defaults,
+                description=description or (func.__doc__ or "").strip(),
+                intermediate=intermediate,
+                needs_frame=needs_frame,
+            ))
+            return func
+        return decorator
+
+    def get(self, name: str) -> IndicatorSpec:
+        if name not in self._specs:
+            raise KeyError(f"Unknown indicator: {name}")
+        return self._specs[name]
+
+    def key(self, name: str, params: Optional[Mapping[str, Any]] = None) -> NodeKey:
+        """파라미터 기본값을 채운 NodeKey"""
+        spec = self.get(name)
+        return NodeKey(name, tuple(sorted(spec.resolve_params(params).items())))
+
+    def catalog(self) -> Dict[str, IndicatorSpec]:
+        """공개 지표 목록 (중간값 제외)"""
+        return {n: s for n, s in self._specs.items() if not s.intermediate}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+
+IndicatorRequest = Union[str, NodeKey, Tuple[str, Mapping[str, Any]]]
+
+
+class IndicatorEngine:
+    """
+    DAG 평가기
+
+    - 요청된 지표의 의존성만 깊이 우선으로 계산 (필요한 것만)
+    - 한 번의 compute() 안에서 공유 중간값 재사용
+    - ticker가 주어지면 (ticker, last_timestamp, len, 마지막 종가) 단위로 노드 결과를 메모이즈
+      (새 봉이 들어오면 해당 종목의 이전 메모는 폐기)
+    """
+
+    def __init__(self, registry: IndicatorRegistry, max_tickers: int = 256):
+        self.registry = registry
+        self.max_tickers = max_tickers
+        self._memo: Dict[str, Tuple[Tuple[Any, ...], Dict[NodeKey, pd.Series]]] = {}
+        self.stats = {'hits': 0, 'computed': 0}
+
+    def _normalize(self, request: IndicatorRequest) -> NodeKey:
+        if isinstance(request, NodeKey):
+            return self.registry.key(request.name, dict(request.params))
+        if isinstance(request, str):
+            return self.registry.key(request)
+        name, params = request
+        return self.registry.key(name, params)
+
+    def _ticker_memo(self, df: pd.DataFrame, ticker: Optional[str]) -> Dict[NodeKey, pd.Series]:
+        ticker = ticker or df.attrs.get('ticker')
+        if not ticker or df.empty:
+            return {}
+
+        # 같은 시점의 봉이 장중 갱신될 수 있으므로 마지막 종가도 키에 포함
+        last_close = df['close'].iloc[-1] if 'close' in df.columns else None
+        version = (df.index[-1], len(df), last_close)
+        entry = self._memo.get(ticker)
+        if entry is None or entry[0] != version:
+            if entry is None and len(self._memo) >= self.max_tickers:
+                self._memo.pop(next(iter(self._memo)))
+            entry = (version, {})
+            self._memo[ticker] = entry
+        return entry[1]
+
+    def _evaluate(
+        self,
+        key: NodeKey,
+        df: pd.DataFrame,
+        memo: Dict[NodeKey, pd.Series],
+        visiting: set
+    ) -> pd.Series:
+        if key in memo:
+            self.stats['hits'] += 1
+            return memo[key]
+        if key in visiting:
+            raise ValueError(f"Cycle detected at indicator '{key.name}'")
+        visiting.add(key)
+
+        spec = self.registry.get(key.name)
+        params = dict(key.params)
+        kwargs = {
+            arg: self._evaluate(self._normalize(dep), df, memo, visiting)
+            for arg, dep in spec.dependencies(params).items()
+        }
+        if spec.needs_frame:
+            kwargs['df'] = df
+
+        result = spec.func(**kwargs, **params)
+        visiting.discard(key)
+        memo[key] = result
+        self.stats['computed'] += 1
+        return result
+
+    def compute(
+        self,
+        df: pd.DataFrame,
+        indicators: Union[Iterable[IndicatorRequest], Mapping[str, IndicatorRequest]],
+        ticker: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        지표 계산
+
+        Args:
+            df: OHLCV DataFrame
+            indicators: 지표 목록 또는 {컬럼명: 지표} 딕셔너리
+            ticker: 메모이즈 키 (없으면 df.attrs['ticker'] 사용, 둘 다 없으면 호출 내에서만 공유)
+
+        Returns:
+            요청한 지표만 담긴 DataFrame (df와 같은 인덱스)
+        """
+        if isinstance(indicators, Mapping):
+            requests = [(alias, self._normalize(req)) for alias, req in indicators.items()]
+        else:
+            requests = []
+            for req in indicators:
+                key = self._normalize(req)
+                alias = req if isinstance(req, str) else key.label
+                requests.append((alias, key))
+
+        memo = self._ticker_memo(df, ticker)
+        columns = {
+            alias: self._evaluate(key, df, memo, set())
+            for alias, key in requests
+        }
+        return pd.DataFrame(columns, index=df.index)
+
+    def compute_one(
+        self,
+        df: pd.DataFrame,
+        name: str,
+        ticker: Optional[str] = None,
+        **params
+    ) -> pd.Series:
+        """단일 지표 계산"""
+        key = self.registry.key(name, params)
+        return self._evaluate(key, df, self._ticker_memo(df, ticker), set())
+
+    def clear_cache(self, ticker: Optional[str] = None):
+        """메모 초기화"""
+        if ticker is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(ticker, None)
+
+
+# 기본 레지스트리 (indicator_catalog에서 채움)
+DEFAULT_REGISTRY = IndicatorRegistry()
+
+# Singleton instance
+_engine_instance: Optional[IndicatorEngine] = None
+
+
+def get_indicator_engine() -> IndicatorEngine:
+    """Get singleton IndicatorEngine instance (기본 카탈로그 포함)"""
+    global _engine_instance
+    if _engine_instance is None:
+        from . import indicator_catalog  # noqa: F401  (카탈로그 등록)
+        _engine_instance = IndicatorEngine(DEFAULT_REGISTRY)
+    return _engine_instance
+
+
+def list_indicators() -> List[str]:
+    """등록된 공개 지표 이름 목록"""
+    get_indicator_engine()
+    return sorted(DEFAULT_REGISTRY.catalog())
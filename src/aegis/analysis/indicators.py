@@ -2,12 +2,15 @@
 PROJECT AEGIS - Technical Indicators Module
 ============================================
 VWAP, RSI, MA calculation functions
+(indicator_graph 기반, 전체 카탈로그는 indicator_catalog 참조)
 """
 
 import pandas as pd
 import numpy as np
 from typing import Optional
 
+from .indicator_graph import get_indicator_engine
+
 
 def calculate_vwap(df: pd.DataFrame) -> pd.Series:
     """
@@ -16,28 +19,7 @@ def calculate_vwap(df: pd.DataFrame) -> pd.Series:
     Note: VWAP은 당일(Intraday) 기준으로 계산됩니다.
     여러 날짜 데이터가 포함된 경우, 날짜별로 리셋됩니다.
     """
-    # float64로 변환 (Decimal 등 object 타입 처리)
-    high = df['high'].astype(float)
-    low = df['low'].astype(float)
-    close = df['close'].astype(float)
-    volume = df['volume'].astype(float)
-
-    typical_price = (high + low + close) / 3
-    tp_vol = typical_price * volume
-
-    # 날짜별 그룹화하여 VWAP 리셋 (여러 날짜 데이터 처리)
-    if hasattr(df.index, 'date'):
-        # DatetimeIndex인 경우 날짜별 그룹화
-        dates = df.index.date
-        cumsum_tp_vol = tp_vol.groupby(dates).cumsum()
-        cumsum_vol = volume.groupby(dates).cumsum()
-    else:
-        # 단일 날짜 또는 date 컬럼이 없는 경우
-        cumsum_tp_vol = tp_vol.cumsum()
-        cumsum_vol = volume.cumsum()
-
-    vwap = cumsum_tp_vol / cumsum_vol
-    return vwap
+    return get_indicator_engine().compute_one(df, 'vwap')
 
 
 def calculate_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -47,34 +29,32 @@ def calculate_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
     Note: 초기 period만큼의 데이터 부족으로 발생하는 NaN은
     중립값(50)으로 채워집니다.
     """
-    delta = df['close'].diff()
-    gain = delta.where(delta > 0, 0)
-    loss = (-delta).where(delta < 0, 0)
-    avg_gain = gain.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    rsi = rsi.replace([np.inf, -np.inf], 100)
-    # 초기 NaN 값을 중립값(50)으로 채움
-    rsi = rsi.fillna(50)
-    return rsi
+    return get_indicator_engine().compute_one(df, 'rsi', period=period)
 
 
 def calculate_ma(df: pd.DataFrame, periods: list = [5, 20, 60]) -> pd.DataFrame:
     """MA (Moving Average) calculation"""
-    result = pd.DataFrame(index=df.index)
-    for period in periods:
-        result[f'ma_{period}'] = df['close'].rolling(window=period).mean()
-    return result
+    return get_indicator_engine().compute(
+        df, {f'ma_{period}': ('sma', {'period': period}) for period in periods}
+    )
 
 
 def calculate_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """Calculate all technical indicators at once"""
+    """
+    Calculate all technical indicators at once
+
+    Note: 지표 그래프로 한 번에 계산하여 종가/rolling 중간값을 공유합니다.
+    """
     result = df.copy()
-    result['vwap'] = calculate_vwap(df)
-    result['rsi'] = calculate_rsi(df)
-    ma_df = calculate_ma(df)
-    result = pd.concat([result, ma_df], axis=1)
+    indicators = get_indicator_engine().compute(df, {
+        'vwap': 'vwap',
+        'rsi': 'rsi',
+        'ma_5': ('sma', {'period': 5}),
+        'ma_20': ('sma', {'period': 20}),
+        'ma_60': ('sma', {'period': 60}),
+    })
+    for column in indicators.columns:
+        result[column] = indicators[column]
     return result
 
 
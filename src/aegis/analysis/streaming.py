@@ -0,0 +1,580 @@
+"""
+PROJECT AEGIS - Streaming Indicators Module
+============================================
+O(1) incremental SMA, RSI, EMA, ATR, VWAP for live ticks
+
+Note: 각 지표는 update(bar) 호출마다 상수 시간으로 갱신되며,
+to_state()/from_state()로 직렬화되어 프로세스 재시작 후에도 이어서 계산됩니다.
+결과는 indicators.py의 배치 계산(calculate_all_indicators)과 동일한 정의를 따릅니다.
+"""
+
+import json
+import math
+import os
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+import pandas as pd
+
+from .signal import SignalResult, score_to_signal
+
+
+def _bar_value(bar: Mapping[str, Any], key: str) -> float:
+    """bar(dict / pandas Series)에서 float 값 추출 (Decimal 등 처리)"""
+    return float(bar[key])
+
+
+def _bar_timestamp(bar: Mapping[str, Any]) -> Optional[Any]:
+    """bar의 시점 (timestamp > date > name 순)"""
+    for key in ('timestamp', 'date', 'datetime'):
+        if key in bar and bar[key] is not None:
+            return bar[key]
+    return getattr(bar, 'name', None)
+
+
+def _session_key(timestamp: Any) -> Optional[str]:
+    """VWAP 리셋 기준 세션 키 (거래일)"""
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, str):
+        return timestamp[:10]
+    if isinstance(timestamp, datetime):
+        return timestamp.date().isoformat()
+    if isinstance(timestamp, date):
+        return timestamp.isoformat()
+    return None
+
+
+class StreamingIndicator:
+    """Streaming indicator base class"""
+
+    def update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        raise NotImplementedError
+
+    def snapshot(self) -> Optional[float]:
+        raise NotImplementedError
+
+    def to_state(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingIndicator":
+        raise NotImplementedError
+
+    @property
+    def is_ready(self) -> bool:
+        return self.snapshot() is not None
+
+
+class RollingSMA(StreamingIndicator):
+    """
+    Ring-buffer SMA
+
+    close.rolling(window=period).mean()과 동일 (period개 미만이면 None)
+    누적 오차를 막기 위해 버퍼가 한 바퀴 돌 때마다 합계를 재계산합니다.
+    """
+
+    def __init__(self, period: int, field: str = 'close'):
+        self.period = period
+        self.field = field
+        self._buffer: List[float] = []
+        self._pos = 0
+        self._sum = 0.0
+
+    def push(self, value: float) -> Optional[float]:
+        if len(self._buffer) < self.period:
+            self._buffer.append(value)
+            self._sum += value
+        else:
+            self._sum += value - self._buffer[self._pos]
+            self._buffer[self._pos] = value
+            self._pos = (self._pos + 1) % self.period
+            if self._pos == 0:
+                self._sum = math.fsum(self._buffer)
+        return self.snapshot()
+
+    def update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        return self.push(_bar_value(bar, self.field))
+
+    def snapshot(self) -> Optional[float]:
+        if len(self._buffer) < self.period:
+            return None
+        return self._sum / self.period
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'period': self.period,
+            'field': self.field,
+            'buffer': list(self._buffer),
+            'pos': self._pos,
+            'sum': self._sum,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RollingSMA":
+        obj = cls(state['period'], state.get('field', 'close'))
+        obj._buffer = list(state['buffer'])
+        obj._pos = state['pos']
+        obj._sum = state['sum']
+        return obj
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    EMA
+
+    close.ewm(span=period, adjust=False, min_periods=period).mean()과 동일
+    """
+
+    def __init__(self, period: int, field: str = 'close'):
+        self.period = period
+        self.field = field
+        self.alpha = 2 / (period + 1)
+        self._value: Optional[float] = None
+        self._count = 0
+
+    def push(self, value: float) -> Optional[float]:
+        if self._value is None:
+            self._value = value
+        else:
+            self._value = (1 - self.alpha) * self._value + self.alpha * value
+        self._count += 1
+        return self.snapshot()
+
+    def update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        return self.push(_bar_value(bar, self.field))
+
+    def snapshot(self) -> Optional[float]:
+        if self._count < self.period:
+            return None
+        return self._value
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'period': self.period,
+            'field': self.field,
+            'value': self._value,
+            'count': self._count,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingEMA":
+        obj = cls(state['period'], state.get('field', 'close'))
+        obj._value = state['value']
+        obj._count = state['count']
+        return obj
+
+
+class WilderRSI(StreamingIndicator):
+    """
+    Wilder RSI
+
+    calculate_rsi()와 동일: alpha=1/period EWM, 첫 봉의 gain/loss는 0,
+    period개 미만이거나 avg_gain == avg_loss == 0이면 중립값(50)
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.alpha = 1 / period
+        self._prev_close: Optional[float] = None
+        self._avg_gain: Optional[float] = None
+        self._avg_loss: Optional[float] = None
+        self._count = 0
+
+    def update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        close = _bar_value(bar, 'close')
+        if self._prev_close is None:
+            gain = loss = 0.0
+        else:
+            delta = close - self._prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+        self._prev_close = close
+
+        if self._avg_gain is None:
+            self._avg_gain, self._avg_loss = gain, loss
+        else:
+            self._avg_gain = (1 - self.alpha) * self._avg_gain + self.alpha * gain
+            self._avg_loss = (1 - self.alpha) * self._avg_loss + self.alpha * loss
+        self._count += 1
+        return self.snapshot()
+
+    def snapshot(self) -> Optional[float]:
+        if self._count == 0:
+            return None
+        if self._count < self.period:
+            return 50.0
+        if self._avg_loss == 0:
+            return 100.0 if self._avg_gain > 0 else 50.0
+        rs = self._avg_gain / self._avg_loss
+        return 100 - (100 / (1 + rs))
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'period': self.period,
+            'prev_close': self._prev_close,
+            'avg_gain': self._avg_gain,
+            'avg_loss': self._avg_loss,
+            'count': self._count,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "WilderRSI":
+        obj = cls(state['period'])
+        obj._prev_close = state['prev_close']
+        obj._avg_gain = state['avg_gain']
+        obj._avg_loss = state['avg_loss']
+        obj._count = state['count']
+        return obj
+
+
+class StreamingATR(StreamingIndicator):
+    """
+    ATR (True Range의 단순 이동평균)
+
+    RiskManager.calculate_atr()와 동일한 정의
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._prev_close: Optional[float] = None
+        self._tr = RollingSMA(period, field='tr')
+
+    def update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        high = _bar_value(bar, 'high')
+        low = _bar_value(bar, 'low')
+        close = _bar_value(bar, 'close')
+
+        true_range = high - low
+        if self._prev_close is not None:
+            true_range = max(
+                true_range,
+                abs(high - self._prev_close),
+                abs(low - self._prev_close),
+            )
+        self._prev_close = close
+        return self._tr.push(true_range)
+
+    def snapshot(self) -> Optional[float]:
+        return self._tr.snapshot()
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'period': self.period,
+            'prev_close': self._prev_close,
+            'tr': self._tr.to_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingATR":
+        obj = cls(state['period'])
+        obj._prev_close = state['prev_close']
+        obj._tr = RollingSMA.from_state(state['tr'])
+        return obj
+
+
+class SessionVWAP(StreamingIndicator):
+    """
+    Session-reset VWAP
+
+    calculate_vwap()와 동일: typical price = (H+L+C)/3
+    session_reset=True면 bar 시점의 날짜가 바뀔 때 누적값을 리셋,
+    False면 날짜 정보가 없는 데이터(RangeIndex)처럼 전체 누적
+    window를 지정하면 최근 window개 bar만 누적 (최근 N일 일봉으로 계산한 VWAP과 동일)
+    """
+
+    def __init__(self, session_reset: bool = True, window: Optional[int] = None):
+        self.session_reset = session_reset
+        self.window = window
+        self._session: Optional[str] = None
+        self._tp_vol = 0.0
+        self._vol = 0.0
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._tp_vols = RollingSMA(self.window) if self.window else None
+        self._vols = RollingSMA(self.window) if self.window else None
+
+    def update(self, bar: Mapping[str, Any]) -> Optional[float]:
+        if self.session_reset:
+            session = _session_key(_bar_timestamp(bar))
+            if session != self._session:
+                self._session = session
+                self._tp_vol = 0.0
+                self._vol = 0.0
+                self._reset_window()
+
+        typical_price = (
+            _bar_value(bar, 'high') + _bar_value(bar, 'low') + _bar_value(bar, 'close')
+        ) / 3
+        volume = _bar_value(bar, 'volume')
+        if self.window:
+            # 링 버퍼 합계 (창 밖으로 나간 bar는 빠짐)
+            self._tp_vols.push(typical_price * volume)
+            self._vols.push(volume)
+            self._tp_vol = self._tp_vols._sum
+            self._vol = self._vols._sum
+        else:
+            self._tp_vol += typical_price * volume
+            self._vol += volume
+        return self.snapshot()
+
+    def snapshot(self) -> Optional[float]:
+        if self._vol == 0:
+            return None
+        return self._tp_vol / self._vol
+
+    def to_state(self) -> Dict[str, Any]:
+        state = {
+            'session_reset': self.session_reset,
+            'window': self.window,
+            'session': self._session,
+            'tp_vol': self._tp_vol,
+            'vol': self._vol,
+        }
+        if self.window:
+            state['tp_vols'] = self._tp_vols.to_state()
+            state['vols'] = self._vols.to_state()
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "SessionVWAP":
+        obj = cls(state['session_reset'], state.get('window'))
+        obj._session = state['session']
+        obj._tp_vol = state['tp_vol']
+        obj._vol = state['vol']
+        if obj.window:
+            obj._tp_vols = RollingSMA.from_state(state['tp_vols'])
+            obj._vols = RollingSMA.from_state(state['vols'])
+        return obj
+
+
+class StreamingSignal:
+    """
+    Incremental AEGIS signal (signal.calculate_signal_score의 마지막 행과 동일)
+
+    - 새 시점의 bar: 상태를 체크포인트한 뒤 갱신
+    - 같은 시점의 bar (장중 일봉 갱신): 체크포인트로 되돌린 뒤 다시 적용
+
+    Usage:
+        tracker = StreamingSignal.from_history(df)
+        tracker.update(latest_bar)
+        result = tracker.signal_result()
+    """
+
+    MA_PERIODS = (5, 20, 60)
+
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        oversold: int = 30,
+        overbought: int = 70,
+        vwap_session_reset: bool = True,
+        vwap_window: Optional[int] = None
+    ):
+        self.rsi_period = rsi_period
+        self.oversold = oversold
+        self.overbought = overbought
+        self.ma = {period: RollingSMA(period) for period in self.MA_PERIODS}
+        self.rsi = WilderRSI(rsi_period)
+        self.vwap = SessionVWAP(vwap_session_reset, vwap_window)
+        self.last_timestamp: Optional[str] = None
+        self.last_close: Optional[float] = None
+        self._checkpoint: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame, **kwargs) -> "StreamingSignal":
+        """과거 OHLCV로 상태 초기화 (1회성 O(n) 워밍업)"""
+        tracker = cls(**kwargs)
+        has_datetime_index = isinstance(df.index, pd.DatetimeIndex)
+        for idx, row in zip(df.index, df.to_dict('records')):
+            if has_datetime_index:
+                row.setdefault('timestamp', idx)
+            tracker.update(row)
+        return tracker
+
+    def _indicator_state(self) -> Dict[str, Any]:
+        return {
+            'ma': {str(p): sma.to_state() for p, sma in self.ma.items()},
+            'rsi': self.rsi.to_state(),
+            'vwap': self.vwap.to_state(),
+            'last_timestamp': self.last_timestamp,
+            'last_close': self.last_close,
+        }
+
+    def _load_indicator_state(self, state: Dict[str, Any]) -> None:
+        self.ma = {int(p): RollingSMA.from_state(s) for p, s in state['ma'].items()}
+        self.rsi = WilderRSI.from_state(state['rsi'])
+        self.vwap = SessionVWAP.from_state(state['vwap'])
+        self.last_timestamp = state['last_timestamp']
+        self.last_close = state['last_close']
+
+    def update(self, bar: Mapping[str, Any]) -> Dict[str, Any]:
+        """bar 1개 반영 후 snapshot 반환"""
+        timestamp = _bar_timestamp(bar)
+        ts_key = timestamp.isoformat() if hasattr(timestamp, 'isoformat') else (
+            str(timestamp) if timestamp is not None else None
+        )
+
+        if ts_key is not None and ts_key == self.last_timestamp and self._checkpoint:
+            # 같은 시점의 갱신된 봉: 직전 상태로 되돌린 후 재적용
+            self._load_indicator_state(self._checkpoint)
+        else:
+            self._checkpoint = self._indicator_state()
+
+        for sma in self.ma.values():
+            sma.update(bar)
+        self.rsi.update(bar)
+        self.vwap.update(bar)
+        self.last_timestamp = ts_key
+        self.last_close = _bar_value(bar, 'close')
+        return self.snapshot()
+
+    def _scores(self) -> Dict[str, int]:
+        ma_5, ma_20, ma_60 = (self.ma[p].snapshot() for p in self.MA_PERIODS)
+        ma_score = 0
+        if None not in (ma_5, ma_20, ma_60):
+            if ma_5 > ma_20 > ma_60:
+                ma_score = 1
+            elif ma_5 < ma_20 < ma_60:
+                ma_score = -1
+
+        vwap = self.vwap.snapshot()
+        vwap_score = 1 if (vwap is not None and self.last_close > vwap) else -1
+
+        rsi = self.rsi.snapshot()
+        rsi_score = 0
+        if rsi is not None:
+            if rsi < self.oversold:
+                rsi_score = 1
+            elif rsi > self.overbought:
+                rsi_score = -1
+
+        return {
+            'ma_score': ma_score,
+            'vwap_score': vwap_score,
+            'rsi_score': rsi_score,
+            'total_score': ma_score + vwap_score + rsi_score,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 지표값 및 점수"""
+        result = {
+            'timestamp': self.last_timestamp,
+            'close': self.last_close,
+            'vwap': self.vwap.snapshot(),
+            'rsi': self.rsi.snapshot(),
+        }
+        for period, sma in self.ma.items():
+            result[f'ma_{period}'] = sma.snapshot()
+        result.update(self._scores())
+        result['signal'] = score_to_signal(result['total_score']).value
+        return result
+
+    def signal_result(self) -> SignalResult:
+        """get_current_signal()과 같은 형식의 결과"""
+        snap = self.snapshot()
+        return SignalResult(
+            signal=score_to_signal(snap['total_score']),
+            score=snap['total_score'],
+            ma_score=snap['ma_score'],
+            vwap_score=snap['vwap_score'],
+            rsi_score=snap['rsi_score'],
+            details={
+                'close': snap['close'],
+                'vwap': snap['vwap'],
+                'rsi': snap['rsi'],
+                'ma_5': snap['ma_5'],
+                'ma_20': snap['ma_20'],
+                'ma_60': snap['ma_60'],
+            }
+        )
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'rsi_period': self.rsi_period,
+            'oversold': self.oversold,
+            'overbought': self.overbought,
+            'indicators': self._indicator_state(),
+            'checkpoint': self._checkpoint,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingSignal":
+        obj = cls(
+            rsi_period=state['rsi_period'],
+            oversold=state['oversold'],
+            overbought=state['overbought'],
+        )
+        obj._load_indicator_state(state['indicators'])
+        obj._checkpoint = state.get('checkpoint')
+        return obj
+
+
+class StreamingStateStore:
+    """
+    종목별 StreamingSignal 상태 저장소 (JSON 파일)
+
+    cron 프로세스가 매번 새로 뜨더라도 지표 상태를 이어서 사용합니다.
+    임시 파일 + os.replace로 원자적으로 저장합니다.
+    """
+
+    STATE_FILE = Path("data/streaming_indicator_state.json")
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else self.STATE_FILE
+        self._trackers: Dict[str, StreamingSignal] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._trackers = {
+                key: StreamingSignal.from_state(state)
+                for key, state in data.get('trackers', {}).items()
+            }
+        except Exception:
+            # 손상된 상태 파일은 무시하고 워밍업부터 다시 시작
+            self._trackers = {}
+
+    def get(self, key: str) -> Optional[StreamingSignal]:
+        return self._trackers.get(key)
+
+    def put(self, key: str, tracker: StreamingSignal) -> None:
+        self._trackers[key] = tracker
+
+    def remove(self, key: str) -> None:
+        self._trackers.pop(key, None)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'trackers': {key: t.to_state() for key, t in self._trackers.items()},
+            'updated_at': datetime.now().isoformat(),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+# Singleton instance
+_store_instance: Optional[StreamingStateStore] = None
+
+
+def get_streaming_state_store() -> StreamingStateStore:
+    """Get singleton StreamingStateStore instance"""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = StreamingStateStore()
+    return _store_instance
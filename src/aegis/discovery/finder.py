@@ -77,6 +77,7 @@ class OpportunityFinder:
     MIN_AEGIS_SCORE = 2.5  # AEGIS 분석 시 최소 점수
     MIN_SCANNER_SCORE = 1.5  # Scanner만 사용 시 최소 점수
     MAX_DEEP_ANALYSIS = 30  # 심층 분석 최대 종목 수 (API 비용 절감)
+    DEEP_ANALYSIS_CONCURRENCY = 5  # 심층 분석 동시 종목 수
     CONSECUTIVE_BONUS = 0.3  # 연속 추천 가산점
 
     def __init__(self, market: str = "KOSPI"):
@@ -204,9 +205,11 @@ class OpportunityFinder:
         self,
         candidates: List[CandidateStock]
     ) -> List[DiscoveryResult]:
-        """AEGIS InformationFusionEngine으로 심층 분석"""
-        results = []
+        """
+        AEGIS InformationFusionEngine으로 심층 분석
 
+        analyze_many: 시장 공통 컨텍스트는 1회만 계산, 종목별 분석은 동시 실행
+        """
         try:
             from src.aegis.fusion.engine import InformationFusionEngine
             engine = InformationFusionEngine()
@@ -216,11 +219,23 @@ class OpportunityFinder:
 
         print(f"\n🔬 AEGIS 심층 분석 중... ({len(candidates)}개)")
 
-        for i, c in enumerate(candidates):
-            try:
-                # InformationFusionEngine 분석
-                fusion_result = await engine.analyze(c.code)
+        fusion_results = {}
+        try:
+            async for fusion_result in engine.analyze_many(
+                [c.code for c in candidates],
+                concurrency=self.DEEP_ANALYSIS_CONCURRENCY,
+            ):
+                fusion_results[fusion_result.ticker] = fusion_result
+                if len(fusion_results) % 10 == 0:
+                    print(f"   진행: {len(fusion_results)}/{len(candidates)}")
+        except Exception as e:
+            # 시장 공통 분석 실패 등: 완료된 종목 외에는 Scanner 점수 사용
+            print(f"   ⚠️ AEGIS 배치 분석 중단: {e}")
 
+        results = []
+        for c in candidates:
+            fusion_result = fusion_results.get(c.code)
+            if fusion_result is not None:
                 result = DiscoveryResult(
                     code=c.code,
                     name=c.name,
@@ -240,10 +255,7 @@ class OpportunityFinder:
                 )
                 results.append(result)
 
-                if (i + 1) % 10 == 0:
-                    print(f"   진행: {i + 1}/{len(candidates)}")
-
-            except Exception as e:
+            else:
                 # 분석 실패시 Scanner 점수만 사용
                 result = DiscoveryResult(
                     code=c.code,
@@ -10,10 +10,12 @@ InvestmentReporter - Phase 9.5 AI 투자 리포트 생성기
 - 대응 전략 (목표가/손절가)
 """
 import asyncio
-from datetime import datetime
+import json
+from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+from src.gemini.batcher import BatchTask, GeminiBatcher
 from src.gemini.client import GeminiClient
 from .finder import DiscoveryResult
 
@@ -55,8 +57,34 @@ class InvestmentReporter:
     Gemini를 활용한 상세 분석 리포트 생성
     """
 
+    # 같은 추천 데이터로 재실행 시 리포트 재사용 (Gemini 응답 캐시)
+    REPORT_CACHE_TTL = timedelta(hours=12)
+
+    # 일괄 생성 시 여러 종목을 한 번의 호출로 묶는 JSON 리포트 (종목 코드 키)
+    BATCH_TASK = BatchTask(
+        name="investment_report",
+        instructions="""당신은 한국 주식 전문 애널리스트입니다. 다음 종목들에 대한 상세 투자 분석 리포트를 작성해주세요.
+분석은 객관적이고 구체적으로 작성하되, 투자 결정에 실질적으로 도움이 되도록 해주세요.""",
+        fields={
+            'executive_summary': ('string', '핵심 요약 2-3문장, 이 종목을 왜 주목해야 하는지'),
+            'investment_points': ('array', '투자 포인트 3개 (구체적 근거 포함 문자열)'),
+            'technical_analysis': ('string', '차트 패턴, 이평선 배열, RSI 등 기술적 분석'),
+            'supply_analysis': ('string', '외국인/기관 매매 동향 및 수급 분석'),
+            'catalyst_analysis': ('string', '업종 동향, 뉴스, 이슈 등 재료/모멘텀'),
+            'bull_scenario': ('string', '긍정 시나리오: 조건과 예상 주가'),
+            'bear_scenario': ('string', '부정 시나리오: 리스크 요인과 예상 주가'),
+            'target_price': ('number', '목표가 (원, 숫자만)'),
+            'stop_loss': ('number', '손절가 (원, 숫자만)'),
+            'strategy': ('string', '구체적인 매매 전략 제안'),
+        },
+        output_tokens_per_item=1500,
+    )
+
     def __init__(self):
         self.gemini = GeminiClient()
+        self.batcher = GeminiBatcher(
+            self.gemini, self.BATCH_TASK, max_batch=5, cache_ttl=self.REPORT_CACHE_TTL
+        )
         self.reports: Dict[str, InvestmentReport] = {}
 
     async def generate_report(
@@ -77,7 +105,7 @@ class InvestmentReporter:
         prompt = self._build_prompt(result, additional_data)
 
         try:
-            response = await self.gemini.generate_content(prompt)
+            response = await self.gemini.generate_content(prompt, cache_ttl=self.REPORT_CACHE_TTL)
             if not response:
                 return self._create_fallback_report(result)
 
@@ -104,37 +132,37 @@ class InvestmentReporter:
         Returns:
             리포트 리스트
         """
-        reports = []
         targets = results[:max_reports]
 
         print(f"\n📝 AI 투자 리포트 생성 중... ({len(targets)}개)")
 
-        for i, r in enumerate(targets, 1):
-            print(f"   [{i}/{len(targets)}] {r.name}...")
-            report = await self.generate_report(r)
-            reports.append(report)
-
-            # Rate limiting (Gemini API 제한)
-            if i < len(targets):
-                await asyncio.sleep(1)
+        # 종목별 요청을 GeminiBatcher가 묶어서 호출 (RPM/TPM 예산은 GeminiClient가 관리)
+        reports = await asyncio.gather(*[self._generate_batched(r) for r in targets])
 
         print(f"   ✅ 리포트 생성 완료")
-        return reports
+        return list(reports)
 
-    def _build_prompt(
-        self,
-        result: DiscoveryResult,
-        additional_data: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """AI 분석 프롬프트 생성"""
+    async def _generate_batched(self, result: DiscoveryResult) -> InvestmentReport:
+        """배치 JSON 응답으로 리포트 생성 (실패 시 기본 리포트)"""
+        try:
+            data = await self.batcher.submit(result.code, self._describe(result))
+        except Exception as e:
+            print(f"   ⚠️ AI 리포트 생성 실패 ({result.name}): {e}")
+            data = None
 
-        # 기본 정보
+        if not data:
+            return self._create_fallback_report(result)
+
+        report = self._report_from_json(result, data)
+        self.reports[result.code] = report
+        return report
+
+    def _describe(self, result: DiscoveryResult) -> str:
+        """종목 분석 데이터 (단건/배치 프롬프트 공통)"""
         badge_info = f"[{result.badge}] " if result.badge else ""
         reasons = ", ".join(result.key_reasons) if result.key_reasons else "없음"
 
-        prompt = f"""당신은 한국 주식 전문 애널리스트입니다. 다음 종목에 대한 상세 투자 분석 리포트를 작성해주세요.
-
-## 분석 대상
+        return f"""## 분석 대상
 - 종목명: {badge_info}{result.name} ({result.code})
 - 시장: {result.market}
 - 현재가: {result.current_price:,}원
@@ -146,7 +174,18 @@ class InvestmentReporter:
 - 수급 점수: {result.supply_score:.1f}점
 
 ## 선정 근거
-{reasons}
+{reasons}"""
+
+    def _build_prompt(
+        self,
+        result: DiscoveryResult,
+        additional_data: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """AI 분석 프롬프트 생성"""
+
+        prompt = f"""당신은 한국 주식 전문 애널리스트입니다. 다음 종목에 대한 상세 투자 분석 리포트를 작성해주세요.
+
+{self._describe(result)}
 
 ## 요청 사항
 다음 형식으로 상세 분석 리포트를 작성해주세요:
@@ -249,6 +288,37 @@ class InvestmentReporter:
 
         return report
 
+    def _report_from_json(
+        self,
+        result: DiscoveryResult,
+        data: Dict[str, Any]
+    ) -> InvestmentReport:
+        """배치 JSON 응답 → 리포트 (가격이 비정상이면 기본값)"""
+        points = [str(p).strip() for p in data['investment_points'] if str(p).strip()]
+        target_price = int(data['target_price'])
+        stop_loss = int(data['stop_loss'])
+        if target_price <= 0:
+            target_price = int(result.current_price * 1.05)  # +5%
+        if stop_loss <= 0:
+            stop_loss = int(result.current_price * 0.97)  # -3%
+
+        return InvestmentReport(
+            stock_code=result.code,
+            stock_name=result.name,
+            executive_summary=data['executive_summary'].strip(),
+            investment_points=points or [data['executive_summary'].strip()],
+            technical_analysis=data['technical_analysis'].strip(),
+            supply_analysis=data['supply_analysis'].strip(),
+            catalyst_analysis=data['catalyst_analysis'].strip(),
+            bull_scenario=data['bull_scenario'].strip(),
+            bear_scenario=data['bear_scenario'].strip(),
+            target_price=target_price,
+            stop_loss=stop_loss,
+            strategy=data['strategy'].strip(),
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            raw_response=json.dumps(data, ensure_ascii=False)
+        )
+
     def _apply_section(
         self,
         report: InvestmentReport,
@@ -7,6 +7,7 @@ Filters:
 - 유동성: 거래대금 100억 이상
 - 기술적: RSI, 이평선, 골든크로스
 - 수급: 외인/기관 순매수
+- 재무: PER/PBR/재무 등급 (시장 전체 재무 스냅샷)
 """
 import asyncio
 from datetime import datetime, timedelta
@@ -17,6 +18,9 @@ import numpy as np
 
 from pykrx import stock as pykrx
 
+from src.aegis.fusion.supply_panel import get_investor_flow_panel
+from src.aegis.fusion.fundamental import get_fundamental_integrator
+
 
 @dataclass
 class CandidateStock:
@@ -44,6 +48,11 @@ class CandidateStock:
     foreigner_net: int = 0
     institution_net: int = 0
 
+    # Fundamentals (스냅샷 기준일 PER/PBR, 0 = 없음/적자)
+    per: float = 0.0
+    pbr: float = 0.0
+    fundamental_grade: Optional[str] = None
+
     # Scoring
     technical_score: float = 0.0
     supply_score: float = 0.0
@@ -110,6 +119,9 @@ class MarketScanner:
         candidates = await self._add_supply_demand(candidates)
         print(f"   수급 분석 완료: {len(candidates)}")
 
+        # 4-1. 재무 지표 추가
+        candidates = await self._add_fundamentals(candidates)
+
         # 5. 종합 스코어링 및 정렬
         scored_candidates = self._calculate_scores(candidates)
 
@@ -282,30 +294,47 @@ class MarketScanner:
         return float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
 
     async def _add_supply_demand(self, candidates: List[CandidateStock]) -> List[CandidateStock]:
-        """수급 데이터 추가 (외인/기관 순매수)"""
+        """수급 데이터 추가 (외인/기관 순매수) - 시장 전체 수급 패널에서 종목코드 인덱스 조회"""
+        if not candidates:
+            return candidates
+
         try:
-            # 투자자별 거래 데이터
-            for market in ["KOSPI", "KOSDAQ"]:
-                df = pykrx.get_market_net_purchases_of_equities(
-                    self.scan_date, self.scan_date, market=market
-                )
+            panel = get_investor_flow_panel()
+            dates = await panel.load(days=1, end_date=self.scan_date)
+            summary = panel.summary(dates)
+            if summary.empty:
+                return candidates
+
+            flows = summary.reindex([c.code for c in candidates])[['foreign_net', 'inst_net']]
+            flows = flows.fillna(0).astype(np.int64).to_numpy()
+            for candidate, (foreign_net, inst_net) in zip(candidates, flows):
+                candidate.foreigner_net = int(foreign_net)
+                candidate.institution_net = int(inst_net)
 
-                if df.empty:
-                    continue
+        except Exception as e:
+            print(f"   ⚠️ 수급 데이터 조회 실패: {e}")
 
-                df = df.reset_index()
+        return candidates
 
-                for candidate in candidates:
-                    if candidate.market != market:
-                        continue
+    async def _add_fundamentals(self, candidates: List[CandidateStock]) -> List[CandidateStock]:
+        """재무 지표 추가 (PER/PBR/등급) - 시장 전체 재무 스냅샷에서 종목코드 인덱스 조회"""
+        if not candidates:
+            return candidates
 
-                    if candidate.code in df['종목코드'].values if '종목코드' in df.columns else False:
-                        row = df[df['종목코드'] == candidate.code].iloc[0]
-                        candidate.foreigner_net = int(row.get('외국인', 0))
-                        candidate.institution_net = int(row.get('기관', 0))
+        try:
+            graded = await get_fundamental_integrator().analyze_market(self.scan_date)
+            if graded.empty:
+                return candidates
+
+            rows = graded.reindex([c.code for c in candidates])
+            values = rows[['per', 'pbr']].fillna(0.0).to_numpy(dtype=float)
+            for candidate, (per, pbr), grade in zip(candidates, values, rows['grade']):
+                candidate.per = float(per)
+                candidate.pbr = float(pbr)
+                candidate.fundamental_grade = grade if isinstance(grade, str) else None
 
         except Exception as e:
-            print(f"   ⚠️ 수급 데이터 조회 실패: {e}")
+            print(f"   ⚠️ 재무 데이터 조회 실패: {e}")
 
         return candidates
 
@@ -4,6 +4,7 @@ PROJECT AEGIS - Strategy Orchestrator
 Ensemble engine that blends multiple strategy signals based on market regime
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -60,6 +61,9 @@ class StrategyOrchestrator(StrategyInterface):
         self.sell_threshold = sell_threshold
         self.min_agreement = min_agreement
         self._current_regime: Optional[RegimeResult] = None
+        # 백테스트용 전 구간 국면 시리즈 (classify_series, 데이터 변경 시 재계산)
+        self._regime_series: Optional[pd.DataFrame] = None
+        self._regime_series_key: Optional[Tuple] = None
 
     def add_strategy(
         self,
@@ -89,6 +93,87 @@ class StrategyOrchestrator(StrategyInterface):
         """Get current market regime"""
         return self.regime_classifier.classify(df)
 
+    def _ensure_regime_series(self, df: pd.DataFrame) -> pd.DataFrame:
+        key = self._frame_key(df)
+        if self._regime_series is None or self._regime_series_key != key:
+            self._regime_series = self.regime_classifier.classify_series(df)
+            self._regime_series_key = key
+        return self._regime_series
+
+    def _regime_at(self, df: pd.DataFrame, index: int) -> RegimeResult:
+        """Regime at bar index, looked up from the precomputed series"""
+        return self.regime_classifier.result_at(self._ensure_regime_series(df), index)
+
+    def prepare(self, df: pd.DataFrame) -> None:
+        """Precompute regime series and member strategy state"""
+        self._ensure_regime_series(df)
+        for config in self.registry.get_all_strategies(enabled_only=True):
+            config.strategy.prepare(df)
+        super().prepare(df)
+
+    def supports_vectorized(self) -> bool:
+        strategies = self.registry.get_all_strategies(enabled_only=True)
+        return all(config.strategy.supports_vectorized() for config in strategies)
+
+    def signal_arrays(self, df: pd.DataFrame) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Ensemble entry/exit conditions as matrix operations
+
+        Votes: (bars x strategies) buy/sell matrices from member signal_arrays().
+        Weights: (regimes x strategies) table indexed by the regime series.
+        Same rules as aggregate_signals(): weighted score vs thresholds plus
+        the min_agreement vote ratio. Returns None if any member has no
+        vectorized conditions.
+        """
+        strategies = self.registry.get_all_strategies(enabled_only=True)
+        n_bars = len(df)
+        if not strategies:
+            empty = np.zeros(n_bars, dtype=bool)
+            return empty, empty
+
+        member_conditions = []
+        for config in strategies:
+            conditions = config.strategy.signal_arrays(df)
+            if conditions is None:
+                return None
+            member_conditions.append(conditions)
+
+        buy_votes = np.column_stack([np.asarray(c[0], dtype=bool) for c in member_conditions])
+        sell_votes = np.column_stack([np.asarray(c[1], dtype=bool) for c in member_conditions])
+
+        regimes = list(MarketRegime)
+        weight_table = np.array([
+            [w for _, _, w in self.registry.get_strategies_for_regime(regime, enabled_only=True)]
+            for regime in regimes
+        ])
+        regime_codes = pd.Categorical(
+            self._ensure_regime_series(df)['regime'],
+            categories=[r.value for r in regimes]
+        ).codes
+        weights = weight_table[regime_codes]               # (bars x strategies)
+        total_weight = np.zeros(n_bars)
+        buy_weighted = np.zeros(n_bars)
+        sell_weighted = np.zeros(n_bars)
+        for j in range(len(strategies)):                   # 전략 순서대로 누적 (per-bar 경로와 동일한 합산 순서)
+            total_weight += weights[:, j]
+            buy_weighted += buy_votes[:, j] * weights[:, j]
+            sell_weighted -= sell_votes[:, j] * weights[:, j]
+
+        has_weight = total_weight > 0
+        safe_total = np.where(has_weight, total_weight, 1.0)
+        flat_score = np.where(has_weight, buy_weighted / safe_total, 0.0)
+        held_score = np.where(has_weight, sell_weighted / safe_total, 0.0)
+        buy_ratio = buy_votes.sum(axis=1) / len(strategies)
+        sell_ratio = sell_votes.sum(axis=1) / len(strategies)
+
+        buy = (flat_score >= self.buy_threshold) & (buy_ratio >= self.min_agreement)
+        sell = (
+            (held_score < self.buy_threshold)
+            & (held_score <= self.sell_threshold)
+            & (sell_ratio >= self.min_agreement)
+        )
+        return buy, sell
+
     def _signal_to_score(self, signal: OrderType) -> float:
         """Convert OrderType to numeric score"""
         if signal == OrderType.BUY:
@@ -202,9 +287,8 @@ class StrategyOrchestrator(StrategyInterface):
         2. Get weighted signals from all strategies
         3. Return aggregated decision
         """
-        # Get market regime
-        df_slice = df.iloc[:index+1]
-        self._current_regime = self.get_market_regime(df_slice)
+        # Get market regime (precomputed series lookup)
+        self._current_regime = self._regime_at(df, index)
 
         # Aggregate signals
         ensemble = self.aggregate_signals(df, index, self._current_regime.regime)
@@ -225,10 +309,14 @@ class StrategyOrchestrator(StrategyInterface):
 
         Use this for debugging or display purposes
         """
-        df_slice = df.iloc[:index+1]
-        self._current_regime = self.get_market_regime(df_slice)
+        self._current_regime = self._regime_at(df, index)
         return self.aggregate_signals(df, index, self._current_regime.regime)
 
+    def reset(self) -> None:
+        super().reset()
+        self._regime_series = None
+        self._regime_series_key = None
+
     def print_status(self):
         """Print current orchestrator status"""
         print("\n" + "=" * 50)
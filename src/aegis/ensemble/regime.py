@@ -13,7 +13,9 @@ import pandas as pd
 import numpy as np
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from ..analysis.indicator_graph import get_indicator_engine
 
 
 class MarketRegime(Enum):
@@ -62,33 +64,26 @@ class MarketRegimeClassifier:
         self.atr_period = atr_period
         self.trend_threshold = trend_threshold
         self.sideway_threshold = sideway_threshold
+        # ticker -> ((last_date, len, last_close), regime series)
+        self._series_cache: Dict[str, Tuple[Tuple, pd.DataFrame]] = {}
+        self.max_cached_tickers = 256
 
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate required indicators for regime detection"""
         result = df.copy()
-
-        # Moving Averages
-        close = df['close'].astype(float)
-        result['ma_short'] = close.rolling(window=self.ma_short_period).mean()
-        result['ma_long'] = close.rolling(window=self.ma_long_period).mean()
-
-        # MA Gap (percentage)
-        result['ma_gap'] = (result['ma_short'] - result['ma_long']) / result['ma_long']
-
-        # Volatility (ATR / Close)
-        high = df['high'].astype(float)
-        low = df['low'].astype(float)
-        prev_close = close.shift(1)
-
-        tr1 = high - low
-        tr2 = abs(high - prev_close)
-        tr3 = abs(low - prev_close)
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = true_range.rolling(window=self.atr_period).mean()
-        result['volatility'] = atr / close
-
-        # Trend Strength (MA slope over 5 periods)
-        result['ma_slope'] = result['ma_short'].diff(5) / result['ma_short'].shift(5)
+        indicators = get_indicator_engine().compute(df, {
+            # Moving Averages
+            'ma_short': ('sma', {'period': self.ma_short_period}),
+            'ma_long': ('sma', {'period': self.ma_long_period}),
+            # MA Gap (percentage)
+            'ma_gap': ('ma_gap', {'short': self.ma_short_period, 'long': self.ma_long_period}),
+            # Volatility (ATR / Close)
+            'volatility': ('atr_ratio', {'period': self.atr_period}),
+            # Trend Strength (MA slope over 5 periods)
+            'ma_slope': ('ma_slope', {'period': self.ma_short_period, 'lag': 5}),
+        })
+        for column in indicators.columns:
+            result[column] = indicators[column]
 
         return result
 
@@ -160,6 +155,102 @@ class MarketRegimeClassifier:
             trend_strength=float(trend_strength)
         )
 
+    def classify_series(self, df: pd.DataFrame, ticker: Optional[str] = None) -> pd.DataFrame:
+        """
+        Classify regime for every bar in one vectorized pass
+
+        Row i equals classify(df.iloc[:i+1]) (all indicators are causal).
+        With a ticker (or df.attrs['ticker']) the result is cached per
+        (ticker, last_date) so repeated live calls on the same data are free.
+
+        Returns:
+            DataFrame[regime, confidence, ma_short, ma_long, volatility, trend_strength]
+        """
+        ticker = ticker or df.attrs.get('ticker')
+        version = None
+        if ticker and not df.empty:
+            last_close = df['close'].iloc[-1] if 'close' in df.columns else None
+            version = (df.index[-1], len(df), last_close)
+            cached = self._series_cache.get(ticker)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+        indicators = get_indicator_engine().compute(df, {
+            'ma_short': ('sma', {'period': self.ma_short_period}),
+            'ma_long': ('sma', {'period': self.ma_long_period}),
+            'ma_gap': ('ma_gap', {'short': self.ma_short_period, 'long': self.ma_long_period}),
+            'volatility': ('atr_ratio', {'period': self.atr_period}),
+            'ma_slope': ('ma_slope', {'period': self.ma_short_period, 'lag': 5}),
+        }, ticker=ticker)
+
+        ma_short = indicators['ma_short'].to_numpy(dtype=float)
+        ma_long = indicators['ma_long'].to_numpy(dtype=float)
+        ma_gap = indicators['ma_gap'].to_numpy(dtype=float)
+        volatility = indicators['volatility'].to_numpy(dtype=float)
+        ma_slope = indicators['ma_slope'].to_numpy(dtype=float)
+
+        valid = ~(np.isnan(ma_short) | np.isnan(ma_long))
+        if self.trend_threshold > 0:
+            trend_strength = np.abs(ma_gap) / self.trend_threshold
+        else:
+            trend_strength = np.zeros(len(df))
+
+        with np.errstate(invalid='ignore'):
+            bull = valid & (ma_gap > self.trend_threshold)
+            bear = valid & (ma_gap < -self.trend_threshold)
+            trend_confidence = np.minimum(1.0, 0.5 + trend_strength * 0.5)
+            bull_confidence = np.where(ma_slope > 0, np.minimum(1.0, trend_confidence + 0.1), trend_confidence)
+            bear_confidence = np.where(ma_slope < 0, np.minimum(1.0, trend_confidence + 0.1), trend_confidence)
+            sideway_confidence = np.where(volatility < 0.02, 0.7, 0.6)
+
+        regime = np.where(
+            bull, MarketRegime.BULL.value,
+            np.where(bear, MarketRegime.BEAR.value, MarketRegime.SIDEWAY.value)
+        )
+        confidence = np.where(
+            bull, bull_confidence,
+            np.where(bear, bear_confidence, np.where(valid, sideway_confidence, 0.5))
+        )
+
+        result = pd.DataFrame({
+            'regime': regime,
+            'confidence': confidence,
+            'ma_short': np.where(np.isnan(ma_short), 0.0, ma_short),
+            'ma_long': np.where(np.isnan(ma_long), 0.0, ma_long),
+            'volatility': np.where(np.isnan(volatility), 0.0, volatility),
+            'trend_strength': np.where(valid, trend_strength, 0.0),
+        }, index=df.index)
+
+        if version is not None:
+            if ticker not in self._series_cache and len(self._series_cache) >= self.max_cached_tickers:
+                self._series_cache.pop(next(iter(self._series_cache)))
+            self._series_cache[ticker] = (version, result)
+        return result
+
+    @staticmethod
+    def result_at(series: pd.DataFrame, index: int) -> RegimeResult:
+        """classify_series() row -> RegimeResult"""
+        row = series.iloc[index]
+        return RegimeResult(
+            regime=MarketRegime(row['regime']),
+            confidence=float(row['confidence']),
+            ma_short=float(row['ma_short']),
+            ma_long=float(row['ma_long']),
+            volatility=float(row['volatility']),
+            trend_strength=float(row['trend_strength'])
+        )
+
+    def classify_latest(self, df: pd.DataFrame, ticker: Optional[str] = None) -> RegimeResult:
+        """Current regime via the cached series (live use)"""
+        return self.result_at(self.classify_series(df, ticker=ticker), -1)
+
+    def clear_cache(self, ticker: Optional[str] = None):
+        """Clear cached regime series"""
+        if ticker is None:
+            self._series_cache.clear()
+        else:
+            self._series_cache.pop(ticker, None)
+
     def get_regime_series(self, df: pd.DataFrame) -> pd.Series:
         """
         Get regime for each row in DataFrame
@@ -167,17 +258,4 @@ class MarketRegimeClassifier:
         Returns:
             Series with MarketRegime values
         """
-        indicators = self.calculate_indicators(df)
-
-        def row_to_regime(row):
-            ma_gap = row['ma_gap']
-            if pd.isna(ma_gap):
-                return MarketRegime.SIDEWAY.value
-            if ma_gap > self.trend_threshold:
-                return MarketRegime.BULL.value
-            elif ma_gap < -self.trend_threshold:
-                return MarketRegime.BEAR.value
-            else:
-                return MarketRegime.SIDEWAY.value
-
-        return indicators.apply(row_to_regime, axis=1)
+        return self.classify_series(df)['regime']
@@ -4,27 +4,39 @@ Multi-modal Information Fusion for Investment Decision
 
 Components:
 - DisclosureAnalyzer: DART 공시 분석
+- DisclosureFeed: 시장 전체 DART 공시 증분 수집 + 거래정지 공시 구독
 - SupplyDemandAnalyzer: 외국인/기관 수급 분석
+- InvestorFlowPanel: 시장 전체 투자자별 순매수 패널 (거래일 단위)
 - FundamentalIntegrator: 재무 건전성 필터
+- FundamentalSnapshot: 시장 전체 재무지표 일별 스냅샷 (PER/PBR/EPS/BPS/DIV)
 - NewsSentimentAnalyzer: 뉴스 감성 분석 (Gemini AI)
+- NewsStoryIndex: 근사 중복 뉴스 묶음 (MinHash-LSH) + story 단위 감성 메모
 - ConsensusMomentumAnalyzer: 증권사 목표가 추세 분석
 - InformationFusionEngine: 종합 점수 계산 (8요소 융합)
 - Global Macro Integration: 미국-한국 커플링 분석 (Phase 4.5)
 """
 
-from .disclosure import DisclosureAnalyzer, analyze_disclosure
+from .disclosure import DisclosureAnalyzer, analyze_disclosure, get_disclosure_feed
+from .disclosure_feed import DisclosureFeed
 from .supply import SupplyDemandAnalyzer, analyze_supply_demand
+from .supply_panel import InvestorFlowPanel, get_investor_flow_panel
 from .fundamental import FundamentalIntegrator, analyze_fundamental
+from .fundamental_snapshot import FundamentalSnapshot, get_fundamental_snapshot
 from .news_sentiment import NewsSentimentAnalyzer, analyze_news_sentiment, NewsSentiment
+from .news_clusters import NewsStoryIndex, get_news_story_index
 from .consensus import ConsensusMomentumAnalyzer, analyze_consensus_momentum, ConsensusTrend
 from .engine import InformationFusionEngine, AegisSignal, get_aegis_signal, get_fusion_engine, FusionResult
 
 __all__ = [
     # Analyzers
     'DisclosureAnalyzer',
+    'DisclosureFeed',
     'SupplyDemandAnalyzer',
+    'InvestorFlowPanel',
     'FundamentalIntegrator',
+    'FundamentalSnapshot',
     'NewsSentimentAnalyzer',
+    'NewsStoryIndex',
     'ConsensusMomentumAnalyzer',
     # Engine
     'InformationFusionEngine',
@@ -36,6 +48,10 @@ __all__ = [
     # Convenience functions
     'get_aegis_signal',
     'get_fusion_engine',
+    'get_investor_flow_panel',
+    'get_fundamental_snapshot',
+    'get_disclosure_feed',
+    'get_news_story_index',
     'analyze_disclosure',
     'analyze_supply_demand',
     'analyze_fundamental',
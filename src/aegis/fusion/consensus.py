@@ -18,6 +18,9 @@ import logging
 import aiohttp
 from pykrx import stock as pykrx
 
+from src.utils.async_cache import AsyncTTLCache
+from src.utils.sqlite_cache import get_l2_cache
+
 
 class ConsensusTrend(Enum):
     """컨센서스 추세"""
@@ -95,7 +98,10 @@ class ConsensusMomentumAnalyzer:
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._cache: Dict[str, Tuple[ConsensusMomentumResult, datetime]] = {}
+        self._cache: AsyncTTLCache[ConsensusMomentumResult] = AsyncTTLCache(
+            "consensus", ttl=self.CACHE_TTL, maxsize=1024, l2=get_l2_cache(),
+            persist=lambda result: result.analyst_count > 0   # 수집 실패/미커버 빈 결과는 L1만
+        )
 
     async def analyze(self, ticker: str) -> ConsensusMomentumResult:
         """
@@ -107,13 +113,11 @@ class ConsensusMomentumAnalyzer:
         Returns:
             ConsensusMomentumResult: 분석 결과
         """
-        # 캐시 확인
-        if ticker in self._cache:
-            cached, cached_at = self._cache[ticker]
-            if datetime.now() - cached_at < self.CACHE_TTL:
-                self.logger.debug(f"Cache hit for {ticker}")
-                return cached
+        # 캐시 조회 (동시 요청은 1회 조회 결과 공유)
+        return await self._cache.get_or_load(ticker, lambda: self._analyze_uncached(ticker))
 
+    async def _analyze_uncached(self, ticker: str) -> ConsensusMomentumResult:
+        """컨센서스 모멘텀 분석 (캐시 miss 시 실행)"""
         self.logger.info(f"Analyzing consensus momentum for {ticker}")
 
         # 1. 현재가 조회
@@ -159,9 +163,6 @@ class ConsensusMomentumAnalyzer:
             }
         )
 
-        # 캐시 저장
-        self._cache[ticker] = (result, datetime.now())
-
         return result
 
     async def _get_current_price(self, ticker: str) -> int:
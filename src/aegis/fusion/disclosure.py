@@ -6,17 +6,22 @@ DART 공시 분석을 통한 투자 신호 생성
 - 공시 제목에서 중요 키워드 감지
 - 점수화 (+2.0 ~ -2.0)
 - Trading Halt 신호 (횡령, 배임 등)
+- 시장 전체 공시 증분 수집 테이블 기반 조회 (DisclosureFeed)
 """
 import asyncio
 import re
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import logging
 
 import OpenDartReader
 from src.config.settings import settings
+from src.aegis.fusion.disclosure_feed import DisclosureFeed
+from src.utils.async_cache import AsyncTTLCache
+from src.utils.keyword_matcher import KeywordMatcher, compact_lower
+from src.utils.sqlite_cache import get_l2_cache
 
 
 class DisclosureImpact(Enum):
@@ -39,6 +44,7 @@ class DisclosureResult:
     disclosures: List[Dict[str, Any]]
     key_events: List[Dict[str, Any]]
     analyzed_at: str
+    degraded: bool = False            # 조회 실패 대체값 (거래정지 여부 미확인)
 
 
 class DisclosureAnalyzer:
@@ -101,8 +107,21 @@ class DisclosureAnalyzer:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.dart = OpenDartReader(settings.DART_API_KEY)
-        self._cache: Dict[str, DisclosureResult] = {}
-        self._cache_ttl = timedelta(minutes=30)
+        # 거래정지/호재/악재 키워드 전체를 한 오토마톤으로 (제목당 1회 스캔)
+        self._matcher = KeywordMatcher.from_tables({
+            'halt': self.HALT_KEYWORDS,
+            'positive': self.POSITIVE_KEYWORDS,
+            'negative': self.NEGATIVE_KEYWORDS,
+        }, normalize=compact_lower)
+        self._cache: AsyncTTLCache[DisclosureResult] = AsyncTTLCache(
+            "disclosure", ttl=timedelta(minutes=30), maxsize=1024, l2=get_l2_cache()
+        )
+        # 시장 전체 공시 수집기: 신규 공시가 들어온 종목은 캐시 무효화, 거래정지는 즉시 표시
+        self.feed = DisclosureFeed(self.dart, self._analyze_title)
+        self.feed.subscribe(self._on_new_filing, halts_only=False)
+        self.feed.subscribe(self._on_halt, halts_only=True)
+        self._windows: set = {30}    # 캐시 키에 쓰인 조회 기간 (days, 상주 수집기는 기본값 무효화)
+        self._halted: Dict[str, Dict[str, Any]] = {}   # 이 프로세스가 수신한 거래정지 공시
 
     async def analyze(self, ticker: str, days: int = 30) -> DisclosureResult:
         """
@@ -115,86 +134,33 @@ class DisclosureAnalyzer:
         Returns:
             DisclosureResult: 분석 결과
         """
-        # 캐시 확인
-        cache_key = f"{ticker}_{days}"
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            cached_time = datetime.fromisoformat(cached.analyzed_at)
-            if datetime.now() - cached_time < self._cache_ttl:
-                self.logger.debug(f"Cache hit for {ticker}")
-                return cached
-
         try:
-            # DART에서 공시 조회
-            disclosures = await self._fetch_disclosures(ticker, days)
-
-            if not disclosures:
-                return DisclosureResult(
-                    ticker=ticker,
-                    score=0.0,
-                    trading_halt=False,
-                    halt_reason=None,
-                    disclosures=[],
-                    key_events=[],
-                    analyzed_at=datetime.now().isoformat()
-                )
-
-            # 공시 분석
-            total_score = 0.0
-            trading_halt = False
-            halt_reason = None
-            key_events = []
-
-            for disc in disclosures:
-                title = disc.get('report_nm', '')
-                score, impact, matched_keyword = self._analyze_title(title)
-
-                if impact == DisclosureImpact.TRADING_HALT:
-                    trading_halt = True
-                    halt_reason = f"위험 공시 감지: {matched_keyword}"
-                    key_events.append({
-                        'title': title,
-                        'date': disc.get('rcept_dt', ''),
-                        'impact': 'TRADING_HALT',
-                        'keyword': matched_keyword,
-                        'score': -999  # 매매 정지
-                    })
-                elif score != 0:
-                    total_score += score
-                    key_events.append({
-                        'title': title,
-                        'date': disc.get('rcept_dt', ''),
-                        'impact': impact.value,
-                        'keyword': matched_keyword,
-                        'score': score
-                    })
-
-            # 점수 정규화 (-2.0 ~ +2.0 범위로 클램핑)
-            final_score = max(-2.0, min(2.0, total_score))
-
-            result = DisclosureResult(
-                ticker=ticker,
-                score=final_score,
-                trading_halt=trading_halt,
-                halt_reason=halt_reason,
-                disclosures=disclosures[:10],  # 최근 10개만
-                key_events=key_events,
-                analyzed_at=datetime.now().isoformat()
+            # 캐시 조회 (동시 요청은 1회 조회 결과 공유, 실패도 잠시 캐시)
+            # 공시 수집은 상주 프로세스(cron/disclosure_feed.py)가 담당, 여기서는 DART 조회 없음
+            self._windows.add(days)
+            result = await self._cache.get_or_load(
+                f"{ticker}_{days}", lambda: self._analyze_uncached(ticker, days)
             )
-
-            # 캐시 저장
-            self._cache[cache_key] = result
-
-            self.logger.info(
-                f"Disclosure analysis for {ticker}: "
-                f"score={final_score:.2f}, halt={trading_halt}, "
-                f"events={len(key_events)}"
+            return await self._apply_halt(result, days)
+        except Exception as e:
+            self.logger.error(f"Failed to analyze disclosures for {ticker}: {e}")
+            return DisclosureResult(
+                ticker=ticker,
+                score=0.0,
+                trading_halt=False,
+                halt_reason=None,
+                disclosures=[],
+                key_events=[],
+                analyzed_at=datetime.now().isoformat(),
+                degraded=True
             )
 
-            return result
+    async def _analyze_uncached(self, ticker: str, days: int) -> DisclosureResult:
+        """공시 분석 (캐시 miss 시 실행)"""
+        # DART에서 공시 조회 (조회 실패는 예외 → negative cache, "공시 없음" 결과로 캐시하지 않음)
+        disclosures = await self._fetch_disclosures(ticker, days)
 
-        except Exception as e:
-            self.logger.error(f"Failed to analyze disclosures for {ticker}: {e}")
+        if not disclosures:
             return DisclosureResult(
                 ticker=ticker,
                 score=0.0,
@@ -205,8 +171,63 @@ class DisclosureAnalyzer:
                 analyzed_at=datetime.now().isoformat()
             )
 
+        # 공시 분석
+        total_score = 0.0
+        trading_halt = False
+        halt_reason = None
+        key_events = []
+
+        for disc in disclosures:
+            title = disc.get('report_nm', '')
+            score, impact, matched_keyword = self._classify(disc)
+
+            if impact == DisclosureImpact.TRADING_HALT:
+                trading_halt = True
+                halt_reason = f"위험 공시 감지: {matched_keyword}"
+                key_events.append({
+                    'title': title,
+                    'date': disc.get('rcept_dt', ''),
+                    'impact': 'TRADING_HALT',
+                    'keyword': matched_keyword,
+                    'score': -999  # 매매 정지
+                })
+            elif score != 0:
+                total_score += score
+                key_events.append({
+                    'title': title,
+                    'date': disc.get('rcept_dt', ''),
+                    'impact': impact.value,
+                    'keyword': matched_keyword,
+                    'score': score
+                })
+
+        # 점수 정규화 (-2.0 ~ +2.0 범위로 클램핑)
+        final_score = max(-2.0, min(2.0, total_score))
+
+        result = DisclosureResult(
+            ticker=ticker,
+            score=final_score,
+            trading_halt=trading_halt,
+            halt_reason=halt_reason,
+            disclosures=disclosures[:10],  # 최근 10개만
+            key_events=key_events,
+            analyzed_at=datetime.now().isoformat()
+        )
+
+        self.logger.info(
+            f"Disclosure analysis for {ticker}: "
+            f"score={final_score:.2f}, halt={trading_halt}, "
+            f"events={len(key_events)}"
+        )
+
+        return result
+
     async def _fetch_disclosures(self, ticker: str, days: int) -> List[Dict[str, Any]]:
-        """DART에서 공시 목록 조회"""
+        """공시 목록 조회 (수집 테이블 인덱스 조회, 불가 시 DART 종목별 조회)"""
+        local = await self.feed.query(ticker, days)
+        if local is not None:
+            return local
+
         try:
             # 종목코드로 회사코드 조회
             corp_code = await asyncio.to_thread(
@@ -237,7 +258,52 @@ class DisclosureAnalyzer:
 
         except Exception as e:
             self.logger.error(f"Failed to fetch disclosures: {e}")
-            return []
+            raise
+
+    def _classify(self, disc: Dict[str, Any]) -> Tuple[float, DisclosureImpact, Optional[str]]:
+        """공시 분류 (수집 시 분류된 공시는 저장된 결과 사용)"""
+        if disc.get('impact'):
+            return disc['score'], DisclosureImpact(disc['impact']), disc.get('keyword')
+        return self._analyze_title(disc.get('report_nm', ''))
+
+    def _on_new_filing(self, filing: Dict[str, Any]):
+        """신규 공시 수신 → 해당 종목 캐시 무효화 (다음 조회 시 재분석)"""
+        for days in self._windows:
+            self._cache.invalidate(f"{filing['stock_code']}_{days}")
+
+    def _on_halt(self, filing: Dict[str, Any]):
+        """거래정지 공시 수신 → 종목 표시 (캐시된 결과에도 즉시 반영)"""
+        self._halted[filing['stock_code']] = filing
+
+    async def _apply_halt(self, result: DisclosureResult, days: int) -> DisclosureResult:
+        """
+        캐시된 결과 이후 들어온 거래정지 공시 반영
+
+        이 프로세스가 수신한 공시와 수집 테이블의 최근 거래정지 목록(다른 프로세스 수집분)을 확인합니다.
+        """
+        if result.trading_halt:
+            return result
+        start = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+        filing = self._halted.get(result.ticker)
+        if filing is not None and filing['rcept_dt'] < start:
+            filing = None
+        if filing is None:
+            halts = await self.feed.recent_halts(days)
+            filing = halts.get(result.ticker) if halts else None
+        if filing is None:
+            return result
+        return replace(
+            result,
+            trading_halt=True,
+            halt_reason=f"위험 공시 감지: {filing.get('keyword')}",
+            key_events=[{
+                'title': filing.get('report_nm', ''),
+                'date': str(filing.get('rcept_dt', '')),
+                'impact': 'TRADING_HALT',
+                'keyword': filing.get('keyword'),
+                'score': -999
+            }] + result.key_events
+        )
 
     def _analyze_title(self, title: str) -> Tuple[float, DisclosureImpact, Optional[str]]:
         """
@@ -246,28 +312,27 @@ class DisclosureAnalyzer:
         Returns:
             (점수, 영향도, 매칭된 키워드)
         """
-        title_normalized = title.replace(' ', '').lower()
+        # 카테고리별로 테이블 순서상 가장 앞선 매칭 키워드 사용
+        matches = self._matcher.unique(title)
 
         # 1. Trading Halt 체크 (최우선)
-        for keyword in self.HALT_KEYWORDS:
-            if keyword in title_normalized:
-                return -999, DisclosureImpact.TRADING_HALT, keyword
+        for match in matches:
+            if match.category == 'halt':
+                return -999, DisclosureImpact.TRADING_HALT, match.keyword
 
         # 2. 호재 체크
-        for score, keywords in self.POSITIVE_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.replace(' ', '').lower() in title_normalized:
-                    impact = (DisclosureImpact.VERY_POSITIVE if score >= 2.0
-                              else DisclosureImpact.POSITIVE)
-                    return score, impact, keyword
+        for match in matches:
+            if match.category == 'positive':
+                impact = (DisclosureImpact.VERY_POSITIVE if match.weight >= 2.0
+                          else DisclosureImpact.POSITIVE)
+                return match.weight, impact, match.keyword
 
         # 3. 악재 체크
-        for score, keywords in self.NEGATIVE_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.replace(' ', '').lower() in title_normalized:
-                    impact = (DisclosureImpact.VERY_NEGATIVE if score <= -1.5
-                              else DisclosureImpact.NEGATIVE)
-                    return score, impact, keyword
+        for match in matches:
+            if match.category == 'negative':
+                impact = (DisclosureImpact.VERY_NEGATIVE if match.weight <= -1.5
+                          else DisclosureImpact.NEGATIVE)
+                return match.weight, impact, match.keyword
 
         # 4. 중립
         return 0.0, DisclosureImpact.NEUTRAL, None
@@ -289,6 +354,11 @@ def get_disclosure_analyzer() -> DisclosureAnalyzer:
     return _analyzer_instance
 
 
+def get_disclosure_feed() -> DisclosureFeed:
+    """Get singleton DisclosureFeed instance (DisclosureAnalyzer와 DART 클라이언트 공유)"""
+    return get_disclosure_analyzer().feed
+
+
 # Convenience function
 async def analyze_disclosure(ticker: str, days: int = 30) -> DisclosureResult:
     """공시 분석 편의 함수"""
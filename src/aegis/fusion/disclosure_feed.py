@@ -0,0 +1,455 @@
+"""
+Disclosure Feed - Phase 4
+시장 전체 DART 공시 증분 수집기
+
+종목마다 find_corp_code + dart.list(30일)를 반복 호출하는 대신:
+- 시장 전체 공시 목록을 워터마크(마지막 접수번호의 접수일)부터 주기적으로 1회 조회
+- 신규 공시는 dart_disclosures 테이블에 저장 (제목 분류 점수/영향도/키워드 포함)
+- DisclosureAnalyzer는 (stock_code, rcept_dt) 인덱스 조회로 종목 공시를 읽음
+- 거래정지(TRADING_HALT) 공시는 수집 즉시 구독자에게 전달
+
+워터마크는 테이블의 MAX(rcept_no)라 프로세스 간 공유되며, 첫 실행은 BACKFILL_DAYS만큼
+백그라운드 Task 1개로 적재. 증분 조회는 DART list.json을 최신순으로 한 페이지씩 받아
+워터마크 이하 접수번호가 나오면 멈춤 (dart.list는 기간 전체 페이지를 받으므로 일일 한도 소진).
+공시 접수 시간(평일 ACTIVE_HOURS) 밖에서는 IDLE_INTERVAL 간격으로만 조회. 조회는 상주 프로세스(cron/disclosure_feed.py)가 담당하고,
+성공 시각을 dart_feed_status에 기록해 다른 프로세스가 테이블 신선도를 판단합니다.
+조회 실패 시 FAILURE_BACKOFF부터 2배씩(최대 MAX_BACKOFF) 재조회를 미룹니다.
+
+Usage:
+    feed = get_disclosure_feed()
+    feed.subscribe(on_halt)                 # on_halt(filing) - 동기/비동기 함수
+    await feed.run(interval=30)             # 상주 프로세스
+    rows = await feed.query('005930', days=30)
+    halts = await feed.recent_halts(days=30)
+"""
+import asyncio
+import inspect
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+import requests
+
+from src.config.database import db
+
+# 공시 1건 → (점수, 영향도 Enum, 매칭 키워드)
+Classifier = Callable[[str], Tuple[float, Any, Optional[str]]]
+Subscriber = Callable[[Dict[str, Any]], Any]
+
+
+class DisclosureFeed:
+    """
+    DART 공시 증분 수집 + 로컬 조회
+
+    Args:
+        dart: OpenDartReader 인스턴스 (DisclosureAnalyzer와 공유)
+        classify: 공시 제목 분류 함수 (DisclosureAnalyzer._analyze_title)
+    """
+
+    # DART 공시 목록 컬럼 (dart.list 결과와 같은 키로 반환)
+    COLUMNS: Tuple[str, ...] = (
+        'rcept_no', 'rcept_dt', 'stock_code', 'corp_code', 'corp_name',
+        'corp_cls', 'report_nm', 'flr_nm', 'rm',
+    )
+
+    HALT_IMPACT = "trading_halt"
+
+    LIST_URL = "https://opendart.fss.or.kr/api/list.json"
+    PAGE_SIZE = 100          # list.json page_count 상한
+    ACTIVE_HOURS = (7, 19)   # 평일 공시 접수/게시 시간 [시작, 끝)
+    IDLE_INTERVAL = 900      # 초, ACTIVE_HOURS 밖(야간/주말) 조회 간격
+    POLL_INTERVAL = 60       # 초, sync() 호출 시 이보다 오래되면 재조회
+    BACKFILL_DAYS = 30       # 테이블이 비어 있을 때 초기 적재 기간
+    FAILURE_BACKOFF = 60     # 초, 조회 실패 후 재조회 대기 (연속 실패 시 2배)
+    MAX_BACKOFF = 900        # 초, 재조회 대기 상한
+    STALE_AFTER = 180        # 초, 마지막 성공 조회가 이보다 오래되면 query()는 None
+    STATUS_TTL = 10          # 초, dart_feed_status/거래정지 목록 재조회 간격
+
+    def __init__(self, dart: Any, classify: Classifier):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.dart = dart
+        self.classify = classify
+        self.available = True                        # DB 사용 가능 여부
+        self.watermark: Optional[str] = None         # 마지막 접수번호
+        self.coverage_start: Optional[str] = None    # 적재 시작일 (YYYYMMDD)
+        self.last_poll: Optional[float] = None       # 마지막 성공 조회 (monotonic)
+        self.last_failure: Optional[float] = None    # 마지막 실패 조회 (monotonic)
+        self.failures = 0                            # 연속 실패 횟수
+        self._subscribers: List[Tuple[Subscriber, bool]] = []
+        self._lock = asyncio.Lock()
+        self._backfill_task: Optional[asyncio.Task] = None
+        self._loaded = False
+        # 다른 프로세스의 조회 성공 시각 / 최근 거래정지 종목 (monotonic 조회 시각, 값)
+        self._status: Tuple[float, Optional[datetime]] = (float('-inf'), None)
+        self._halts: Tuple[float, int, Dict[str, Dict[str, Any]]] = (float('-inf'), 0, {})
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: Subscriber, halts_only: bool = True) -> Callable[[], None]:
+        """
+        신규 공시 구독 (초기 적재분은 전달하지 않음)
+
+        Args:
+            callback: 공시 dict(COLUMNS + score/impact/keyword)를 받는 함수
+            halts_only: True면 거래정지 공시만 전달
+
+        Returns:
+            구독 해제 함수
+        """
+        entry = (callback, halts_only)
+        self._subscribers.append(entry)
+        return lambda: self._subscribers.remove(entry) if entry in self._subscribers else None
+
+    async def _publish(self, filings: List[Dict[str, Any]]):
+        for filing in filings:
+            is_halt = filing['impact'] == self.HALT_IMPACT
+            if is_halt:
+                self.logger.warning(
+                    f"Trading halt disclosure: {filing['stock_code']} {filing['report_nm']}"
+                )
+            for callback, halts_only in list(self._subscribers):
+                if halts_only and not is_halt:
+                    continue
+                try:
+                    result = callback(filing)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    self.logger.error(f"Disclosure subscriber failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    async def _ensure_db(self) -> bool:
+        if not self.available:
+            return False
+        if db.pool is None:
+            try:
+                await db.connect()
+            except Exception as e:
+                self.logger.warning(f"dart_disclosures unavailable, using per-ticker DART: {e}")
+                self.available = False
+                return False
+        return True
+
+    async def _load_watermark(self):
+        row = await db.fetchrow("SELECT MAX(rcept_no) AS rcept_no, MIN(rcept_dt) AS start FROM dart_disclosures")
+        if row and row['rcept_no']:
+            self.watermark = row['rcept_no']
+            self.coverage_start = row['start'].strftime("%Y%m%d")
+        self._loaded = True
+
+    def _in_backoff(self) -> bool:
+        if self.last_failure is None:
+            return False
+        delay = min(self.FAILURE_BACKOFF * 2 ** (self.failures - 1), self.MAX_BACKOFF)
+        return time.monotonic() - self.last_failure < delay
+
+    async def _record(self, error: Optional[Exception] = None):
+        """조회 결과 기록 (실패면 backoff, 성공/실패 시각은 dart_feed_status에 공유)"""
+        if error is None:
+            self.last_poll = time.monotonic()
+            self.last_failure = None
+            self.failures = 0
+        else:
+            self.last_failure = time.monotonic()
+            self.failures += 1
+        try:
+            await db.execute(
+                """
+                INSERT INTO dart_feed_status (feed, polled_at, failed_at, error)
+                VALUES ('dart', CASE WHEN $1::text IS NULL THEN NOW() END,
+                        CASE WHEN $1::text IS NOT NULL THEN NOW() END, $1::text)
+                ON CONFLICT (feed) DO UPDATE SET
+                    polled_at = COALESCE(EXCLUDED.polled_at, dart_feed_status.polled_at),
+                    failed_at = COALESCE(EXCLUDED.failed_at, dart_feed_status.failed_at),
+                    error = EXCLUDED.error
+                """,
+                None if error is None else str(error)[:500]
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to update dart_feed_status: {e}")
+
+    async def poll(self) -> List[Dict[str, Any]]:
+        """
+        워터마크 이후 시장 전체 공시 조회 → 저장 → 구독자 전달
+
+        Returns:
+            새로 저장된 공시 (초기 적재 시에는 빈 리스트)
+        """
+        async with self._lock:
+            new = await self._poll_locked()
+        if new:
+            await self._publish(new)
+        return new
+
+    def _is_stale(self, max_age: float) -> bool:
+        return self.last_poll is None or time.monotonic() - self.last_poll > max_age
+
+    async def _poll_locked(self) -> List[Dict[str, Any]]:
+        if not await self._ensure_db() or self._in_backoff():
+            return []
+        try:
+            if self.watermark is None:
+                await self._load_watermark()
+            if self.watermark is None:
+                # 초기 적재는 호출자와 분리된 Task 1개로 (호출자가 취소돼도 재시작하지 않음)
+                if self._backfill_task is None or self._backfill_task.done():
+                    self._backfill_task = asyncio.create_task(self._backfill())
+                return []
+
+            records = await asyncio.to_thread(self._list_since, self.watermark)
+            filings = self._prepare(records)
+            new = await self._store(filings)
+        except Exception as e:
+            self.logger.error(f"Failed to poll DART disclosures: {e}")
+            await self._record(e)
+            return []
+
+        await self._record()
+        if filings:
+            self.watermark = max(self.watermark, max(f['rcept_no'] for f in filings))
+        if new:
+            self.logger.info(f"Disclosure feed: {len(new)} new filings (watermark {self.watermark})")
+        return new
+
+    def _list_since(self, watermark: str) -> List[Dict[str, Any]]:
+        """
+        워터마크 이후 시장 전체 공시 (list.json 최신순 페이지 조회, 워터마크 이하가 나오면 중단)
+
+        평소 조회는 1페이지(요청 1회)로 끝납니다.
+        """
+        params = {
+            'crtfc_key': self.dart.api_key,
+            'bgn_de': watermark[:8],
+            'end_de': datetime.now().strftime("%Y%m%d"),
+            'sort': 'date',
+            'sort_mth': 'desc',
+            'page_count': self.PAGE_SIZE,
+        }
+        records: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            response = requests.get(self.LIST_URL, params={**params, 'page_no': page}, timeout=10)
+            response.raise_for_status()
+            body = response.json()
+            if body.get('status') == '013':     # 조회된 데이터 없음
+                break
+            if body.get('status') != '000':
+                raise RuntimeError(f"DART list.json {body.get('status')}: {body.get('message')}")
+            rows = body.get('list') or []
+            records.extend(r for r in rows if r.get('rcept_no', '') > watermark)
+            if not rows or any(r.get('rcept_no', '') <= watermark for r in rows):
+                break
+            if page >= int(body.get('total_page') or 1):
+                break
+            page += 1
+        return records
+
+    async def _backfill(self):
+        """테이블이 비어 있을 때 BACKFILL_DAYS 적재 (구독자에게는 전달하지 않음)"""
+        today = datetime.now().strftime("%Y%m%d")
+        start = (datetime.now() - timedelta(days=self.BACKFILL_DAYS)).strftime("%Y%m%d")
+        try:
+            df = await asyncio.to_thread(self.dart.list, start=start, end=today)
+            filings = self._prepare(df.to_dict('records') if df is not None else [])
+            new = await self._store(filings)
+        except Exception as e:
+            self.logger.error(f"Failed to backfill DART disclosures: {e}")
+            await self._record(e)
+            return
+
+        async with self._lock:
+            await self._record()
+            if filings:
+                self.watermark = max(self.watermark or '', max(f['rcept_no'] for f in filings))
+                self.coverage_start = min(self.coverage_start or start, start)
+        self.logger.info(f"Disclosure feed backfilled {len(new)} filings since {start}")
+
+    def _prepare(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """상장사 공시만 추려 제목 분류 (점수/영향도/키워드) 추가"""
+        filings = []
+        for record in records:
+            stock_code = (record.get('stock_code') or '').strip()
+            if not stock_code or not record.get('rcept_no'):
+                continue
+            filing = {c: (str(record.get(c) or '').strip()) for c in self.COLUMNS}
+            rcept_dt = record.get('rcept_dt')
+            if hasattr(rcept_dt, 'strftime'):
+                filing['rcept_dt'] = rcept_dt.strftime("%Y%m%d")
+            else:
+                filing['rcept_dt'] = filing['rcept_dt'].replace('-', '')[:8]
+            score, impact, keyword = self.classify(filing['report_nm'])
+            filing.update(score=float(score), impact=getattr(impact, 'value', impact), keyword=keyword)
+            filings.append(filing)
+        return filings
+
+    async def _store(self, filings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """dart_disclosures 저장 (이미 있는 접수번호 제외), 새로 저장된 공시 반환"""
+        if not filings:
+            return []
+        columns = {c: [f[c] for f in filings] for c in self.COLUMNS}
+        columns['rcept_dt'] = [datetime.strptime(d, "%Y%m%d").date() for d in columns['rcept_dt']]
+        rows = await db.fetch(
+            """
+            INSERT INTO dart_disclosures
+                (rcept_no, rcept_dt, stock_code, corp_code, corp_name, corp_cls,
+                 report_nm, flr_nm, rm, score, impact, keyword)
+            SELECT * FROM unnest(
+                $1::varchar[], $2::date[], $3::varchar[], $4::varchar[], $5::varchar[], $6::varchar[],
+                $7::text[], $8::varchar[], $9::varchar[], $10::float8[], $11::varchar[], $12::varchar[]
+            )
+            ON CONFLICT (rcept_no) DO NOTHING
+            RETURNING rcept_no
+            """,
+            *[columns[c] for c in self.COLUMNS],
+            [f['score'] for f in filings],
+            [f['impact'] for f in filings],
+            [f['keyword'] for f in filings]
+        )
+        inserted = {r['rcept_no'] for r in rows}
+        return [f for f in filings if f['rcept_no'] in inserted]
+
+    async def sync(self, max_age: Optional[float] = None) -> bool:
+        """
+        마지막 조회가 max_age(기본 POLL_INTERVAL)초보다 오래됐으면 poll (동시 호출은 1회만 조회)
+
+        Returns:
+            로컬 테이블 조회 가능 여부 (DB 사용 불가/조회가 연속 실패 중이면 False)
+
+        조회 실패 후 backoff 중이거나 초기 적재가 진행 중이면 바로 반환합니다.
+        종목별 분석 경로에서는 호출하지 않습니다 (query()는 신선도만 확인).
+        """
+        max_age = self.POLL_INTERVAL if max_age is None else max_age
+        if self._is_stale(max_age):
+            new = []
+            async with self._lock:
+                if self._is_stale(max_age):
+                    new = await self._poll_locked()
+            if new:
+                await self._publish(new)
+        return self.available and not self._is_stale(max_age * 2)
+
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        """평일 공시 접수 시간(ACTIVE_HOURS) 여부"""
+        now = now or datetime.now()
+        start, end = self.ACTIVE_HOURS
+        return now.weekday() < 5 and start <= now.hour < end
+
+    async def run(self, interval: Optional[float] = None, stop: Optional[asyncio.Event] = None):
+        """
+        상주 폴링 루프 (거래정지 공시를 interval초 안에 구독자에게 전달)
+
+        공시 접수 시간 밖에서는 IDLE_INTERVAL(과 interval 중 긴 쪽) 간격으로 조회합니다.
+        """
+        interval = interval or self.POLL_INTERVAL
+        stop = stop or asyncio.Event()
+        try:
+            while not stop.is_set():
+                await self.poll()
+                delay = interval if self.is_active() else max(interval, self.IDLE_INTERVAL)
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if self._backfill_task is not None and not self._backfill_task.done():
+                self._backfill_task.cancel()
+
+    # ------------------------------------------------------------------
+    # Local query
+    # ------------------------------------------------------------------
+
+    def covers(self, days: int) -> bool:
+        """최근 days일이 적재 구간 안에 있는지"""
+        start = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+        return self.coverage_start is not None and start >= self.coverage_start
+
+    async def is_current(self, max_age: Optional[float] = None) -> bool:
+        """
+        테이블이 max_age(기본 STALE_AFTER)초 안에 조회됐는지 (다른 프로세스의 조회 포함)
+
+        DART 조회 없이 이 프로세스의 마지막 성공 시각 또는 dart_feed_status만 확인합니다.
+        """
+        max_age = self.STALE_AFTER if max_age is None else max_age
+        if not self._is_stale(max_age):
+            return True
+        if not await self._ensure_db():
+            return False
+
+        checked_at, polled_at = self._status
+        if time.monotonic() - checked_at > self.STATUS_TTL:
+            try:
+                if not self._loaded:
+                    await self._load_watermark()
+                polled_at = await db.fetchval(
+                    "SELECT polled_at FROM dart_feed_status WHERE feed = 'dart'"
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to read dart_feed_status: {e}")
+                polled_at = None
+            self._status = (time.monotonic(), polled_at)
+        return polled_at is not None and (datetime.now() - polled_at).total_seconds() <= max_age
+
+    async def recent_halts(self, days: int) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        최근 days일 거래정지 공시 종목 {stock_code: 최신 공시} (STATUS_TTL초 메모)
+
+        Returns:
+            종목별 거래정지 공시, 테이블이 신선하지 않으면 None
+        """
+        if not await self.is_current() or not self.covers(days):
+            return None
+        checked_at, window, halts = self._halts
+        if window != days or time.monotonic() - checked_at > self.STATUS_TTL:
+            start = (datetime.now() - timedelta(days=days)).date()
+            try:
+                rows = await db.fetch(
+                    """
+                    SELECT DISTINCT ON (stock_code) rcept_no, rcept_dt, stock_code, report_nm, keyword
+                    FROM dart_disclosures
+                    WHERE impact = $1 AND rcept_dt >= $2
+                    ORDER BY stock_code, rcept_no DESC
+                    """,
+                    self.HALT_IMPACT, start
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to query trading halt disclosures: {e}")
+                return None
+            halts = {row['stock_code']: row for row in rows}
+            self._halts = (time.monotonic(), days, halts)
+        return halts
+
+    async def query(self, ticker: str, days: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        종목 최근 공시 (최신순, dart.list 결과와 같은 키 + score/impact/keyword)
+
+        DART를 조회하지 않습니다. 상주 수집기가 STALE_AFTER초 안에 조회하지 않았으면 None.
+
+        Returns:
+            공시 목록, 로컬 테이블로 답할 수 없으면 None (호출부에서 DART 직접 조회)
+        """
+        if not await self.is_current() or not self.covers(days):
+            return None
+        start = (datetime.now() - timedelta(days=days)).date()
+        try:
+            rows = await db.fetch(
+                """
+                SELECT rcept_no, rcept_dt, stock_code, corp_code, corp_name, corp_cls,
+                       report_nm, flr_nm, rm, score, impact, keyword
+                FROM dart_disclosures
+                WHERE stock_code = $1 AND rcept_dt >= $2
+                ORDER BY rcept_no DESC
+                """,
+                ticker, start
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to query dart_disclosures for {ticker}: {e}")
+            return None
+        for row in rows:
+            row['rcept_dt'] = row['rcept_dt'].strftime("%Y%m%d")
+        return rows
@@ -9,6 +9,8 @@ Information Fusion Engine - Phase 5.0 (Context Integration)
 - 뉴스 감성 및 컨센서스 모멘텀 통합
 - 글로벌 매크로 커플링 분석 통합 (Phase 4.5)
 - 시장 컨텍스트 및 캘린더 통합 (Phase 5.0)
+- 다종목 배치 분석 analyze_many (시장 공통 컨텍스트 1회 계산, 동시성 제한, 스트리밍)
+- 지연 예산: 분석기별 타임아웃, 누락 요소는 마지막 캐시값 또는 중립(가중치 재정규화)
 
 공식 (9개 요소):
 Score_final = W_tech*S_tech + W_news*S_news + W_disc*S_disc +
@@ -16,8 +18,10 @@ Score_final = W_tech*S_tech + W_news*S_news + W_disc*S_disc +
               W_consensus*S_consensus + W_global*S_global + W_context*S_context
 """
 import asyncio
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from functools import partial
+from typing import Dict, Any, Optional, List, AsyncIterator, Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
@@ -36,6 +40,7 @@ from .supply import SupplyDemandAnalyzer, SupplyDemandResult
 from .fundamental import FundamentalIntegrator, FundamentalResult
 from .news_sentiment import NewsSentimentAnalyzer, NewsSentimentResult
 from .consensus import ConsensusMomentumAnalyzer, ConsensusMomentumResult
+from src.utils.async_cache import AsyncTTLCache
 
 # Phase 4.5 imports (Global Macro)
 from src.aegis.global_macro import get_coupling_analyzer, CouplingResult
@@ -97,6 +102,37 @@ class FusionResult:
     analyzed_at: str = ""
 
 
+@dataclass
+class AnalyzerOutcome:
+    """분석기 1회 실행 결과"""
+    value: Any                  # 분석 결과 (neutral이면 None)
+    elapsed_ms: float
+    status: str                 # "ok" / "cached" (타임아웃·실패 → 마지막 성공값) / "neutral"
+
+
+@dataclass
+class MarketContext:
+    """
+    종목과 무관한 시장 공통 분석 결과 (배치 단위로 1회 계산)
+
+    - outcomes: market_context (MarketScanner.get_full_market_context("KOSPI")),
+      sentiment (시장 심리), calendar (이벤트 캘린더)
+    """
+    outcomes: Dict[str, AnalyzerOutcome]
+
+    @property
+    def market(self) -> Optional[Dict[str, Any]]:
+        return self.outcomes['market_context'].value
+
+    @property
+    def sentiment(self) -> Optional[SentimentResult]:
+        return self.outcomes['sentiment'].value
+
+    @property
+    def calendar(self) -> Optional[CalendarResult]:
+        return self.outcomes['calendar'].value
+
+
 class InformationFusionEngine:
     """
     멀티모달 정보 융합 엔진
@@ -145,6 +181,23 @@ class InformationFusionEngine:
         },
     }
 
+    # 지연 예산 (초): 전체 예산 + 분석기별 타임아웃
+    DEFAULT_DEADLINE = 10.0
+    ANALYZER_TIMEOUTS = {
+        'disclosure': 5.0,
+        'supply': 5.0,
+        'fundamental': 5.0,
+        'news_sentiment': 8.0,     # Gemini 호출
+        'consensus': 5.0,
+        'global_macro': 6.0,       # yfinance
+        'market_context': 6.0,
+        'sentiment': 5.0,
+        'calendar': 5.0,
+        'weights': 3.0,            # DynamicWeightOptimizer (pykrx KOSPI 변동성)
+    }
+    FALLBACK_MAX_AGE = 6 * 3600    # 타임아웃 시 대체값으로 쓸 마지막 결과의 최대 나이 (초)
+    FALLBACK_MAX_ENTRIES = 4096    # 보관할 마지막 결과 수 ((분석기, 종목) 기준 LRU)
+
     # 신호 임계값
     SIGNAL_THRESHOLDS = {
         'strong_buy': 2.0,
@@ -181,6 +234,14 @@ class InformationFusionEngine:
         # Phase 4.5: 동적 가중치 사용 여부
         self._use_dynamic_weights: bool = True
 
+        # 지연 예산 및 분석기별 마지막 성공 결과 ((분석기, 종목) → (시각, 결과))
+        self.deadline: float = self.DEFAULT_DEADLINE
+        self.analyzer_timeouts: Dict[str, float] = dict(self.ANALYZER_TIMEOUTS)
+        self._last_results: AsyncTTLCache[Any] = AsyncTTLCache(
+            "fusion_fallback", ttl=self.FALLBACK_MAX_AGE, maxsize=self.FALLBACK_MAX_ENTRIES,
+            negative_ttl=None
+        )
+
     async def analyze(
         self,
         ticker: str,
@@ -188,6 +249,7 @@ class InformationFusionEngine:
         price_df: Optional[pd.DataFrame] = None,
         technical_score: float = 0.0,
         sector: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> FusionResult:
         """
         종목에 대한 종합 융합 분석 수행
@@ -198,137 +260,269 @@ class InformationFusionEngine:
             price_df: 가격 데이터 (시장 국면 분류용)
             technical_score: 기술적 분석 점수 (외부에서 전달)
             sector: 섹터 (커플링 분석용)
+            deadline: 전체 지연 예산(초), 없으면 self.deadline
 
         Returns:
             FusionResult: 융합 분석 결과
         """
         self.logger.info(f"Starting fusion analysis for {ticker}")
 
-        # 1. 병렬로 모든 분석 수행 (9개 분석기 - Phase 5.0)
-        disclosure_task = self.disclosure_analyzer.analyze(ticker, days=30)
-        supply_task = self.supply_analyzer.analyze(ticker, days=10)
-        fundamental_task = self.fundamental_integrator.analyze(ticker)
-        news_task = self.news_sentiment_analyzer.analyze(ticker, days=3, use_ai=True)
-        consensus_task = self.consensus_analyzer.analyze(ticker)
-        market_task = self.market_scanner.get_full_market_context("KOSPI")
-        coupling_task = self.coupling_analyzer.analyze(ticker, stock_name or ticker, sector)
-
-        # Phase 5.0: 시장 컨텍스트 분석
-        sentiment_task = self.sentiment_meter.analyze()
-        calendar_task = self.calendar_fetcher.analyze(days_ahead=14)
-
-        (disclosure, supply, fundamental, news, consensus, market, coupling,
-         sentiment, calendar) = await asyncio.gather(
-            disclosure_task, supply_task, fundamental_task,
-            news_task, consensus_task, market_task, coupling_task,
-            sentiment_task, calendar_task
+        # 1. 시장 국면(price_df만 사용) → 가중치 조회를 분석기와 동시에 시작 (전체 지연 ≤ deadline)
+        regime = self._get_market_regime(price_df, ticker)
+        weights = self._weights_for({}, regime.regime.value, deadline)
+
+        # 2. 병렬로 모든 분석 수행 (9개 분석기 - Phase 5.0, 분석기별 타임아웃)
+        try:
+            context, analyses = await asyncio.gather(
+                self.get_market_context(deadline),
+                self._gather_ticker_analyses(ticker, stock_name, sector, deadline)
+            )
+            return await self._fuse(ticker, analyses, context, regime, weights, technical_score)
+        finally:
+            weights.cancel()   # 거래정지 조기 반환/예외 시 (완료된 Task면 무시)
+
+    async def _run_analyzer(
+        self,
+        name: str,
+        key: Optional[str],
+        call: Callable[[], Awaitable[Any]],
+        budget: float
+    ) -> AnalyzerOutcome:
+        """
+        분석기 1개 실행 (타임아웃 = min(분석기별 한도, 전체 예산))
+
+        실패/타임아웃 시 FALLBACK_MAX_AGE 이내의 마지막 성공 결과(cached),
+        없으면 None(neutral)을 반환합니다.
+        """
+        timeout = min(self.analyzer_timeouts.get(name, budget), budget)
+        started = time.monotonic()
+        try:
+            value = await asyncio.wait_for(call(), timeout=timeout)
+            elapsed_ms = (time.monotonic() - started) * 1000
+            self._last_results.set((name, key), value)
+            return AnalyzerOutcome(value, round(elapsed_ms, 1), "ok")
+        except asyncio.TimeoutError:
+            self.logger.warning(f"{name} analyzer timed out after {timeout:.1f}s ({key or 'market'})")
+        except Exception as e:
+            self.logger.warning(f"{name} analyzer failed ({key or 'market'}): {e}")
+
+        elapsed_ms = round((time.monotonic() - started) * 1000, 1)
+        if (name, key) in self._last_results:
+            return AnalyzerOutcome(self._last_results.get((name, key)), elapsed_ms, "cached")
+        return AnalyzerOutcome(None, elapsed_ms, "neutral")
+
+    async def get_market_context(self, deadline: Optional[float] = None) -> MarketContext:
+        """시장 공통 분석 (시장 컨텍스트 + 심리 + 캘린더)"""
+        budget = deadline or self.deadline
+        market, sentiment, calendar = await asyncio.gather(
+            self._run_analyzer('market_context', None, partial(self.market_scanner.get_full_market_context, "KOSPI"), budget),
+            self._run_analyzer('sentiment', None, self.sentiment_meter.analyze, budget),
+            self._run_analyzer('calendar', None, partial(self.calendar_fetcher.analyze, days_ahead=14), budget)
+        )
+        return MarketContext(
+            outcomes={'market_context': market, 'sentiment': sentiment, 'calendar': calendar}
         )
 
+    async def _gather_ticker_analyses(
+        self,
+        ticker: str,
+        stock_name: str = "",
+        sector: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, AnalyzerOutcome]:
+        """종목별 분석기 6개 병렬 실행"""
+        budget = deadline or self.deadline
+        calls = {
+            'disclosure': partial(self.disclosure_analyzer.analyze, ticker, days=30),
+            'supply': partial(self.supply_analyzer.analyze, ticker, days=10),
+            'fundamental': partial(self.fundamental_integrator.analyze, ticker),
+            'news_sentiment': partial(self.news_sentiment_analyzer.analyze, ticker, days=3, use_ai=True),
+            'consensus': partial(self.consensus_analyzer.analyze, ticker),
+            'global_macro': partial(self.coupling_analyzer.analyze, ticker, stock_name or ticker, sector),
+        }
+        outcomes = await asyncio.gather(*[
+            self._run_analyzer(name, ticker, call, budget) for name, call in calls.items()
+        ])
+        return dict(zip(calls, outcomes))
+
+    def _weights_for(
+        self,
+        tasks: Dict[str, asyncio.Future],
+        regime: str,
+        deadline: Optional[float] = None
+    ) -> asyncio.Future:
+        """
+        국면별 가중치 조회 Task (tasks 단위 메모이즈, 국면당 1회 - 동시 요청은 같은 Task 공유)
+
+        분석기와 동시에 시작해야 전체 지연이 deadline 안에 들어옵니다.
+        """
+        task = tasks.get(regime)
+        if task is None:
+            task = asyncio.ensure_future(self._get_optimized_weights(regime, deadline or self.deadline))
+            tasks[regime] = task
+        return task
+
+    @staticmethod
+    def _renormalize(weights: Dict[str, float], missing: List[str]) -> Dict[str, float]:
+        """누락 요소를 제외하고 가중치 합을 원래 합으로 재조정"""
+        total = sum(weights.values())
+        remaining = sum(w for k, w in weights.items() if k not in missing)
+        if remaining <= 0:
+            return {k: 0.0 for k in weights}
+        scale = total / remaining
+        return {k: (0.0 if k in missing else w * scale) for k, w in weights.items()}
+
+    async def _fuse(
+        self,
+        ticker: str,
+        analyses: Dict[str, AnalyzerOutcome],
+        context: MarketContext,
+        regime: RegimeResult,
+        weights_task: asyncio.Future,
+        technical_score: float
+    ) -> FusionResult:
+        """
+        분석 결과 융합 → FusionResult (누락 요소는 cached 값 또는 neutral)
+
+        Args:
+            regime: 시장 국면 (_get_market_regime)
+            weights_task: 분석기와 함께 시작한 국면별 가중치 조회 (_weights_for)
+        """
+        outcomes = {**analyses, **context.outcomes}
+        disclosure = analyses['disclosure'].value
+        supply = analyses['supply'].value
+        fundamental = analyses['fundamental'].value
+        news = analyses['news_sentiment'].value
+        consensus = analyses['consensus'].value
+        coupling = analyses['global_macro'].value
+        market, sentiment, calendar = context.market, context.sentiment, context.calendar
+
+        degraded = {name: o.status for name, o in outcomes.items() if o.status != "ok"}
+        timings = {name: o.elapsed_ms for name, o in outcomes.items()}
+
         # 2. Trading Halt 체크 (최우선)
-        if disclosure.trading_halt:
+        if disclosure is not None and disclosure.trading_halt:
             return self._create_halt_result(
                 ticker, disclosure, supply, fundamental,
                 disclosure.halt_reason
             )
+        # 공시를 이번에 확인하지 못했으면 (타임아웃/실패/대체값) 거래정지 여부 미확인 → 매수 신호 차단
+        halt_unverified = (
+            analyses['disclosure'].status != "ok" or disclosure is None or disclosure.degraded
+        )
 
         # 3. Fundamental 필터 체크
-        if not fundamental.pass_filter:
+        fundamental_pass = fundamental.pass_filter if fundamental is not None else True
+        if not fundamental_pass:
             self.logger.warning(
                 f"{ticker} failed fundamental filter: {fundamental.filter_reason}"
             )
             # 필터 실패해도 분석은 계속하되, 점수 페널티
 
-        # 4. 시장 국면 분류
-        regime = self._get_market_regime(price_df)
+        # 4. 시장 국면 분류 (호출자가 분석기 착수 전에 계산)
 
         # 5. 시장 컨텍스트 점수 계산
-        market_score = self._calculate_market_score(market)
+        market_score = self._calculate_market_score(market) if market is not None else None
 
         # 6. 글로벌 커플링 점수 정규화 (-100~100 → -3~+3)
-        global_macro_score = coupling.coupling_score / 33.33
+        global_macro_score = coupling.coupling_score / 33.33 if coupling is not None else None
 
         # 7. Phase 5.0: 시장 컨텍스트 점수 계산
         # Fear & Greed 점수 (0-100) → 정규화 (-3 ~ +3)
         # 50이 중립, 0은 극도의 공포, 100은 극도의 탐욕
-        context_score = (sentiment.sentiment_score - 50) / 16.67
+        context_score = (sentiment.sentiment_score - 50) / 16.67 if sentiment is not None else None
 
         # 캘린더 리스크 조정: 고위험 이벤트 시 점수 하향
-        if calendar.should_reduce_exposure:
+        if context_score is not None and calendar is not None and calendar.should_reduce_exposure:
             context_score *= calendar.position_adjustment
 
-        # 8. 가중치 조회 (동적 또는 정적)
-        weights = await self._get_optimized_weights(regime.regime.value)
+        # 8. 가중치 조회 (동적 또는 정적, 분석기와 동시에 시작한 Task)
+        weights = await asyncio.shield(weights_task)
 
         # 9. 가중치 적용하여 최종 점수 계산 (9개 요소 - Phase 5.0)
-        final_score = (
-            weights['technical'] * technical_score +
-            weights['disclosure'] * disclosure.score +
-            weights['supply'] * supply.score +
-            weights['fundamental'] * fundamental.score +
-            weights['market_context'] * market_score +
-            weights['news_sentiment'] * news.score +
-            weights['consensus'] * consensus.score +
-            weights['global_macro'] * global_macro_score +
-            weights['context'] * context_score
+        # 값이 없는 요소(neutral)는 제외하고 나머지 가중치를 재정규화
+        scores = {
+            'technical': technical_score,
+            'disclosure': disclosure.score if disclosure is not None else None,
+            'supply': supply.score if supply is not None else None,
+            'fundamental': fundamental.score if fundamental is not None else None,
+            'market_context': market_score,
+            'news_sentiment': news.score if news is not None else None,
+            'consensus': consensus.score if consensus is not None else None,
+            'global_macro': global_macro_score,
+            'context': context_score,
+        }
+        missing = [factor for factor, score in scores.items() if score is None]
+        if missing:
+            weights = self._renormalize(weights, missing)
+        final_score = sum(
+            weights[factor] * score for factor, score in scores.items() if score is not None
         )
 
         # 커플링 조정 계수 적용 (강한 커플링 종목만)
-        if coupling.coupling_strength.value in ['strong', 'moderate']:
+        if coupling is not None and coupling.coupling_strength.value in ['strong', 'moderate']:
             final_score *= coupling.adjustment_factor
 
         # Phase 5.0: 캘린더 기반 방어 모드 (Critical 이벤트 시)
-        if calendar.risk_level == "critical":
+        if calendar is not None and calendar.risk_level == "critical":
             final_score *= 0.8  # 20% 페널티
             self.logger.warning(f"Critical calendar event: {calendar.warning_message}")
 
         # Fundamental 필터 실패 시 페널티
-        if not fundamental.pass_filter:
+        if not fundamental_pass:
             final_score -= 0.5
 
-        # 9. 최종 신호 결정
+        # 9. 최종 신호 결정 (거래정지 미확인 시 매수 신호는 HOLD로 fail-closed)
         signal = self._determine_signal(final_score)
-
-        return FusionResult(
-            ticker=ticker,
-            final_score=round(final_score, 3),
-            signal=signal,
-            trading_halt=False,
-            halt_reason=None,
-            disclosure_score=disclosure.score,
-            supply_score=supply.score,
-            fundamental_score=fundamental.score,
-            market_context_score=market_score,
-            technical_score=technical_score,
-            news_sentiment_score=news.score,
-            consensus_score=consensus.score,
-            global_macro_score=round(global_macro_score, 3),
-            context_score=round(context_score, 3),  # Phase 5.0
-            weights_used=weights,
-            regime=regime.regime.value,
-            regime_confidence=regime.confidence,
-            fundamental_pass=fundamental.pass_filter,
-            details={
-                'disclosure_events': len(disclosure.key_events),
-                'supply_pattern': supply.pattern.value,
-                'fundamental_grade': fundamental.grade.value,
-                'market_sentiment': market.get('summary', {}).get('market_sentiment', 'unknown'),
-                'leading_sectors': market.get('summary', {}).get('leading_sectors', []),
+        if halt_unverified and signal in (AegisSignal.STRONG_BUY, AegisSignal.BUY):
+            self.logger.warning(f"{ticker} trading halt check unavailable, {signal.value} held")
+            signal = AegisSignal.HOLD
+
+        details = {
+            # 지연 예산: 누락 요소 (cached: 마지막 성공값 사용, neutral: 가중치 재정규화) 및 분석기별 소요시간
+            'degraded_factors': degraded,
+            'analyzer_timings_ms': timings,
+            'halt_check': 'unverified' if halt_unverified else 'ok',
+        }
+        if disclosure is not None:
+            details['disclosure_events'] = len(disclosure.key_events)
+        if supply is not None:
+            details['supply_pattern'] = supply.pattern.value
+        if fundamental is not None:
+            details['fundamental_grade'] = fundamental.grade.value
+        if market is not None:
+            details['market_sentiment'] = market.get('summary', {}).get('market_sentiment', 'unknown')
+            details['leading_sectors'] = market.get('summary', {}).get('leading_sectors', [])
+        if news is not None:
+            details.update({
                 'news_sentiment': news.sentiment.value,
                 'news_count': news.news_count,
+                'ai_summary': news.ai_summary,
+            })
+        if consensus is not None:
+            details.update({
                 'consensus_trend': consensus.trend.value,
                 'upside_potential': consensus.upside_potential,
-                'ai_summary': news.ai_summary,
-                # Phase 4.5: Global Macro details
+            })
+        if coupling is not None:
+            # Phase 4.5: Global Macro details
+            details.update({
                 'coupling_strength': coupling.coupling_strength.value,
                 'us_sentiment': coupling.us_sentiment.value,
                 'sector_sentiment': coupling.sector_sentiment.value,
                 'coupling_adjustment': coupling.adjustment_factor,
                 'coupling_reason': coupling.analysis_reason,
-                # Phase 5.0: Market Context details
+            })
+        if sentiment is not None:
+            # Phase 5.0: Market Context details
+            details.update({
                 'fear_greed_score': sentiment.sentiment_score,
                 'market_condition': sentiment.condition.value,
                 'position_multiplier': sentiment.position_multiplier,
                 'sentiment_warning': sentiment.warning_message,
+            })
+        if calendar is not None:
+            details.update({
                 'calendar_risk_level': calendar.risk_level,
                 'calendar_risk_score': calendar.risk_score,
                 'calendar_warning': calendar.warning_message,
@@ -337,14 +531,133 @@ class InformationFusionEngine:
                     e.name for e in calendar.upcoming_events
                     if e.impact.value == 'critical' and e.d_day <= 7
                 ],
-            },
+            })
+
+        return FusionResult(
+            ticker=ticker,
+            final_score=round(final_score, 3),
+            signal=signal,
+            trading_halt=False,
+            halt_reason=None,
+            disclosure_score=scores['disclosure'] or 0.0,
+            supply_score=scores['supply'] or 0.0,
+            fundamental_score=scores['fundamental'] or 0.0,
+            market_context_score=market_score or 0.0,
+            technical_score=technical_score,
+            news_sentiment_score=scores['news_sentiment'] or 0.0,
+            consensus_score=scores['consensus'] or 0.0,
+            global_macro_score=round(global_macro_score or 0.0, 3),
+            context_score=round(context_score or 0.0, 3),  # Phase 5.0
+            weights_used=weights,
+            regime=regime.regime.value,
+            regime_confidence=regime.confidence,
+            fundamental_pass=fundamental_pass,
+            details=details,
             analyzed_at=datetime.now().isoformat()
         )
 
-    def _get_market_regime(self, price_df: Optional[pd.DataFrame]) -> RegimeResult:
-        """시장 국면 분류"""
+    async def analyze_many(
+        self,
+        tickers: Sequence[str],
+        concurrency: int = 5,
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None,
+        stock_names: Optional[Dict[str, str]] = None,
+        price_data: Optional[Dict[str, pd.DataFrame]] = None,
+        technical_scores: Optional[Dict[str, float]] = None,
+        sectors: Optional[Dict[str, str]] = None,
+        errors: Optional[Dict[str, Exception]] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[FusionResult]:
+        """
+        다종목 배치 융합 분석 (완료 순서대로 스트리밍)
+
+        - 시장 공통 분석(시장 컨텍스트/심리/캘린더/국면별 가중치)은 배치당 1회
+        - 종목별 분석은 최대 concurrency개 종목 동시 실행 (tickers 순서대로 착수)
+        - top_k: final_score >= min_score (없으면 Trading Halt 제외 전체)인 결과가
+          top_k개 나오면 나머지 분석을 취소하고 종료
+
+        Args:
+            tickers: 종목코드 목록 (우선순위 순)
+            concurrency: 동시 분석 종목 수
+            top_k: 조기 종료 기준 개수
+            min_score: top_k 집계 최소 점수
+            stock_names / price_data / technical_scores / sectors: 종목별 analyze() 인자
+            errors: 전달 시 실패한 종목의 예외를 {ticker: exception}으로 기록
+            deadline: 종목당 지연 예산(초), 없으면 self.deadline
+
+        Yields:
+            FusionResult (실패 종목은 로그 후 건너뜀)
+        """
+        stock_names = stock_names or {}
+        price_data = price_data or {}
+        technical_scores = technical_scores or {}
+        sectors = sectors or {}
+
+        self.logger.info(f"Starting batch fusion analysis for {len(tickers)} tickers")
+        context_task = asyncio.ensure_future(self.get_market_context(deadline))
+        weight_tasks: Dict[str, asyncio.Future] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        pending = iter(tickers)
+
+        async def worker():
+            for ticker in pending:
+                try:
+                    regime = self._get_market_regime(price_data.get(ticker), ticker)
+                    weights = self._weights_for(weight_tasks, regime.regime.value, deadline)
+                    analyses = await self._gather_ticker_analyses(
+                        ticker, stock_names.get(ticker, ""), sectors.get(ticker), deadline
+                    )
+                    context = await asyncio.shield(context_task)
+                    result = await self._fuse(
+                        ticker, analyses, context, regime, weights,
+                        technical_scores.get(ticker, 0.0)
+                    )
+                    await queue.put((ticker, result))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    await queue.put((ticker, e))
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(max(1, min(concurrency, len(tickers))))
+        ]
+        hits = 0
+        try:
+            for _ in range(len(tickers)):
+                ticker, result = await queue.get()
+                if isinstance(result, Exception):
+                    self.logger.warning(f"Fusion analysis failed for {ticker}: {result}")
+                    if errors is not None:
+                        errors[ticker] = result
+                    continue
+
+                yield result
+
+                if top_k is not None and not result.trading_halt:
+                    if min_score is None or result.final_score >= min_score:
+                        hits += 1
+                        if hits >= top_k:
+                            self.logger.info(f"Top-{top_k} reached, stopping batch early")
+                            break
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            for task in [context_task, *weight_tasks.values()]:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(context_task, *weight_tasks.values(), return_exceptions=True)
+
+    def _get_market_regime(
+        self,
+        price_df: Optional[pd.DataFrame],
+        ticker: Optional[str] = None
+    ) -> RegimeResult:
+        """시장 국면 분류 (종목별 (ticker, 마지막 날짜) 국면 시리즈 캐시 사용)"""
         if price_df is not None and len(price_df) >= 60:
-            return self.regime_classifier.classify(price_df)
+            return self.regime_classifier.classify_latest(price_df, ticker=ticker)
 
         # 기본값: SIDEWAY
         return RegimeResult(
@@ -377,13 +690,17 @@ class InformationFusionEngine:
 
         return score
 
-    async def _get_optimized_weights(self, regime: str) -> Dict[str, float]:
+    async def _get_optimized_weights(self, regime: str, budget: Optional[float] = None) -> Dict[str, float]:
         """
         최적화된 가중치 반환 (Phase 5.0)
 
         동적 가중치 사용 시: DynamicWeightOptimizer에서 변동성 기반 조정
         정적 가중치 사용 시: 기본 가중치 반환
+
+        Args:
+            budget: 지연 예산(초), 타임아웃 = min(weights 한도, budget)
         """
+        budget = budget or self.deadline
         default_weights = self.DEFAULT_WEIGHTS.get(regime, self.DEFAULT_WEIGHTS['SIDEWAY'])
 
         # 사용자 정의 가중치 우선
@@ -393,7 +710,10 @@ class InformationFusionEngine:
         # 동적 가중치 사용
         if self._use_dynamic_weights:
             try:
-                weight_adjustment = await self.weight_optimizer.get_optimized_weights(regime)
+                weight_adjustment = await asyncio.wait_for(
+                    self.weight_optimizer.get_optimized_weights(regime),
+                    timeout=min(self.analyzer_timeouts.get('weights', budget), budget)
+                )
                 # 기본 가중치에 누락된 키 추가 (Phase 4.5 global_macro, Phase 5.0 context)
                 adjusted = weight_adjustment.adjusted_weights.copy()
                 if 'global_macro' not in adjusted:
@@ -435,8 +755,8 @@ class InformationFusionEngine:
         self,
         ticker: str,
         disclosure: DisclosureResult,
-        supply: SupplyDemandResult,
-        fundamental: FundamentalResult,
+        supply: Optional[SupplyDemandResult],
+        fundamental: Optional[FundamentalResult],
         halt_reason: str
     ) -> FusionResult:
         """Trading Halt 결과 생성"""
@@ -447,15 +767,15 @@ class InformationFusionEngine:
             trading_halt=True,
             halt_reason=halt_reason,
             disclosure_score=disclosure.score,
-            supply_score=supply.score,
-            fundamental_score=fundamental.score,
+            supply_score=supply.score if supply is not None else 0.0,
+            fundamental_score=fundamental.score if fundamental is not None else 0.0,
             market_context_score=0.0,
             technical_score=0.0,
             context_score=0.0,  # Phase 5.0
             weights_used={},
             regime='N/A',
             regime_confidence=0.0,
-            fundamental_pass=fundamental.pass_filter,
+            fundamental_pass=fundamental.pass_filter if fundamental is not None else True,
             details={'halt_reason': halt_reason},
             analyzed_at=datetime.now().isoformat()
         )
@@ -6,6 +6,7 @@ Fundamental Integrator - Phase 4
 - 부채비율, ROE, 영업이익률 분석
 - 부실 기업 필터링
 - 우량 기업 가점
+- 시장 전체 재무 스냅샷 기반 조회/벡터 등급 (FundamentalSnapshot)
 """
 import asyncio
 from datetime import datetime, timedelta
@@ -14,8 +15,14 @@ from dataclasses import dataclass
 from enum import Enum
 import logging
 
+import numpy as np
+import pandas as pd
 from pykrx import stock
 
+from src.aegis.fusion.fundamental_snapshot import get_fundamental_snapshot
+from src.utils.async_cache import AsyncTTLCache
+from src.utils.sqlite_cache import get_l2_cache
+
 
 class FundamentalGrade(Enum):
     """재무 등급"""
@@ -62,8 +69,16 @@ class FundamentalIntegrator:
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._cache: Dict[str, FundamentalResult] = {}
-        self._cache_ttl = timedelta(hours=6)  # 재무 데이터는 자주 안 바뀜
+        # 재무 데이터는 자주 안 바뀜 (메모리 6시간, 디스크 1일: 다음 날 cron도 재사용)
+        self._cache: AsyncTTLCache[FundamentalResult] = AsyncTTLCache(
+            "fundamental", ttl=timedelta(hours=6), maxsize=4096,
+            l2=get_l2_cache(), l2_ttl=timedelta(days=1),
+            persist=lambda result: bool(result.metrics)    # 데이터 없음 결과는 디스크에 남기지 않음
+        )
+        self.snapshot = get_fundamental_snapshot()
+        self._graded: pd.DataFrame = pd.DataFrame()    # 스냅샷 기준일 전 종목 등급
+        self._graded_rows: Dict[str, tuple] = {}        # 종목코드 → (score, grade, pass_filter)
+        self._graded_date: Optional[str] = None
 
     async def analyze(self, ticker: str) -> FundamentalResult:
         """
@@ -75,48 +90,85 @@ class FundamentalIntegrator:
         Returns:
             FundamentalResult: 분석 결과
         """
-        # 캐시 확인
-        if ticker in self._cache:
-            cached = self._cache[ticker]
-            cached_time = datetime.fromisoformat(cached.analyzed_at)
-            if datetime.now() - cached_time < self._cache_ttl:
-                self.logger.debug(f"Cache hit for {ticker}")
-                return cached
-
         try:
-            # pykrx에서 재무 데이터 조회
-            fundamentals = await self._fetch_fundamentals(ticker)
-
-            if not fundamentals:
-                return self._unknown_result(ticker)
-
-            # 분석 수행
-            score, grade, pass_filter, filter_reason = self._analyze_fundamentals(fundamentals)
-
-            result = FundamentalResult(
-                ticker=ticker,
-                score=score,
-                grade=grade,
-                pass_filter=pass_filter,
-                filter_reason=filter_reason,
-                metrics=fundamentals,
-                analyzed_at=datetime.now().isoformat()
-            )
-
-            # 캐시 저장
-            self._cache[ticker] = result
-
-            self.logger.info(
-                f"Fundamental analysis for {ticker}: "
-                f"score={score:.2f}, grade={grade.value}, pass={pass_filter}"
-            )
-
-            return result
+            # 시장 전체 스냅샷에 있으면 dict 조회만으로 결과 생성 (네트워크 없음)
+            result = await self._from_snapshot(ticker)
+            if result is not None:
+                return result
 
+            # 캐시 조회 (동시 요청은 1회 조회 결과 공유, 실패도 잠시 캐시)
+            return await self._cache.get_or_load(ticker, lambda: self._analyze_uncached(ticker))
         except Exception as e:
             self.logger.error(f"Failed to analyze fundamentals for {ticker}: {e}")
             return self._unknown_result(ticker)
 
+    async def analyze_market(self, date: Optional[str] = None) -> pd.DataFrame:
+        """
+        시장 전체 재무 등급 (스냅샷 기준일 1회 계산)
+
+        Returns:
+            스냅샷 컬럼 + score / grade / pass_filter (index: 종목코드, 실패 시 빈 DataFrame)
+        """
+        snapshot_date = await self.snapshot.load(date)
+        if snapshot_date is None:
+            return pd.DataFrame()
+        if self._graded_date != snapshot_date:
+            graded = self.grade_frame(self.snapshot.frame)
+            grades = [FundamentalGrade(g) for g in graded['grade']]
+            self._graded_rows = dict(zip(
+                graded.index,
+                zip(graded['score'].tolist(), grades, graded['pass_filter'].tolist())
+            ))
+            self._graded = graded
+            self._graded_date = snapshot_date
+        return self._graded
+
+    async def _from_snapshot(self, ticker: str) -> Optional[FundamentalResult]:
+        """스냅샷 기반 결과 (스냅샷 미적재/미포함 종목이면 None)"""
+        await self.analyze_market()
+        row = self._graded_rows.get(ticker)
+        if row is None:
+            return None
+        score, grade, pass_filter = row
+        return FundamentalResult(
+            ticker=ticker,
+            score=score,
+            grade=grade,
+            pass_filter=pass_filter,
+            filter_reason=None,
+            metrics=self.snapshot.get(ticker),
+            analyzed_at=datetime.now().isoformat()
+        )
+
+    async def _analyze_uncached(self, ticker: str) -> FundamentalResult:
+        """재무 분석 (캐시 miss 시 실행)"""
+        # pykrx에서 재무 데이터 조회
+        fundamentals = await self._fetch_fundamentals(ticker)
+
+        if not fundamentals:
+            # 대체값은 캐시하지 않음: negative cache(짧은 TTL) 후 analyze()가 _unknown_result 반환
+            raise LookupError(f"No fundamental data for {ticker}")
+
+        # 분석 수행
+        score, grade, pass_filter, filter_reason = self._analyze_fundamentals(fundamentals)
+
+        result = FundamentalResult(
+            ticker=ticker,
+            score=score,
+            grade=grade,
+            pass_filter=pass_filter,
+            filter_reason=filter_reason,
+            metrics=fundamentals,
+            analyzed_at=datetime.now().isoformat()
+        )
+
+        self.logger.info(
+            f"Fundamental analysis for {ticker}: "
+            f"score={score:.2f}, grade={grade.value}, pass={pass_filter}"
+        )
+
+        return result
+
     async def _fetch_fundamentals(self, ticker: str) -> Dict[str, Any]:
         """pykrx에서 재무 데이터 조회"""
         try:
@@ -166,7 +218,7 @@ class FundamentalIntegrator:
 
         except Exception as e:
             self.logger.error(f"Failed to fetch fundamentals: {e}")
-            return {}
+            raise
 
     def _analyze_fundamentals(
         self, metrics: Dict[str, Any]
@@ -245,6 +297,42 @@ class FundamentalIntegrator:
 
         return final_score, grade, pass_filter, filter_reason
 
+    def grade_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        _analyze_fundamentals의 전 종목 벡터 버전 (ROE/PER/PBR/배당 기준)
+
+        스냅샷에는 부채비율/영업이익률이 없으므로 해당 항목은 가감점 없음.
+        가감점 순서가 같아 종목별 점수는 스칼라 버전과 동일합니다.
+        """
+        roe = frame['roe'].to_numpy(dtype=float)
+        per = frame['per'].to_numpy(dtype=float)
+        pbr = frame['pbr'].to_numpy(dtype=float)
+        div_yield = frame['div_yield'].to_numpy(dtype=float)
+
+        score = np.zeros(len(frame))
+        score += np.select(
+            [roe > self.THRESHOLDS['roe_excellent'], roe > self.THRESHOLDS['roe_good'],
+             roe < self.THRESHOLDS['roe_poor']],
+            [0.5, 0.3, -0.3], 0.0
+        )
+        score += np.select([(per > 0) & (per < 10), per > 50], [0.2, -0.2], 0.0)
+        score += np.where((pbr > 0) & (pbr < 1.0), 0.2, 0.0)
+        score += np.where(div_yield > 3, 0.2, 0.0)
+        score = np.clip(score, -2.0, 2.0)
+
+        grade = np.select(
+            [score >= 0.8, score >= 0.3, score >= -0.3, score >= -0.8],
+            [FundamentalGrade.EXCELLENT.value, FundamentalGrade.GOOD.value,
+             FundamentalGrade.AVERAGE.value, FundamentalGrade.POOR.value],
+            FundamentalGrade.DANGER.value
+        )
+
+        graded = frame.copy()
+        graded['score'] = score
+        graded['grade'] = grade
+        graded['pass_filter'] = grade != FundamentalGrade.DANGER.value
+        return graded
+
     def _unknown_result(self, ticker: str) -> FundamentalResult:
         """데이터 없을 때 기본 결과"""
         return FundamentalResult(
@@ -260,6 +348,7 @@ class FundamentalIntegrator:
     def clear_cache(self):
         """캐시 초기화"""
         self._cache.clear()
+        self._graded_date = None
 
 
 # Singleton instance
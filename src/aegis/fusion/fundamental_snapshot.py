@@ -0,0 +1,295 @@
+"""
+Fundamental Snapshot - Phase 4
+시장 전체 재무지표 일별 스냅샷 (PER/PBR/EPS/BPS/DIV/DPS)
+
+종목마다 pykrx를 호출하는 대신 거래일마다 시장 전체 재무지표를 한 번에 조회:
+- 거래일 1일 = KOSPI/KOSDAQ 2회 호출 (pykrx get_market_fundamental)
+- 조회 결과는 stock_fundamentals_daily 테이블에 저장 → 다른 프로세스/다음 실행은 DB에서 로드
+- 종목 조회는 dict 조회 (네트워크 없음), 등급/가치주 필터는 전 종목 벡터 연산
+
+기준일은 확정된 최근 거래일 (당일은 FINAL_HOUR 이후부터 당일 종가 기준).
+
+Usage:
+    snapshot = get_fundamental_snapshot()
+    await snapshot.load()
+    snapshot.get('005930')['pbr']
+    snapshot.value_screen(pbr_range=(0.2, 1.0), per_range=(3, 10))
+"""
+import asyncio
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+from pykrx import stock
+
+from src.config.database import db
+
+
+class FundamentalSnapshot:
+    """
+    시장 전체 재무지표 스냅샷 (index: 종목코드)
+
+    Columns:
+        market, per, pbr, eps, bps, div_yield, dps, roe (= EPS / BPS * 100)
+    """
+
+    # pykrx 컬럼 → 스냅샷 컬럼
+    COLUMNS: Dict[str, str] = {
+        'PER': 'per',
+        'PBR': 'pbr',
+        'EPS': 'eps',
+        'BPS': 'bps',
+        'DIV': 'div_yield',
+        'DPS': 'dps',
+    }
+
+    MARKETS: Tuple[str, ...] = ("KOSPI", "KOSDAQ")
+
+    # DB에 이 종목 수 이상 저장된 날짜만 "적재 완료"로 간주
+    MIN_STORED_TICKERS = 1000
+
+    # 당일 데이터는 HH시 이후 확정으로 간주 (그 전에는 전 거래일 스냅샷 사용)
+    FINAL_HOUR = 18
+
+    # 적재 실패 후 재시도 간격 (초) - 실패 중에는 호출자가 종목별 조회로 폴백
+    RETRY_INTERVAL = 600
+
+    def __init__(self, use_db: bool = True):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.use_db = use_db
+        self.date: Optional[str] = None                    # 기준 거래일 (YYYYMMDD)
+        self.frame: pd.DataFrame = pd.DataFrame()
+        self._records: Dict[str, Dict[str, Any]] = {}      # 종목코드 → metrics
+        self._dates: Dict[str, List[str]] = {}             # 조회일 → 최근 거래일 목록
+        self._loaded_for: Optional[Tuple[str, bool]] = None  # (조회일, 당일 확정 여부)
+        self._failed: Dict[Tuple[str, bool], float] = {}   # 적재 실패 키 → 실패 시각
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._records
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    async def _recent_trading_dates(self, end: str) -> List[str]:
+        """end 이전 최근 거래일 (YYYYMMDD, 오래된 순) - KOSPI 지수 일봉 1회 조회"""
+        if end not in self._dates:
+            start = (datetime.strptime(end, "%Y%m%d") - timedelta(days=14)).strftime("%Y%m%d")
+            df = await asyncio.to_thread(stock.get_index_ohlcv_by_date, start, end, "1001")
+            if df is None or df.empty:
+                return []
+            self._dates[end] = [d.strftime("%Y%m%d") for d in df.index]
+        return self._dates[end]
+
+    def _is_final(self, date: str) -> bool:
+        now = datetime.now()
+        return date < now.strftime("%Y%m%d") or now.hour >= self.FINAL_HOUR
+
+    async def load(self, date: Optional[str] = None) -> Optional[str]:
+        """
+        기준일 스냅샷 적재 (메모리 → DB → pykrx 순, 이미 적재된 기준일이면 즉시 반환)
+
+        Args:
+            date: 조회일 (YYYYMMDD), None이면 오늘 → 확정된 최근 거래일 사용
+
+        Returns:
+            적재된 기준 거래일 (실패 시 None)
+        """
+        end = date or datetime.now().strftime("%Y%m%d")
+        key = (end, self._is_final(end))
+        if self.date is not None and key == self._loaded_for:
+            return self.date
+        if time.monotonic() - self._failed.get(key, float('-inf')) < self.RETRY_INTERVAL:
+            return None
+
+        async with self._lock:
+            if self.date is not None and key == self._loaded_for:
+                return self.date
+            if time.monotonic() - self._failed.get(key, float('-inf')) < self.RETRY_INTERVAL:
+                return None
+
+            try:
+                dates = await self._recent_trading_dates(end)
+            except Exception as e:
+                self.logger.warning(f"Failed to resolve trading dates for {end}: {e}")
+                dates = []
+            dates = [d for d in dates if self._is_final(d)]
+            # 최근 거래일 데이터가 비어 있으면 (공휴일 직후 등) 전 거래일로 후퇴
+            for target in reversed(dates[-2:]):
+                frame = await self._load_from_db(target) if self.use_db else None
+                if frame is None:
+                    try:
+                        frame = await asyncio.to_thread(self._fetch_day, target)
+                    except Exception as e:
+                        self.logger.warning(f"Failed to fetch fundamental snapshot for {target}: {e}")
+                        continue
+                    if frame.empty:
+                        continue
+                    if self.use_db:
+                        await self._save_to_db(target, frame)
+                self._set(target, frame)
+                self._loaded_for = key
+                return target
+
+            self._failed[key] = time.monotonic()
+
+        self.logger.warning(f"Fundamental snapshot unavailable for {end}")
+        return None
+
+    def _fetch_day(self, date: str) -> pd.DataFrame:
+        """거래일 1일 시장 전체 재무지표 (pykrx 시장별 1회)"""
+        markets = []
+        for market in self.MARKETS:
+            df = stock.get_market_fundamental(date, market=market)
+            if df is not None and not df.empty:
+                df = df.rename(columns=self.COLUMNS).reindex(columns=list(self.COLUMNS.values()))
+                df['market'] = market
+                markets.append(df)
+
+        if not markets:
+            return pd.DataFrame()
+
+        frame = pd.concat(markets)
+        frame = frame[~frame.index.duplicated(keep='first')]
+        frame.index.name = 'stock_code'
+        self.logger.info(f"Fundamental snapshot fetched for {date}: {len(frame)} tickers")
+        return frame
+
+    async def _ensure_db(self) -> bool:
+        if db.pool is not None:
+            return True
+        try:
+            await db.connect()
+            return True
+        except Exception as e:
+            self.logger.warning(f"stock_fundamentals_daily unavailable, using pykrx only: {e}")
+            self.use_db = False
+            return False
+
+    async def _load_from_db(self, date: str) -> Optional[pd.DataFrame]:
+        """저장된 기준일 로드 (종목 수가 MIN_STORED_TICKERS 미만이면 None)"""
+        if not await self._ensure_db():
+            return None
+        try:
+            rows = await db.fetch(
+                f"""
+                SELECT stock_code, market, {', '.join(self.COLUMNS.values())}
+                FROM stock_fundamentals_daily
+                WHERE date = $1
+                """,
+                datetime.strptime(date, "%Y%m%d").date()
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to load fundamental snapshot from DB: {e}")
+            return None
+
+        if len(rows) < self.MIN_STORED_TICKERS:
+            return None
+        frame = pd.DataFrame([dict(r) for r in rows]).set_index('stock_code')
+        return frame[list(self.COLUMNS.values()) + ['market']].astype(
+            {c: float for c in self.COLUMNS.values()}
+        )
+
+    async def _save_to_db(self, date: str, frame: pd.DataFrame):
+        """stock_fundamentals_daily upsert (시장 전체, stocks 미등록 종목 포함)"""
+        if not await self._ensure_db():
+            return
+        values = frame[list(self.COLUMNS.values())].astype(float)
+        try:
+            await db.execute(
+                f"""
+                INSERT INTO stock_fundamentals_daily
+                    (date, stock_code, market, {', '.join(self.COLUMNS.values())})
+                SELECT $1::date, t.*
+                FROM unnest(
+                    $2::varchar[], $3::varchar[], $4::float8[], $5::float8[],
+                    $6::float8[], $7::float8[], $8::float8[], $9::float8[]
+                ) AS t(stock_code, market, {', '.join(self.COLUMNS.values())})
+                ON CONFLICT (date, stock_code) DO UPDATE SET
+                    market = EXCLUDED.market,
+                    {', '.join(f'{c} = EXCLUDED.{c}' for c in self.COLUMNS.values())}
+                """,
+                datetime.strptime(date, "%Y%m%d").date(),
+                frame.index.tolist(),
+                frame['market'].tolist(),
+                *[values[c].tolist() for c in self.COLUMNS.values()]
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to store fundamental snapshot: {e}")
+
+    def _set(self, date: str, frame: pd.DataFrame):
+        frame = frame.copy()
+        eps, bps = frame['eps'].to_numpy(dtype=float), frame['bps'].to_numpy(dtype=float)
+        # FundamentalIntegrator와 동일한 근사: ROE = EPS / BPS * 100 (EPS 0 또는 BPS <= 0이면 없음)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            frame['roe'] = np.where((eps != 0) & (bps > 0), np.round(eps / bps * 100, 2), np.nan)
+
+        self.date = date
+        self.frame = frame
+        self._records = self._to_records(frame)
+
+    @staticmethod
+    def _to_records(frame: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """종목별 metrics dict (FundamentalIntegrator._fetch_fundamentals와 같은 키)"""
+        columns = ['per', 'pbr', 'eps', 'bps', 'div_yield', 'roe']
+        records = {}
+        for ticker, row in zip(frame.index, frame[columns].itertuples(index=False, name=None)):
+            metrics = {c: (None if math.isnan(v) else float(v)) for c, v in zip(columns, row)}
+            metrics['debt_ratio'] = None
+            metrics['opm'] = None
+            records[ticker] = metrics
+        return records
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """종목 재무지표 (스냅샷에 없으면 None) - dict 조회만, 네트워크 없음"""
+        metrics = self._records.get(ticker)
+        return dict(metrics) if metrics is not None else None
+
+    def value_screen(
+        self,
+        pbr_range: Tuple[float, float] = (0.2, 1.0),
+        per_range: Tuple[float, float] = (3.0, 10.0),
+        tickers: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        저PBR/저PER 가치주 필터 (Smart Value Finder 1차 필터)
+
+        Args:
+            pbr_range: PBR 범위 (양 끝 포함)
+            per_range: PER 범위 (양 끝 포함)
+            tickers: 대상 종목 (None이면 전체, 유동성/시총 필터를 거친 목록 전달)
+
+        Returns:
+            조건 통과 종목 (PBR, PER 오름차순)
+        """
+        frame = self.frame
+        if frame.empty:
+            return frame
+        if tickers is not None:
+            frame = frame[frame.index.isin(tickers)]
+        mask = frame['pbr'].between(*pbr_range) & frame['per'].between(*per_range)
+        return frame[mask].sort_values(['pbr', 'per'])
+
+
+# Singleton instance
+_snapshot_instance: Optional[FundamentalSnapshot] = None
+
+
+def get_fundamental_snapshot() -> FundamentalSnapshot:
+    """Get singleton FundamentalSnapshot instance"""
+    global _snapshot_instance
+    if _snapshot_instance is None:
+        _snapshot_instance = FundamentalSnapshot()
+    return _snapshot_instance
@@ -0,0 +1,289 @@
+"""
+News Story Index - Phase 4
+근사 중복 뉴스 → 기사 묶음(story) 색인 + 묶음 단위 감성 메모이제이션
+
+네이버/다음/Tier 3 언론사는 같은 통신사 기사를 제목만 조금 바꿔 싣습니다:
+- 제목/본문 MinHash-LSH로 근사 중복을 하나의 story로 묶음 (제목 Jaccard 또는 본문 Jaccard)
+- 제목/본문 일치 모두 guard(숫자/감성 키워드 집합)까지 같아야 인정 ("급등"↔"급락", "3분기"↔"4분기" 분리)
+- story마다 키워드/AI 감성을 한 번만 계산해 저장 → 종목/캐시 주기가 달라도 재사용
+- story 크기(싣은 기사 변형 수)는 관련도 가중치로 사용 (weight = 1 + log2(size))
+
+색인은 L2 디스크 캐시(news_stories)에 story별 항목으로 저장되어 cron 프로세스 간 공유됩니다.
+(변경된 story만 기록 → 동시에 도는 프로세스가 서로의 story를 덮어쓰지 않음)
+
+Usage:
+    index = get_news_story_index()
+    await index.load()
+    story = index.assign(title, content, source, guard=("22",), now=time.time())
+    story.weight, story.keyword_result, story.ai_score
+    await index.save()
+"""
+import asyncio
+import hashlib
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+import logging
+
+import numpy as np
+
+from src.utils.near_duplicate import MinHashLSH, MinHasher, normalize_text
+from src.utils.sqlite_cache import SQLiteCache, get_l2_cache
+
+
+@dataclass
+class NewsStory:
+    """근사 중복 기사 묶음"""
+    story_id: str
+    title: str                        # 대표 제목 (처음 본 기사)
+    source: str
+    guard: Hashable
+    first_seen: float                 # epoch seconds
+    last_seen: float
+    members: Set[str] = field(default_factory=set)   # 정규화 제목 해시 (기사 변형)
+    # 묶음 단위 감성 메모 (None = 아직 계산 안 함)
+    keyword_result: Optional[Tuple[float, List[str], int, int]] = None   # (점수, 키워드, 호재 수, 악재 수)
+    ai_score: Optional[float] = None
+    ai_summary: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return max(1, len(self.members))
+
+    @property
+    def weight(self) -> float:
+        """관련도 가중치: 여러 언론사가 실은 기사일수록 큼"""
+        return 1.0 + math.log2(self.size)
+
+
+class NewsStoryIndex:
+    """
+    근사 중복 뉴스 색인 (제목 LSH + 본문 LSH)
+
+    Args:
+        l2: story 저장용 디스크 캐시 (None이면 프로세스 메모리만)
+    """
+
+    TITLE_THRESHOLD = 0.6     # 제목 문자 2-gram Jaccard
+    BODY_THRESHOLD = 0.6      # 본문 앞부분 문자 2-gram Jaccard
+    BODY_CHARS = 300          # 본문 비교 길이
+    MIN_BODY_CHARS = 80       # 이보다 짧은 본문은 비교하지 않음
+    MAX_STORIES = 3000
+    MAX_MEMBERS = 64
+    STORY_TTL = timedelta(days=3)
+
+    L2_NAMESPACE = "news_stories"   # key = story_id
+    SAVE_INTERVAL = 30        # 초, 변경 후 이보다 오래되면 변경된 story 저장
+
+    def __init__(self, l2: Optional[SQLiteCache] = None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.l2 = l2
+        self.hasher = MinHasher()
+        # story 수는 _evict()가 관리 (LSH 자체 용량 제한 없음)
+        self.titles = MinHashLSH(self.TITLE_THRESHOLD, maxsize=None)
+        self.bodies = MinHashLSH(self.BODY_THRESHOLD, maxsize=None)
+        self.stories: Dict[str, NewsStory] = {}
+        self.stats: Dict[str, int] = {'items': 0, 'stories': 0, 'collapsed': 0}
+        self._loaded = False
+        self._dirty: Set[str] = set()     # 저장 대기 story_id
+        self._last_save = 0.0
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.stories)
+
+    # ------------------------------------------------------------------
+    # Clustering
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def member_key(title: str) -> str:
+        return hashlib.md5(normalize_text(title).encode('utf-8')).hexdigest()[:12]
+
+    def _match(self, title_sig: np.ndarray, body_sig: Optional[np.ndarray], guard: Hashable) -> Optional[NewsStory]:
+        for story_id, _ in self.titles.candidates(title_sig):
+            story = self.stories.get(story_id)
+            if story is not None and story.guard == guard:
+                return story
+        if body_sig is not None:
+            for story_id, _ in self.bodies.candidates(body_sig):
+                story = self.stories.get(story_id)
+                if story is not None and story.guard == guard:
+                    return story
+        return None
+
+    def assign(
+        self,
+        title: str,
+        content: str = "",
+        source: str = "",
+        guard: Hashable = None,
+        now: Optional[float] = None
+    ) -> NewsStory:
+        """
+        기사를 기존 story에 묶거나 새 story 생성
+
+        Args:
+            title: 기사 제목
+            content: 본문 (앞부분 BODY_CHARS자만 비교)
+            source: 언론사
+            guard: 제목 일치 시 같아야 하는 값 (숫자/감성 키워드 등)
+            now: 기준 시각 (epoch, 기본 현재)
+
+        Returns:
+            기사가 속한 NewsStory
+        """
+        now = time.time() if now is None else now
+        self.stats['items'] += 1
+        title_sig = self.hasher.signature(title)
+        body = (content or "")[:self.BODY_CHARS]
+        body_sig = self.hasher.signature(body) if len(body) >= self.MIN_BODY_CHARS else None
+        member = self.member_key(title)
+
+        story = self._match(title_sig, body_sig, guard)
+        if story is None:
+            story = NewsStory(
+                story_id=member,
+                title=title,
+                source=source,
+                guard=guard,
+                first_seen=now,
+                last_seen=now,
+            )
+            suffix = 1
+            while story.story_id in self.stories:
+                # 정규화 제목은 같지만 guard가 다른 경우 (드묾)
+                story.story_id = f"{member}-{suffix}"
+                suffix += 1
+            self.stories[story.story_id] = story
+            self.titles.add(story.story_id, title_sig)
+            self.stats['stories'] += 1
+            self._evict()
+        else:
+            self.stats['collapsed'] += 1
+
+        if member not in story.members and len(story.members) < self.MAX_MEMBERS:
+            story.members.add(member)
+        if body_sig is not None and story.story_id not in self.bodies:
+            self.bodies.add(story.story_id, body_sig)
+        story.last_seen = max(story.last_seen, now)
+        self._dirty.add(story.story_id)
+        return story
+
+    def _evict(self, now: Optional[float] = None):
+        """STORY_TTL 지난 story와 MAX_STORIES 초과분(오래된 순) 제거"""
+        now = time.time() if now is None else now
+        cutoff = now - self.STORY_TTL.total_seconds()
+        expired = [s.story_id for s in self.stories.values() if s.last_seen < cutoff]
+        if len(self.stories) - len(expired) > self.MAX_STORIES:
+            alive = sorted(
+                (s for s in self.stories.values() if s.last_seen >= cutoff), key=lambda s: s.last_seen
+            )
+            expired.extend(s.story_id for s in alive[:len(self.stories) - len(expired) - self.MAX_STORIES])
+        for story_id in expired:
+            self.stories.pop(story_id, None)
+            self.titles.remove(story_id)
+            self.bodies.remove(story_id)
+            self._dirty.discard(story_id)
+
+    def mark_dirty(self, *stories: NewsStory):
+        """story 감성 메모 갱신 후 호출 (다음 save()에서 저장)"""
+        self._dirty.update(story.story_id for story in stories)
+
+    # ------------------------------------------------------------------
+    # Persistence (L2, story별 항목)
+    # ------------------------------------------------------------------
+
+    async def load(self):
+        """L2 story 적재 (프로세스당 1회)"""
+        if self._loaded:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if self.l2 is None:
+                return
+            try:
+                records = await asyncio.to_thread(self.l2.items, self.L2_NAMESPACE)
+            except Exception as e:
+                self.logger.warning(f"Failed to load news story index: {e}")
+                return
+            self._restore(records.values())
+
+    def _restore(self, records: Iterable[Dict[str, Any]]):
+        cutoff = time.time() - self.STORY_TTL.total_seconds()
+        for record in records:
+            if record['last_seen'] < cutoff or record['story_id'] in self.stories:
+                continue
+            story = NewsStory(**{k: v for k, v in record.items() if k not in ('title_sig', 'body_sig')})
+            self.stories[story.story_id] = story
+            self.titles.add(story.story_id, np.frombuffer(record['title_sig'], dtype=np.uint32))
+            if record['body_sig'] is not None:
+                self.bodies.add(story.story_id, np.frombuffer(record['body_sig'], dtype=np.uint32))
+        self._evict()
+        self.logger.debug(f"News story index restored: {len(self.stories)} stories")
+
+    def _records(self, story_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        records = {}
+        for story_id in story_ids:
+            story = self.stories.get(story_id)
+            title_sig = self.titles.get(story_id)
+            body_sig = self.bodies.get(story_id)
+            if story is None or title_sig is None:
+                continue
+            records[story_id] = {
+                'story_id': story.story_id,
+                'title': story.title,
+                'source': story.source,
+                'guard': story.guard,
+                'first_seen': story.first_seen,
+                'last_seen': story.last_seen,
+                'members': set(story.members),
+                'keyword_result': story.keyword_result,
+                'ai_score': story.ai_score,
+                'ai_summary': story.ai_summary,
+                'title_sig': title_sig.tobytes(),
+                'body_sig': body_sig.tobytes() if body_sig is not None else None,
+            }
+        return records
+
+    async def save(self, force: bool = False):
+        """변경된 story가 있고 SAVE_INTERVAL이 지났으면 (force면 즉시) 해당 story만 저장"""
+        if self.l2 is None or not self._dirty:
+            return
+        if not force and time.monotonic() - self._last_save < self.SAVE_INTERVAL:
+            return
+        dirty, self._dirty = self._dirty, set()
+        self._last_save = time.monotonic()
+        try:
+            await asyncio.to_thread(
+                self.l2.set_many, self.L2_NAMESPACE, self._records(dirty),
+                self.STORY_TTL.total_seconds()
+            )
+        except Exception as e:
+            self._dirty |= dirty
+            self.logger.warning(f"Failed to save news story index: {e}")
+
+    def info(self) -> Dict[str, Any]:
+        sizes = [s.size for s in self.stories.values()]
+        return {
+            **self.stats,
+            'indexed': len(self.stories),
+            'multi_source': sum(1 for n in sizes if n > 1),
+            'max_size': max(sizes, default=0),
+        }
+
+
+# Singleton instance
+_index_instance: Optional[NewsStoryIndex] = None
+
+
+def get_news_story_index() -> NewsStoryIndex:
+    """Get singleton NewsStoryIndex instance"""
+    global _index_instance
+    if _index_instance is None:
+        _index_instance = NewsStoryIndex(l2=get_l2_cache())
+    return _index_instance
@@ -6,11 +6,12 @@ Gemini API를 활용한 뉴스 감성 분석
 - 실시간 뉴스 수집 및 분석
 - Gemini AI를 통한 감성 점수화
 - 키워드 기반 빠른 필터링
-- 중복 뉴스 제거 (유사도 기반)
+- 근사 중복 뉴스 묶음 (MinHash-LSH story, 묶음 크기 = 관련도 가중치)
+- story 단위 감성(키워드/AI) 1회 계산 후 메모 (종목/캐시 주기 간 재사용)
 """
 import asyncio
 import re
-import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
@@ -20,7 +21,13 @@ import logging
 import aiohttp
 
 # Gemini client
+from src.gemini.batcher import BatchTask, GeminiBatcher
 from src.gemini.client import GeminiClient
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.near_duplicate import normalize_text
+from .news_clusters import NewsStory, get_news_story_index
+from src.utils.async_cache import AsyncTTLCache
+from src.utils.sqlite_cache import get_l2_cache
 
 
 class NewsSentiment(Enum):
@@ -43,7 +50,9 @@ class NewsItem:
     sentiment: Optional[NewsSentiment] = None
     sentiment_score: float = 0.0
     keywords: List[str] = field(default_factory=list)
-    relevance: float = 1.0
+    relevance: float = 1.0            # story 가중치 (1 + log2(묶인 기사 변형 수))
+    story_id: Optional[str] = None
+    cluster_size: int = 1
 
 
 @dataclass
@@ -112,10 +121,48 @@ class NewsSentimentAnalyzer:
     # 캐시 TTL (15분)
     CACHE_TTL = timedelta(minutes=15)
 
+    # Gemini 응답 캐시 TTL: 같은 헤드라인 묶음은 하루 동안 재채점하지 않음
+    AI_CACHE_TTL = timedelta(hours=24)
+
+    # 아직 채점 안 된 story들은 종목과 관계없이 Gemini 1회 호출로 묶어서 채점 (story ID 키 JSON 응답)
+    AI_BATCH_TASK = BatchTask(
+        name="news_story_sentiment",
+        instructions="""다음은 주식 관련 뉴스 헤드라인입니다. 기사마다 해당 종목 주가에 대한 감성 점수와 한줄 요약을 작성하세요.
+
+감성 점수 기준 (-2.0 ~ +2.0):
+- +2.0: 매우 긍정적 (대규모 계약, 흑자전환 등)
+- +1.0: 긍정적 (실적 개선, 신규 투자 등)
+- 0.0: 중립
+- -1.0: 부정적 (실적 부진, 하향 조정 등)
+- -2.0: 매우 부정적 (횡령, 상장폐지 우려 등)""",
+        fields={
+            'score': ('number', '감성 점수 -2.0 ~ +2.0'),
+            'summary': ('string', '한줄 요약 50자 이내'),
+        },
+        output_tokens_per_item=120,
+        item_label="기사",
+    )
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._cache: Dict[str, Tuple[NewsSentimentResult, datetime]] = {}
+        self._cache: AsyncTTLCache[NewsSentimentResult] = AsyncTTLCache(
+            "news_sentiment", ttl=self.CACHE_TTL, maxsize=1024, l2=get_l2_cache(),
+            persist=lambda result: result.news_count > 0      # 수집 실패/뉴스 없음 빈 결과는 L1만
+        )
         self._gemini_client: Optional[GeminiClient] = None
+        self._ai_batcher: Optional[GeminiBatcher] = None
+        self._stories = get_news_story_index()
+        # 키워드 테이블 전체를 한 오토마톤으로 (기사당 1회 스캔)
+        tables = {
+            'positive': self.POSITIVE_KEYWORDS,
+            'negative': self.NEGATIVE_KEYWORDS,
+            'priority': self.HIGH_PRIORITY_KEYWORDS,
+        }
+        self._matcher = KeywordMatcher.from_tables({**tables, 'source': self.MAJOR_SOURCES})
+        # story guard 비교용 (머리표/문장부호/공백 제거한 제목 기준)
+        self._guard_matcher = KeywordMatcher.from_tables(
+            tables, normalize=lambda text: normalize_text(text).replace(' ', '')
+        )
 
     def _get_gemini_client(self) -> GeminiClient:
         """Gemini 클라이언트 지연 초기화"""
@@ -123,6 +170,15 @@ class NewsSentimentAnalyzer:
             self._gemini_client = GeminiClient()
         return self._gemini_client
 
+    def _get_ai_batcher(self) -> GeminiBatcher:
+        """종목별 AI 감성 분석 배처 지연 초기화"""
+        if self._ai_batcher is None:
+            self._ai_batcher = GeminiBatcher(
+                self._get_gemini_client(), self.AI_BATCH_TASK, max_batch=8,
+                cache_ttl=self.AI_CACHE_TTL
+            )
+        return self._ai_batcher
+
     def _is_high_priority_news(self, item: NewsItem) -> bool:
         """
         [Phase 7.5] Smart Filtering - AI 분석 대상 뉴스인지 판단
@@ -136,28 +192,23 @@ class NewsSentimentAnalyzer:
             False: 키워드 점수만 사용
         """
         # 1. 중요 키워드 체크
-        for keyword in self.HIGH_PRIORITY_KEYWORDS:
-            if keyword in item.title:
-                return True
+        if any(m.category == 'priority' for m in self._matcher.find_all(item.title)):
+            return True
 
         # 2. 주요 언론사 체크
-        for source in self.MAJOR_SOURCES:
-            if source in item.source:
-                return True
-
-        return False
+        return any(m.category == 'source' for m in self._matcher.find_all(item.source))
 
     def _filter_for_ai_analysis(self, news_items: List[NewsItem]) -> List[NewsItem]:
         """
         [Phase 7.5] AI 분석 대상 뉴스만 필터링
 
         Returns:
-            AI 분석 대상 뉴스 리스트 (최대 5개로 제한)
+            AI 분석 대상 뉴스 리스트 (최대 5개, 많이 실린 story 우선)
         """
-        high_priority = [
-            item for item in news_items
-            if self._is_high_priority_news(item)
-        ]
+        high_priority = sorted(
+            (item for item in news_items if self._is_high_priority_news(item)),
+            key=lambda item: -item.relevance
+        )
 
         self.logger.debug(
             f"Smart Filter: {len(high_priority)}/{len(news_items)} news selected for AI"
@@ -183,14 +234,13 @@ class NewsSentimentAnalyzer:
         Returns:
             NewsSentimentResult: 감성 분석 결과
         """
-        # 캐시 확인
-        cache_key = f"{ticker}_{days}"
-        if cache_key in self._cache:
-            cached, cached_at = self._cache[cache_key]
-            if datetime.now() - cached_at < self.CACHE_TTL:
-                self.logger.debug(f"Cache hit for {ticker}")
-                return cached
+        # 캐시 조회 (동시 요청은 1회 조회 결과 공유)
+        return await self._cache.get_or_load(
+            f"{ticker}_{days}", lambda: self._analyze_uncached(ticker, days, use_ai)
+        )
 
+    async def _analyze_uncached(self, ticker: str, days: int, use_ai: bool) -> NewsSentimentResult:
+        """뉴스 감성 분석 (캐시 miss 시 실행)"""
         self.logger.info(f"Analyzing news sentiment for {ticker}")
 
         # 1. 뉴스 수집
@@ -224,6 +274,9 @@ class NewsSentimentAnalyzer:
                     f"[Smart Filter] No high-priority news, skipping AI (saved API call)"
                 )
 
+        # story 메모 저장 (SAVE_INTERVAL 간격)
+        await self._stories.save()
+
         # 4. 최종 점수 계산
         # 키워드 70% + AI 30%
         if use_ai and ai_score != 0.0:
@@ -256,12 +309,10 @@ class NewsSentimentAnalyzer:
                 'days_analyzed': days,
                 'ai_analyzed_count': ai_analyzed_count,  # [Phase 7.5] Smart Filtering 결과
                 'total_news_count': len(news_items),
+                'story_articles': sum(item.cluster_size for item in news_items),
             }
         )
 
-        # 캐시 저장
-        self._cache[cache_key] = (result, datetime.now())
-
         return result
 
     async def _fetch_news(self, ticker: str, days: int) -> List[NewsItem]:
@@ -302,59 +353,80 @@ class NewsSentimentAnalyzer:
         except Exception as e:
             self.logger.error(f"Failed to fetch news: {e}")
 
-        # 중복 제거
+        # 중복 제거 (근사 중복 → story)
+        await self._stories.load()
         news_items = self._deduplicate_news(news_items)
 
         return news_items[:20]  # 최대 20개
 
     def _deduplicate_news(self, news_items: List[NewsItem]) -> List[NewsItem]:
-        """중복 뉴스 제거 (제목 유사도 기반)"""
-        seen_hashes = set()
-        unique_items = []
+        """
+        근사 중복 뉴스를 story로 묶어 대표 기사만 남김
 
-        for item in news_items:
-            # 제목에서 특수문자 제거 후 해시
-            clean_title = re.sub(r'[^\w\s]', '', item.title)
-            title_hash = hashlib.md5(clean_title.encode()).hexdigest()[:8]
+        대표 기사(story에서 처음 나온 기사)의 relevance = story 가중치, cluster_size = 묶인 변형 수.
+        story는 종목/프로세스 간 공유되므로 다른 종목에서 이미 본 기사도 같은 story로 묶임.
+        """
+        now = time.time()
+        representatives: Dict[str, NewsItem] = {}
 
-            if title_hash not in seen_hashes:
-                seen_hashes.add(title_hash)
-                unique_items.append(item)
+        for item in news_items:
+            story = self._stories.assign(
+                item.title, item.content, item.source,
+                guard=self._story_guard(item.title), now=now
+            )
+            if story.story_id in representatives:
+                continue
+            item.story_id = story.story_id
+            representatives[story.story_id] = item
+
+        for story_id, item in representatives.items():
+            story = self._stories.stories.get(story_id)
+            if story is not None:
+                item.cluster_size = story.size
+                item.relevance = story.weight
+
+        return list(representatives.values())
+
+    def _story_guard(self, title: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        제목 유사 story 병합 조건: 숫자와 감성/중요 키워드 집합이 같아야 함
 
-        return unique_items
+        "주가 5% 급등"/"주가 5% 급락", "3분기 실적"/"4분기 실적" 같은 짧은 제목은
+        문자 n-gram이 대부분 겹치므로 의미를 가르는 토큰을 따로 비교.
+        """
+        numbers = tuple(sorted(set(re.findall(r'\d+', normalize_text(title)))))
+        keywords = tuple(sorted({m.keyword for m in self._guard_matcher.find_all(title)}))
+        return numbers, keywords
 
     def _analyze_keywords(self, news_items: List[NewsItem]) -> Dict[str, Any]:
-        """키워드 기반 감성 분석"""
+        """키워드 기반 감성 분석 (story 단위 메모, 평균은 story 가중치 기준)"""
         total_score = 0.0
+        weighted_score = 0.0
+        total_weight = 0.0
         positive_count = 0
         negative_count = 0
 
         for item in news_items:
-            text = f"{item.title} {item.content}"
-            item_score = 0.0
-            found_keywords = []
-
-            # 호재 키워드 검색
-            for score, keywords in self.POSITIVE_KEYWORDS.items():
-                for kw in keywords:
-                    if kw in text:
-                        item_score += score
-                        found_keywords.append(kw)
-                        positive_count += 1
-
-            # 악재 키워드 검색
-            for score, keywords in self.NEGATIVE_KEYWORDS.items():
-                for kw in keywords:
-                    if kw in text:
-                        item_score += score  # 음수
-                        found_keywords.append(kw)
-                        negative_count += 1
+            story = self._stories.stories.get(item.story_id) if item.story_id else None
+            if story is not None and story.keyword_result is not None:
+                item_score, found_keywords, positive, negative = story.keyword_result
+            else:
+                item_score, found_keywords, positive, negative = self._score_keywords(
+                    f"{item.title} {item.content}"
+                )
+                if story is not None:
+                    story.keyword_result = (item_score, found_keywords, positive, negative)
+                    self._stories.mark_dirty(story)
 
+            positive_count += positive
+            negative_count += negative
             item.sentiment_score = item_score
-            item.keywords = found_keywords
+            item.keywords = list(found_keywords)
             total_score += item_score
+            weighted_score += item_score * item.relevance
+            total_weight += item.relevance
 
-        avg_score = total_score / len(news_items) if news_items else 0.0
+        avg_score = weighted_score / total_weight if total_weight else 0.0
 
         return {
             'average': round(avg_score, 2),
@@ -363,70 +435,62 @@ class NewsSentimentAnalyzer:
             'negative_count': negative_count,
         }
 
+    def _score_keywords(self, text: str) -> Tuple[float, List[str], int, int]:
+        """기사 1건 키워드 점수 → (점수, 키워드, 호재 수, 악재 수) - 키워드별 1회 반영"""
+        matches = self._matcher.unique(text, ('positive', 'negative'))
+        positive_count = sum(1 for m in matches if m.category == 'positive')
+        item_score = sum(m.weight for m in matches)
+        return item_score, [m.keyword for m in matches], positive_count, len(matches) - positive_count
+
+    def score_headlines(self, headlines: List[str]) -> List[float]:
+        """헤드라인 일괄 키워드 채점 (AI/뉴스 수집 없이, 대량 처리용)"""
+        return self._matcher.scores(headlines, ('positive', 'negative')).tolist()
+
     async def _analyze_with_ai(
         self,
         ticker: str,
         news_items: List[NewsItem]
     ) -> Dict[str, Any]:
-        """Gemini AI를 통한 심층 분석"""
+        """
+        Gemini AI를 통한 심층 분석 (story 단위)
+
+        아직 채점 안 된 story만 GeminiBatcher로 묶어 요청하고 (다른 종목의 story와 같은
+        호출에 묶임) 결과는 story에 메모. 종목 점수는 story 가중 평균, 요약은 가장 많이
+        실린 story의 요약.
+        """
         try:
-            gemini = self._get_gemini_client()
+            batcher = self._get_ai_batcher()
 
-            if not gemini.model:
+            if not batcher.client.model:
                 return {'summary': None, 'score': 0.0}
 
-            # 뉴스 요약 구성
-            news_text = "\n".join([
-                f"- [{item.source}] {item.title}"
-                for item in news_items[:10]
-            ])
-
-            prompt = f"""
-다음은 종목 {ticker}에 관한 최근 뉴스 헤드라인입니다:
-
-{news_text}
-
-위 뉴스들을 분석하여 다음 형식으로 답변해주세요:
-
-1. 종합 감성 점수: (숫자만, -2.0 ~ +2.0 범위)
-   - +2.0: 매우 긍정적 (대규모 계약, 흑자전환 등)
-   - +1.0: 긍정적 (실적 개선, 신규 투자 등)
-   - 0.0: 중립
-   - -1.0: 부정적 (실적 부진, 하향 조정 등)
-   - -2.0: 매우 부정적 (횡령, 상장폐지 우려 등)
-
-2. 한줄 요약: (50자 이내)
-
-답변 형식:
-점수: [숫자]
-요약: [내용]
-"""
-
-            response = await gemini.generate_content(prompt)
-
-            if not response:
+            stories: List[NewsStory] = []
+            for item in news_items[:10]:
+                story = self._stories.stories.get(item.story_id) if item.story_id else None
+                if story is not None and story not in stories:
+                    stories.append(story)
+
+            pending = [story for story in stories if story.ai_score is None]
+            if pending:
+                results = await asyncio.gather(*[
+                    batcher.submit(story.story_id, f"[{story.source}] {story.title}")
+                    for story in pending
+                ])
+                for story, result in zip(pending, results):
+                    if result:
+                        story.ai_score = max(-2.0, min(2.0, float(result['score'])))
+                        story.ai_summary = result['summary'].strip() or None
+                self._stories.mark_dirty(*pending)
+
+            scored = [story for story in stories if story.ai_score is not None]
+            if not scored:
                 return {'summary': None, 'score': 0.0}
 
-            # 응답 파싱
-            score = 0.0
-            summary = None
-
-            for line in response.split('\n'):
-                line = line.strip()
-                if line.startswith('점수:'):
-                    try:
-                        score_text = line.replace('점수:', '').strip()
-                        # 숫자 추출
-                        match = re.search(r'[-+]?\d*\.?\d+', score_text)
-                        if match:
-                            score = float(match.group())
-                            score = max(-2.0, min(2.0, score))
-                    except ValueError:
-                        pass
-                elif line.startswith('요약:'):
-                    summary = line.replace('요약:', '').strip()
-
-            return {'summary': summary, 'score': score}
+            total_weight = sum(story.weight for story in scored)
+            score = sum(story.ai_score * story.weight for story in scored) / total_weight
+            lead = max(scored, key=lambda story: (story.weight, abs(story.ai_score)))
+
+            return {'summary': lead.ai_summary, 'score': round(score, 2)}
 
         except Exception as e:
             self.logger.error(f"AI analysis failed: {e}")
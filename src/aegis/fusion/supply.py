@@ -6,6 +6,7 @@ Supply Demand Analyzer - Phase 4
 - 외국인/기관 순매수 동향 분석
 - 양매수(Dual Buy) 패턴 감지
 - 연속 순매수 패턴 감지
+- 시장 전체 수급 패널(InvestorFlowPanel) 기반 조회 (거래일당 pykrx 6회)
 """
 import asyncio
 from datetime import datetime, timedelta
@@ -14,8 +15,13 @@ from dataclasses import dataclass
 from enum import Enum
 import logging
 
+import pandas as pd
 from pykrx import stock
 
+from src.utils.async_cache import AsyncTTLCache
+from src.utils.sqlite_cache import get_l2_cache
+from .supply_panel import InvestorFlowPanel, get_investor_flow_panel
+
 
 class SupplyPattern(Enum):
     """수급 패턴 분류"""
@@ -55,8 +61,10 @@ class SupplyDemandAnalyzer:
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._cache: Dict[str, SupplyDemandResult] = {}
-        self._cache_ttl = timedelta(minutes=10)
+        self._cache: AsyncTTLCache[SupplyDemandResult] = AsyncTTLCache(
+            "supply", ttl=timedelta(minutes=10), maxsize=1024, l2=get_l2_cache()
+        )
+        self.panel: InvestorFlowPanel = get_investor_flow_panel()
 
     async def analyze(self, ticker: str, days: int = 10) -> SupplyDemandResult:
         """
@@ -69,62 +77,117 @@ class SupplyDemandAnalyzer:
         Returns:
             SupplyDemandResult: 분석 결과
         """
-        # 캐시 확인
-        cache_key = f"{ticker}_{days}"
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            cached_time = datetime.fromisoformat(cached.analyzed_at)
-            if datetime.now() - cached_time < self._cache_ttl:
-                self.logger.debug(f"Cache hit for {ticker}")
-                return cached
-
         try:
-            # pykrx에서 투자자별 거래 데이터 조회
-            investor_data = await self._fetch_investor_data(ticker, days)
+            # 캐시 조회 (동시 요청은 1회 조회 결과 공유, 실패도 잠시 캐시)
+            return await self._cache.get_or_load(
+                f"{ticker}_{days}", lambda: self._analyze_uncached(ticker, days)
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to analyze supply/demand for {ticker}: {e}")
+            return self._empty_result(ticker)
 
-            if not investor_data:
-                return self._empty_result(ticker)
+    async def analyze_market(self, days: int = 10) -> Dict[str, SupplyDemandResult]:
+        """
+        시장 전체 종목 수급 분석 (패널 1회 적재, 종목별 pykrx 호출 없음)
 
-            # 분석 수행
-            score, pattern, details = self._analyze_supply_demand(investor_data)
+        Returns:
+            {종목코드: SupplyDemandResult} - 결과는 종목별 캐시에도 저장
+        """
+        summary = await self._panel_summary(days)
+        if summary is None:
+            return {}
 
-            # 연속 순매수 일수 계산
-            foreign_consecutive = self._count_consecutive_buy(
-                investor_data, 'foreign_net'
-            )
-            inst_consecutive = self._count_consecutive_buy(
-                investor_data, 'inst_net'
-            )
+        results = {}
+        for ticker, row in zip(summary.index, summary.itertuples(index=False)):
+            result = self._result_from_summary(ticker, row._asdict())
+            self._cache.set(f"{ticker}_{days}", result)
+            results[ticker] = result
 
-            # 최근 데이터 (오늘 또는 가장 최근)
-            latest = investor_data[-1] if investor_data else {}
-
-            result = SupplyDemandResult(
-                ticker=ticker,
-                score=score,
-                pattern=pattern,
-                foreign_net=latest.get('foreign_net', 0),
-                inst_net=latest.get('inst_net', 0),
-                foreign_consecutive=foreign_consecutive,
-                inst_consecutive=inst_consecutive,
-                details=details,
-                analyzed_at=datetime.now().isoformat()
-            )
+        self.logger.info(f"Market supply analysis: {len(results)} tickers ({days} days)")
+        return results
 
-            # 캐시 저장
-            self._cache[cache_key] = result
+    async def _panel_summary(self, days: int) -> Optional[pd.DataFrame]:
+        """수급 패널 요약 (적재 실패 시 None → 종목별 조회)"""
+        try:
+            dates = await self.panel.load(days)
+        except Exception as e:
+            self.logger.warning(f"Investor flow panel unavailable: {e}")
+            return None
+        summary = self.panel.summary(dates) if dates else None
+        return summary if summary is not None and not summary.empty else None
+
+    def _result_from_summary(self, ticker: str, row: Dict[str, Any]) -> SupplyDemandResult:
+        """패널 요약 행 → SupplyDemandResult"""
+        row = {key: int(value) for key, value in row.items()}
+        score, pattern, details = self._score_supply(
+            row['foreign_net'], row['inst_net'],
+            row['total_foreign'], row['total_inst'],
+            row['foreign_consecutive'], row['inst_consecutive']
+        )
+        return SupplyDemandResult(
+            ticker=ticker,
+            score=score,
+            pattern=pattern,
+            foreign_net=row['foreign_net'],
+            inst_net=row['inst_net'],
+            foreign_consecutive=row['foreign_consecutive'],
+            inst_consecutive=row['inst_consecutive'],
+            details=details,
+            analyzed_at=datetime.now().isoformat()
+        )
 
-            self.logger.info(
-                f"Supply analysis for {ticker}: "
-                f"score={score:.2f}, pattern={pattern.value}, "
-                f"foreign_cons={foreign_consecutive}, inst_cons={inst_consecutive}"
+    async def _analyze_uncached(self, ticker: str, days: int) -> SupplyDemandResult:
+        """수급 분석 (캐시 miss 시 실행)"""
+        # 1. 시장 전체 패널 (인덱스 조회)
+        summary = await self._panel_summary(days)
+        if summary is not None and ticker in summary.index:
+            result = self._result_from_summary(ticker, summary.loc[ticker])
+            self.logger.debug(
+                f"Supply analysis for {ticker} (panel): "
+                f"score={result.score:.2f}, pattern={result.pattern.value}"
             )
-
             return result
 
-        except Exception as e:
-            self.logger.error(f"Failed to analyze supply/demand for {ticker}: {e}")
-            return self._empty_result(ticker)
+        # 2. 패널에 없는 종목 → pykrx 종목별 조회
+        investor_data = await self._fetch_investor_data(ticker, days)
+
+        if not investor_data:
+            # 대체값은 캐시하지 않음: negative cache(짧은 TTL) 후 analyze()가 _empty_result 반환
+            raise LookupError(f"No investor data for {ticker}")
+
+        # 분석 수행
+        score, pattern, details = self._analyze_supply_demand(investor_data)
+
+        # 연속 순매수 일수 계산
+        foreign_consecutive = self._count_consecutive_buy(
+            investor_data, 'foreign_net'
+        )
+        inst_consecutive = self._count_consecutive_buy(
+            investor_data, 'inst_net'
+        )
+
+        # 최근 데이터 (오늘 또는 가장 최근)
+        latest = investor_data[-1] if investor_data else {}
+
+        result = SupplyDemandResult(
+            ticker=ticker,
+            score=score,
+            pattern=pattern,
+            foreign_net=latest.get('foreign_net', 0),
+            inst_net=latest.get('inst_net', 0),
+            foreign_consecutive=foreign_consecutive,
+            inst_consecutive=inst_consecutive,
+            details=details,
+            analyzed_at=datetime.now().isoformat()
+        )
+
+        self.logger.info(
+            f"Supply analysis for {ticker}: "
+            f"score={score:.2f}, pattern={pattern.value}, "
+            f"foreign_cons={foreign_consecutive}, inst_cons={inst_consecutive}"
+        )
+
+        return result
 
     async def _fetch_investor_data(self, ticker: str, days: int) -> List[Dict[str, Any]]:
         """pykrx에서 투자자별 거래 데이터 조회"""
@@ -141,32 +204,27 @@ class SupplyDemandAnalyzer:
             if df is None or df.empty:
                 return []
 
-            # DataFrame 처리
-            data_list = []
-            for date_idx, row in df.iterrows():
-                try:
-                    # 외국인 순매수 (매수-매도)
-                    foreign_net = int(row.get('외국인합계', 0))
-                    # 기관 순매수
-                    inst_net = int(row.get('기관합계', 0))
-                    # 개인 순매수
-                    retail_net = int(row.get('개인', 0))
-
-                    data_list.append({
-                        'date': date_idx.strftime("%Y-%m-%d") if hasattr(date_idx, 'strftime') else str(date_idx),
-                        'foreign_net': foreign_net,
-                        'inst_net': inst_net,
-                        'retail_net': retail_net,
-                    })
-                except Exception as e:
-                    self.logger.debug(f"Skip row: {e}")
-                    continue
-
-            return data_list[-days:]  # 최근 N일
+            # 외국인 / 기관 / 개인 순매수 (최근 N일)
+            frame = (
+                df.reindex(columns=['외국인합계', '기관합계', '개인'])
+                .apply(pd.to_numeric, errors='coerce')
+                .fillna(0)
+                .astype('int64')
+                .tail(days)
+            )
+            return [
+                {
+                    'date': date_idx.strftime("%Y-%m-%d") if hasattr(date_idx, 'strftime') else str(date_idx),
+                    'foreign_net': int(foreign_net),
+                    'inst_net': int(inst_net),
+                    'retail_net': int(retail_net),
+                }
+                for date_idx, (foreign_net, inst_net, retail_net) in zip(frame.index, frame.to_numpy())
+            ]
 
         except Exception as e:
             self.logger.error(f"Failed to fetch investor data: {e}")
-            return []
+            raise
 
     def _analyze_supply_demand(
         self, data: List[Dict[str, Any]]
@@ -175,17 +233,31 @@ class SupplyDemandAnalyzer:
         if not data:
             return 0.0, SupplyPattern.NEUTRAL, {}
 
-        score = 0.0
-        details = {}
-
         # 최근 데이터 기준
         latest = data[-1]
-        foreign_net = latest.get('foreign_net', 0)
-        inst_net = latest.get('inst_net', 0)
 
-        # 기간 합계
-        total_foreign = sum(d.get('foreign_net', 0) for d in data)
-        total_inst = sum(d.get('inst_net', 0) for d in data)
+        return self._score_supply(
+            latest.get('foreign_net', 0),
+            latest.get('inst_net', 0),
+            # 기간 합계
+            sum(d.get('foreign_net', 0) for d in data),
+            sum(d.get('inst_net', 0) for d in data),
+            self._count_consecutive_buy(data, 'foreign_net'),
+            self._count_consecutive_buy(data, 'inst_net'),
+        )
+
+    def _score_supply(
+        self,
+        foreign_net: int,
+        inst_net: int,
+        total_foreign: int,
+        total_inst: int,
+        foreign_cons: int,
+        inst_cons: int
+    ) -> tuple[float, SupplyPattern, Dict[str, Any]]:
+        """최근 순매수/기간 누적/연속 일수 → 점수, 패턴, 상세"""
+        score = 0.0
+        details = {}
 
         details['latest_foreign'] = foreign_net
         details['latest_inst'] = inst_net
@@ -217,9 +289,6 @@ class SupplyDemandAnalyzer:
             pattern = SupplyPattern.NEUTRAL
 
         # 2. 연속 순매수 보너스: +0.5 (3일 이상)
-        foreign_cons = self._count_consecutive_buy(data, 'foreign_net')
-        inst_cons = self._count_consecutive_buy(data, 'inst_net')
-
         if foreign_cons >= 3:
             score += 0.5
             details['foreign_consecutive_bonus'] = True
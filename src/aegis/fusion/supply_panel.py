@@ -0,0 +1,300 @@
+"""
+Investor Flow Panel - Phase 4
+시장 전체 투자자별 순매수 패널 (일 단위)
+
+종목마다 pykrx를 호출하는 대신 거래일마다 시장 전체 순매수를 한 번에 조회:
+- 거래일 1일 = KOSPI/KOSDAQ × (외국인, 기관합계, 개인) = pykrx 6회 호출
+- 조회 결과는 stock_supply_demand 테이블에 저장 → 다른 프로세스/다음 실행은 DB에서 로드
+- 종목 조회는 ticker 인덱스 기반, 연속 순매수 일수는 전 종목 벡터 연산
+
+Usage:
+    panel = get_investor_flow_panel()
+    dates = await panel.load(days=10)
+    summary = panel.summary(dates)          # index: 종목코드
+    summary.loc['005930', 'foreign_consecutive']
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+from pykrx import stock
+
+from src.config.database import db
+
+
+class InvestorFlowPanel:
+    """
+    시장 전체 투자자별 순매수 패널
+
+    Note:
+        외국인은 pykrx 투자자 구분 '외국인' 기준 (종목별 조회의 '외국인합계'는
+        기타외국인 포함), 금액 단위는 원.
+    """
+
+    # 패널 컬럼 → pykrx 투자자 구분
+    INVESTORS: Dict[str, str] = {
+        'foreign_net': '외국인',
+        'inst_net': '기관합계',
+        'retail_net': '개인',
+    }
+
+    # 패널 컬럼 → stock_supply_demand 컬럼
+    DB_COLUMNS: Dict[str, str] = {
+        'foreign_net': 'foreigner_net',
+        'inst_net': 'institution_net',
+        'retail_net': 'individual_net',
+    }
+
+    MARKETS: Tuple[str, ...] = ("KOSPI", "KOSDAQ")
+
+    # DB에 이 종목 수 이상 저장된 날짜만 "적재 완료"로 간주 (부분 저장일은 재조회)
+    MIN_STORED_TICKERS = 1000
+
+    # 메모리에 유지할 최대 거래일 수
+    MAX_CACHED_DAYS = 40
+
+    # 장중 데이터는 확정 전 (HH시 이후 확정으로 간주), 메모리에서만 주기적으로 갱신
+    FINAL_HOUR = 18
+    INTRADAY_REFRESH = 600  # 초
+
+    def __init__(self, use_db: bool = True):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.use_db = use_db
+        self._days: Dict[str, pd.DataFrame] = {}          # YYYYMMDD → (ticker × INVESTORS)
+        self._dates: Dict[Tuple[str, int], List[str]] = {}  # (end_date, days) → 거래일 목록
+        self._summaries: Dict[Tuple[str, ...], pd.DataFrame] = {}
+        self._intraday: Dict[str, float] = {}              # 미확정 거래일 → 조회 시각
+        self._lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    async def trading_dates(self, days: int, end_date: Optional[str] = None) -> List[str]:
+        """최근 N 거래일 (YYYYMMDD, 오래된 순) - KOSPI 지수 일봉 1회 조회"""
+        end = end_date or datetime.now().strftime("%Y%m%d")
+        key = (end, days)
+        if key not in self._dates:
+            start = (datetime.strptime(end, "%Y%m%d") - timedelta(days=days * 2 + 10)).strftime("%Y%m%d")
+            df = await asyncio.to_thread(stock.get_index_ohlcv_by_date, start, end, "1001")
+            if df is None or df.empty:
+                return []
+            self._dates[key] = [d.strftime("%Y%m%d") for d in df.index[-days:]]
+        return self._dates[key]
+
+    async def load(self, days: int = 10, end_date: Optional[str] = None) -> List[str]:
+        """
+        최근 N 거래일 패널 적재 (메모리 → DB → pykrx 순)
+
+        Returns:
+            적재된 거래일 목록 (오래된 순)
+        """
+        dates = await self.trading_dates(days, end_date)
+
+        async with self._lock:
+            missing = [d for d in dates if self._needs_fetch(d)]
+
+            if missing and self.use_db:
+                self._days.update(await self._load_from_db(missing))
+                missing = [d for d in dates if d not in self._days]
+
+            fetched: Dict[str, pd.DataFrame] = {}
+            for date in missing:
+                frame = await asyncio.to_thread(self._fetch_day, date)
+                if frame.empty:
+                    continue
+                self._days[date] = frame
+                self._summaries = {k: v for k, v in self._summaries.items() if date not in k}
+                if self._is_final(date):
+                    self._intraday.pop(date, None)
+                    fetched[date] = frame
+                else:
+                    self._intraday[date] = time.monotonic()
+
+            if fetched and self.use_db:
+                await self._save_to_db(fetched)
+
+            self._evict()
+
+        return [d for d in dates if d in self._days]
+
+    def _is_final(self, date: str) -> bool:
+        now = datetime.now()
+        return date < now.strftime("%Y%m%d") or now.hour >= self.FINAL_HOUR
+
+    def _needs_fetch(self, date: str) -> bool:
+        if date not in self._days:
+            return True
+        fetched_at = self._intraday.get(date)
+        return fetched_at is not None and time.monotonic() - fetched_at > self.INTRADAY_REFRESH
+
+    def _fetch_day(self, date: str) -> pd.DataFrame:
+        """거래일 1일 시장 전체 순매수 (pykrx 6회 호출)"""
+        markets = []
+        for market in self.MARKETS:
+            columns = {}
+            for column, investor in self.INVESTORS.items():
+                df = stock.get_market_net_purchases_of_equities(date, date, market, investor)
+                if df is not None and not df.empty:
+                    columns[column] = df['순매수거래대금']
+            if columns:
+                markets.append(pd.DataFrame(columns))
+
+        if not markets:
+            return pd.DataFrame(columns=list(self.INVESTORS))
+
+        frame = pd.concat(markets)
+        frame = frame[~frame.index.duplicated(keep='first')]
+        frame.index.name = 'stock_code'
+        self.logger.info(f"Investor flow panel fetched for {date}: {len(frame)} tickers")
+        return frame.reindex(columns=list(self.INVESTORS)).fillna(0).astype(np.int64)
+
+    async def _ensure_db(self) -> bool:
+        if db.pool is not None:
+            return True
+        try:
+            await db.connect()
+            return True
+        except Exception as e:
+            self.logger.warning(f"stock_supply_demand unavailable, using memory only: {e}")
+            self.use_db = False
+            return False
+
+    async def _load_from_db(self, dates: List[str]) -> Dict[str, pd.DataFrame]:
+        """저장된 거래일 로드 (날짜별 종목 수가 MIN_STORED_TICKERS 이상인 날만)"""
+        if not await self._ensure_db():
+            return {}
+        try:
+            # FK로 stocks 등록 종목만 저장되므로 등록 종목 수 기준으로 완결성 판단
+            registered = await db.fetchval("SELECT COUNT(*) FROM stocks")
+            rows = await db.fetch(
+                f"""
+                SELECT stock_code, date, {', '.join(self.DB_COLUMNS.values())}
+                FROM stock_supply_demand
+                WHERE date = ANY($1::date[])
+                """,
+                [datetime.strptime(d, "%Y%m%d").date() for d in dates]
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to load investor flow panel from DB: {e}")
+            return {}
+
+        if not rows:
+            return {}
+        df = pd.DataFrame(rows).rename(columns={v: k for k, v in self.DB_COLUMNS.items()})
+        threshold = min(self.MIN_STORED_TICKERS, int((registered or 0) * 0.9))
+        loaded = {}
+        for date, group in df.groupby('date'):
+            key = date.strftime("%Y%m%d")
+            if len(group) < max(threshold, 1) or not self._is_final(key):
+                continue
+            frame = group.set_index('stock_code')[list(self.INVESTORS)].fillna(0).astype(np.int64)
+            loaded[key] = frame
+        return loaded
+
+    async def _save_to_db(self, frames: Dict[str, pd.DataFrame]):
+        """stock_supply_demand upsert (stocks에 등록된 종목만 - FK)"""
+        if not await self._ensure_db():
+            return
+        codes, dates, foreign, inst, retail = [], [], [], [], []
+        for date, frame in frames.items():
+            day = datetime.strptime(date, "%Y%m%d").date()
+            codes.extend(frame.index.tolist())
+            dates.extend([day] * len(frame))
+            foreign.extend(frame['foreign_net'].tolist())
+            inst.extend(frame['inst_net'].tolist())
+            retail.extend(frame['retail_net'].tolist())
+        try:
+            await db.execute(
+                """
+                INSERT INTO stock_supply_demand
+                    (stock_code, date, foreigner_net, institution_net, individual_net)
+                SELECT t.stock_code, t.date, t.foreigner_net, t.institution_net, t.individual_net
+                FROM unnest($1::varchar[], $2::date[], $3::bigint[], $4::bigint[], $5::bigint[])
+                    AS t(stock_code, date, foreigner_net, institution_net, individual_net)
+                JOIN stocks s ON s.stock_code = t.stock_code
+                ON CONFLICT (stock_code, date) DO UPDATE SET
+                    foreigner_net = EXCLUDED.foreigner_net,
+                    institution_net = EXCLUDED.institution_net,
+                    individual_net = EXCLUDED.individual_net
+                """,
+                codes, dates, foreign, inst, retail
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to store investor flow panel: {e}")
+
+    def _evict(self):
+        if len(self._days) > self.MAX_CACHED_DAYS:
+            for date in sorted(self._days)[:-self.MAX_CACHED_DAYS]:
+                del self._days[date]
+                self._intraday.pop(date, None)
+            self._summaries.clear()
+
+    # ------------------------------------------------------------------
+    # Vectorized views
+    # ------------------------------------------------------------------
+
+    def wide(self, column: str, dates: List[str]) -> pd.DataFrame:
+        """(거래일 × 종목) 순매수 행렬"""
+        frames = {d: self._days[d][column] for d in dates if d in self._days}
+        if not frames:
+            return pd.DataFrame()
+        return pd.DataFrame(frames).T.fillna(0)
+
+    @staticmethod
+    def consecutive_buy_days(wide: pd.DataFrame) -> pd.Series:
+        """최근일부터 연속 순매수(>0) 일수 - 전 종목 벡터 연산"""
+        if wide.empty:
+            return pd.Series(dtype=np.int64)
+        positive = wide.to_numpy() > 0
+        counts = np.cumprod(positive[::-1], axis=0).sum(axis=0)
+        return pd.Series(counts.astype(np.int64), index=wide.columns)
+
+    def summary(self, dates: List[str]) -> pd.DataFrame:
+        """
+        종목별 수급 요약 (index: 종목코드)
+
+        Columns:
+            foreign_net / inst_net / retail_net: 최근 거래일 순매수
+            total_foreign / total_inst: 기간 누적 순매수
+            foreign_consecutive / inst_consecutive: 연속 순매수 일수
+        """
+        key = tuple(dates)
+        if key in self._summaries:
+            return self._summaries[key]
+
+        foreign = self.wide('foreign_net', dates)
+        inst = self.wide('inst_net', dates)
+        retail = self.wide('retail_net', dates)
+        if foreign.empty:
+            return pd.DataFrame()
+
+        result = pd.DataFrame({
+            'foreign_net': foreign.iloc[-1],
+            'inst_net': inst.iloc[-1],
+            'retail_net': retail.iloc[-1],
+            'total_foreign': foreign.sum(),
+            'total_inst': inst.sum(),
+            'foreign_consecutive': self.consecutive_buy_days(foreign),
+            'inst_consecutive': self.consecutive_buy_days(inst),
+        }).fillna(0).astype(np.int64)
+        result.index.name = 'stock_code'
+
+        self._summaries[key] = result
+        return result
+
+
+# Singleton instance
+_panel_instance: Optional[InvestorFlowPanel] = None
+
+
+def get_investor_flow_panel() -> InvestorFlowPanel:
+    """Get singleton InvestorFlowPanel instance"""
+    global _panel_instance
+    if _panel_instance is None:
+        _panel_instance = InvestorFlowPanel()
+    return _panel_instance
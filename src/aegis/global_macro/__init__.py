@@ -3,16 +3,28 @@ AEGIS Global Macro Module - Phase 4.5
 글로벌 시장 분석 및 커플링 전략
 
 Components:
-- GlobalMarketFetcher: 미국 시장 데이터 수집 (yfinance)
-- CouplingAnalyzer: 미국-한국 종목 커플링 분석
+- GlobalMacroSnapshot: 해외 심볼 일괄 다운로드 + 세션 기반 공유 스냅샷 (yfinance)
+- GlobalMarketFetcher: 미국 시장 데이터 수집 (스냅샷 기반)
+- CouplingEngine: 전 종목 × 미국 지수/섹터 ETF/ADR 롤링 상관/베타 top-k 색인
+- CouplingAnalyzer: 미국-한국 종목 커플링 분석 (색인 조회)
 """
 
+from .snapshot import GlobalMacroSnapshot, get_global_macro_snapshot, MacroSnapshot, MacroQuote
 from .fetcher import GlobalMarketFetcher, get_global_market_fetcher
+from .coupling_index import CouplingEngine, get_coupling_engine, CouplingIndex, CouplingLink
 from .coupling import CouplingAnalyzer, get_coupling_analyzer, CouplingResult
 
 __all__ = [
+    'GlobalMacroSnapshot',
+    'get_global_macro_snapshot',
+    'MacroSnapshot',
+    'MacroQuote',
     'GlobalMarketFetcher',
     'get_global_market_fetcher',
+    'CouplingEngine',
+    'get_coupling_engine',
+    'CouplingIndex',
+    'CouplingLink',
     'CouplingAnalyzer',
     'get_coupling_analyzer',
     'CouplingResult',
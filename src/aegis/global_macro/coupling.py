@@ -3,7 +3,7 @@ Coupling Analyzer - Phase 4.5
 미국-한국 종목 커플링 분석
 
 핵심 기능:
-- 미국 종목과 한국 종목 간 연관성 매핑
+- 미국 종목과 한국 종목 간 연관성 매핑 (CouplingEngine 상관/베타 색인 조회, 없으면 수동 매핑)
 - 미국 시장 변화가 한국 종목에 미치는 영향 분석
 - 커플링 조정 점수 산출
 """
@@ -21,6 +21,8 @@ from .fetcher import (
     MarketSentiment,
     IndexData
 )
+from .snapshot import MacroSnapshot
+from .coupling_index import CouplingEngine, CouplingIndex, CouplingLink, get_coupling_engine
 
 
 class CouplingStrength(Enum):
@@ -70,12 +72,20 @@ class CouplingAnalyzer:
     미국-한국 종목 커플링 분석기
 
     Phase 4.5 Spec:
-    - 미국 종목/지수와 한국 종목 간 연관성 분석
+    - 미국 종목/지수와 한국 종목 간 연관성 분석 (전 종목 상관/베타 색인, 수동 매핑은 fallback)
     - 미국 시장 변화에 따른 한국 종목 영향도 계산
     - FusionEngine 가중치 조정용 점수 산출
     """
 
-    # 커플링 매핑 정의
+    # 유의수준 배율 → 커플링 강도 (색인 검정 ALPHA/M에 배율을 곱한 더 엄격한 검정 통과 시)
+    # 임계 |ρ|는 CouplingEngine.critical_correlation(관측 수)로 계산: 60일·45심볼 기준
+    # WEAK 0.46 (색인 검정 자체) / MODERATE 0.52 / STRONG 0.57
+    CORRELATION_STRENGTH = [
+        (0.01, CouplingStrength.STRONG),
+        (0.1, CouplingStrength.MODERATE),
+    ]
+
+    # 수동 커플링 매핑 (상관 색인에 없는 종목용: 신규 상장, 거래정지, DB 미연결)
     COUPLING_MAP: Dict[str, CouplingMapping] = {
         # 반도체
         '005930': CouplingMapping(
@@ -215,6 +225,7 @@ class CouplingAnalyzer:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self._global_fetcher = get_global_market_fetcher()
+        self._engine = get_coupling_engine()
         self._cached_global_data: Optional[GlobalMarketData] = None
 
     async def analyze(
@@ -235,32 +246,77 @@ class CouplingAnalyzer:
             CouplingResult: 커플링 분석 결과
         """
         self.logger.info(f"Analyzing coupling for {stock_name}({stock_code})")
+        global_data, snapshot, index = await self._load_context()
+        return self._analyze(stock_code, stock_name, sector, global_data, snapshot, index)
 
-        # 1. 글로벌 시장 데이터 조회
-        global_data = await self._get_global_data()
+    async def analyze_batch(
+        self,
+        stocks: List[Tuple[str, str, Optional[str]]]
+    ) -> Dict[str, CouplingResult]:
+        """
+        다수 종목 일괄 분석 (시장 데이터/색인 1회 조회 후 종목별 색인 조회)
+
+        Args:
+            stocks: [(stock_code, stock_name, sector), ...] 리스트
+
+        Returns:
+            Dict[stock_code, CouplingResult]
+        """
+        global_data, snapshot, index = await self._load_context()
+
+        results = {}
+        for stock_code, stock_name, sector in stocks:
+            try:
+                results[stock_code] = self._analyze(
+                    stock_code, stock_name, sector, global_data, snapshot, index
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to analyze {stock_code}: {e}")
 
-        # 2. 커플링 매핑 조회
-        mapping = self._get_coupling_mapping(stock_code, stock_name, sector)
+        return results
 
-        # 3. 연관 미국 종목/지수 데이터 추출
-        related_stocks = self._extract_related_stocks(global_data, mapping)
-        related_indices = self._extract_related_indices(global_data, mapping)
+    async def _load_context(self) -> Tuple[GlobalMarketData, MacroSnapshot, Optional[CouplingIndex]]:
+        """글로벌 시장 데이터 + 스냅샷 + 커플링 색인 (모두 공유 캐시)"""
+        global_data = await self._get_global_data()
+        snapshot = await self._global_fetcher.snapshot.get()
+        index = await self._engine.get_index()
+        return global_data, snapshot, index
 
-        # 4. 심리 분석
+    def _analyze(
+        self,
+        stock_code: str,
+        stock_name: str,
+        sector: Optional[str],
+        global_data: GlobalMarketData,
+        snapshot: MacroSnapshot,
+        index: Optional[CouplingIndex]
+    ) -> CouplingResult:
+        """커플링 분석 (I/O 없음)"""
+        if index is not None and stock_code in index:
+            # 1. 상관 색인 기반 매핑 (유의한 연결이 없으면 커플링 없음, 수동 매핑으로 대체하지 않음)
+            links = index.lookup(stock_code)
+            mapping = self._mapping_from_links(stock_code, stock_name, sector, links, index)
+            related_stocks, related_indices = self._extract_linked_quotes(snapshot, links)
+            coupling_score = self._calculate_link_score(links, snapshot)
+        else:
+            # 1'. 수동 매핑 (색인에 없는 종목)
+            mapping = self._get_coupling_mapping(stock_code, stock_name, sector)
+            related_stocks = self._extract_related_stocks(global_data, mapping)
+            related_indices = self._extract_related_indices(global_data, mapping)
+            coupling_score = self._calculate_coupling_score(
+                related_stocks, related_indices, mapping.coupling_strength
+            )
+
+        # 2. 심리 분석
         us_sentiment = global_data.overall_sentiment
         sector_sentiment = self._get_sector_sentiment(global_data, mapping.sector)
 
-        # 5. 커플링 점수 계산
-        coupling_score = self._calculate_coupling_score(
-            related_stocks, related_indices, mapping.coupling_strength
-        )
-
-        # 6. 조정 계수 계산
+        # 3. 조정 계수 계산
         adjustment_factor = self._calculate_adjustment_factor(
             coupling_score, mapping.coupling_strength
         )
 
-        # 7. 분석 이유 생성
+        # 4. 분석 이유 생성
         analysis_reason = self._generate_analysis_reason(
             mapping, us_sentiment, sector_sentiment, coupling_score
         )
@@ -279,32 +335,6 @@ class CouplingAnalyzer:
             analyzed_at=datetime.now().isoformat()
         )
 
-    async def analyze_batch(
-        self,
-        stocks: List[Tuple[str, str, Optional[str]]]
-    ) -> Dict[str, CouplingResult]:
-        """
-        다수 종목 일괄 분석
-
-        Args:
-            stocks: [(stock_code, stock_name, sector), ...] 리스트
-
-        Returns:
-            Dict[stock_code, CouplingResult]
-        """
-        # 글로벌 데이터 한 번만 조회
-        self._cached_global_data = await self._global_fetcher.fetch()
-
-        results = {}
-        for stock_code, stock_name, sector in stocks:
-            try:
-                result = await self.analyze(stock_code, stock_name, sector)
-                results[stock_code] = result
-            except Exception as e:
-                self.logger.warning(f"Failed to analyze {stock_code}: {e}")
-
-        return results
-
     async def _get_global_data(self) -> GlobalMarketData:
         """글로벌 시장 데이터 조회 (캐시 활용)"""
         if self._cached_global_data:
@@ -336,6 +366,104 @@ class CouplingAnalyzer:
             description=f'{sector_key} 섹터 기본 커플링'
         )
 
+    def _mapping_from_links(
+        self,
+        stock_code: str,
+        stock_name: str,
+        sector: Optional[str],
+        links: List[CouplingLink],
+        index: CouplingIndex
+    ) -> CouplingMapping:
+        """상관 색인 연결 → 커플링 매핑"""
+        if not links:
+            return CouplingMapping(
+                kr_stock_code=stock_code,
+                kr_stock_name=stock_name,
+                us_symbols=[],
+                us_indices=[],
+                sector=sector or 'default',
+                coupling_strength=CouplingStrength.NONE,
+                description=f"유의한 미국 연결 없음 ({index.window}일, {index.as_of})"
+            )
+
+        top = links[0]
+        # 색인에 남은 연결은 이미 유의성 검정을 통과 → 최소 WEAK
+        strength = CouplingStrength.WEAK
+        alpha = CouplingEngine.ALPHA / max(len(index.symbols), 1)
+        for scale, level in self.CORRELATION_STRENGTH:
+            critical = float(CouplingEngine.critical_correlation(top.observations, alpha * scale))
+            if abs(top.correlation) >= critical:
+                strength = level
+                break
+
+        return CouplingMapping(
+            kr_stock_code=stock_code,
+            kr_stock_name=stock_name,
+            us_symbols=[l.symbol for l in links if CouplingEngine.is_stock(l.symbol)],
+            us_indices=[l.symbol for l in links if not CouplingEngine.is_stock(l.symbol)],
+            sector=sector or self._engine.sector_of(links) or 'default',
+            coupling_strength=strength,
+            description=(
+                f"{top.symbol} 상관 {top.correlation:+.2f} / 베타 {top.beta:.2f} "
+                f"({index.window}일, {index.as_of})"
+            )
+        )
+
+    def _extract_linked_quotes(
+        self,
+        snapshot: MacroSnapshot,
+        links: List[CouplingLink]
+    ) -> Tuple[Dict[str, IndexData], Dict[str, IndexData]]:
+        """연결 심볼 시세 추출 → (종목/ADR, 지수/ETF)"""
+        names = {
+            **GlobalMarketFetcher.INDICES, **GlobalMarketFetcher.KEY_STOCKS,
+            **CouplingEngine.SECTOR_ETFS, **CouplingEngine.ADRS,
+        }
+        timestamp = snapshot.fetched_datetime.isoformat()
+        stocks, indices = {}, {}
+        for link in links:
+            quote = snapshot.quotes.get(link.symbol)
+            if quote is None:
+                continue
+            target = stocks if CouplingEngine.is_stock(link.symbol) else indices
+            target[link.symbol] = IndexData(
+                symbol=link.symbol,
+                name=names.get(link.symbol, link.symbol),
+                price=quote.price,
+                change=quote.change,
+                change_pct=quote.change_pct,
+                volume=quote.volume,
+                timestamp=timestamp
+            )
+        return stocks, indices
+
+    def _calculate_link_score(
+        self,
+        links: List[CouplingLink],
+        snapshot: MacroSnapshot
+    ) -> float:
+        """
+        상관 색인 커플링 점수 (-100 ~ +100)
+
+        연결 심볼의 전일 변화율 × 베타(= 종목 기대 변화율)를 설명력(ρ²)으로 가중 평균해 점수화
+        """
+        weighted = 0.0
+        total_weight = 0.0
+        for link in links:
+            quote = snapshot.quotes.get(link.symbol)
+            if quote is None:
+                continue
+            weight = link.correlation ** 2
+            weighted += weight * link.beta * quote.change_pct
+            total_weight += weight
+
+        if total_weight == 0:
+            return 0.0
+
+        # 점수화 (기대 변화율 * 10, -100~+100 범위로 클램핑)
+        score = max(-100, min(100, weighted / total_weight * 10))
+        return round(score, 2)
+
     def _extract_related_stocks(
         self,
         global_data: GlobalMarketData,
@@ -468,7 +596,7 @@ class CouplingAnalyzer:
         )
 
     def get_supported_mappings(self) -> List[str]:
-        """지원하는 종목 코드 목록 반환"""
+        """수동 매핑 종목 코드 목록 반환 (상관 색인 종목은 get_coupling_engine() 참고)"""
         return list(self.COUPLING_MAP.keys())
 
     def add_custom_mapping(self, mapping: CouplingMapping):
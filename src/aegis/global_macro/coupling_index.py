@@ -0,0 +1,420 @@
+"""
+Coupling Index - Phase 4.5
+미국-한국 데이터 기반 커플링 색인 (롤링 상관/베타 행렬 → 종목별 top-k)
+
+수동 매핑(COUPLING_MAP) 대신 전 종목 수익률과 미국 지수/섹터 ETF/ADR 수익률의 관계를 직접 계산:
+- KRX 일봉 종가 패널(daily_ohlcv) × 미국 종가 이력(GlobalMacroSnapshot.history) 1일 1회 계산
+- 시차 정렬: KRX 거래일 t ↔ t 이전 마지막 미국 거래일 (KRX 휴장 사이 미국 수익률은 누적)
+- 최근 WINDOW 거래일 상관/베타를 결측 마스크 행렬곱으로 한 번에 계산 (종목 N × 심볼 M)
+- 종목마다 심볼 수로 본페로니 보정한 상관 t-검정을 통과한 연결만 남김 (무상관 종목은 연결 없음)
+- 종목마다 |상관| 상위 TOP_K 심볼만 압축 저장 (int16/float32) → analyze는 조회만 수행
+
+색인은 L2 디스크 캐시(coupling_index)에 계산일별로 저장되어 cron 프로세스 간 공유됩니다.
+
+Usage:
+    engine = get_coupling_engine()
+    index = await engine.get_index()
+    index.lookup('005930')   # [CouplingLink('^SOX', 0.62, 1.08, 60), ...]
+"""
+import asyncio
+import time
+from statistics import NormalDist
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.config.database import db
+from src.utils.sqlite_cache import SQLiteCache, get_l2_cache
+
+from .fetcher import GlobalMarketFetcher
+from .snapshot import GlobalMacroSnapshot, get_global_macro_snapshot
+
+
+@dataclass
+class CouplingLink:
+    """종목-미국 심볼 연결"""
+    symbol: str
+    correlation: float     # 시차 수익률 상관계수
+    beta: float            # 미국 수익률 1%당 종목 수익률 (%)
+    observations: int      # 계산에 쓴 공통 거래일 수
+
+
+@dataclass
+class CouplingIndex:
+    """종목별 top-k 커플링 (행: 종목, 열: 순위)"""
+    as_of: str                    # 마지막 KRX 거래일 (YYYY-MM-DD)
+    window: int
+    symbols: List[str]            # 미국 심볼 (top_symbol 값의 대상)
+    codes: List[str]              # 종목코드 (행)
+    top_symbol: np.ndarray        # (N, k) int16, symbols 인덱스 (-1 = 없음)
+    top_corr: np.ndarray          # (N, k) float32
+    top_beta: np.ndarray          # (N, k) float32
+    top_obs: np.ndarray           # (N, k) int16
+    built_at: float = field(default_factory=time.time)
+    rows: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        if not self.rows:
+            self.rows = {code: i for i, code in enumerate(self.codes)}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.rows
+
+    def lookup(self, code: str) -> List[CouplingLink]:
+        """종목의 커플링 심볼 (|상관| 내림차순), 없으면 빈 리스트"""
+        row = self.rows.get(code)
+        if row is None:
+            return []
+        return [
+            CouplingLink(
+                symbol=self.symbols[j],
+                correlation=round(float(c), 3),
+                beta=round(float(b), 3),
+                observations=int(n),
+            )
+            for j, c, b, n in zip(
+                self.top_symbol[row], self.top_corr[row], self.top_beta[row], self.top_obs[row]
+            )
+            if j >= 0
+        ]
+
+
+class CouplingEngine:
+    """
+    롤링 상관/베타 커플링 색인 생성기
+
+    Args:
+        snapshot: 미국 종가 이력 공급원 (기본 GlobalMacroSnapshot 싱글톤)
+        l2: 색인 저장용 디스크 캐시 (None이면 프로세스 메모리만)
+    """
+
+    # 섹터 ETF (지수보다 업종 연동이 뚜렷한 종목용)
+    SECTOR_ETFS = {
+        'SOXX': 'iShares 반도체',
+        'SMH': 'VanEck 반도체',
+        'XLK': '기술 섹터',
+        'XLC': '커뮤니케이션 섹터',
+        'XLE': '에너지 섹터',
+        'XLU': '유틸리티 섹터',
+        'XLF': '금융 섹터',
+        'XLV': '헬스케어 섹터',
+        'XLI': '산업재 섹터',
+        'XLB': '소재 섹터',
+        'XLY': '임의소비재 섹터',
+        'LIT': '리튬/2차전지',
+        'TAN': '태양광',
+        'EWY': 'MSCI 한국',
+    }
+
+    # 미국 상장 한국 기업 ADR
+    ADRS = {
+        'PKX': 'POSCO홀딩스 ADR',
+        'KB': 'KB금융 ADR',
+        'SHG': '신한지주 ADR',
+        'WF': '우리금융지주 ADR',
+        'KEP': '한국전력 ADR',
+        'SKM': 'SK텔레콤 ADR',
+        'KT': 'KT ADR',
+        'LPL': 'LG디스플레이 ADR',
+    }
+
+    # 심볼 → GlobalMarketData.sector_sentiments 섹터 (섹터 미지정 종목의 섹터 추정용)
+    SYMBOL_SECTORS = {
+        **dict.fromkeys(['NVDA', 'MU', 'AMD', 'INTC', 'ASML', '^SOX', 'SOXX', 'SMH', 'LPL'], 'semiconductor'),
+        **dict.fromkeys(['TSLA', 'RIVN', 'ALB', 'LIT'], 'ev_battery'),
+        **dict.fromkeys(['META', 'GOOGL', 'AAPL', 'XLK', 'XLC', 'SKM', 'KT'], 'tech'),
+        **dict.fromkeys(['FSLR', 'ENPH', 'NEE', 'TAN', 'XLE', 'XLU', 'KEP'], 'energy'),
+        **dict.fromkeys(['XLF', 'KB', 'SHG', 'WF'], 'financial'),
+    }
+
+    WINDOW = 60                   # 롤링 창 (KRX 거래일)
+    MIN_OBSERVATIONS = 40         # 최소 공통 거래일 (신규 상장/거래정지 종목 제외)
+    TOP_K = 5
+    # 종목당 유의수준 (심볼 M개 동시 검정 → 쌍별 ALPHA / M, 본페로니)
+    # 고정 |ρ| 하한(0.35)은 60일 창에서 무상관 종목의 22%에 연결을 남김
+    ALPHA = 0.01
+
+    L2_NAMESPACE = "coupling_index"
+    L2_TTL = timedelta(days=3)
+    RETRY_INTERVAL = timedelta(minutes=10)
+
+    def __init__(
+        self,
+        snapshot: Optional[GlobalMacroSnapshot] = None,
+        l2: Optional[SQLiteCache] = None
+    ):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.snapshot = snapshot or get_global_macro_snapshot()
+        self.l2 = l2
+        self.snapshot.track(self.universe())
+        self._index: Optional[CouplingIndex] = None
+        self._index_day: Optional[str] = None
+        self._last_attempt = 0.0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def universe(cls) -> List[str]:
+        """상관 계산 대상 미국 심볼 (지수 + 핵심 종목 + 섹터 ETF + ADR)"""
+        symbols = [
+            *GlobalMarketFetcher.INDICES, *GlobalMarketFetcher.KEY_STOCKS,
+            *cls.SECTOR_ETFS, *cls.ADRS,
+        ]
+        return list(dict.fromkeys(symbols))
+
+    @classmethod
+    def is_stock(cls, symbol: str) -> bool:
+        """개별 종목/ADR 여부 (지수/ETF와 구분)"""
+        return symbol in GlobalMarketFetcher.KEY_STOCKS or symbol in cls.ADRS
+
+    def sector_of(self, links: Sequence[CouplingLink]) -> Optional[str]:
+        """상관이 가장 높은 섹터 심볼의 섹터"""
+        for link in links:
+            sector = self.SYMBOL_SECTORS.get(link.symbol)
+            if sector is not None and link.correlation > 0:
+                return sector
+        return None
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    async def get_index(self) -> Optional[CouplingIndex]:
+        """
+        오늘자 커플링 색인 (메모리 → L2 → 계산 순, 1일 1회 계산)
+
+        Returns:
+            CouplingIndex (데이터가 없으면 직전 색인 또는 None)
+        """
+        today = datetime.now().strftime("%Y%m%d")
+        if self._index_day == today:
+            return self._index
+
+        async with self._lock:
+            if self._index_day == today:
+                return self._index
+
+            stored = await self._load(today)
+            if stored is not None:
+                self._index, self._index_day = stored, today
+                return self._index
+
+            now = time.monotonic()
+            if self._last_attempt and now - self._last_attempt < self.RETRY_INTERVAL.total_seconds():
+                return self._index
+            self._last_attempt = now
+
+            try:
+                index = await self.build()
+            except Exception as e:
+                self.logger.warning(f"Coupling index build failed: {e}")
+                index = None
+
+            if index is not None:
+                self._index, self._index_day = index, today
+                await self._save(today, index)
+            return self._index
+
+    async def build(self) -> Optional[CouplingIndex]:
+        """KRX 종가 패널 + 미국 종가 이력으로 색인 계산"""
+        us_close = await self.snapshot.history()
+        us_close = us_close.reindex(columns=[s for s in self.universe() if s in us_close.columns])
+        if us_close.empty:
+            self.logger.warning("US close history unavailable, coupling index skipped")
+            return None
+
+        # 창 + 여유분 (KRX 휴장일 감안 달력일 환산)
+        since = max(
+            us_close.index.min(),
+            pd.Timestamp.now().normalize() - pd.Timedelta(days=int(self.WINDOW * 1.6) + 15),
+        )
+        krx_close = await self._load_krx_close(since)
+        if krx_close.empty:
+            self.logger.warning("KRX close panel unavailable, coupling index skipped")
+            return None
+
+        index = await asyncio.to_thread(self.compute, krx_close, us_close)
+        self.logger.info(
+            f"Coupling index built: {len(index)} stocks × {len(index.symbols)} US symbols "
+            f"(as of {index.as_of}, window {index.window})"
+        )
+        return index
+
+    async def _load_krx_close(self, since: pd.Timestamp) -> pd.DataFrame:
+        """daily_ohlcv 종가 패널 (거래일 × 종목코드)"""
+        if db.pool is None:
+            await db.connect()
+        rows = await db.fetch(
+            """
+            SELECT stock_code, date, close
+            FROM daily_ohlcv
+            WHERE date >= $1 AND close > 0
+            ORDER BY date
+            """,
+            since.date()
+        )
+        if not rows:
+            return pd.DataFrame()
+        df = pd.DataFrame([dict(r) for r in rows])
+        wide = df.pivot_table(index='date', columns='stock_code', values='close', aggfunc='last')
+        wide.index = pd.DatetimeIndex(wide.index)
+        return wide.astype(float)
+
+    # ------------------------------------------------------------------
+    # Vectorized computation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def lagged_log_prices(us_close: pd.DataFrame, krx_dates: pd.DatetimeIndex) -> pd.DataFrame:
+        """KRX 거래일 t에 t 이전 마지막 미국 거래일 로그 종가 정렬 (미국 휴장일은 직전 종가 유지)"""
+        log_us = np.log(us_close.where(us_close > 0)).ffill()
+        positions = log_us.index.searchsorted(krx_dates, side='left') - 1
+        values = log_us.to_numpy()[np.clip(positions, 0, None)]
+        values[positions < 0] = np.nan
+        return pd.DataFrame(values, index=krx_dates, columns=log_us.columns)
+
+    @staticmethod
+    def masked_moments(x: np.ndarray, y: np.ndarray):
+        """
+        결측 쌍을 제외한 상관/베타 행렬
+
+        Args:
+            x: (T, N) 종목 수익률 (NaN = 결측)
+            y: (T, M) 미국 수익률
+
+        Returns:
+            (corr, beta, n) 각 (N, M) - 종목 i와 심볼 j의 공통 관측만 사용
+        """
+        mx = ~np.isnan(x)
+        my = ~np.isnan(y)
+        x0 = np.where(mx, x, 0.0)
+        y0 = np.where(my, y, 0.0)
+        fx = mx.astype(float)
+        fy = my.astype(float)
+
+        n = fx.T @ fy
+        sx = x0.T @ fy
+        sy = fx.T @ y0
+        sxx = (x0 * x0).T @ fy
+        syy = fx.T @ (y0 * y0)
+        sxy = x0.T @ y0
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = sxy / n - sx * sy / (n * n)
+            var_x = sxx / n - (sx / n) ** 2
+            var_y = syy / n - (sy / n) ** 2
+            corr = cov / np.sqrt(var_x * var_y)
+            beta = cov / var_y
+        bad = (var_x <= 1e-12) | (var_y <= 1e-12)
+        corr[bad] = np.nan
+        beta[bad] = np.nan
+        return corr, beta, n
+
+    @staticmethod
+    def critical_correlation(n: np.ndarray, alpha: float) -> np.ndarray:
+        """
+        양측 상관 t-검정 임계 |ρ| (t = ρ√(n-2) / √(1-ρ²), 자유도 n-2)
+
+        scipy 없이 t 분위수를 정규 분위수의 Cornish-Fisher 전개로 근사
+        (Abramowitz & Stegun 26.7.5, 자유도 30 이상에서 오차 1e-4 미만)
+
+        Args:
+            n: 관측 수 (배열)
+            alpha: 쌍별 유의수준
+
+        Returns:
+            n과 같은 모양의 임계 |ρ| (n <= 3이면 inf)
+        """
+        z = NormalDist().inv_cdf(1 - alpha / 2)
+        g = [
+            (z ** 3 + z) / 4,
+            (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96,
+            (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384,
+            (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160,
+        ]
+        df = np.asarray(n, dtype=float) - 2
+        with np.errstate(invalid='ignore', divide='ignore'):
+            t = z + sum(gk / df ** (k + 1) for k, gk in enumerate(g))
+            critical = t / np.sqrt(df + t * t)
+        return np.where(df > 1, critical, np.inf)
+
+    def compute(self, krx_close: pd.DataFrame, us_close: pd.DataFrame) -> CouplingIndex:
+        """
+        커플링 색인 계산 (1회 행렬 연산)
+
+        Args:
+            krx_close: (KRX 거래일 × 종목코드) 종가
+            us_close: (미국 거래일 × 심볼) 종가
+        """
+        krx_close = krx_close.sort_index()
+        us_close = us_close.sort_index()
+        krx_dates = pd.DatetimeIndex(krx_close.index).normalize()
+
+        krx_returns = np.log(krx_close.where(krx_close > 0)).diff().to_numpy()[1:]
+        us_returns = self.lagged_log_prices(us_close, krx_dates).diff().to_numpy()[1:]
+        x = krx_returns[-self.WINDOW:] * 100
+        y = us_returns[-self.WINDOW:] * 100
+
+        corr, beta, n = self.masked_moments(x, y)
+        critical = self.critical_correlation(n, self.ALPHA / max(corr.shape[1], 1))
+        valid = (n >= self.MIN_OBSERVATIONS) & np.isfinite(corr) & (np.abs(corr) >= critical)
+        strength = np.where(valid, np.abs(corr), -1.0)
+
+        k = min(self.TOP_K, strength.shape[1])
+        top = np.argpartition(-strength, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(strength, top, axis=1), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_valid = np.take_along_axis(valid, top, axis=1)
+
+        return CouplingIndex(
+            as_of=krx_dates[-1].strftime("%Y-%m-%d"),
+            window=len(x),
+            symbols=list(us_close.columns),
+            codes=[str(c) for c in krx_close.columns],
+            top_symbol=np.where(top_valid, top, -1).astype(np.int16),
+            top_corr=np.take_along_axis(corr, top, axis=1).astype(np.float32),
+            top_beta=np.take_along_axis(beta, top, axis=1).astype(np.float32),
+            top_obs=np.take_along_axis(n, top, axis=1).astype(np.int16),
+        )
+
+    # ------------------------------------------------------------------
+    # Persistence (L2)
+    # ------------------------------------------------------------------
+
+    async def _load(self, day: str) -> Optional[CouplingIndex]:
+        if self.l2 is None:
+            return None
+        try:
+            found, index, _ = await asyncio.to_thread(self.l2.get, self.L2_NAMESPACE, day)
+        except Exception as e:
+            self.logger.warning(f"Failed to load coupling index: {e}")
+            return None
+        return index if found else None
+
+    async def _save(self, day: str, index: CouplingIndex):
+        if self.l2 is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self.l2.set, self.L2_NAMESPACE, day, index, self.L2_TTL.total_seconds()
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to save coupling index: {e}")
+
+
+# Singleton instance
+_engine_instance: Optional[CouplingEngine] = None
+
+
+def get_coupling_engine() -> CouplingEngine:
+    """Get singleton CouplingEngine instance"""
+    global _engine_instance
+    if _engine_instance is None:
+        _engine_instance = CouplingEngine(l2=get_l2_cache())
+    return _engine_instance
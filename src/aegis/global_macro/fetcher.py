@@ -1,6 +1,6 @@
 """
 Global Market Fetcher - Phase 4.5
-미국 시장 데이터 수집 (yfinance 활용)
+미국 시장 데이터 수집 (GlobalMacroSnapshot 일괄 스냅샷 활용)
 
 핵심 기능:
 - 미국 주요 지수 (SOX, 나스닥100, S&P500) 수집
@@ -8,22 +8,19 @@ Global Market Fetcher - Phase 4.5
 - 나스닥100 선물 실시간 데이터
 - 환율 (USD/KRW) 모니터링
 """
-import asyncio
-from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
-import yfinance as yf
+from .snapshot import MacroSnapshot, get_global_macro_snapshot
 
 
 class MarketSession(Enum):
     """시장 세션"""
-    PRE_MARKET = "pre_market"       # 프리마켓 (한국시간 18:00-22:30)
-    REGULAR = "regular"              # 정규장 (한국시간 22:30-05:00)
-    AFTER_HOURS = "after_hours"      # 애프터마켓 (한국시간 05:00-07:00)
+    PRE_MARKET = "pre_market"       # 프리마켓 (ET 04:00-09:30)
+    REGULAR = "regular"              # 정규장 (ET 09:30-16:00)
+    AFTER_HOURS = "after_hours"      # 애프터마켓 (ET 16:00-20:00)
     CLOSED = "closed"                # 휴장
 
 
@@ -78,7 +75,7 @@ class GlobalMarketFetcher:
     글로벌 시장 데이터 수집기
 
     Phase 4.5 Spec:
-    - yfinance로 미국 주요 지수 및 핵심 종목 수집
+    - 미국 주요 지수 및 핵심 종목 수집 (추적 심볼 전체 1회 일괄 다운로드 스냅샷)
     - 나스닥100 선물 실시간 모니터링
     - 환율(USD/KRW) 추적
     """
@@ -129,204 +126,73 @@ class GlobalMarketFetcher:
         'KRW=X': 'USD/KRW',
     }
 
-    # 캐시 TTL
-    CACHE_TTL = timedelta(minutes=5)
-
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._cache: Optional[Tuple[GlobalMarketData, datetime]] = None
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self.snapshot = get_global_macro_snapshot()
+        self.snapshot.track([*self.INDICES, *self.KEY_STOCKS, *self.FUTURES, *self.FOREX])
+        # 같은 스냅샷으로 만든 결과 재사용 (스냅샷 fetched_at, 결과)
+        self._result: Optional[Tuple[float, GlobalMarketData]] = None
 
     async def fetch(self, force_refresh: bool = False) -> GlobalMarketData:
         """
         글로벌 시장 데이터 수집
 
         Args:
-            force_refresh: 캐시 무시하고 새로 조회
+            force_refresh: 세션 신선도와 무관하게 스냅샷 새로 다운로드
 
         Returns:
             GlobalMarketData: 시장 데이터
         """
-        # 캐시 확인
-        if not force_refresh and self._cache:
-            cached_data, cached_at = self._cache
-            if datetime.now() - cached_at < self.CACHE_TTL:
-                self.logger.debug("Returning cached global market data")
-                return cached_data
-
-        self.logger.info("Fetching global market data...")
+        snapshot = await self.snapshot.get(force=force_refresh)
+        if self._result is not None and self._result[0] == snapshot.fetched_at:
+            return self._result[1]
 
-        # 병렬로 데이터 수집
-        loop = asyncio.get_event_loop()
+        result = self._build(snapshot)
+        self._result = (snapshot.fetched_at, result)
+        return result
 
-        indices_task = loop.run_in_executor(self._executor, self._fetch_indices)
-        stocks_task = loop.run_in_executor(self._executor, self._fetch_stocks)
-        forex_task = loop.run_in_executor(self._executor, self._fetch_forex)
-        futures_task = loop.run_in_executor(self._executor, self._fetch_futures)
+    def _build(self, snapshot: MacroSnapshot) -> GlobalMarketData:
+        """스냅샷 → GlobalMarketData"""
+        timestamp = snapshot.fetched_datetime.isoformat()
 
-        indices, stocks, forex, futures = await asyncio.gather(
-            indices_task, stocks_task, forex_task, futures_task
-        )
+        indices = self._collect(snapshot, self.INDICES, timestamp)
+        stocks = self._collect(snapshot, self.KEY_STOCKS, timestamp)
+        futures = self._collect(snapshot, self.FUTURES, timestamp)
+        usd_krw = snapshot.quotes.get('KRW=X')
 
         # 시장 심리 분석
         overall_sentiment = self._analyze_overall_sentiment(indices, stocks)
         sector_sentiments = self._analyze_sector_sentiments(stocks)
 
-        # 시장 세션 판단
-        market_session = self._get_market_session()
-
-        result = GlobalMarketData(
+        return GlobalMarketData(
             indices=indices,
             stocks=stocks,
-            usd_krw=forex.get('usd_krw', 0.0),
-            usd_krw_change=forex.get('usd_krw_change', 0.0),
+            usd_krw=usd_krw.price if usd_krw else 0.0,
+            usd_krw_change=usd_krw.change_pct if usd_krw else 0.0,
             nasdaq_futures=futures.get('NQ=F'),
             overall_sentiment=overall_sentiment,
             sector_sentiments=sector_sentiments,
-            fetched_at=datetime.now().isoformat(),
-            market_session=market_session
+            fetched_at=timestamp,
+            market_session=self._get_market_session()
         )
 
-        # 캐시 저장
-        self._cache = (result, datetime.now())
-
-        return result
-
-    def _fetch_indices(self) -> Dict[str, IndexData]:
-        """주요 지수 조회"""
+    @staticmethod
+    def _collect(snapshot: MacroSnapshot, names: Dict[str, str], timestamp: str) -> Dict[str, IndexData]:
+        """스냅샷에서 심볼 그룹 추출 (수집 실패 심볼은 제외)"""
         result = {}
-
-        try:
-            tickers = yf.Tickers(' '.join(self.INDICES.keys()))
-
-            for symbol, name in self.INDICES.items():
-                try:
-                    ticker = tickers.tickers.get(symbol)
-                    if ticker is None:
-                        continue
-
-                    info = ticker.info
-                    hist = ticker.history(period='2d')
-
-                    if hist.empty:
-                        continue
-
-                    current_price = hist['Close'].iloc[-1]
-                    prev_close = hist['Close'].iloc[-2] if len(hist) > 1 else current_price
-                    change = current_price - prev_close
-                    change_pct = (change / prev_close) * 100 if prev_close > 0 else 0
-
-                    result[symbol] = IndexData(
-                        symbol=symbol,
-                        name=name,
-                        price=round(current_price, 2),
-                        change=round(change, 2),
-                        change_pct=round(change_pct, 2),
-                        volume=int(hist['Volume'].iloc[-1]) if 'Volume' in hist else 0,
-                        timestamp=datetime.now().isoformat()
-                    )
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch {symbol}: {e}")
-
-        except Exception as e:
-            self.logger.error(f"Failed to fetch indices: {e}")
-
-        return result
-
-    def _fetch_stocks(self) -> Dict[str, IndexData]:
-        """핵심 종목 조회"""
-        result = {}
-
-        try:
-            tickers = yf.Tickers(' '.join(self.KEY_STOCKS.keys()))
-
-            for symbol, name in self.KEY_STOCKS.items():
-                try:
-                    ticker = tickers.tickers.get(symbol)
-                    if ticker is None:
-                        continue
-
-                    hist = ticker.history(period='2d')
-
-                    if hist.empty:
-                        continue
-
-                    current_price = hist['Close'].iloc[-1]
-                    prev_close = hist['Close'].iloc[-2] if len(hist) > 1 else current_price
-                    change = current_price - prev_close
-                    change_pct = (change / prev_close) * 100 if prev_close > 0 else 0
-
-                    result[symbol] = IndexData(
-                        symbol=symbol,
-                        name=name,
-                        price=round(current_price, 2),
-                        change=round(change, 2),
-                        change_pct=round(change_pct, 2),
-                        volume=int(hist['Volume'].iloc[-1]) if 'Volume' in hist else 0,
-                        timestamp=datetime.now().isoformat()
-                    )
-
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch {symbol}: {e}")
-
-        except Exception as e:
-            self.logger.error(f"Failed to fetch stocks: {e}")
-
-        return result
-
-    def _fetch_forex(self) -> Dict[str, float]:
-        """환율 조회"""
-        try:
-            ticker = yf.Ticker('KRW=X')
-            hist = ticker.history(period='2d')
-
-            if hist.empty:
-                return {'usd_krw': 0.0, 'usd_krw_change': 0.0}
-
-            current = hist['Close'].iloc[-1]
-            prev = hist['Close'].iloc[-2] if len(hist) > 1 else current
-            change = ((current - prev) / prev) * 100 if prev > 0 else 0
-
-            return {
-                'usd_krw': round(current, 2),
-                'usd_krw_change': round(change, 2)
-            }
-
-        except Exception as e:
-            self.logger.warning(f"Failed to fetch forex: {e}")
-            return {'usd_krw': 0.0, 'usd_krw_change': 0.0}
-
-    def _fetch_futures(self) -> Dict[str, IndexData]:
-        """선물 조회"""
-        result = {}
-
-        try:
-            for symbol, name in self.FUTURES.items():
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period='2d')
-
-                if hist.empty:
-                    continue
-
-                current_price = hist['Close'].iloc[-1]
-                prev_close = hist['Close'].iloc[-2] if len(hist) > 1 else current_price
-                change = current_price - prev_close
-                change_pct = (change / prev_close) * 100 if prev_close > 0 else 0
-
-                result[symbol] = IndexData(
-                    symbol=symbol,
-                    name=name,
-                    price=round(current_price, 2),
-                    change=round(change, 2),
-                    change_pct=round(change_pct, 2),
-                    volume=0,
-                    timestamp=datetime.now().isoformat()
-                )
-
-        except Exception as e:
-            self.logger.warning(f"Failed to fetch futures: {e}")
-
+        for symbol, name in names.items():
+            quote = snapshot.quotes.get(symbol)
+            if quote is None:
+                continue
+            result[symbol] = IndexData(
+                symbol=symbol,
+                name=name,
+                price=quote.price,
+                change=quote.change,
+                change_pct=quote.change_pct,
+                volume=quote.volume,
+                timestamp=timestamp
+            )
         return result
 
     def _analyze_overall_sentiment(
@@ -399,27 +265,13 @@ class GlobalMarketFetcher:
         return result
 
     def _get_market_session(self) -> MarketSession:
-        """현재 미국 시장 세션 판단 (한국 시간 기준)"""
-        now = datetime.now()
-        hour = now.hour
-
-        # 한국 시간 기준 (EST + 14시간)
-        # 프리마켓: 18:00-22:30 KST
-        # 정규장: 22:30-05:00 KST
-        # 애프터마켓: 05:00-07:00 KST
-
-        if 18 <= hour < 22:
-            return MarketSession.PRE_MARKET
-        elif 22 <= hour or hour < 5:
-            return MarketSession.REGULAR
-        elif 5 <= hour < 7:
-            return MarketSession.AFTER_HOURS
-        else:
-            return MarketSession.CLOSED
+        """현재 미국 시장 세션 판단 (미국 동부시간 기준, 서머타임 반영)"""
+        return MarketSession(self.snapshot.us_session())
 
     def clear_cache(self):
-        """캐시 초기화"""
-        self._cache = None
+        """캐시 초기화 (다음 fetch()에서 스냅샷 신선도 재확인)"""
+        self._result = None
+        self.snapshot.invalidate()
         self.logger.info("Global market cache cleared")
 
 
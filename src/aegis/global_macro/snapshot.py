@@ -0,0 +1,466 @@
+"""
+Global Macro Snapshot - Phase 4.5
+프로젝트가 추적하는 모든 해외 심볼(지수/종목/선물/환율)을 한 번의 yfinance 일괄 다운로드로
+수집해 L2 디스크 캐시(global_macro)에 공유하는 스냅샷
+
+세션 기반 신선도 (미국 동부시간 기준, 서머타임 반영):
+- 미국 장중(프리마켓 04:00 ~ 애프터마켓 20:00 ET, 평일): REFRESH_INTERVAL마다 갱신
+- KRX 개장 전(08:40 ~ 09:00 KST, 평일): Globex 선물 선반영을 위해 REFRESH_INTERVAL마다 갱신
+- 그 외(미국 휴장): 마지막 경계(미국 세션 종료 / KRX 개장) 이후 1회 수집한 스냅샷을 고정 사용
+
+GlobalMarketFetcher, DataIntegrityManager 등 소비자는 yfinance를 직접 호출하지 않고
+이 스냅샷을 읽습니다. cron 프로세스가 바뀌어도 디스크 스냅샷이 신선하면 다운로드하지 않습니다.
+
+일봉 종가 이력(history)도 같은 방식으로 공유합니다 (미국 정규장 마감 후 1일 1회 갱신).
+
+Usage:
+    snapshot = get_global_macro_snapshot()
+    snapshot.track(['NQ=F', 'KRW=X'])
+    data = await snapshot.get()
+    data.quotes['NQ=F'].change_pct
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, time as dtime
+from typing import Dict, Iterable, List, Optional, Set
+from zoneinfo import ZoneInfo
+import logging
+
+import pandas as pd
+
+try:
+    import yfinance as yf
+except ImportError:
+    yf = None
+
+from src.utils.sqlite_cache import SQLiteCache, get_l2_cache
+
+US_EASTERN = ZoneInfo('America/New_York')
+KST = ZoneInfo('Asia/Seoul')
+
+
+@dataclass
+class MacroQuote:
+    """심볼별 최근 종가/전일 종가"""
+    symbol: str
+    price: float
+    prev_close: float
+    change: float
+    change_pct: float
+    volume: int
+    as_of: str                        # 마지막 봉 날짜 (YYYY-MM-DD)
+
+
+@dataclass
+class MacroSnapshot:
+    """일괄 다운로드 결과"""
+    quotes: Dict[str, MacroQuote]
+    symbols: List[str]                # 요청한 심볼 (수집 실패 심볼 포함)
+    fetched_at: float                 # epoch seconds
+    session: str                      # 수집 시점 미국 세션
+    failed: List[str] = field(default_factory=list)
+
+    def age(self, now: Optional[float] = None) -> float:
+        """수집 후 경과 초"""
+        return (time.time() if now is None else now) - self.fetched_at
+
+    @property
+    def fetched_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.fetched_at)
+
+
+@dataclass
+class MacroHistory:
+    """일봉 종가 이력 (index: 미국 거래일, columns: 심볼)"""
+    closes: pd.DataFrame
+    symbols: List[str]
+    fetched_at: float
+
+
+class GlobalMacroSnapshot:
+    """
+    해외 시장 스냅샷 저장소 (일괄 다운로드 + 디스크 공유 + 세션 기반 신선도)
+
+    Args:
+        l2: 스냅샷 공유용 디스크 캐시 (None이면 프로세스 메모리만)
+    """
+
+    REFRESH_INTERVAL = timedelta(minutes=5)      # 미국 장중 / KRX 개장 전 갱신 주기
+    RETRY_INTERVAL = timedelta(minutes=1)        # 다운로드 실패 후 재시도 간격
+
+    # 미국 세션 (ET)
+    US_PRE_MARKET = dtime(4, 0)
+    US_REGULAR = dtime(9, 30)
+    US_AFTER_HOURS = dtime(16, 0)
+    US_CLOSE = dtime(20, 0)
+
+    # KRX 개장 전 Globex 선반영 (KST)
+    KRX_OPEN = dtime(9, 0)
+    KRX_PREFETCH_LEAD = timedelta(minutes=20)
+
+    QUOTE_PERIOD = '5d'                          # 휴일을 건너 최근 2개 종가 확보
+    HISTORY_PERIOD = '6mo'                       # 종가 이력 (커플링 상관 계산용)
+    HISTORY_SETTLE = dtime(16, 30)               # 이 시각(ET) 이후 당일 일봉 확정으로 간주
+
+    L2_NAMESPACE = "global_macro"
+    L2_KEY = "snapshot"
+    L2_HISTORY_KEY = "history"
+    L2_TTL = timedelta(days=7)
+
+    def __init__(self, l2: Optional[SQLiteCache] = None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.l2 = l2
+        self.tracked: Set[str] = set()
+        self.stats: Dict[str, int] = {'downloads': 0, 'failures': 0, 'l2_hits': 0}
+        self._snapshot: Optional[MacroSnapshot] = None
+        self._last_attempt = 0.0
+        self._lock = asyncio.Lock()
+        self._history: Optional[MacroHistory] = None
+        self._history_attempt = 0.0
+        self._history_lock = asyncio.Lock()
+
+    def track(self, symbols: Iterable[str]):
+        """일괄 다운로드 대상 심볼 등록 (다음 get()에서 누락 심볼이 있으면 재수집)"""
+        self.tracked.update(symbols)
+
+    # ------------------------------------------------------------------
+    # Session-aware freshness
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _last_weekday_at(now: float, tz: ZoneInfo, at: dtime) -> float:
+        """now 이전 가장 최근 평일 `at`(tz 현지 시각)의 epoch"""
+        day = datetime.fromtimestamp(now, tz).date()
+        for _ in range(8):
+            candidate = datetime.combine(day, at, tzinfo=tz)
+            if candidate.weekday() < 5 and candidate.timestamp() <= now:
+                return candidate.timestamp()
+            day -= timedelta(days=1)
+        return 0.0
+
+    def us_session(self, now: Optional[float] = None) -> str:
+        """미국 시장 세션 (pre_market / regular / after_hours / closed), 공휴일은 미반영"""
+        et = datetime.fromtimestamp(time.time() if now is None else now, US_EASTERN)
+        t = et.time()
+        if et.weekday() >= 5 or not (self.US_PRE_MARKET <= t < self.US_CLOSE):
+            return "closed"
+        if t < self.US_REGULAR:
+            return "pre_market"
+        if t < self.US_AFTER_HOURS:
+            return "regular"
+        return "after_hours"
+
+    def in_prefetch_window(self, now: Optional[float] = None) -> bool:
+        """KRX 개장 전 Globex 선반영 구간 여부"""
+        kst = datetime.fromtimestamp(time.time() if now is None else now, KST)
+        opening = datetime.combine(kst.date(), self.KRX_OPEN, tzinfo=KST)
+        return kst.weekday() < 5 and opening - self.KRX_PREFETCH_LEAD <= kst < opening
+
+    def is_fresh(self, fetched_at: float, now: Optional[float] = None) -> bool:
+        """현재 세션 기준으로 fetched_at에 수집한 스냅샷을 그대로 써도 되는지"""
+        now = time.time() if now is None else now
+        if self.us_session(now) != "closed" or self.in_prefetch_window(now):
+            return now - fetched_at <= self.REFRESH_INTERVAL.total_seconds()
+        # 휴장: 마지막 경계 이후 수집분이면 고정 사용
+        boundary = max(
+            self._last_weekday_at(now, US_EASTERN, self.US_CLOSE),
+            self._last_weekday_at(now, KST, self.KRX_OPEN),
+        )
+        return fetched_at >= boundary
+
+    def _usable(self, snapshot: Optional[MacroSnapshot], now: float) -> bool:
+        return (
+            snapshot is not None
+            and self.tracked.issubset(snapshot.symbols)
+            and self.is_fresh(snapshot.fetched_at, now)
+        )
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    async def get(self, force: bool = False) -> MacroSnapshot:
+        """
+        신선한 스냅샷 반환 (메모리 → L2 → 일괄 다운로드 순, 동시 호출은 1회 다운로드 공유)
+
+        Args:
+            force: 신선도와 무관하게 새로 다운로드
+
+        Returns:
+            MacroSnapshot (다운로드 실패 시 직전 스냅샷, 없으면 빈 스냅샷)
+        """
+        now = time.time()
+        if not force and self._usable(self._snapshot, now):
+            return self._snapshot
+
+        async with self._lock:
+            now = time.time()
+            if not force and self._usable(self._snapshot, now):
+                return self._snapshot
+
+            if not force:
+                stored = await self._load()
+                if stored is not None:
+                    # 다른 프로세스가 수집한 심볼도 추적 대상에 포함 (다음 수집에서 누락 방지)
+                    self.tracked.update(stored.symbols)
+                    if self._snapshot is None or stored.fetched_at > self._snapshot.fetched_at:
+                        self._snapshot = stored
+                    if self._usable(self._snapshot, now):
+                        self.stats['l2_hits'] += 1
+                        return self._snapshot
+
+            if (
+                not force
+                and self._snapshot is not None
+                and now - self._last_attempt < self.RETRY_INTERVAL.total_seconds()
+            ):
+                return self._snapshot
+
+            self._last_attempt = now
+            symbols = sorted(self.tracked)
+            try:
+                snapshot = await asyncio.to_thread(self._download, symbols)
+            except Exception as e:
+                self.stats['failures'] += 1
+                self.logger.error(f"Global macro download failed: {e}")
+                snapshot = None
+
+            if snapshot is not None and snapshot.quotes:
+                self._snapshot = snapshot
+                await self._save(snapshot)
+            elif self._snapshot is None:
+                self._snapshot = MacroSnapshot(
+                    quotes={}, symbols=[], fetched_at=0.0,
+                    session=self.us_session(now), failed=symbols
+                )
+            return self._snapshot
+
+    async def quote(self, symbol: str) -> Optional[MacroQuote]:
+        """심볼 1개 시세 (추적 대상이 아니면 등록 후 조회)"""
+        if symbol not in self.tracked:
+            self.track([symbol])
+        return (await self.get()).quotes.get(symbol)
+
+    async def prefetch(self) -> Optional[MacroSnapshot]:
+        """KRX 개장 전 구간이면 스냅샷 갱신 (cron에서 매분 호출, 구간 밖에서는 아무것도 하지 않음)"""
+        if not self.in_prefetch_window():
+            return None
+        return await self.get()
+
+    async def history(self) -> pd.DataFrame:
+        """
+        추적 심볼 전체 일봉 종가 이력 (HISTORY_PERIOD, 1회 일괄 다운로드)
+
+        미국 정규장 일봉 확정(HISTORY_SETTLE) 이후 수집분이면 재사용합니다.
+
+        Returns:
+            (미국 거래일 × 심볼) 종가, 실패 시 직전 이력 또는 빈 DataFrame
+        """
+        now = time.time()
+        if self._history_usable(self._history, now):
+            return self._history.closes
+
+        async with self._history_lock:
+            now = time.time()
+            if self._history_usable(self._history, now):
+                return self._history.closes
+
+            stored = await self._load(self.L2_HISTORY_KEY)
+            if stored is not None:
+                self.tracked.update(stored.symbols)
+                if self._history is None or stored.fetched_at > self._history.fetched_at:
+                    self._history = stored
+                if self._history_usable(self._history, now):
+                    self.stats['l2_hits'] += 1
+                    return self._history.closes
+
+            if self._history is not None and now - self._history_attempt < self.RETRY_INTERVAL.total_seconds():
+                return self._history.closes
+
+            self._history_attempt = now
+            symbols = sorted(self.tracked)
+            try:
+                closes = await asyncio.to_thread(self._download_history, symbols)
+            except Exception as e:
+                self.stats['failures'] += 1
+                self.logger.error(f"Global macro history download failed: {e}")
+                closes = None
+
+            if closes is not None and not closes.empty:
+                self._history = MacroHistory(closes=closes, symbols=symbols, fetched_at=now)
+                await self._save(self._history, self.L2_HISTORY_KEY)
+            return self._history.closes if self._history is not None else pd.DataFrame()
+
+    def _history_usable(self, history: Optional["MacroHistory"], now: float) -> bool:
+        return (
+            history is not None
+            and self.tracked.issubset(history.symbols)
+            and history.fetched_at >= self._last_weekday_at(now, US_EASTERN, self.HISTORY_SETTLE)
+        )
+
+    def invalidate(self):
+        """메모리 스냅샷 폐기 (디스크 스냅샷은 신선도 규칙에 따라 재사용)"""
+        self._snapshot = None
+        self._last_attempt = 0.0
+        self._history = None
+        self._history_attempt = 0.0
+
+    # ------------------------------------------------------------------
+    # Download
+    # ------------------------------------------------------------------
+
+    def _download(self, symbols: List[str]) -> MacroSnapshot:
+        """추적 심볼 전체를 yf.download 1회로 수집"""
+        if yf is None:
+            raise RuntimeError("yfinance not installed")
+        if not symbols:
+            raise RuntimeError("no symbols tracked")
+
+        self.logger.info(f"Downloading global macro snapshot ({len(symbols)} symbols)...")
+        self.stats['downloads'] += 1
+        frame = yf.download(
+            symbols,
+            period=self.QUOTE_PERIOD,
+            interval='1d',
+            group_by='ticker',
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+        )
+
+        quotes: Dict[str, MacroQuote] = {}
+        failed: List[str] = []
+        for symbol in symbols:
+            quote = self._parse_quote(frame, symbol, len(symbols))
+            if quote is None:
+                failed.append(symbol)
+            else:
+                quotes[symbol] = quote
+        if failed:
+            self.logger.warning(f"No data for {len(failed)} symbols: {', '.join(failed)}")
+
+        now = time.time()
+        return MacroSnapshot(
+            quotes=quotes,
+            symbols=symbols,
+            fetched_at=now,
+            session=self.us_session(now),
+            failed=failed,
+        )
+
+    def _download_history(self, symbols: List[str]) -> pd.DataFrame:
+        """추적 심볼 전체 일봉 종가 이력을 yf.download 1회로 수집"""
+        if yf is None:
+            raise RuntimeError("yfinance not installed")
+        if not symbols:
+            raise RuntimeError("no symbols tracked")
+
+        self.logger.info(f"Downloading global macro history ({len(symbols)} symbols, {self.HISTORY_PERIOD})...")
+        self.stats['downloads'] += 1
+        frame = yf.download(
+            symbols,
+            period=self.HISTORY_PERIOD,
+            interval='1d',
+            group_by='ticker',
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+        )
+        if frame is None or frame.empty:
+            return pd.DataFrame()
+
+        if getattr(frame.columns, 'nlevels', 1) > 1:
+            closes = frame.xs('Close', axis=1, level=1)
+        else:
+            closes = frame[['Close']].set_axis(symbols[:1], axis=1)
+        closes = closes.reindex(columns=[s for s in symbols if s in closes.columns]).astype(float)
+        # 거래일 날짜만 유지 (시간대 제거)
+        index = pd.DatetimeIndex(closes.index)
+        closes.index = (index.tz_localize(None) if index.tz is not None else index).normalize()
+        return closes.dropna(how='all')
+
+    @staticmethod
+    def _parse_quote(frame, symbol: str, count: int) -> Optional[MacroQuote]:
+        """다운로드 프레임에서 심볼의 최근 2개 종가 추출"""
+        if frame is None or frame.empty:
+            return None
+        columns = frame.columns
+        if getattr(columns, 'nlevels', 1) > 1:
+            if symbol not in columns.get_level_values(0):
+                return None
+            hist = frame[symbol]
+        elif count == 1:
+            hist = frame
+        else:
+            return None
+
+        closes = hist['Close'].dropna()
+        if closes.empty:
+            return None
+        price = float(closes.iloc[-1])
+        prev_close = float(closes.iloc[-2]) if len(closes) > 1 else price
+        change = price - prev_close
+        change_pct = (change / prev_close) * 100 if prev_close > 0 else 0.0
+
+        volume = 0
+        if 'Volume' in hist:
+            volumes = hist['Volume'].reindex(closes.index)
+            if len(volumes) and volumes.iloc[-1] == volumes.iloc[-1]:   # NaN 제외
+                volume = int(volumes.iloc[-1])
+
+        return MacroQuote(
+            symbol=symbol,
+            price=round(price, 2),
+            prev_close=round(prev_close, 2),
+            change=round(change, 2),
+            change_pct=round(change_pct, 2),
+            volume=volume,
+            as_of=str(closes.index[-1])[:10],
+        )
+
+    # ------------------------------------------------------------------
+    # Persistence (L2)
+    # ------------------------------------------------------------------
+
+    async def _load(self, key: str = L2_KEY):
+        if self.l2 is None:
+            return None
+        try:
+            found, value, _ = await asyncio.to_thread(self.l2.get, self.L2_NAMESPACE, key)
+        except Exception as e:
+            self.logger.warning(f"Failed to load global macro {key}: {e}")
+            return None
+        return value if found else None
+
+    async def _save(self, value, key: str = L2_KEY):
+        if self.l2 is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self.l2.set, self.L2_NAMESPACE, key, value, self.L2_TTL.total_seconds()
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to save global macro {key}: {e}")
+
+    def info(self) -> Dict[str, object]:
+        snapshot = self._snapshot
+        return {
+            **self.stats,
+            'tracked': len(self.tracked),
+            'quotes': len(snapshot.quotes) if snapshot else 0,
+            'age_seconds': round(snapshot.age(), 1) if snapshot and snapshot.fetched_at else None,
+            'session': self.us_session(),
+        }
+
+
+# Singleton instance
+_snapshot_instance: Optional[GlobalMacroSnapshot] = None
+
+
+def get_global_macro_snapshot() -> GlobalMacroSnapshot:
+    """Get singleton GlobalMacroSnapshot instance"""
+    global _snapshot_instance
+    if _snapshot_instance is None:
+        _snapshot_instance = GlobalMacroSnapshot(l2=get_l2_cache())
+    return _snapshot_instance
@@ -6,6 +6,9 @@ Components:
 - WeightOptimizer: Grid search로 최적 가중치 탐색
 - RobustnessTester: 다양한 종목/기간에 대한 강건성 검증
 - DynamicWeightOptimizer: 실시간 시장 변동성 기반 가중치 조정 (Phase 4)
+- SweepRunner: 가중치 조합 × 종목 × 기간 병렬 백테스트 (shared memory, 재개 가능)
+- weight_search: Random/Sobol, Coordinate Descent, Successive Halving/Hyperband 탐색
+- WalkForwardOptimizer: rolling train/test 표본 외 검증 (데이터 해시 폴드 캐시)
 - real_world: 실전 강화 모듈 (Phase 6)
   - FinalSignalValidator: Veto System
   - DataIntegrityManager: NQ 선물 연동
@@ -21,6 +24,20 @@ from .dynamic_weight_optimizer import (
     WeightAdjustment,
     MarketVolatility,
 )
+from .sweep_runner import SweepRunner, WeightedBlendStrategy
+from .weight_search import (
+    SearchBudget,
+    SearchResult,
+    get_searcher,
+    BlendBacktestObjective,
+    FactorScoreObjective,
+)
+from .walk_forward import (
+    WalkForwardOptimizer,
+    WalkForwardConfig,
+    WalkForwardResult,
+    FoldCache,
+)
 
 # Phase 6: Real-World Optimization
 from .real_world import (
@@ -44,6 +61,17 @@ __all__ = [
     'get_optimized_weights',
     'WeightAdjustment',
     'MarketVolatility',
+    'SweepRunner',
+    'WeightedBlendStrategy',
+    'SearchBudget',
+    'SearchResult',
+    'get_searcher',
+    'BlendBacktestObjective',
+    'FactorScoreObjective',
+    'WalkForwardOptimizer',
+    'WalkForwardConfig',
+    'WalkForwardResult',
+    'FoldCache',
 
     # Phase 6: Real-World
     'FinalSignalValidator',
@@ -4,7 +4,7 @@ Data Integrity Manager - Phase 6
 
 핵심 기능:
 - 데이터 소스 Failover (pykrx -> KIS API)
-- Nasdaq 100 선물 (NQ=F) 실시간 조회
+- Nasdaq 100 선물 (NQ=F) 조회 (GlobalMacroSnapshot 공유 스냅샷)
 - 데이터 신선도 및 지연 모니터링
 """
 import asyncio
@@ -14,10 +14,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
-try:
-    import yfinance as yf
-except ImportError:
-    yf = None
+from src.aegis.global_macro.snapshot import get_global_macro_snapshot
 
 
 class DataSource(Enum):
@@ -89,7 +86,8 @@ class DataIntegrityManager:
         self.logger = logging.getLogger(self.__class__.__name__)
         self._source_status: Dict[DataSource, DataStatus] = {}
         self._last_fetch: Dict[str, datetime] = {}
-        self._cache: Dict[str, Any] = {}
+        self.macro = get_global_macro_snapshot()
+        self.macro.track(self.GLOBEX_SYMBOLS.values())
 
     async def get_nq_futures(self) -> Optional[GlobexData]:
         """
@@ -121,60 +119,42 @@ class DataIntegrityManager:
         return futures_data
 
     async def _fetch_globex_data(self, symbol: str) -> Optional[GlobexData]:
-        """Globex 선물 데이터 조회"""
-        if yf is None:
-            self.logger.warning("yfinance not installed")
-            return None
-
+        """Globex 선물 데이터 조회 (공유 스냅샷에서 읽음)"""
         yahoo_symbol = self.GLOBEX_SYMBOLS.get(symbol)
         if not yahoo_symbol:
             return None
 
-        # 캐시 체크 (1분 이내면 캐시 반환)
-        cache_key = f"globex_{symbol}"
-        if cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            if (datetime.now() - cached_time).seconds < 60:
-                return cached_data
-
-        try:
-            ticker = yf.Ticker(yahoo_symbol)
-            info = ticker.info
-
-            # 최근 1일 데이터
-            hist = ticker.history(period='1d', interval='1m')
-
-            if hist.empty:
-                return None
-
-            latest = hist.iloc[-1]
-            prev_close = info.get('previousClose', latest['Open'])
-
-            price = latest['Close']
-            change = price - prev_close
-            change_pct = (change / prev_close) * 100 if prev_close else 0
-
-            data = GlobexData(
-                symbol=symbol,
-                price=round(price, 2),
-                change=round(change, 2),
-                change_pct=round(change_pct, 2),
-                volume=int(latest['Volume']),
-                timestamp=datetime.now(),
-                source=DataSource.YFINANCE,
-                status=DataStatus.FRESH
-            )
-
-            # 캐시 저장
-            self._cache[cache_key] = (data, datetime.now())
-            self._last_fetch[cache_key] = datetime.now()
-
-            return data
-
-        except Exception as e:
-            self.logger.error(f"Failed to fetch {symbol} futures: {e}")
+        snapshot = await self.macro.get()
+        quote = snapshot.quotes.get(yahoo_symbol)
+        if quote is None:
+            self.logger.warning(f"{symbol} futures not in global macro snapshot")
             return None
 
+        fetched = snapshot.fetched_datetime
+        self._last_fetch[f"globex_{symbol}"] = fetched
+
+        return GlobexData(
+            symbol=symbol,
+            price=quote.price,
+            change=quote.change,
+            change_pct=quote.change_pct,
+            volume=quote.volume,
+            timestamp=fetched,
+            source=DataSource.YFINANCE,
+            status=self._snapshot_status(snapshot.fetched_at)
+        )
+
+    def _snapshot_status(self, fetched_at: float) -> DataStatus:
+        """스냅샷 신선도 (휴장 중 고정 스냅샷은 세션 기준으로 FRESH)"""
+        if self.macro.is_fresh(fetched_at):
+            return DataStatus.FRESH
+        age = datetime.now().timestamp() - fetched_at
+        if age <= self.FRESHNESS['fresh']:
+            return DataStatus.FRESH
+        if age <= self.FRESHNESS['stale']:
+            return DataStatus.STALE
+        return DataStatus.OUTDATED
+
     def get_premarket_signal(self, nq_data: GlobexData) -> Dict[str, Any]:
         """
         장 시작 전 신호 생성 (08:50 ~ 09:00 사용)
@@ -242,9 +222,11 @@ class DataIntegrityManager:
         latency = (datetime.now() - start).total_seconds() * 1000
 
         if nq_data:
-            sources_status['NQ_futures'] = DataStatus.FRESH
+            sources_status['NQ_futures'] = nq_data.status
             latencies['NQ_futures'] = latency
             last_updates['NQ_futures'] = nq_data.timestamp
+            if nq_data.status != DataStatus.FRESH:
+                warnings.append(f"NQ futures snapshot is {nq_data.status.value}")
         else:
             sources_status['NQ_futures'] = DataStatus.UNAVAILABLE
             warnings.append("NQ futures data unavailable")
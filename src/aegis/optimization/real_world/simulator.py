@@ -6,14 +6,18 @@ Execution Simulator - Phase 6
 - 매수/매도 슬리피지 적용
 - 거래세 + 수수료 반영
 - 시간대별 가중치 조정
+- 벡터 체결 모델 (주문 배열 단위 호가/슬리피지/비용 계산, 분봉 백테스트용)
 """
 import asyncio
 from datetime import datetime, time
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+import numpy as np
+import pandas as pd
+
 
 class TimeSegment(Enum):
     """시간대 구분"""
@@ -118,6 +122,31 @@ class ExecutionSimulator:
         (float('inf'), 1000),
     ]
 
+    # 시간대 경계 (분 단위, 해당 분부터 다음 시간대)
+    SEGMENT_BOUNDARIES = [
+        (8 * 60 + 30, TimeSegment.PREMARKET),
+        (9 * 60, TimeSegment.OPENING),
+        (9 * 60 + 30, TimeSegment.MORNING),
+        (11 * 60 + 30, TimeSegment.LUNCH),
+        (13 * 60, TimeSegment.AFTERNOON),
+        (14 * 60 + 30, TimeSegment.CLOSING),
+        (15 * 60 + 20, TimeSegment.CLOSED),
+        (15 * 60 + 30, TimeSegment.AFTER_HOURS),
+        (18 * 60, TimeSegment.CLOSED),
+    ]
+
+    # 시간대별 슬리피지 호가 수 (벡터 체결 모델에서 slippage_ticks=None일 때)
+    SEGMENT_SLIPPAGE_TICKS = {
+        TimeSegment.PREMARKET: 2,
+        TimeSegment.OPENING: 2,     # 시초 변동성
+        TimeSegment.MORNING: 1,
+        TimeSegment.LUNCH: 1,
+        TimeSegment.AFTERNOON: 1,
+        TimeSegment.CLOSING: 2,     # 동시호가 직전 호가 공백
+        TimeSegment.AFTER_HOURS: 2,
+        TimeSegment.CLOSED: 2,
+    }
+
     # 시간대별 가중치 조정
     TIME_WEIGHTS = {
         TimeSegment.PREMARKET: {
@@ -183,6 +212,92 @@ class ExecutionSimulator:
                 return tick
         return 1000
 
+    # ------------------------------------------------------------------
+    # 벡터 체결 모델 (주문 배열 단위)
+    # ------------------------------------------------------------------
+
+    SEGMENTS = list(TimeSegment)
+
+    def get_tick_sizes(self, prices: np.ndarray) -> np.ndarray:
+        """가격 배열 -> 호가 단위 배열 (get_tick_size 벡터화)"""
+        thresholds = np.array([threshold for threshold, _ in self.TICK_SIZES])
+        ticks = np.array([tick for _, tick in self.TICK_SIZES], dtype=float)
+        idx = np.searchsorted(thresholds, np.asarray(prices, dtype=float), side='right')
+        return ticks[np.minimum(idx, len(ticks) - 1)]
+
+    def get_time_segments(self, timestamps) -> np.ndarray:
+        """타임스탬프 배열 -> 시간대 코드 배열 (SEGMENTS 인덱스)"""
+        index = pd.DatetimeIndex(timestamps)
+        minutes = np.asarray(index.hour * 60 + index.minute)
+        edges = np.array([minute for minute, _ in self.SEGMENT_BOUNDARIES])
+        lookup = np.array(
+            [self.SEGMENTS.index(TimeSegment.CLOSED)]
+            + [self.SEGMENTS.index(segment) for _, segment in self.SEGMENT_BOUNDARIES]
+        )
+        return lookup[np.searchsorted(edges, minutes, side='right')]
+
+    def get_slippage_ticks(self, timestamps) -> np.ndarray:
+        """타임스탬프 배열 -> 시간대별 슬리피지 호가 수"""
+        per_segment = np.array([self.SEGMENT_SLIPPAGE_TICKS[segment] for segment in self.SEGMENTS])
+        return per_segment[self.get_time_segments(timestamps)]
+
+    def fill_prices(
+        self,
+        prices: np.ndarray,
+        sides: Union[int, np.ndarray],
+        timestamps=None,
+        slippage_ticks: Optional[Union[int, np.ndarray]] = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        체결가 배열 (calculate_slippage 벡터화)
+
+        Args:
+            prices: 신호 가격 배열
+            sides: +1 매수 / -1 매도 (스칼라 또는 배열)
+            timestamps: slippage_ticks=None일 때 시간대별 호가 수 결정에 사용
+            slippage_ticks: 슬리피지 호가 수 (None이면 SEGMENT_SLIPPAGE_TICKS)
+
+        Returns:
+            (체결가 배열, 슬리피지 금액 배열)
+        """
+        prices = np.asarray(prices, dtype=float)
+        if slippage_ticks is None:
+            if timestamps is None:
+                raise ValueError("timestamps required for time-segment slippage")
+            slippage_ticks = self.get_slippage_ticks(timestamps)
+        slippage = self.get_tick_sizes(prices) * slippage_ticks
+        return prices + np.sign(sides) * slippage, slippage
+
+    def simulate_fills(
+        self,
+        prices: np.ndarray,
+        quantities: np.ndarray,
+        sides: np.ndarray,
+        timestamps=None,
+        slippage_ticks: Optional[Union[int, np.ndarray]] = 1
+    ) -> Dict[str, np.ndarray]:
+        """
+        주문 배열 체결 시뮬레이션 (simulate_buy / simulate_sell 벡터화)
+
+        Returns:
+            {'expected_price', 'slippage', 'gross_amount', 'tax_fee', 'net_amount'}
+            net_amount: 매수는 지불액(+비용), 매도는 수령액(-세금/수수료)
+        """
+        sides = np.sign(np.asarray(sides, dtype=float))
+        quantities = np.asarray(quantities, dtype=float)
+        expected_price, slippage = self.fill_prices(prices, sides, timestamps, slippage_ticks)
+
+        gross_amount = expected_price * quantities
+        cost_rate = np.where(sides > 0, self.COSTS['total_buy_cost'], self.COSTS['total_sell_cost'])
+        tax_fee = gross_amount * cost_rate
+        return {
+            'expected_price': expected_price,
+            'slippage': slippage,
+            'gross_amount': gross_amount,
+            'tax_fee': tax_fee,
+            'net_amount': gross_amount + sides * tax_fee,
+        }
+
     def calculate_slippage(
         self,
         price: float,
@@ -79,10 +79,6 @@ class RobustnessTester:
         stocks = stocks or self._test_stocks
         individual_results = []
 
-        passed = True
-        fail_reason = None
-        max_mdd = 0.0
-
         for ticker, name, stock_type in stocks:
             self.logger.info(f"Testing {name} ({ticker})...")
 
@@ -97,15 +93,43 @@ class RobustnessTester:
             result['type'] = stock_type
             individual_results.append(result)
 
+        return self.aggregate_results(individual_results, stocks_tested=len(stocks))
+
+    def aggregate_results(
+        self,
+        individual_results: List[Dict[str, Any]],
+        stocks_tested: Optional[int] = None,
+        periods_tested: int = 3
+    ) -> RobustnessResult:
+        """
+        종목별 결과 집계 + MDD 실패 판정
+
+        run_robustness_test()와 병렬 스윕(SweepRunner)이 공유합니다.
+        결과에 부트스트랩 MDD 상한('mdd_upper', MonteCarloRiskEngine)이 있으면
+        단일 경로 MDD 대신 상한으로 판정합니다.
+        """
+        passed = True
+        fail_reason = None
+        max_mdd = 0.0
+
+        for result in individual_results:
+            name = result.get('name', result.get('ticker'))
+            ticker = result.get('ticker')
+
             # MDD 체크
             mdd = abs(result.get('mdd', 0))
             if mdd > max_mdd:
                 max_mdd = mdd
 
+            mdd_label = "MDD"
+            if 'mdd_upper' in result:
+                mdd = abs(result['mdd_upper'])
+                mdd_label = "MDD(upper CI)"
+
             if mdd > self.MAX_MDD_THRESHOLD:
                 passed = False
                 fail_reason = (
-                    f"{name}({ticker}) MDD {mdd:.1f}% > {self.MAX_MDD_THRESHOLD}%"
+                    f"{name}({ticker}) {mdd_label} {mdd:.1f}% > {self.MAX_MDD_THRESHOLD}%"
                 )
                 self.logger.warning(f"FAIL: {fail_reason}")
 
@@ -122,8 +146,8 @@ class RobustnessTester:
         return RobustnessResult(
             passed=passed,
             fail_reason=fail_reason,
-            stocks_tested=len(stocks),
-            periods_tested=3,  # Bull, Bear, Sideways
+            stocks_tested=stocks_tested if stocks_tested is not None else len(individual_results),
+            periods_tested=periods_tested,  # Bull, Bear, Sideways
             avg_win_rate=round(avg_win_rate, 2),
             avg_mdd=round(avg_mdd, 2),
             max_mdd=round(max_mdd, 2),
@@ -0,0 +1,589 @@
+"""
+Sweep Runner - Phase 6
+가중치 조합 × 종목 × 기간 병렬 백테스트
+
+핵심 기능:
+- 작업을 프로세스 풀로 분산 (기본: 모든 코어)
+- OHLCV 패널은 shared memory 한 블록으로 공유 (DataFrame pickling 없음)
+- 완료 순서대로 결과 스트리밍 → WeightOptimizer.observe() / RobustnessTester 집계
+- 결과를 JSONL로 append 저장, 같은 run_id로 재실행하면 완료된 작업은 건너뜀
+
+작업 단위는 (종목, 기간, 가중치 조합 묶음)입니다. 워커는 종목/기간 DataFrame과
+구성 전략의 진입/청산 조건을 한 번만 만들고, 묶음 안의 조합마다 조건만 섞어
+BacktestEngine(fast=True)을 돌립니다.
+
+가중치 키는 STRATEGY_FACTORIES에 있어야 합니다 (없는 키에 가중치가 있으면 ValueError,
+투표 가중치가 0인 조합은 건너뜀).
+
+Usage:
+    panel = PricePanel.from_frames(scored_frames)   # total_score 포함
+    runner = SweepRunner()
+    optimizer = WeightOptimizer(strategies=list(STRATEGY_FACTORIES))
+    results = runner.optimize(
+        optimizer, panel,
+        combinations=optimizer.generate_weight_combinations(),
+        periods={'bull': ('2020-04-01', '2021-06-30'), 'bear': (...), 'sideways': (...)},
+        run_id='grid_2025q1',
+    )
+"""
+import hashlib
+import json
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.backtest.engine import BacktestEngine
+from ..analysis.backtest.portfolio import PricePanel
+from ..analysis.backtest.strategy import (
+    AegisSwingStrategy,
+    MeanReversionStrategy,
+    OrderType,
+    StrategyInterface,
+)
+from ..risk import MonteCarloRiskEngine
+from .robustness_tester import RobustnessResult, RobustnessTester
+from .weight_optimizer import MarketRegime, OptimizationResult, WeightOptimizer
+
+
+# 가중치 키 → 구성 전략 (signal_arrays() 지원 전략만)
+STRATEGY_FACTORIES: Dict[str, Callable[[], StrategyInterface]] = {
+    'swing': AegisSwingStrategy,
+    'mean_reversion': MeanReversionStrategy,
+}
+
+
+Conditions = Tuple[np.ndarray, np.ndarray]
+
+
+class WeightedBlendStrategy(StrategyInterface):
+    """
+    고정 가중치 앙상블 전략 (벡터화)
+
+    StrategyOrchestrator.aggregate_signals()와 같은 규칙을 국면 구분 없이 적용:
+    - 무포지션: 가중 BUY 비율 >= buy_threshold 이고 BUY 동의율 >= min_agreement 이면 BUY
+    - 보유 중: 가중 SELL 비율 >= -sell_threshold 이고 SELL 동의율 >= min_agreement 이면 SELL
+
+    가중치 0 또는 STRATEGY_FACTORIES에 없는 전략은 투표에서 제외됩니다.
+    """
+
+    def __init__(
+        self,
+        weights: Dict[str, float],
+        components: Optional[Dict[str, StrategyInterface]] = None,
+        conditions: Optional[Dict[str, Conditions]] = None,
+        buy_threshold: float = 0.3,
+        sell_threshold: float = -0.3,
+        min_agreement: float = 0.5,
+        capital_per_trade_pct: float = 0.2
+    ):
+        super().__init__("AEGIS Weighted Blend")
+        self.weights = weights
+        self.components = components
+        self.conditions = conditions
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        self.min_agreement = min_agreement
+        self.capital_per_trade_pct = capital_per_trade_pct
+        self._arrays: Optional[Conditions] = None
+
+    @staticmethod
+    def component_conditions(df: pd.DataFrame, names: List[str]) -> Dict[str, Conditions]:
+        """구성 전략별 진입/청산 조건 (조합 간 재사용)"""
+        conditions = {}
+        for name in names:
+            factory = STRATEGY_FACTORIES.get(name)
+            if factory is None:
+                continue
+            conditions[name] = factory().signal_arrays(df)
+        return conditions
+
+    @staticmethod
+    def blend(
+        conditions: Dict[str, Conditions],
+        weights: Dict[str, float],
+        buy_threshold: float = 0.3,
+        sell_threshold: float = -0.3,
+        min_agreement: float = 0.5
+    ) -> Optional[Conditions]:
+        voters = [
+            (name, weights[name]) for name in conditions
+            if weights.get(name, 0) > 0
+        ]
+        if not voters:
+            return None
+
+        total_weight = sum(w for _, w in voters)
+        buy_score = sum(w * conditions[name][0] for name, w in voters) / total_weight
+        sell_score = sum(w * conditions[name][1] for name, w in voters) / total_weight
+        buy_ratio = sum(conditions[name][0].astype(float) for name, _ in voters) / len(voters)
+        sell_ratio = sum(conditions[name][1].astype(float) for name, _ in voters) / len(voters)
+
+        buy = (buy_score >= buy_threshold) & (buy_ratio >= min_agreement)
+        sell = (-sell_score <= sell_threshold) & (sell_ratio >= min_agreement)
+        return buy, sell
+
+    def signal_arrays(self, df: pd.DataFrame) -> Conditions:
+        conditions = self.conditions
+        if conditions is None:
+            if self.components is not None:
+                conditions = {n: s.signal_arrays(df) for n, s in self.components.items()}
+            else:
+                conditions = self.component_conditions(df, list(self.weights))
+        blended = self.blend(
+            conditions, self.weights,
+            self.buy_threshold, self.sell_threshold, self.min_agreement
+        )
+        if blended is None:
+            empty = np.zeros(len(df), dtype=bool)
+            return empty, empty
+        return blended
+
+    def prepare(self, df: pd.DataFrame) -> None:
+        self._arrays = self.signal_arrays(df)
+        super().prepare(df)
+
+    def calculate_signal(self, df: pd.DataFrame, index: int) -> OrderType:
+        # 조건 배열은 프레임당 1회 계산 (봉마다 재계산하면 O(n²))
+        if not self.is_prepared(df):
+            self.prepare(df)
+        buy, sell = self._arrays
+        if self.position is None and buy[index]:
+            return OrderType.BUY
+        if self.position is not None and sell[index]:
+            return OrderType.SELL
+        return OrderType.HOLD
+
+    def calculate_quantity(self, capital: float, price: float, signal: OrderType) -> int:
+        if signal == OrderType.BUY:
+            return int((capital * self.capital_per_trade_pct) / price)
+        elif signal == OrderType.SELL:
+            return self.position.quantity if self.position else 0
+        return 0
+
+    def reset(self) -> None:
+        super().reset()
+        self._arrays = None
+
+
+def backtest_metrics(
+    engine: BacktestEngine,
+    result: Dict[str, Any],
+    n_bars: int,
+    monte_carlo: Optional[MonteCarloRiskEngine] = None
+) -> Dict[str, Any]:
+    """
+    백테스트 결과 → 최적화 지표 (WeightOptimizer / RobustnessTester 공용 키)
+
+    monte_carlo가 주어지면 거래 부트스트랩 분포 지표(mdd_upper, cagr_lower,
+    sharpe_lower, risk_of_ruin)를 추가합니다.
+    """
+    report = result['report']
+    _, mdd_pct = engine.monitor.calculate_mdd()
+    years = n_bars / 252
+    growth = result['final_capital'] / result['initial_capital']
+    cagr = (growth ** (1 / years) - 1) * 100 if years > 0 and growth > 0 else 0.0
+    profit_factor = report.profit_factor if report else 0.0
+    metrics = {
+        'sharpe_ratio': float(engine.monitor.calculate_sharpe_ratio()),
+        'profit_factor': float(profit_factor) if math.isfinite(profit_factor) else 99.0,
+        'win_rate': float(report.win_rate) if report else 0.0,
+        'total_return': float(result['total_return_pct']),
+        'mdd': float(mdd_pct),
+        'cagr': float(cagr),
+        'total_trades': int(report.total_trades) if report else 0,
+    }
+    if monte_carlo is not None:
+        distribution = monte_carlo.analyze_trades(
+            result['trades'], result['initial_capital'],
+            periods_per_year=len(result['trades']) / years if years > 0 else None
+        )
+        if distribution is not None:
+            metrics.update(distribution.metrics())
+        else:
+            metrics.update(mdd_upper=float(mdd_pct), cagr_lower=float(cagr),
+                           sharpe_lower=metrics['sharpe_ratio'], risk_of_ruin=0.0)
+    return metrics
+
+
+@dataclass
+class SweepUnit:
+    """워커 작업 단위 (종목 × 기간 × 조합 묶음)"""
+    ticker: str
+    period: str
+    start: int            # 패널 행 범위 [start, stop)
+    stop: int
+    combos: List[Dict[str, float]]
+    keys: List[str]
+
+
+# ---------------------------------------------------------------------------
+# Worker side (module-level: picklable)
+# ---------------------------------------------------------------------------
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(
+    shm_name: str,
+    shape: Tuple[int, int, int],
+    fields: List[str],
+    tickers: List[str],
+    index_values: np.ndarray,
+    engine_kwargs: Dict[str, Any],
+    blend_kwargs: Dict[str, Any],
+    untrack: bool,
+    monte_carlo_paths: int = 0
+):
+    shm = SharedMemory(name=shm_name)
+    if untrack:
+        # spawn/forkserver 워커는 별도 추적 → 생성한 부모 프로세스만 unlink 하도록 해제
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    _WORKER.update(
+        shm=shm,
+        data=np.ndarray(shape, dtype=np.float64, buffer=shm.buf),
+        fields=fields,
+        columns={ticker: j for j, ticker in enumerate(tickers)},
+        index=pd.Index(index_values),
+        engine_kwargs=engine_kwargs,
+        blend_kwargs=blend_kwargs,
+        monte_carlo=MonteCarloRiskEngine(n_paths=monte_carlo_paths, seed=0) if monte_carlo_paths else None,
+    )
+
+
+def _run_unit(unit: SweepUnit) -> List[Dict[str, Any]]:
+    data = _WORKER['data']
+    j = _WORKER['columns'][unit.ticker]
+    df = pd.DataFrame(
+        data[:, unit.start:unit.stop, j].T.copy(),
+        index=_WORKER['index'][unit.start:unit.stop],
+        columns=_WORKER['fields'],
+    )
+    df = df[df['close'].notna()]
+    df.attrs['ticker'] = unit.ticker
+
+    names = sorted({name for combo in unit.combos for name in combo})
+    conditions = WeightedBlendStrategy.component_conditions(df, names)
+    engine = BacktestEngine(**_WORKER['engine_kwargs'])
+
+    results = []
+    for key, weights in zip(unit.keys, unit.combos):
+        strategy = WeightedBlendStrategy(weights, conditions=conditions, **_WORKER['blend_kwargs'])
+        result = engine.run(df, strategy, stock_code=unit.ticker, fast=True)
+        results.append({
+            'key': key,
+            'ticker': unit.ticker,
+            'period': unit.period,
+            'weights': weights,
+            **backtest_metrics(engine, result, len(df), _WORKER['monte_carlo']),
+        })
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+class SweepRunner:
+    """
+    병렬 파라미터 스윕 실행기
+
+    Phase 6 Spec:
+    - 조합 × 종목 × 기간을 프로세스 풀로 분산
+    - shared memory 패널 공유
+    - 결과 스트리밍 + 재개 가능한 실행 (run_id)
+    """
+
+    RESULTS_DIR = Path("data/sweeps")
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        blend_kwargs: Optional[Dict[str, Any]] = None,
+        units_per_worker: int = 4,
+        monte_carlo_paths: int = 0
+    ):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.engine_kwargs = engine_kwargs or {}
+        self.blend_kwargs = blend_kwargs or {}
+        self.units_per_worker = units_per_worker
+        self.monte_carlo_paths = monte_carlo_paths   # >0이면 조합별 부트스트랩 MDD 상한/파산확률 포함
+
+    @staticmethod
+    def task_key(weights: Dict[str, float], ticker: str, period: str, start: int, stop: int) -> str:
+        payload = json.dumps(
+            [sorted(weights.items()), ticker, period, start, stop],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def _validate_combinations(self, combinations: List[Dict[str, float]]) -> List[Dict[str, float]]:
+        """
+        가중치 키 검증 (스윕 시작 전)
+
+        STRATEGY_FACTORIES에 없는 전략에 가중치가 있으면 ValueError (조용히 투표에서 빠지면
+        결과가 다른 조합과 섞임), 투표 가중치가 0인 조합(거래 없음)은 제외합니다.
+        """
+        unknown = sorted({
+            name for weights in combinations for name, weight in weights.items()
+            if weight > 0 and name not in STRATEGY_FACTORIES
+        })
+        if unknown:
+            raise ValueError(
+                f"No sweep strategy for weight keys {unknown}; "
+                f"supported: {sorted(STRATEGY_FACTORIES)}"
+            )
+        voting = [
+            weights for weights in combinations
+            if any(weights.get(name, 0) > 0 for name in STRATEGY_FACTORIES)
+        ]
+        if len(voting) < len(combinations):
+            self.logger.warning(f"Skipping {len(combinations) - len(voting)} combinations with no voting weight")
+        return voting
+
+    def _results_path(self, run_id: str) -> Path:
+        return self.RESULTS_DIR / f"{run_id}.jsonl"
+
+    def _load_completed(self, run_id: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        if not run_id:
+            return {}
+        path = self._results_path(run_id)
+        if not path.exists():
+            return {}
+
+        completed = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시 잘린 마지막 줄
+                completed[record['key']] = record
+        return completed
+
+    def _period_bounds(
+        self,
+        index: pd.Index,
+        periods: Dict[str, Tuple[Any, Any]]
+    ) -> Dict[str, Tuple[int, int]]:
+        bounds = {}
+        for name, (start, end) in periods.items():
+            lo = 0 if start is None else int(index.searchsorted(pd.Timestamp(start), side='left'))
+            hi = len(index) if end is None else int(index.searchsorted(pd.Timestamp(end), side='right'))
+            bounds[name] = (lo, hi)
+        return bounds
+
+    def _build_units(
+        self,
+        tickers: List[str],
+        bounds: Dict[str, Tuple[int, int]],
+        combinations: List[Dict[str, float]],
+        completed: Dict[str, Dict[str, Any]]
+    ) -> List[SweepUnit]:
+        n_groups = max(1, len(tickers) * len(bounds))
+        target_units = self.max_workers * self.units_per_worker
+        chunk = max(1, math.ceil(len(combinations) * n_groups / target_units))
+
+        units = []
+        for ticker in tickers:
+            for period, (start, stop) in bounds.items():
+                pending = []
+                for weights in combinations:
+                    key = self.task_key(weights, ticker, period, start, stop)
+                    if key not in completed:
+                        pending.append((key, weights))
+                for i in range(0, len(pending), chunk):
+                    batch = pending[i:i + chunk]
+                    units.append(SweepUnit(
+                        ticker=ticker,
+                        period=period,
+                        start=start,
+                        stop=stop,
+                        combos=[w for _, w in batch],
+                        keys=[k for k, _ in batch],
+                    ))
+        return units
+
+    def iter_results(
+        self,
+        panel: PricePanel,
+        combinations: List[Dict[str, float]],
+        periods: Dict[str, Tuple[Any, Any]],
+        tickers: Optional[List[str]] = None,
+        run_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        스윕 실행 (완료 순서대로 결과 yield)
+
+        Args:
+            panel: total_score가 포함된 가격 패널
+            combinations: 가중치 조합 목록
+            periods: {기간명: (시작일, 종료일)} (None = 처음/끝)
+            tickers: 대상 종목 (기본: 패널 전체)
+            run_id: 지정 시 data/sweeps/{run_id}.jsonl 에 저장/재개
+
+        Yields:
+            {'key', 'ticker', 'period', 'weights', 'sharpe_ratio', ...}
+            (재개 시 이전 실행 결과가 먼저 나옵니다)
+        """
+        if 'total_score' not in panel.fields:
+            raise ValueError("PricePanel must contain 'total_score'. Run calculate_signal_score() first.")
+
+        combinations = self._validate_combinations(combinations)
+        tickers = tickers or panel.tickers
+        bounds = self._period_bounds(panel.index, periods)
+        completed = self._load_completed(run_id)
+        valid_keys = {
+            self.task_key(w, t, p, *bounds[p])
+            for w in combinations for t in tickers for p in bounds
+        }
+
+        resumed = 0
+        for key, record in completed.items():
+            if key in valid_keys:
+                resumed += 1
+                yield record
+
+        units = self._build_units(tickers, bounds, combinations, completed)
+        total = sum(len(u.combos) for u in units)
+        self.logger.info(
+            f"Sweep: {total} backtests in {len(units)} units "
+            f"({resumed} resumed, {self.max_workers} workers)"
+        )
+        if not units:
+            return
+
+        fields = list(panel.fields)
+        data = np.stack([panel.fields[f].to_numpy(dtype=np.float64) for f in fields])
+        shm = SharedMemory(create=True, size=max(data.nbytes, 1))
+        out = None
+        try:
+            shared = np.ndarray(data.shape, dtype=np.float64, buffer=shm.buf)
+            shared[:] = data
+            del data
+
+            if run_id:
+                self.RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+                out = open(self._results_path(run_id), 'a', encoding='utf-8')
+
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(units)),
+                initializer=_init_worker,
+                initargs=(
+                    shm.name, shared.shape, fields, panel.tickers,
+                    panel.index.to_numpy(), self.engine_kwargs, self.blend_kwargs,
+                    multiprocessing.get_start_method() != 'fork',
+                    self.monte_carlo_paths,
+                )
+            ) as executor:
+                futures = [executor.submit(_run_unit, unit) for unit in units]
+                for future in as_completed(futures):
+                    for record in future.result():
+                        if out:
+                            out.write(json.dumps(record, default=str) + "\n")
+                        yield record
+                    if out:
+                        out.flush()
+        finally:
+            if out:
+                out.close()
+            shm.close()
+            shm.unlink()
+
+    def optimize(
+        self,
+        optimizer: WeightOptimizer,
+        panel: PricePanel,
+        combinations: List[Dict[str, float]],
+        periods: Dict[str, Tuple[Any, Any]],
+        tickers: Optional[List[str]] = None,
+        metric: str = "sharpe_ratio",
+        run_id: Optional[str] = None
+    ) -> Dict[str, OptimizationResult]:
+        """
+        국면(기간)별 최적 가중치 탐색
+
+        한 조합의 모든 종목 결과가 모이는 즉시 종목 평균을 optimizer.observe()로 전달합니다.
+        기간명이 MarketRegime 값('bull'/'bear'/'sideways')이면 해당 국면에 반영됩니다.
+        """
+        tickers = tickers or panel.tickers
+        pending: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        regimes = {}
+        for period in periods:
+            try:
+                regimes[period] = MarketRegime(period)
+            except ValueError:
+                regimes[period] = None
+                self.logger.warning(f"Period '{period}' is not a MarketRegime; results are not observed")
+
+        for regime in regimes.values():
+            if regime is not None:
+                optimizer.reset_streaming(regime)
+
+        for record in self.iter_results(panel, combinations, periods, tickers, run_id):
+            combo_id = json.dumps(sorted(record['weights'].items()))
+            bucket = pending.setdefault((record['period'], combo_id), [])
+            bucket.append(record)
+            if len(bucket) < len(tickers):
+                continue
+
+            regime = regimes.get(record['period'])
+            if regime is not None:
+                optimizer.observe(regime, self._average(bucket), metric)
+            del pending[(record['period'], combo_id)]
+
+        return {
+            period: optimizer.get_streaming_result(regime)
+            for period, regime in regimes.items() if regime is not None
+        }
+
+    def robustness(
+        self,
+        tester: RobustnessTester,
+        panel: PricePanel,
+        combinations: List[Dict[str, float]],
+        periods: Dict[str, Tuple[Any, Any]],
+        stocks: Optional[List[tuple]] = None,
+        run_id: Optional[str] = None
+    ) -> List[Tuple[Dict[str, float], RobustnessResult]]:
+        """
+        조합별 강건성 테스트 (종목 × 기간 결과를 RobustnessTester 기준으로 집계)
+        """
+        stocks = stocks or tester.get_test_stocks()
+        info = {ticker: (name, stock_type) for ticker, name, stock_type in stocks}
+        tickers = [t for t in info if t in panel.tickers]
+
+        by_combo: Dict[str, List[Dict[str, Any]]] = {}
+        weights_of: Dict[str, Dict[str, float]] = {}
+        for record in self.iter_results(panel, combinations, periods, tickers, run_id):
+            combo_id = json.dumps(sorted(record['weights'].items()))
+            name, stock_type = info[record['ticker']]
+            by_combo.setdefault(combo_id, []).append({**record, 'name': name, 'type': stock_type})
+            weights_of[combo_id] = record['weights']
+
+        return [
+            (weights_of[combo_id], tester.aggregate_results(
+                results, stocks_tested=len(tickers), periods_tested=len(periods)
+            ))
+            for combo_id, results in by_combo.items()
+        ]
+
+    @staticmethod
+    def _average(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        metrics = ['sharpe_ratio', 'profit_factor', 'win_rate', 'total_return', 'mdd', 'cagr']
+        averaged = {m: float(np.mean([r.get(m, 0) for r in records])) for m in metrics}
+        averaged['total_trades'] = int(sum(r.get('total_trades', 0) for r in records))
+        averaged['weights'] = records[0]['weights']
+        averaged['period'] = records[0]['period']
+        return averaged
@@ -0,0 +1,431 @@
+"""
+Walk-Forward Optimizer - Phase 6
+Rolling train/test 분할 기반 표본 외(out-of-sample) 검증
+
+핵심 기능:
+- 이력을 rolling(또는 anchored) train → test 폴드로 분할
+- 각 train 폴드에서 가중치 최적화 (후보 목록 또는 weight_search 전략)
+- 직후 test 폴드에서 선택된 가중치만 평가 → 표본 외 성과 집계
+- 폴드별 지표 패널 / 파라미터별 백테스트 결과를 데이터 해시 키로 캐시
+  (폴드 경계는 이력 시작 기준으로 고정 → 하루치 데이터가 추가되면 마지막 폴드만 재계산)
+
+Usage:
+    wf = WalkForwardOptimizer(WalkForwardConfig(train_bars=252, test_bars=63))
+    result = wf.run(frames, keys=['swing', 'mean_reversion'], method='coordinate', max_cost=30)
+    print(result.oos_metrics, result.latest_params)
+"""
+import hashlib
+import json
+import logging
+import pickle
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.signal import calculate_signal_score
+from .weight_search import BlendBacktestObjective, SearchBudget, get_searcher
+
+
+Frames = Dict[str, pd.DataFrame]
+
+
+@dataclass
+class WalkForwardConfig:
+    """Walk-forward 분할 설정 (단위: 봉)"""
+    train_bars: int = 252          # 1년
+    test_bars: int = 63            # 1분기
+    step_bars: Optional[int] = None  # 기본: test_bars (test 폴드가 겹치지 않음)
+    warmup_bars: int = 60          # 지표 워밍업 (ma_60)
+    anchored: bool = False         # True: train 시작을 이력 처음으로 고정 (expanding)
+    min_test_bars: int = 5         # 마지막 폴드 최소 test 길이
+    seed: int = 0                  # 탐색 시드 (폴드 데이터 해시와 섞어 폴드별 고정, 캐시 키에 포함)
+
+
+@dataclass
+class Fold:
+    """폴드 경계 (공통 캘린더 행 위치, [start, end))"""
+    index: int
+    warmup_start: int
+    train_start: int
+    train_end: int
+    test_end: int
+
+
+@dataclass
+class FoldResult:
+    """폴드 결과"""
+    fold: Fold
+    data_hash: str
+    train_period: Tuple[str, str]
+    test_period: Tuple[str, str]
+    best_params: Dict[str, float]
+    train_metrics: Dict[str, Any]
+    test_metrics: Dict[str, Any]
+    evaluations: int
+    cache_hits: int
+    panel_cached: bool
+
+
+@dataclass
+class WalkForwardResult:
+    """Walk-forward 결과"""
+    folds: List[FoldResult]
+    oos_metrics: Dict[str, Any]
+    latest_params: Dict[str, float]
+    cache_stats: Dict[str, int] = field(default_factory=dict)
+
+
+class FoldCache:
+    """
+    폴드 캐시 (메모리 + 디스크)
+
+    - panels/{hash}.pkl: 폴드 구간 지표 패널 (prepare 결과)
+    - results/{hash}.json: {segment|fidelity|params: 지표}
+    - 데이터가 추가되면 마지막 폴드 해시가 바뀌어 옛 파일이 남으므로 maintain()으로
+      max_age 지난 파일과 종류별 max_entries 초과분(오래 안 쓴 순)을 삭제
+    """
+
+    CACHE_DIR = Path("data/walk_forward_cache")
+    MAX_AGE_DAYS = 30
+    MAX_ENTRIES = 500         # 종류(panels/results)별
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        persist: bool = True,
+        max_age_days: float = MAX_AGE_DAYS,
+        max_entries: int = MAX_ENTRIES
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+        self.persist = persist
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self._panels: Dict[str, Frames] = {}
+        self._results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def _path(self, kind: str, key: str, suffix: str) -> Path:
+        return self.cache_dir / kind / f"{key}.{suffix}"
+
+    def get_panel(self, key: str) -> Optional[Frames]:
+        if key in self._panels:
+            return self._panels[key]
+        path = self._path('panels', key, 'pkl')
+        if self.persist and path.exists():
+            with open(path, 'rb') as f:
+                self._panels[key] = pickle.load(f)
+            path.touch()   # 수정 시각 = 마지막 사용 시각 (maintain 기준)
+            return self._panels[key]
+        return None
+
+    def put_panel(self, key: str, frames: Frames):
+        self._panels[key] = frames
+        if self.persist:
+            path = self._path('panels', key, 'pkl')
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump(frames, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def results(self, key: str) -> Dict[str, Dict[str, Any]]:
+        if key not in self._results:
+            path = self._path('results', key, 'json')
+            if self.persist and path.exists():
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._results[key] = json.load(f)
+                path.touch()
+            else:
+                self._results[key] = {}
+        return self._results[key]
+
+    def flush_results(self, key: str):
+        if not self.persist or key not in self._results:
+            return
+        path = self._path('results', key, 'json')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self._results[key], f)
+
+    def maintain(self) -> int:
+        """max_age 지난 파일 + 종류별 max_entries 초과분(오래 안 쓴 순) 삭제 (삭제 건수 반환)"""
+        if not self.persist:
+            return 0
+        cutoff = time.time() - self.max_age_days * 86400
+        removed = 0
+        for kind in ('panels', 'results'):
+            directory = self.cache_dir / kind
+            if not directory.is_dir():
+                continue
+            files = []
+            for path in directory.iterdir():
+                try:
+                    files.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+            files.sort(reverse=True)
+            for rank, (mtime, path) in enumerate(files):
+                if mtime >= cutoff and rank < self.max_entries:
+                    continue
+                path.unlink(missing_ok=True)
+                getattr(self, f"_{kind}").pop(path.stem, None)
+                removed += 1
+        return removed
+
+    def clear(self):
+        self._panels.clear()
+        self._results.clear()
+
+
+class _CachedObjective:
+    """파라미터별 백테스트 결과 캐시를 거치는 objective"""
+
+    def __init__(self, factory: Callable[[], Callable], store: Dict[str, Dict[str, Any]], segment: str):
+        self._factory = factory
+        self._objective = None
+        self.store = store
+        self.segment = segment
+        self.hits = 0
+
+    def __call__(self, params: Dict[str, float], fidelity: float = 1.0) -> Dict[str, Any]:
+        key = f"{self.segment}|{fidelity:.6f}|{json.dumps(sorted(params.items()))}"
+        if key in self.store:
+            self.hits += 1
+            return self.store[key]
+        if self._objective is None:
+            # 세그먼트 objective는 캐시 미스가 있을 때만 생성
+            self._objective = self._factory()
+        metrics = self._objective(params, fidelity)
+        self.store[key] = metrics
+        return metrics
+
+
+class WalkForwardOptimizer:
+    """
+    Walk-forward 최적화기
+
+    Phase 6 Spec:
+    - rolling train/test 폴드
+    - train 최적화 → test 평가 (표본 외)
+    - 데이터 해시 기반 폴드 캐시
+    """
+
+    def __init__(
+        self,
+        config: Optional[WalkForwardConfig] = None,
+        prepare: Callable[[pd.DataFrame], pd.DataFrame] = calculate_signal_score,
+        objective_factory: Callable[[Frames], Callable] = BlendBacktestObjective,
+        cache: Optional[FoldCache] = None,
+        cache_tag: str = ""
+    ):
+        """
+        Args:
+            config: 폴드 분할 설정
+            prepare: 폴드 구간 OHLCV → 지표/점수 DataFrame (기본: calculate_signal_score)
+            objective_factory: 세그먼트 frames → objective(params, fidelity)
+            cache: 폴드 캐시 (기본: data/walk_forward_cache)
+            cache_tag: prepare/objective 설정이 바뀌면 변경 (캐시 키에 포함)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.config = config or WalkForwardConfig()
+        self.prepare = prepare
+        self.objective_factory = objective_factory
+        self.cache = cache or FoldCache()
+        self.cache_tag = cache_tag
+
+    def make_folds(self, n_bars: int) -> List[Fold]:
+        """폴드 경계 생성 (이력 시작 기준 고정)"""
+        cfg = self.config
+        step = cfg.step_bars or cfg.test_bars
+        folds = []
+        k = 0
+        while True:
+            train_end = k * step + cfg.train_bars
+            if train_end >= n_bars:
+                break
+            test_end = min(train_end + cfg.test_bars, n_bars)
+            if test_end - train_end < cfg.min_test_bars:
+                break
+            train_start = 0 if cfg.anchored else k * step
+            folds.append(Fold(
+                index=k,
+                warmup_start=max(0, train_start - cfg.warmup_bars),
+                train_start=train_start,
+                train_end=train_end,
+                test_end=test_end,
+            ))
+            k += 1
+        return folds
+
+    @staticmethod
+    def _window(frames: Frames, start, end) -> Frames:
+        window = {}
+        for ticker, df in frames.items():
+            part = df.loc[start:end]
+            if not part.empty:
+                part.attrs['ticker'] = ticker   # IndicatorEngine 종목 메모 키
+                window[ticker] = part
+        return window
+
+    def _fold_hash(self, raw: Frames, fold: Fold, calendar: pd.Index) -> str:
+        digest = hashlib.sha1()
+        prepare_id = f"{getattr(self.prepare, '__module__', '')}.{getattr(self.prepare, '__qualname__', repr(self.prepare))}"
+        objective_id = getattr(self.objective_factory, '__qualname__', repr(self.objective_factory))
+        digest.update(json.dumps([
+            prepare_id, objective_id, self.cache_tag, self.config.seed,
+            str(calendar[fold.train_start]), str(calendar[fold.train_end]), str(calendar[fold.test_end - 1]),
+        ]).encode())
+        for ticker in sorted(raw):
+            digest.update(ticker.encode())
+            digest.update(pd.util.hash_pandas_object(raw[ticker], index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _fold_panel(self, key: str, raw: Frames) -> Tuple[Frames, bool]:
+        panel = self.cache.get_panel(key)
+        if panel is not None:
+            return panel, True
+        panel = {ticker: self.prepare(df) for ticker, df in raw.items()}
+        self.cache.put_panel(key, panel)
+        return panel, False
+
+    def _optimize(
+        self,
+        objective: _CachedObjective,
+        keys: List[str],
+        candidates: Optional[List[Dict[str, float]]],
+        method: str,
+        max_cost: float,
+        metric: str,
+        initial: Optional[Dict[str, float]],
+        seed: Optional[int] = None
+    ) -> Tuple[Dict[str, float], Dict[str, Any], int]:
+        if candidates is not None:
+            best_params, best_metrics = {}, {}
+            best_value = float('-inf')
+            for params in candidates:
+                params = {k: float(v) for k, v in params.items()}
+                metrics = objective(params)
+                if metrics.get(metric, 0) > best_value:
+                    best_value, best_params, best_metrics = metrics.get(metric, 0), params, metrics
+            return best_params, best_metrics, len(candidates)
+
+        result = get_searcher(method, seed=seed).search(
+            objective, keys, SearchBudget(max_cost=max_cost), metric=metric, initial=initial
+        )
+        return result.best_weights, result.best_metrics, result.evaluations
+
+    def run(
+        self,
+        frames: Frames,
+        keys: Optional[List[str]] = None,
+        candidates: Optional[List[Dict[str, float]]] = None,
+        method: str = "coordinate",
+        max_cost: float = 30.0,
+        metric: str = "sharpe_ratio",
+        warm_start: bool = True
+    ) -> WalkForwardResult:
+        """
+        Walk-forward 실행
+
+        Args:
+            frames: 종목별 OHLCV DataFrame (DatetimeIndex)
+            keys: 가중치 키 (method 탐색 시 필수)
+            candidates: 후보 파라미터 목록 (지정 시 전수 평가, method 무시)
+            method: weight_search 전략 (grid/random/sobol/coordinate/halving/hyperband)
+            max_cost: 폴드당 train 탐색 예산
+            metric: 최적화 지표
+            warm_start: 직전 폴드 최적값을 다음 폴드 탐색 시작점으로 사용
+
+        Returns:
+            WalkForwardResult
+        """
+        if candidates is None and not keys:
+            raise ValueError("Either candidates or keys must be given")
+
+        calendar = pd.Index(sorted(set().union(*[df.index for df in frames.values()])))
+        folds = self.make_folds(len(calendar))
+        if not folds:
+            self.logger.warning(
+                f"Not enough history for walk-forward: {len(calendar)} bars "
+                f"< train {self.config.train_bars} + test {self.config.min_test_bars}"
+            )
+            return WalkForwardResult(folds=[], oos_metrics={}, latest_params={})
+
+        results: List[FoldResult] = []
+        stats = {'folds': len(folds), 'panels_cached': 0, 'result_hits': 0, 'evaluations': 0}
+        previous_best: Optional[Dict[str, float]] = None
+
+        for fold in folds:
+            raw = self._window(frames, calendar[fold.warmup_start], calendar[fold.test_end - 1])
+            key = self._fold_hash(raw, fold, calendar)
+            panel, panel_cached = self._fold_panel(key, raw)
+            store = self.cache.results(key)
+
+            train_start, train_last = calendar[fold.train_start], calendar[fold.train_end - 1]
+            test_start, test_last = calendar[fold.train_end], calendar[fold.test_end - 1]
+
+            train_objective = _CachedObjective(
+                lambda: self.objective_factory(self._window(panel, train_start, train_last)), store, 'train'
+            )
+            test_objective = _CachedObjective(
+                lambda: self.objective_factory(self._window(panel, test_start, test_last)), store, 'test'
+            )
+
+            best_params, train_metrics, evaluations = self._optimize(
+                train_objective, keys or [], candidates, method, max_cost, metric,
+                previous_best if warm_start else None,
+                seed=int(key[:8], 16)   # 같은 폴드 데이터 → 같은 후보 (재실행 시 결과 캐시 적중)
+            )
+            test_metrics = test_objective(best_params) if best_params else {}
+            self.cache.flush_results(key)
+
+            hits = train_objective.hits + test_objective.hits
+            stats['panels_cached'] += int(panel_cached)
+            stats['result_hits'] += hits
+            stats['evaluations'] += evaluations
+            previous_best = best_params or previous_best
+
+            results.append(FoldResult(
+                fold=fold,
+                data_hash=key,
+                train_period=(str(train_start), str(train_last)),
+                test_period=(str(test_start), str(test_last)),
+                best_params=best_params,
+                train_metrics=train_metrics,
+                test_metrics=test_metrics,
+                evaluations=evaluations,
+                cache_hits=hits,
+                panel_cached=panel_cached,
+            ))
+            self.logger.info(
+                f"Fold {fold.index}: train {metric}={train_metrics.get(metric, 0):.3f} "
+                f"test {metric}={test_metrics.get(metric, 0):.3f} "
+                f"({'cached' if panel_cached else 'computed'}, {hits} result hits)"
+            )
+
+        stats['evicted'] = self.cache.maintain()
+
+        return WalkForwardResult(
+            folds=results,
+            oos_metrics=self._aggregate(results),
+            latest_params=results[-1].best_params,
+            cache_stats=stats,
+        )
+
+    @staticmethod
+    def _aggregate(results: List[FoldResult]) -> Dict[str, Any]:
+        """표본 외 성과 집계 (test 폴드 수익률은 복리로 연결)"""
+        tested = [r.test_metrics for r in results if r.test_metrics]
+        if not tested:
+            return {}
+        growth = float(np.prod([1 + m.get('total_return', 0) / 100 for m in tested]))
+        return {
+            'folds': len(tested),
+            'total_return': (growth - 1) * 100,
+            'avg_sharpe_ratio': float(np.mean([m.get('sharpe_ratio', 0) for m in tested])),
+            'avg_win_rate': float(np.mean([m.get('win_rate', 0) for m in tested])),
+            'max_mdd': float(max(m.get('mdd', 0) for m in tested)),
+            'total_trades': int(sum(m.get('total_trades', 0) for m in tested)),
+            'positive_folds': int(sum(1 for m in tested if m.get('total_return', 0) > 0)),
+        }
@@ -59,6 +59,8 @@ class WeightOptimizer:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.strategies = strategies or self.DEFAULT_STRATEGIES
         self._optimal_weights: Dict[MarketRegime, Dict[str, float]] = {}
+        # 스트리밍 최적화 상태: regime -> (best_metric, best_result, 관측 수)
+        self._streaming_best: Dict[MarketRegime, Tuple[float, Dict[str, Any], int]] = {}
 
     def optimize_for_regime(
         self,
@@ -109,6 +111,111 @@ class WeightOptimizer:
             optimized_at=datetime.now().isoformat()
         )
 
+    def observe(
+        self,
+        regime: MarketRegime,
+        result: Dict[str, Any],
+        metric: str = "sharpe_ratio"
+    ) -> bool:
+        """
+        백테스트 결과 1건 반영 (병렬 스윕 결과를 완료 순서대로 스트리밍)
+
+        optimize_for_regime()과 같은 기준(metric 최대)으로 최고 결과를 갱신합니다.
+
+        Returns:
+            최고 결과가 갱신되었으면 True
+        """
+        metric_value = result.get(metric, 0)
+        best_value, best_result, count = self._streaming_best.get(
+            regime, (float('-inf'), None, 0)
+        )
+        improved = metric_value > best_value
+        if improved:
+            best_value, best_result = metric_value, result
+            self._optimal_weights[regime] = result.get('weights', {})
+        self._streaming_best[regime] = (best_value, best_result, count + 1)
+        return improved
+
+    def get_streaming_result(self, regime: MarketRegime) -> OptimizationResult:
+        """observe()로 누적된 현재 최적 결과"""
+        if regime not in self._streaming_best:
+            return self._empty_result(regime)
+
+        _, best_result, count = self._streaming_best[regime]
+        if best_result is None:
+            return self._empty_result(regime)
+
+        return OptimizationResult(
+            regime=regime,
+            best_weights=best_result.get('weights', {}),
+            sharpe_ratio=best_result.get('sharpe_ratio', 0),
+            profit_factor=best_result.get('profit_factor', 0),
+            win_rate=best_result.get('win_rate', 0),
+            total_return=best_result.get('total_return', 0),
+            iterations=count,
+            optimized_at=datetime.now().isoformat()
+        )
+
+    def reset_streaming(self, regime: Optional[MarketRegime] = None):
+        """스트리밍 최적화 상태 초기화"""
+        if regime is None:
+            self._streaming_best.clear()
+        else:
+            self._streaming_best.pop(regime, None)
+
+    def search_for_regime(
+        self,
+        regime: MarketRegime,
+        objective: Any,
+        method: str = "hyperband",
+        max_cost: float = 100.0,
+        metric: str = "sharpe_ratio",
+        keys: Optional[List[str]] = None,
+        initial: Optional[Dict[str, float]] = None,
+        **searcher_kwargs
+    ) -> OptimizationResult:
+        """
+        예산 제한 가중치 탐색 (Grid 대안)
+
+        Args:
+            regime: 시장 국면
+            objective: objective(weights, fidelity) -> 지표 딕셔너리 (weight_search 참고)
+            method: grid / random / sobol / coordinate / halving / hyperband
+            max_cost: 백테스트 예산 (전체 구간 1회 = 1.0)
+            metric: 최적화 지표
+            keys: 가중치 키 (기본: self.strategies)
+            initial: 시작점/첫 후보 (예: 현재 가중치)
+
+        Returns:
+            OptimizationResult: 최적화 결과
+        """
+        from .weight_search import SearchBudget, get_searcher
+
+        searcher = get_searcher(method, **searcher_kwargs)
+        result = searcher.search(
+            objective,
+            keys or self.strategies,
+            SearchBudget(max_cost=max_cost),
+            metric=metric,
+            initial=initial,
+        )
+        if not result.best_weights:
+            self.logger.warning(f"No full-length evaluation within budget for {regime.value}")
+            return self._empty_result(regime)
+
+        self._optimal_weights[regime] = result.best_weights
+        best = result.best_metrics
+        return OptimizationResult(
+            regime=regime,
+            best_weights=result.best_weights,
+            sharpe_ratio=best.get('sharpe_ratio', 0),
+            profit_factor=best.get('profit_factor', 0),
+            win_rate=best.get('win_rate', 0),
+            total_return=best.get('total_return', 0),
+            iterations=result.evaluations,
+            optimized_at=datetime.now().isoformat()
+        )
+
     def generate_weight_combinations(
         self,
         strategies: Optional[List[str]] = None,
@@ -0,0 +1,559 @@
+"""
+Weight Search - Phase 6
+표본 효율적인 가중치 탐색 (Grid 대안)
+
+핵심 기능:
+- Random / Sobol 샘플링 (가중치 심플렉스: 모든 가중치 >= 0, 합계 = 1.0)
+- Coordinate Descent (한 가중치씩 ±delta 이동, 개선 없으면 delta 축소)
+- Successive Halving / Hyperband (짧은 구간에서 먼저 평가, 상위 후보만 전체 구간으로 승급)
+- 백테스트 예산 제한: 비용 = 평가 구간 비율의 합 (전체 구간 1회 = 1.0)
+
+Objective 규약:
+    objective(weights, fidelity) -> 지표 딕셔너리 (backtest_metrics()와 같은 키)
+    fidelity: 0 < f <= 1, 최근 f 비율 구간만 백테스트
+
+Usage:
+    objective = FactorScoreObjective(frames, factors=list(weights))
+    result = HyperbandSearch().search(objective, list(weights), SearchBudget(max_cost=60))
+"""
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.stats import qmc
+except ImportError:
+    qmc = None
+
+from ..analysis.backtest.engine import BacktestEngine
+from ..analysis.backtest.strategy import AegisSwingStrategy
+from ..risk import MonteCarloRiskEngine
+from .sweep_runner import WeightedBlendStrategy, backtest_metrics
+
+
+Weights = Dict[str, float]
+Objective = Callable[[Weights, float], Dict[str, Any]]
+
+
+# ---------------------------------------------------------------------------
+# Simplex sampling
+# ---------------------------------------------------------------------------
+
+def _halton(n: int, dim: int, skip: int = 1) -> np.ndarray:
+    """Halton 저불일치 수열 (scipy 미설치 시 Sobol 대체)"""
+    primes = []
+    candidate = 2
+    while len(primes) < dim:
+        if all(candidate % p for p in primes):
+            primes.append(candidate)
+        candidate += 1
+
+    points = np.empty((n, dim))
+    for d, base in enumerate(primes):
+        for i in range(n):
+            k, f, value = i + skip, 1.0, 0.0
+            while k > 0:
+                f /= base
+                value += f * (k % base)
+                k //= base
+            points[i, d] = value
+    return points
+
+
+def sample_simplex(
+    n: int,
+    dim: int,
+    method: str = "random",
+    seed: Optional[int] = None,
+    offset: int = 0
+) -> np.ndarray:
+    """
+    가중치 심플렉스 위의 균등 표본
+
+    단위 초입방체 (dim-1)차원 점을 정렬 후 간격으로 변환합니다.
+    Sobol 수열의 저불일치 성질이 심플렉스에서도 유지됩니다.
+
+    Args:
+        n: 표본 수
+        dim: 가중치 개수
+        method: "random" 또는 "sobol"
+        seed: 난수 시드
+        offset: 저불일치 수열 시작 위치 (반복 호출 시 이전 표본 다음부터 이어서 생성)
+
+    Returns:
+        (n, dim) 배열, 각 행의 합 = 1.0
+    """
+    if dim == 1:
+        return np.ones((n, 1))
+
+    if method == "sobol":
+        if qmc is not None:
+            sampler = qmc.Sobol(d=dim - 1, scramble=True, seed=seed)
+            if offset:
+                sampler.fast_forward(offset)
+            cube = sampler.random(n)
+        else:
+            # Cranley-Patterson rotation (seed=None이면 호출마다 다른 이동)
+            cube = _halton(n, dim - 1, skip=1 + offset)
+            cube = (cube + np.random.default_rng(seed).random(dim - 1)) % 1.0
+    elif method == "random":
+        cube = np.random.default_rng(seed).random((n, dim - 1))
+    else:
+        raise ValueError(f"Unknown sampling method: {method}")
+
+    cube = np.sort(cube, axis=1)
+    edges = np.hstack([np.zeros((n, 1)), cube, np.ones((n, 1))])
+    return np.diff(edges, axis=1)
+
+
+def _to_weights(keys: List[str], vector: np.ndarray) -> Weights:
+    return {k: round(float(v), 4) for k, v in zip(keys, vector)}
+
+
+# ---------------------------------------------------------------------------
+# Budget / result
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SearchBudget:
+    """탐색 예산 (cost 단위: 전체 구간 백테스트 1회 = 1.0)"""
+    max_cost: float = 100.0
+    max_evaluations: Optional[int] = None
+    cost: float = 0.0
+    evaluations: int = 0
+
+    def can_afford(self, fidelity: float) -> bool:
+        if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            return False
+        return self.cost + fidelity <= self.max_cost + 1e-9
+
+    def charge(self, fidelity: float):
+        self.cost += fidelity
+        self.evaluations += 1
+
+
+@dataclass
+class SearchResult:
+    """탐색 결과"""
+    method: str
+    best_weights: Weights
+    best_metrics: Dict[str, Any]
+    best_value: float
+    cost: float
+    evaluations: int
+    history: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class _Evaluator:
+    """objective 호출 + 예산 차감 + 중복 평가 메모"""
+
+    def __init__(self, objective: Objective, budget: SearchBudget, metric: str):
+        self.objective = objective
+        self.budget = budget
+        self.metric = metric
+        self.history: List[Dict[str, Any]] = []
+        self._memo: Dict[Tuple[str, float], Dict[str, Any]] = {}
+        self.best: Optional[Dict[str, Any]] = None   # 전체 구간(fidelity=1) 기준 최고
+
+    def __call__(self, weights: Weights, fidelity: float = 1.0) -> Optional[float]:
+        key = (json.dumps(sorted(weights.items())), round(fidelity, 6))
+        if key in self._memo:
+            return self._memo[key].get(self.metric, 0)
+        if not self.budget.can_afford(fidelity):
+            return None
+
+        metrics = self.objective(weights, fidelity)
+        self.budget.charge(fidelity)
+        self._memo[key] = metrics
+        value = metrics.get(self.metric, 0)
+        self.history.append({'weights': weights, 'fidelity': fidelity, self.metric: value})
+
+        if fidelity >= 1.0 and (self.best is None or value > self.best['value']):
+            self.best = {'weights': weights, 'metrics': metrics, 'value': value}
+        return value
+
+    def result(self, method: str) -> SearchResult:
+        best = self.best or {'weights': {}, 'metrics': {}, 'value': float('-inf')}
+        return SearchResult(
+            method=method,
+            best_weights=best['weights'],
+            best_metrics=best['metrics'],
+            best_value=best['value'],
+            cost=round(self.budget.cost, 4),
+            evaluations=self.budget.evaluations,
+            history=self.history,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Search strategies
+# ---------------------------------------------------------------------------
+
+class WeightSearcher:
+    """가중치 탐색 전략 기본 클래스"""
+
+    name = "base"
+
+    def __init__(self, seed: Optional[int] = None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.seed = seed
+
+    def search(
+        self,
+        objective: Objective,
+        keys: List[str],
+        budget: Optional[SearchBudget] = None,
+        metric: str = "sharpe_ratio",
+        initial: Optional[Weights] = None
+    ) -> SearchResult:
+        budget = budget or SearchBudget()
+        evaluate = _Evaluator(objective, budget, metric)
+        self._search(evaluate, keys, initial)
+        result = evaluate.result(self.name)
+        self.logger.info(
+            f"{self.name}: best {metric}={result.best_value:.4f} "
+            f"({result.evaluations} evals, cost {result.cost:.1f})"
+        )
+        return result
+
+    def _search(self, evaluate: _Evaluator, keys: List[str], initial: Optional[Weights]):
+        raise NotImplementedError
+
+
+class GridSearch(WeightSearcher):
+    """기존 Grid (WeightOptimizer.generate_weight_combinations와 같은 격자)"""
+
+    name = "grid"
+
+    def __init__(self, step: float = 0.1, seed: Optional[int] = None):
+        super().__init__(seed)
+        self.step = step
+
+    def _search(self, evaluate, keys, initial):
+        from .weight_optimizer import WeightOptimizer
+        for weights in WeightOptimizer(keys).generate_weight_combinations(step=self.step):
+            if evaluate({k: float(v) for k, v in weights.items()}) is None:
+                break
+
+
+class RandomSearch(WeightSearcher):
+    """Random / Sobol 샘플링 (예산 소진까지 전체 구간 평가)"""
+
+    def __init__(self, method: str = "random", batch: int = 64, seed: Optional[int] = None):
+        super().__init__(seed)
+        self.method = method
+        self.name = method
+        self.batch = batch
+
+    def _search(self, evaluate, keys, initial):
+        if initial and evaluate(initial) is None:
+            return
+        batch_seed = self.seed
+        offset = 0
+        while True:
+            evaluations = evaluate.budget.evaluations
+            vectors = sample_simplex(self.batch, len(keys), self.method, batch_seed, offset=offset)
+            for vector in vectors:
+                if evaluate(_to_weights(keys, vector)) is None:
+                    return
+            if evaluate.budget.evaluations == evaluations:
+                # 한 바퀴 동안 새 평가가 없음 (모두 메모 적중) → 더 진행해도 예산이 줄지 않음
+                return
+            offset += self.batch
+            batch_seed = None if batch_seed is None else batch_seed + 1
+
+
+class CoordinateDescentSearch(WeightSearcher):
+    """
+    Coordinate Descent
+
+    각 가중치를 ±delta 만큼 옮기고 나머지를 비례 조정 (합계 유지).
+    한 바퀴 동안 개선이 없으면 delta를 절반으로 줄입니다.
+    """
+
+    name = "coordinate"
+
+    def __init__(self, delta: float = 0.1, min_delta: float = 0.0125, seed: Optional[int] = None):
+        super().__init__(seed)
+        self.delta = delta
+        self.min_delta = min_delta
+
+    @staticmethod
+    def _move(vector: np.ndarray, i: int, step: float) -> Optional[np.ndarray]:
+        target = min(max(vector[i] + step, 0.0), 1.0)
+        if abs(target - vector[i]) < 1e-9:
+            return None
+        rest = 1.0 - vector[i]
+        moved = vector.copy()
+        if rest > 1e-9:
+            moved *= (1.0 - target) / rest
+        else:
+            moved[:] = (1.0 - target) / (len(vector) - 1)
+        moved[i] = target
+        return moved
+
+    def _search(self, evaluate, keys, initial):
+        if initial:
+            vector = np.array([initial.get(k, 0.0) for k in keys], dtype=float)
+            vector = vector / vector.sum() if vector.sum() > 0 else np.full(len(keys), 1 / len(keys))
+        else:
+            vector = np.full(len(keys), 1 / len(keys))
+
+        best = evaluate(_to_weights(keys, vector))
+        if best is None:
+            return
+
+        delta = self.delta
+        while delta >= self.min_delta:
+            improved = False
+            for i in range(len(keys)):
+                for step in (delta, -delta):
+                    moved = self._move(vector, i, step)
+                    if moved is None:
+                        continue
+                    value = evaluate(_to_weights(keys, moved))
+                    if value is None:
+                        return
+                    if value > best:
+                        best, vector, improved = value, moved, True
+                        break
+            if not improved:
+                delta /= 2
+
+
+class SuccessiveHalvingSearch(WeightSearcher):
+    """
+    Successive Halving
+
+    n개 후보를 min_fidelity 구간에서 평가 → 상위 1/eta만 eta배 긴 구간으로 승급 →
+    마지막 라운드는 전체 구간(fidelity=1).
+    """
+
+    name = "halving"
+
+    def __init__(
+        self,
+        n_candidates: int = 81,
+        min_fidelity: float = 1 / 9,
+        eta: int = 3,
+        method: str = "sobol",
+        seed: Optional[int] = None
+    ):
+        super().__init__(seed)
+        self.n_candidates = n_candidates
+        self.min_fidelity = min_fidelity
+        self.eta = eta
+        self.method = method
+
+    def _run_bracket(
+        self,
+        evaluate: _Evaluator,
+        candidates: List[Weights],
+        fidelity: float
+    ) -> bool:
+        """한 브래킷 실행 (예산 소진 시 False)"""
+        while candidates:
+            fidelity = min(fidelity, 1.0)
+            scored = []
+            for weights in candidates:
+                value = evaluate(weights, fidelity)
+                if value is None:
+                    return False
+                scored.append((value, weights))
+
+            if fidelity >= 1.0:
+                return True
+
+            scored.sort(key=lambda x: x[0], reverse=True)
+            keep = max(1, len(scored) // self.eta)
+            candidates = [w for _, w in scored[:keep]]
+            fidelity *= self.eta
+        return True
+
+    def _candidates(
+        self,
+        keys: List[str],
+        n: int,
+        initial: Optional[Weights],
+        seed_offset: int = 0,
+        offset: int = 0
+    ) -> List[Weights]:
+        seed = None if self.seed is None else self.seed + seed_offset
+        candidates = [
+            _to_weights(keys, v) for v in sample_simplex(n, len(keys), self.method, seed, offset=offset)
+        ]
+        if initial:
+            candidates[0] = initial
+        return candidates
+
+    def _search(self, evaluate, keys, initial):
+        candidates = self._candidates(keys, self.n_candidates, initial)
+        self._run_bracket(evaluate, candidates, self.min_fidelity)
+
+
+class HyperbandSearch(SuccessiveHalvingSearch):
+    """
+    Hyperband
+
+    후보 수/시작 구간을 바꾼 Successive Halving 브래킷을 반복합니다
+    (공격적인 조기 탈락 ↔ 적은 후보를 긴 구간에서 평가). 예산이 남으면 다시 순환합니다.
+    """
+
+    name = "hyperband"
+
+    def __init__(self, min_fidelity: float = 1 / 9, eta: int = 3, method: str = "sobol", seed: Optional[int] = None):
+        super().__init__(min_fidelity=min_fidelity, eta=eta, method=method, seed=seed)
+
+    def _search(self, evaluate, keys, initial):
+        s_max = max(0, int(math.floor(math.log(1 / self.min_fidelity, self.eta) + 1e-9)))
+        bracket = 0
+        offset = 0
+        while True:
+            evaluations = evaluate.budget.evaluations
+            for s in range(s_max, -1, -1):
+                n = int(math.ceil((s_max + 1) / (s + 1) * self.eta ** s))
+                fidelity = self.eta ** (-s)
+                candidates = self._candidates(
+                    keys, n, initial if bracket == 0 else None, seed_offset=bracket, offset=offset
+                )
+                bracket += 1
+                offset += n
+                if not self._run_bracket(evaluate, candidates, fidelity):
+                    return
+            if evaluate.budget.evaluations == evaluations:
+                # 한 순환 동안 새 평가가 없음 (모두 메모 적중) → 종료
+                return
+
+
+SEARCH_STRATEGIES: Dict[str, Callable[..., WeightSearcher]] = {
+    'grid': GridSearch,
+    'random': lambda **kw: RandomSearch(method='random', **kw),
+    'sobol': lambda **kw: RandomSearch(method='sobol', **kw),
+    'coordinate': CoordinateDescentSearch,
+    'halving': SuccessiveHalvingSearch,
+    'hyperband': HyperbandSearch,
+}
+
+
+def get_searcher(method: str, **kwargs) -> WeightSearcher:
+    """이름으로 탐색 전략 생성"""
+    if method not in SEARCH_STRATEGIES:
+        raise ValueError(f"Unknown search method: {method} (available: {sorted(SEARCH_STRATEGIES)})")
+    return SEARCH_STRATEGIES[method](**kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Objectives
+# ---------------------------------------------------------------------------
+
+class _BacktestObjective:
+    """종목별 fast 백테스트 평균 지표 (최근 fidelity 비율 구간)"""
+
+    MIN_BARS = 80
+
+    MONTE_CARLO_METRICS = ('mdd_upper', 'cagr_lower', 'sharpe_lower', 'risk_of_ruin')
+
+    def __init__(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        monte_carlo: Optional[MonteCarloRiskEngine] = None
+    ):
+        self.frames = frames
+        self.engine_kwargs = engine_kwargs or {}
+        self.monte_carlo = monte_carlo      # 있으면 부트스트랩 분포 지표도 평균
+
+    def _window(self, df: pd.DataFrame, fidelity: float, ticker: str) -> pd.DataFrame:
+        n = len(df)
+        size = min(n, max(self.MIN_BARS, int(math.ceil(n * fidelity))))
+        window = df.iloc[n - size:]
+        window.attrs['ticker'] = ticker   # IndicatorEngine 종목 메모 키
+        return window
+
+    def _evaluate(self, weights: Weights, fidelity: float, ticker: str, df: pd.DataFrame) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def __call__(self, weights: Weights, fidelity: float = 1.0) -> Dict[str, Any]:
+        results = [
+            self._evaluate(weights, fidelity, ticker, self._window(df, fidelity, ticker))
+            for ticker, df in self.frames.items()
+        ]
+        names = ('sharpe_ratio', 'profit_factor', 'win_rate', 'total_return', 'mdd', 'cagr')
+        if self.monte_carlo is not None:
+            names += self.MONTE_CARLO_METRICS
+        metrics = {m: float(np.mean([r[m] for r in results])) for m in names}
+        metrics['total_trades'] = int(sum(r['total_trades'] for r in results))
+        metrics['weights'] = weights
+        return metrics
+
+
+class BlendBacktestObjective(_BacktestObjective):
+    """
+    전략 가중치 목적함수 (WeightedBlendStrategy)
+
+    구성 전략의 진입/청산 조건은 (종목, fidelity)별로 한 번만 계산합니다.
+    """
+
+    def __init__(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        blend_kwargs: Optional[Dict[str, Any]] = None,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        monte_carlo: Optional[MonteCarloRiskEngine] = None
+    ):
+        super().__init__(frames, engine_kwargs, monte_carlo)
+        self.blend_kwargs = blend_kwargs or {}
+        self._conditions: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def _evaluate(self, weights, fidelity, ticker, df):
+        key = (ticker, len(df))
+        if key not in self._conditions:
+            self._conditions[key] = WeightedBlendStrategy.component_conditions(df, sorted(weights))
+        strategy = WeightedBlendStrategy(weights, conditions=self._conditions[key], **self.blend_kwargs)
+        engine = BacktestEngine(**self.engine_kwargs)
+        result = engine.run(df, strategy, stock_code=ticker, fast=True)
+        return backtest_metrics(engine, result, len(df), self.monte_carlo)
+
+
+class FactorScoreObjective(_BacktestObjective):
+    """
+    요소 가중치 목적함수 (InformationFusionEngine 9개 요소 등)
+
+    frames: 종목별 OHLC + 요소 점수 컬럼 (예: 'technical', 'supply', ...) 이력
+    total_score = sum(w_f * score_f) 를 AegisSwingStrategy 임계값(기본: 융합 엔진 BUY/SELL 1.0/-1.0)으로 매매합니다.
+    """
+
+    def __init__(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        factors: List[str],
+        buy_threshold: float = 1.0,
+        sell_threshold: float = -1.0,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        monte_carlo: Optional[MonteCarloRiskEngine] = None
+    ):
+        super().__init__(frames, engine_kwargs, monte_carlo)
+        self.factors = factors
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        self._matrices = {
+            ticker: df[factors].fillna(0.0).to_numpy(dtype=float)
+            for ticker, df in frames.items()
+        }
+
+    def _evaluate(self, weights, fidelity, ticker, df):
+        w = np.array([weights.get(f, 0.0) for f in self.factors])
+        scores = self._matrices[ticker][-len(df):] @ w
+        scored = df.assign(total_score=scores)
+        strategy = AegisSwingStrategy(
+            buy_threshold=self.buy_threshold,
+            sell_threshold=self.sell_threshold
+        )
+        engine = BacktestEngine(**self.engine_kwargs)
+        result = engine.run(scored, strategy, stock_code=ticker, fast=True)
+        return backtest_metrics(engine, result, len(df), self.monte_carlo)
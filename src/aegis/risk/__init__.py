@@ -6,10 +6,20 @@ Capital protection through position sizing and circuit breakers
 
 from .manager import RiskManager, RiskConfig
 from .circuit_breaker import CircuitBreaker, TradingHaltedException
+from .monte_carlo import (
+    MonteCarloRiskEngine,
+    MonteCarloResult,
+    ConfidenceInterval,
+    get_monte_carlo_engine,
+)
 
 __all__ = [
     'RiskManager',
     'RiskConfig',
     'CircuitBreaker',
     'TradingHaltedException',
+    'MonteCarloRiskEngine',
+    'MonteCarloResult',
+    'ConfidenceInterval',
+    'get_monte_carlo_engine',
 ]
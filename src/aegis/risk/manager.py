@@ -7,12 +7,16 @@ Features:
 - Kelly Criterion for optimal position sizing
 - Fixed Fractional Risk (1-2% per trade)
 - ATR-based dynamic stop-loss
+- Kelly fraction capped by bootstrap risk of ruin (MonteCarloRiskEngine)
 """
 
 import pandas as pd
 import numpy as np
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
+
+from ..analysis.indicator_graph import get_indicator_engine
+from .monte_carlo import MonteCarloRiskEngine
 
 
 @dataclass
@@ -29,11 +33,15 @@ class RiskConfig:
     # Kelly Criterion
     use_kelly: bool = False                   # Use Kelly for sizing
     kelly_fraction: float = 0.5               # Half-Kelly (conservative)
+    monte_carlo_seed: int = 0                 # Bootstrap seed for the risk-of-ruin cap (same input -> same size)
 
     # Circuit Breaker (daily limits)
     max_daily_loss_pct: float = 0.02          # -2% daily loss limit
     max_daily_trades: int = 10                # Max trades per day
 
+    # Portfolio
+    max_positions: int = 10                   # Max concurrent positions (portfolio backtest)
+
 
 class RiskManager:
     """
@@ -64,20 +72,7 @@ class RiskManager:
         ATR = Moving Average of True Range
         True Range = max(High-Low, |High-PrevClose|, |Low-PrevClose|)
         """
-        high = df['high'].astype(float)
-        low = df['low'].astype(float)
-        close = df['close'].astype(float)
-
-        prev_close = close.shift(1)
-
-        tr1 = high - low
-        tr2 = abs(high - prev_close)
-        tr3 = abs(low - prev_close)
-
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean()
-
-        return atr
+        return get_indicator_engine().compute_one(df, 'atr', period=period)
 
     def calculate_dynamic_stop_loss(
         self,
@@ -93,14 +88,20 @@ class RiskManager:
             Stop-loss price level
         """
         atr = self.calculate_atr(df)
-        current_atr = atr.iloc[-1]
+        price = entry_price or float(df['close'].iloc[-1])
+        return self.calculate_stop_loss_from_atr(price, atr.iloc[-1])
 
+    def calculate_stop_loss_from_atr(self, price: float, current_atr: float) -> float:
+        """
+        Calculate ATR stop-loss from a precomputed ATR value
+
+        Used by the array-based backtest path, where ATR is computed once
+        for the whole series instead of once per entry.
+        """
         if pd.isna(current_atr) or current_atr <= 0:
             # Fallback to fixed stop-loss
-            price = entry_price or float(df['close'].iloc[-1])
             return price * (1 - self.config.fixed_stop_loss_pct)
 
-        price = entry_price or float(df['close'].iloc[-1])
         stop_loss = price - (current_atr * self.config.atr_multiplier)
 
         # Ensure stop-loss is not too tight (min 1%)
@@ -130,6 +131,34 @@ class RiskManager:
         # Clamp to reasonable bounds
         return max(0.0, min(kelly, self.config.max_capital_per_trade_pct))
 
+    def calculate_kelly_fraction_mc(
+        self,
+        trade_r_multiples: Sequence[float],
+        max_risk_of_ruin: float = 0.01,
+        engine=None
+    ) -> float:
+        """
+        Kelly fraction reduced until the bootstrap risk of ruin is acceptable
+
+        Args:
+            trade_r_multiples: per-trade PnL / amount risked (R-multiples).
+                Sizing risks `fraction` of capital per trade, so the equity
+                return of a trade is fraction * R.
+            max_risk_of_ruin: allowed P(ruin) over the resampled trade sequences
+            engine: MonteCarloRiskEngine (default: seeded with config.monte_carlo_seed)
+
+        Returns:
+            Fraction of capital to risk (0.0 ~ calculate_kelly_fraction())
+        """
+        kelly = self.calculate_kelly_fraction()
+        if kelly <= 0 or len(trade_r_multiples) < 2:
+            return kelly
+
+        if engine is None:
+            engine = MonteCarloRiskEngine(seed=self.config.monte_carlo_seed)
+        candidates = kelly * np.linspace(0.1, 1.0, 10)
+        return engine.max_safe_fraction(trade_r_multiples, candidates, max_risk_of_ruin)
+
     def calculate_position_size(
         self,
         capital: float,
@@ -0,0 +1,318 @@
+"""
+PROJECT AEGIS - Monte Carlo Risk Engine
+========================================
+Bootstrap distributions of backtest risk metrics
+
+A single backtest gives one MDD / Sharpe from one path. This engine resamples
+the path instead:
+- iid bootstrap of per-trade returns (on equity)
+- circular block bootstrap of daily returns (keeps volatility clustering)
+
+All paths are evaluated as (paths x steps) NumPy matrices in log-equity space
+(10,000 paths x a few hundred steps in well under a second) and summarized as
+confidence intervals for MDD, CAGR, Sharpe plus risk of ruin.
+
+Usage:
+    mc = get_monte_carlo_engine()
+    result = mc.analyze_backtest(backtest_result)
+    result.mdd_pct.upper     # 95th percentile MDD
+    result.risk_of_ruin      # P(equity <= 50% of initial)
+"""
+
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class ConfidenceInterval:
+    """Distribution summary (lower/upper = two-sided confidence bounds)"""
+    mean: float
+    median: float
+    lower: float
+    upper: float
+
+
+@dataclass
+class MonteCarloResult:
+    """Monte Carlo risk report"""
+    method: str                 # "iid" / "block"
+    n_paths: int
+    n_steps: int
+    confidence: float
+    mdd_pct: ConfidenceInterval
+    cagr_pct: ConfidenceInterval
+    sharpe_ratio: ConfidenceInterval
+    total_return_pct: ConfidenceInterval
+    risk_of_ruin: float         # P(min equity <= initial * (1 - ruin_threshold))
+    prob_loss: float            # P(final equity < initial)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def metrics(self) -> Dict[str, float]:
+        """Flat keys for optimizer results (backtest_metrics 확장)"""
+        return {
+            'mdd_upper': self.mdd_pct.upper,
+            'cagr_lower': self.cagr_pct.lower,
+            'sharpe_lower': self.sharpe_ratio.lower,
+            'risk_of_ruin': self.risk_of_ruin,
+        }
+
+
+class MonteCarloRiskEngine:
+    """
+    Vectorized bootstrap risk engine
+
+    Paths are processed in batches of at most max_cells (paths x steps)
+    values so memory stays bounded for long daily series.
+    """
+
+    def __init__(
+        self,
+        n_paths: int = 10_000,
+        confidence: float = 0.95,
+        ruin_threshold_pct: float = 50.0,
+        risk_free_rate: float = 0.035,
+        seed: Optional[int] = None,
+        max_cells: int = 4_000_000
+    ):
+        self.n_paths = n_paths
+        self.confidence = confidence
+        self.ruin_threshold_pct = ruin_threshold_pct
+        self.risk_free_rate = risk_free_rate
+        self.seed = seed
+        self.max_cells = max_cells
+
+    # ------------------------------------------------------------------
+    # Resampling
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def default_block_size(n: int) -> int:
+        """n^(1/3) (일반적인 block bootstrap 기본값)"""
+        return max(1, int(round(n ** (1 / 3))))
+
+    def sample_indices(
+        self,
+        rng: np.random.Generator,
+        n: int,
+        n_paths: int,
+        horizon: int,
+        block_size: int = 1
+    ) -> np.ndarray:
+        """
+        Bootstrap index matrix (n_paths x horizon)
+
+        block_size=1 → iid, otherwise circular block bootstrap
+        """
+        if block_size <= 1:
+            return rng.integers(0, n, size=(n_paths, horizon))
+        n_blocks = -(-horizon // block_size)
+        starts = rng.integers(0, n, size=(n_paths, n_blocks, 1))
+        idx = (starts + np.arange(block_size)) % n
+        return idx.reshape(n_paths, n_blocks * block_size)[:, :horizon]
+
+    def _batches(self, horizon: int) -> Iterable[int]:
+        batch = max(1, self.max_cells // max(horizon, 1))
+        remaining = self.n_paths
+        while remaining > 0:
+            size = min(batch, remaining)
+            yield size
+            remaining -= size
+
+    # ------------------------------------------------------------------
+    # Path statistics
+    # ------------------------------------------------------------------
+
+    def _path_stats(self, returns: np.ndarray, periods_per_year: float) -> Dict[str, np.ndarray]:
+        """(paths x steps) equity returns → per-path metrics"""
+        n_steps = returns.shape[1]
+        # -100% 이하는 전액 손실로 처리 (log 발산 방지)
+        log_equity = np.cumsum(np.log1p(np.maximum(returns, -0.999999)), axis=1)
+        peak = np.maximum(np.maximum.accumulate(log_equity, axis=1), 0.0)
+        mdd = -np.expm1((log_equity - peak).min(axis=1)) * 100
+
+        final = log_equity[:, -1]
+        years = n_steps / periods_per_year
+        cagr = np.expm1(np.minimum(final / years, 50.0)) * 100   # 초단기 구간 연율화 overflow 방지
+
+        mean = returns.mean(axis=1)
+        std = returns.std(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = (mean * periods_per_year - self.risk_free_rate) / (std * np.sqrt(periods_per_year))
+        sharpe = np.where(std > 0, sharpe, 0.0)
+
+        ruin_level = np.log1p(-self.ruin_threshold_pct / 100)
+        return {
+            'mdd_pct': mdd,
+            'cagr_pct': cagr,
+            'sharpe_ratio': sharpe,
+            'total_return_pct': np.expm1(final) * 100,
+            'ruined': log_equity.min(axis=1) <= ruin_level,
+        }
+
+    def _summarize(self, values: np.ndarray) -> ConfidenceInterval:
+        alpha = (1 - self.confidence) / 2
+        lower, median, upper = np.percentile(values, [alpha * 100, 50, (1 - alpha) * 100])
+        return ConfidenceInterval(
+            mean=round(float(values.mean()), 4),
+            median=round(float(median), 4),
+            lower=round(float(lower), 4),
+            upper=round(float(upper), 4),
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def simulate(
+        self,
+        returns: Sequence[float],
+        periods_per_year: float = 252,
+        block_size: int = 1,
+        horizon: Optional[int] = None,
+        fraction: float = 1.0
+    ) -> Optional[MonteCarloResult]:
+        """
+        Resample a return series and summarize the path distribution
+
+        Args:
+            returns: per-step equity returns (0.01 = +1%)
+            periods_per_year: steps per year (252 daily, trades/year for trades)
+            block_size: 1 = iid bootstrap, >1 = circular block bootstrap
+            horizon: steps per path (default: len(returns))
+            fraction: exposure scaling applied to every return
+
+        Returns:
+            MonteCarloResult (None if fewer than 2 returns)
+        """
+        base = np.asarray(returns, dtype=float)
+        base = base[np.isfinite(base)]
+        if len(base) < 2:
+            return None
+        horizon = horizon or len(base)
+        rng = np.random.default_rng(self.seed)
+
+        parts = []
+        for size in self._batches(horizon):
+            idx = self.sample_indices(rng, len(base), size, horizon, block_size)
+            parts.append(self._path_stats(base[idx] * fraction, periods_per_year))
+        stats = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+        return MonteCarloResult(
+            method="block" if block_size > 1 else "iid",
+            n_paths=self.n_paths,
+            n_steps=horizon,
+            confidence=self.confidence,
+            mdd_pct=self._summarize(stats['mdd_pct']),
+            cagr_pct=self._summarize(stats['cagr_pct']),
+            sharpe_ratio=self._summarize(stats['sharpe_ratio']),
+            total_return_pct=self._summarize(stats['total_return_pct']),
+            risk_of_ruin=round(float(stats['ruined'].mean()), 4),
+            prob_loss=round(float((stats['total_return_pct'] < 0).mean()), 4),
+        )
+
+    @staticmethod
+    def trade_returns(trades: Sequence[Any], initial_capital: float) -> np.ndarray:
+        """Trade PnL → return on equity at entry (realized equity before each trade)"""
+        pnl = np.array([t.pnl for t in trades], dtype=float)
+        equity_before = initial_capital + np.concatenate([[0.0], np.cumsum(pnl)[:-1]])
+        return pnl / equity_before
+
+    @staticmethod
+    def trades_per_year(trades: Sequence[Any]) -> float:
+        """Trade frequency from the trade timestamps (1년 미만/불명이면 거래 수 그대로)"""
+        try:
+            days = (trades[-1].exit_time - trades[0].entry_time).days
+        except (AttributeError, TypeError):
+            days = 0
+        if days <= 0:
+            return float(len(trades))
+        return len(trades) / (days / 365.25)
+
+    def analyze_trades(
+        self,
+        trades: Sequence[Any],
+        initial_capital: float,
+        periods_per_year: Optional[float] = None
+    ) -> Optional[MonteCarloResult]:
+        """iid bootstrap of trade returns (TradeRecord-like: pnl, entry_time, exit_time)"""
+        if len(trades) < 2:
+            return None
+        return self.simulate(
+            self.trade_returns(trades, initial_capital),
+            periods_per_year=periods_per_year or self.trades_per_year(trades),
+        )
+
+    def analyze_equity(
+        self,
+        equity_curve: Sequence[float],
+        periods_per_year: float = 252,
+        block_size: Optional[int] = None
+    ) -> Optional[MonteCarloResult]:
+        """Block bootstrap of per-bar equity returns"""
+        equity = np.asarray(equity_curve, dtype=float)
+        if len(equity) < 3:
+            return None
+        returns = np.diff(equity) / equity[:-1]
+        return self.simulate(
+            returns,
+            periods_per_year=periods_per_year,
+            block_size=block_size or self.default_block_size(len(returns)),
+        )
+
+    def analyze_backtest(
+        self,
+        result: Dict[str, Any],
+        method: str = "trades",
+        periods_per_year: Optional[float] = None
+    ) -> Optional[MonteCarloResult]:
+        """BacktestEngine / PortfolioBacktestEngine result dict"""
+        if method == "trades":
+            return self.analyze_trades(result['trades'], result['initial_capital'], periods_per_year)
+        if method == "block":
+            return self.analyze_equity(result['equity_curve'], periods_per_year or 252)
+        raise ValueError(f"Unknown method: {method} (use 'trades' or 'block')")
+
+    def max_safe_fraction(
+        self,
+        trade_returns: Sequence[float],
+        candidates: Sequence[float],
+        max_risk_of_ruin: float = 0.01
+    ) -> float:
+        """
+        Largest exposure fraction whose bootstrap risk of ruin stays within limit
+
+        All candidates are evaluated on the same resampled paths (common random
+        numbers), so the result is monotone in the candidate fraction.
+        """
+        base = np.asarray(trade_returns, dtype=float)
+        base = base[np.isfinite(base)]
+        if len(base) < 2:
+            return 0.0
+        rng = np.random.default_rng(self.seed)
+        idx = self.sample_indices(rng, len(base), min(self.n_paths, self.max_cells // len(base) or 1), len(base))
+        sampled = base[idx]
+        ruin_level = np.log1p(-self.ruin_threshold_pct / 100)
+
+        best = 0.0
+        for fraction in sorted(candidates):
+            log_equity = np.cumsum(np.log1p(np.maximum(sampled * fraction, -0.999999)), axis=1)
+            if (log_equity.min(axis=1) <= ruin_level).mean() > max_risk_of_ruin:
+                break
+            best = float(fraction)
+        return best
+
+
+# Singleton instance
+_monte_carlo_instance: Optional[MonteCarloRiskEngine] = None
+
+
+def get_monte_carlo_engine() -> MonteCarloRiskEngine:
+    """Get singleton MonteCarloRiskEngine instance"""
+    global _monte_carlo_instance
+    if _monte_carlo_instance is None:
+        _monte_carlo_instance = MonteCarloRiskEngine()
+    return _monte_carlo_instance
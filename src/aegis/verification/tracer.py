@@ -119,8 +119,8 @@ class SignalTraceManager:
         """MarketScanner lazy load"""
         if self._market_scanner is None:
             try:
-                from src.fetchers.tier1_official_libs.market_scanner import MarketScanner
-                self._market_scanner = MarketScanner()
+                from src.fetchers.tier1_official_libs.market_scanner import get_market_scanner
+                self._market_scanner = get_market_scanner()
             except ImportError:
                 self.logger.warning("MarketScanner not available")
         return self._market_scanner
@@ -129,8 +129,8 @@ class SignalTraceManager:
         """NewsSentimentAnalyzer lazy load"""
         if self._news_analyzer is None:
             try:
-                from src.aegis.fusion.news_sentiment import NewsSentimentAnalyzer
-                self._news_analyzer = NewsSentimentAnalyzer()
+                from src.aegis.fusion.news_sentiment import get_news_sentiment_analyzer
+                self._news_analyzer = get_news_sentiment_analyzer()
             except ImportError:
                 self.logger.warning("NewsSentimentAnalyzer not available")
         return self._news_analyzer
@@ -28,6 +28,9 @@ class Settings(BaseSettings):
 
     # Gemini API (backup)
     GEMINI_API_KEY: Optional[str] = None
+    GEMINI_RPM: int = 60                  # 모델별 분당 요청 수 한도 (프로세스 공유)
+    GEMINI_TPM: int = 1_000_000           # 모델별 분당 토큰 수 한도
+    GEMINI_MAX_CONCURRENCY: int = 4       # 동시 호출 수 (전용 스레드 수)
 
     # Anthropic Claude API
     ANTHROPIC_API_KEY: Optional[str] = None
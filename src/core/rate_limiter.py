@@ -4,7 +4,7 @@ Implements token bucket algorithm for rate limiting
 """
 import asyncio
 import time
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 
 class RateLimiter:
@@ -91,3 +91,77 @@ class MultiRateLimiter:
             self.limiters[site_id] = RateLimiter(calls_per_minute=60)
 
         return self.limiters[site_id]
+
+
+class TokenBucket:
+    """
+    Async token bucket with continuous refill.
+
+    Unlike RateLimiter (fixed spacing between calls), a bucket allows bursts
+    up to its capacity and can meter weighted units such as LLM tokens.
+
+    Usage:
+        rpm = TokenBucket(capacity=60)             # 60 requests per minute
+        tpm = TokenBucket(capacity=1_000_000)      # 1M tokens per minute
+        await rpm.acquire()
+        await tpm.acquire(estimated_tokens)
+        tpm.adjust(estimated_tokens - actual_tokens)   # settle after the call
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0, timer: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            capacity: Maximum tokens (refilled over period seconds)
+            period: Refill period in seconds
+            timer: Monotonic clock (replaceable for tests)
+        """
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self.tokens = self.capacity
+        self._timer = timer
+        self._updated = timer()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self):
+        now = self._timer()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _get_lock(self) -> asyncio.Lock:
+        # asyncio.run()을 여러 번 호출하는 스크립트에서도 재사용 가능하도록 루프별 Lock
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock, self._loop = asyncio.Lock(), loop
+        return self._lock
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        Wait until amount tokens are available and take them (FIFO).
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(float(amount), self.capacity)
+        started = self._timer()
+        async with self._get_lock():
+            while True:
+                pause = self._paused_until - self._timer()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                    continue
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return self._timer() - started
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def adjust(self, amount: float):
+        """Return (+) or charge (-) tokens after the fact; balance may go negative"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def pause(self, seconds: float):
+        """Block all acquirers for seconds (e.g. server-provided retry hint)"""
+        self._paused_until = max(self._paused_until, self._timer() + seconds)
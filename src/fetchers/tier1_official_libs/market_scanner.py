@@ -15,6 +15,9 @@ from typing import Dict, Any, List, Optional, Tuple
 from pykrx import stock
 import logging
 
+from src.utils.async_cache import AsyncTTLCache
+from src.utils.sqlite_cache import get_l2_cache
+
 
 class MarketScanner:
     """
@@ -31,9 +34,10 @@ class MarketScanner:
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._cache: Dict[str, Any] = {}
-        self._cache_time: Optional[datetime] = None
-        self._cache_ttl = timedelta(minutes=5)  # 5분 캐시
+        # 5분 캐시 (시장별 TTL, 동시 요청은 1회 스캔 결과 공유)
+        self._cache: AsyncTTLCache[Dict[str, Any]] = AsyncTTLCache(
+            "market_scanner", ttl=timedelta(minutes=5), maxsize=16, l2=get_l2_cache()
+        )
 
     # Industry sectors to filter (skip broad market indices)
     INDUSTRY_SECTORS = [
@@ -241,14 +245,12 @@ class MarketScanner:
         Returns:
             Complete market context dictionary
         """
-        # Check cache
-        cache_key = f"market_context_{market}"
-        if self._cache_time and datetime.now() - self._cache_time < self._cache_ttl:
-            if cache_key in self._cache:
-                self.logger.debug(f"Returning cached market context for {market}")
-                return self._cache[cache_key]
-
-        # Fetch fresh data
+        return await self._cache.get_or_load(
+            f"market_context_{market}", lambda: self._scan_market_context(market)
+        )
+
+    async def _scan_market_context(self, market: str) -> Dict[str, Any]:
+        """Fetch fresh market context (cache miss)."""
         heatmap, breadth = await asyncio.gather(
             self.get_sector_heatmap(market),
             self.get_market_breadth(market)
@@ -268,16 +270,11 @@ class MarketScanner:
             }
         }
 
-        # Update cache
-        self._cache[cache_key] = context
-        self._cache_time = datetime.now()
-
         return context
 
     def clear_cache(self):
         """Clear the internal cache."""
         self._cache.clear()
-        self._cache_time = None
 
 
 # Singleton instance for easy access
@@ -0,0 +1,278 @@
+"""
+Gemini Batcher
+Packs concurrent per-ticker analysis requests into one structured Gemini call.
+
+Callers submit (ticker, item text) and await their own result. Requests that
+arrive within a short window are packed into a single prompt, up to max_batch
+items and the prompt/output token budget, and the model is asked for one JSON
+object keyed by ticker:
+
+    {"005930": {"score": 1.0, "summary": "..."}, "000660": {...}}
+
+The response is validated per ticker against the task's field types and split
+back to the awaiting callers. Tickers missing or invalid in the response are
+retried once as a smaller batch, then as single-ticker requests, and finally
+resolve to None. If the call itself fails (no response or an exception), every
+ticker in the batch resolves to None at once without retries. Per-item results are stored in the Gemini response cache, so
+a ticker analyzed in any batch is reused regardless of batch composition.
+
+Usage:
+    task = BatchTask(
+        name="news_sentiment",
+        instructions="각 종목의 뉴스 헤드라인을 분석하세요.",
+        fields={'score': ('number', '-2.0 ~ +2.0'), 'summary': ('string', '50자 이내')},
+    )
+    batcher = GeminiBatcher(GeminiClient(), task, cache_ttl=timedelta(hours=24))
+    result = await batcher.submit('005930', headlines_text)   # dict or None
+"""
+import asyncio
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.gemini.cache import CachedResponse
+from src.gemini.client import GeminiClient, estimate_tokens
+
+# JSON 필드 타입 → 허용 Python 타입
+_FIELD_TYPES: Dict[str, Tuple[type, ...]] = {
+    'number': (int, float),
+    'integer': (int,),
+    'string': (str,),
+    'array': (list,),
+    'boolean': (bool,),
+}
+
+
+@dataclass
+class BatchTask:
+    """Batched analysis definition"""
+    name: str
+    instructions: str                                  # 공통 지시문 (프롬프트 머리말)
+    fields: Dict[str, Tuple[str, str]]                 # 필드명 → (JSON 타입, 설명)
+    output_tokens_per_item: int = 200                  # 종목당 응답 토큰 추정치
+    item_label: str = "종목"
+
+    def schema_text(self) -> str:
+        return ", ".join(
+            f'"{name}": <{kind}: {description}>' for name, (kind, description) in self.fields.items()
+        )
+
+    def validate(self, value: Any) -> bool:
+        if not isinstance(value, dict):
+            return False
+        for name, (kind, _) in self.fields.items():
+            item = value.get(name)
+            if isinstance(item, bool) and kind != 'boolean':
+                return False
+            if not isinstance(item, _FIELD_TYPES.get(kind, (object,))):
+                return False
+        return True
+
+
+@dataclass
+class _Pending:
+    key: str
+    item: str
+    future: asyncio.Future
+    tokens: int = 0
+
+
+class GeminiBatcher:
+    """Collects per-ticker requests over a short window and sends them as one call"""
+
+    def __init__(
+        self,
+        client: GeminiClient,
+        task: BatchTask,
+        max_batch: int = 5,
+        window: float = 0.2,
+        max_prompt_tokens: int = 30_000,
+        max_output_tokens: int = 8_192,
+        cache_ttl: Optional[Union[float, timedelta]] = None
+    ):
+        """
+        Args:
+            client: GeminiClient (RPM/TPM 예산은 모델 단위로 공유)
+            task: 배치 작업 정의 (지시문 + JSON 필드)
+            max_batch: 배치당 최대 종목 수
+            window: 첫 요청 후 다른 요청을 모으는 시간 (초)
+            max_prompt_tokens: 배치 프롬프트 토큰 상한 (추정치 기준)
+            max_output_tokens: 응답 토큰 상한 (종목당 추정치 × 종목 수로 배치 크기 제한)
+            cache_ttl: 종목별 결과 캐시 TTL (None이면 캐시 안 함)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.client = client
+        self.task = task
+        self.max_batch = max(1, min(max_batch, max_output_tokens // max(task.output_tokens_per_item, 1)))
+        self.window = window
+        self.max_prompt_tokens = max_prompt_tokens
+        self.max_output_tokens = max_output_tokens
+        self.cache_ttl = cache_ttl
+        self.stats: Dict[str, int] = {
+            'submitted': 0, 'cached': 0, 'batches': 0, 'batched_items': 0,
+            'retried_items': 0, 'single_fallbacks': 0, 'failed': 0,
+        }
+        self._pending: List[_Pending] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    # ------------------------------------------------------------------
+    # Submit
+    # ------------------------------------------------------------------
+
+    def _cache_key(self, key: str, item: str) -> Optional[str]:
+        cache = self.client.cache
+        if self.cache_ttl is None or cache is None:
+            return None
+        return cache.key(self.client.model_name, f"{self.task.instructions}\n{key}\n{item}",
+                         {'batch_task': self.task.name, 'fields': self.task.fields})
+
+    async def submit(self, key: str, item: str) -> Optional[Dict[str, Any]]:
+        """
+        Queue one ticker and wait for its parsed result
+
+        Returns:
+            Validated field dict, None if the model is disabled or every attempt failed
+        """
+        if not self.client.model:
+            return None
+        self.stats['submitted'] += 1
+
+        cache_key = self._cache_key(key, item)
+        if cache_key is not None:
+            cached = await asyncio.to_thread(self.client.cache.get, cache_key)
+            if cached is not None:
+                self.stats['cached'] += 1
+                return json.loads(cached.text)
+
+        # 같은 종목/입력이 이미 대기 중이면 결과 공유
+        for pending in self._pending:
+            if pending.key == key and pending.item == item:
+                return await asyncio.shield(pending.future)
+
+        loop = asyncio.get_running_loop()
+        pending = _Pending(key, item, loop.create_future(), estimate_tokens(item) + estimate_tokens(key) + 8)
+        self._pending.append(pending)
+
+        if self._is_full():
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await asyncio.shield(pending.future)
+
+    def _is_full(self) -> bool:
+        tokens = estimate_tokens(self.task.instructions) + sum(p.tokens for p in self._pending)
+        return len(self._pending) >= self.max_batch or tokens >= self.max_prompt_tokens
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch, attempt=0))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def build_prompt(self, batch: List[_Pending]) -> str:
+        keys = [p.key for p in batch]
+        sections = "\n\n".join(f"### {p.key}\n{p.item}" for p in batch)
+        example = ", ".join(f'"{k}": {{{self.task.schema_text()}}}' for k in keys[:2])
+        return f"""{self.task.instructions}
+
+아래 {len(batch)}개 {self.task.item_label}을(를) 각각 독립적으로 분석하세요.
+
+{sections}
+
+반드시 JSON 객체 하나만 출력하세요. 키는 {self.task.item_label} 코드({', '.join(keys)})이며 모두 포함해야 합니다.
+형식: {{{example}{', ...' if len(keys) > 2 else ''}}}
+"""
+
+    @staticmethod
+    def parse(text: str) -> Dict[str, Any]:
+        """JSON 객체 추출 (```json 코드 블록 허용), 실패 시 빈 dict"""
+        text = text.strip()
+        fenced = re.search(r'```(?:json)?\s*(.*?)```', text, re.DOTALL)
+        if fenced:
+            text = fenced.group(1)
+        start, end = text.find('{'), text.rfind('}')
+        if start < 0 or end <= start:
+            return {}
+        try:
+            data = json.loads(text[start:end + 1])
+        except json.JSONDecodeError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    async def _call(self, batch: List[_Pending]) -> Optional[Dict[str, Any]]:
+        self.stats['batches'] += 1
+        self.stats['batched_items'] += len(batch)
+        text = await self.client.generate_content(
+            self.build_prompt(batch),
+            generation_config={
+                'response_mime_type': 'application/json',
+                'max_output_tokens': min(
+                    self.max_output_tokens, self.task.output_tokens_per_item * len(batch) * 2
+                ),
+            },
+        )
+        return None if text is None else self.parse(text)
+
+    async def _run(self, batch: List[_Pending], attempt: int):
+        try:
+            data = await self._call(batch)
+        except Exception as e:
+            self.logger.error(f"Gemini batch {self.task.name} failed: {e}")
+            data = None
+
+        if data is None:
+            # 호출 자체 실패 (예산 초과/API 오류): 쪼개서 재시도해도 같은 결과이므로 즉시 None
+            self._fail(batch)
+            return
+
+        failed = []
+        for pending in batch:
+            value = data.get(pending.key)
+            if self.task.validate(value):
+                await self._resolve(pending, value)
+            else:
+                failed.append(pending)
+
+        if not failed:
+            return
+        if len(failed) > 1 and attempt == 0:
+            # 일부/전체 파싱 실패: 실패 종목만 배치로 1회 재시도
+            self.stats['retried_items'] += len(failed)
+            await self._run(failed, attempt=1)
+        elif attempt < 2:
+            # 재시도도 실패: 단건 요청으로 폴백
+            self.stats['single_fallbacks'] += len(failed)
+            await asyncio.gather(*[self._run([p], attempt=2) for p in failed])
+        else:
+            self.logger.warning(f"Gemini batch {self.task.name}: no valid result for {failed[0].key}")
+            self._fail(failed)
+
+    def _fail(self, batch: List[_Pending]):
+        self.stats['failed'] += len(batch)
+        for pending in batch:
+            if not pending.future.done():
+                pending.future.set_result(None)
+
+    async def _resolve(self, pending: _Pending, value: Dict[str, Any]):
+        value = {name: value[name] for name in self.task.fields}
+        if not pending.future.done():
+            pending.future.set_result(value)
+        cache_key = self._cache_key(pending.key, pending.item)
+        if cache_key is not None:
+            await asyncio.to_thread(
+                self.client.cache.set, cache_key,
+                CachedResponse(json.dumps(value, ensure_ascii=False)), self.cache_ttl
+            )
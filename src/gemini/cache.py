@@ -0,0 +1,129 @@
+"""
+Gemini Response Cache
+Content-addressed persistent cache for Gemini responses.
+
+Key = sha256(model, normalized prompt, generation parameters), so the same
+prompt from any caller/process reuses one stored response. Entries live in a
+dedicated SQLiteCache file (size-bounded, oldest entries evicted first) and
+each caller picks its own TTL:
+
+    text = await client.generate_content(prompt, cache_ttl=timedelta(hours=24))
+
+Hit rate and the tokens saved by hits are reported via info() / get_gemini_metrics().
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, asdict
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from src.utils.sqlite_cache import SQLiteCache
+
+TTL = Union[float, timedelta]
+
+
+@dataclass
+class CachedResponse:
+    """Stored response text + token usage of the original call"""
+    text: str
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    saved_prompt_tokens: int = 0
+    saved_output_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class GeminiResponseCache:
+    """Namespaced SQLiteCache wrapper keyed by prompt content"""
+
+    NAMESPACE = "gemini"
+    DEFAULT_PATH = SQLiteCache.DEFAULT_PATH.parent / "gemini_responses.sqlite3"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_bytes: int = 64 * 1024 * 1024):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.store = SQLiteCache(path or self.DEFAULT_PATH, max_bytes=max_bytes)
+        self.stats = ResponseCacheStats()
+
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        """공백/들여쓰기 차이는 같은 프롬프트로 취급"""
+        return re.sub(r'\s+', ' ', prompt).strip()
+
+    @classmethod
+    def key(cls, model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+        payload = json.dumps(
+            [model, cls.normalize(prompt), params or {}],
+            sort_keys=True, ensure_ascii=False, default=repr
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Cached response (None on miss or disk error)"""
+        try:
+            found, value, _ = self.store.get(self.NAMESPACE, key)
+        except Exception as e:
+            self.logger.warning(f"Gemini cache read failed: {e}")
+            found, value = False, None
+        if not found:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self.stats.saved_prompt_tokens += value.prompt_tokens
+        self.stats.saved_output_tokens += value.output_tokens
+        return value
+
+    def set(self, key: str, response: CachedResponse, ttl: TTL):
+        seconds = ttl.total_seconds() if isinstance(ttl, timedelta) else float(ttl)
+        try:
+            self.store.set(self.NAMESPACE, key, response, seconds)
+            self.stats.stores += 1
+        except Exception as e:
+            self.logger.warning(f"Gemini cache write failed: {e}")
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            **asdict(self.stats),
+            'hit_rate': round(self.stats.hit_rate, 4),
+            'bytes': self.store.info()['bytes'],
+            'max_bytes': self.store.max_bytes,
+        }
+
+
+# Singleton instance
+_cache_instance: Optional[GeminiResponseCache] = None
+_cache_failed = False
+
+
+def get_gemini_cache() -> Optional[GeminiResponseCache]:
+    """
+    Get singleton GeminiResponseCache instance
+
+    AEGIS_GEMINI_CACHE=0 이면 비활성화, AEGIS_GEMINI_CACHE_PATH로 경로 지정.
+    """
+    global _cache_instance, _cache_failed
+    if _cache_instance is None and not _cache_failed:
+        if os.getenv("AEGIS_GEMINI_CACHE", "1") == "0":
+            _cache_failed = True
+            return None
+        try:
+            _cache_instance = GeminiResponseCache(os.getenv("AEGIS_GEMINI_CACHE_PATH") or None)
+        except (sqlite3.Error, OSError) as e:
+            logging.getLogger("GeminiResponseCache").warning(f"Gemini response cache disabled: {e}")
+            _cache_failed = True
+    return _cache_instance
@@ -1,42 +1,302 @@
 """
 Gemini AI Client
 Handles interaction with Google's Gemini API for text generation and analysis.
+
+Calls run on a dedicated thread pool so the event loop keeps serving other
+fetchers/analyzers while a request is in flight. All clients of the same model
+share one budget per process:
+- requests-per-minute and tokens-per-minute token buckets (settings.GEMINI_RPM / GEMINI_TPM)
+- bounded concurrency (settings.GEMINI_MAX_CONCURRENCY)
+- 429/503 retried with jittered exponential backoff, honouring server retry hints
+- per-call latency / token counts (client.last_call, get_gemini_metrics())
+- optional content-addressed response cache per call (cache_ttl, src/gemini/cache.py)
 """
+import asyncio
 import logging
+import random
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
+from typing import Optional, List, Dict, Any, Union
+
 import google.generativeai as genai
-from typing import Optional, List, Dict, Any
 from src.config.settings import settings
+from src.core.rate_limiter import TokenBucket
+from src.gemini.cache import CachedResponse, get_gemini_cache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL = 'gemini-2.0-flash'
+
+
+@dataclass
+class GeminiCallStats:
+    """Single generate_content call"""
+    model: str
+    status: str                 # ok / cached / error / rate_limited
+    latency_ms: float           # 마지막 시도의 API 왕복 시간
+    waited_ms: float            # RPM/TPM 예산 + 재시도 대기 시간
+    attempts: int
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.output_tokens
+
+
+def estimate_tokens(text: str) -> int:
+    """Conservative pre-call token estimate (한국어는 1~2자당 1토큰)"""
+    return max(1, len(text) // 2)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """429 ResourceExhausted / 503 ServiceUnavailable"""
+    code = getattr(error, 'code', None)
+    code = getattr(code, 'value', code)   # grpc StatusCode → (int, str)
+    if isinstance(code, tuple):
+        code = code[0]
+    if code in (429, 503, 8, 14):         # HTTP or gRPC RESOURCE_EXHAUSTED / UNAVAILABLE
+        return True
+    name = type(error).__name__
+    return name in ('ResourceExhausted', 'ServiceUnavailable', 'TooManyRequests') or '429' in str(error)
+
+
+def _retry_hint(error: Exception) -> Optional[float]:
+    """Server-provided retry delay in seconds ("retry in 23.5s", RetryInfo retry_delay)"""
+    match = re.search(r'retry in ([\d.]+)\s*s', str(error), re.IGNORECASE) or \
+        re.search(r'retry_delay\s*\{\s*seconds:\s*(\d+)', str(error))
+    return float(match.group(1)) if match else None
+
+
+class GeminiBudget:
+    """Per-model shared budget: RPM/TPM buckets, concurrency slots, executor, metrics"""
+
+    OUTPUT_TOKEN_ESTIMATE = 512   # 응답 토큰 사전 예약량 (호출 후 실제 사용량으로 정산)
+    RECENT_CALLS = 200
+
+    def __init__(self, model_name: str, rpm: int, tpm: int, max_concurrency: int):
+        self.model_name = model_name
+        self.max_concurrency = max_concurrency
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="gemini")
+        self.recent: deque = deque(maxlen=self.RECENT_CALLS)
+        self.totals: Dict[str, float] = {
+            'calls': 0, 'cached': 0, 'errors': 0, 'retries': 0, 'rate_limited': 0,
+            'prompt_tokens': 0, 'output_tokens': 0, 'latency_ms': 0.0, 'waited_ms': 0.0,
+        }
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots, self._loop = asyncio.Semaphore(self.max_concurrency), loop
+        return self._slots
+
+    async def reserve(self, estimated_tokens: int) -> float:
+        """Take one request + estimated tokens from the buckets (returns seconds waited)"""
+        waited = await self.requests.acquire()
+        return waited + await self.tokens.acquire(estimated_tokens)
+
+    def record(self, stats: GeminiCallStats):
+        totals = self.totals
+        if stats.status == 'cached':
+            # 응답 캐시 hit: API 호출/토큰 사용 없음
+            totals['cached'] += 1
+            return
+        self.recent.append(stats)
+        totals['calls'] += 1
+        totals['errors'] += stats.status != 'ok'
+        totals['rate_limited'] += stats.status == 'rate_limited'
+        totals['retries'] += stats.attempts - 1
+        totals['prompt_tokens'] += stats.prompt_tokens
+        totals['output_tokens'] += stats.output_tokens
+        totals['latency_ms'] += stats.latency_ms
+        totals['waited_ms'] += stats.waited_ms
+
+    def info(self) -> Dict[str, Any]:
+        latencies = sorted(s.latency_ms for s in self.recent if s.status == 'ok')
+        calls = max(self.totals['calls'], 1)
+        return {
+            'model': self.model_name,
+            **self.totals,
+            'avg_latency_ms': round(self.totals['latency_ms'] / calls, 1),
+            'p95_latency_ms': latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+            'rpm_available': round(self.requests.tokens, 1),
+            'tpm_available': round(self.tokens.tokens),
+        }
+
+
+_budgets: Dict[str, GeminiBudget] = {}
+
+
+def get_gemini_budget(model_name: str = DEFAULT_MODEL) -> GeminiBudget:
+    """Get the process-wide budget for a model (created from settings on first use)"""
+    if model_name not in _budgets:
+        _budgets[model_name] = GeminiBudget(
+            model_name,
+            rpm=settings.GEMINI_RPM,
+            tpm=settings.GEMINI_TPM,
+            max_concurrency=settings.GEMINI_MAX_CONCURRENCY,
+        )
+    return _budgets[model_name]
+
+
+def get_gemini_metrics() -> Dict[str, Dict[str, Any]]:
+    """Call counters / latency / token usage per model (+ 'response_cache' hit rate / saved tokens)"""
+    metrics = {name: budget.info() for name, budget in _budgets.items()}
+    cache = get_gemini_cache()
+    if cache is not None:
+        metrics['response_cache'] = cache.info()
+    return metrics
+
+
 class GeminiClient:
     """Client for interacting with Google Gemini API"""
 
-    def __init__(self):
-        if not settings.GEMINI_API_KEY:
+    MAX_ATTEMPTS = 5
+    ANALYSIS_CACHE_TTL = timedelta(hours=6)   # analyze_stock: 같은 입력 데이터면 장중 재사용
+    BACKOFF_BASE = 1.0      # 초, 재시도마다 2배 (full jitter)
+    BACKOFF_MAX = 60.0
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, api_key: Optional[str] = None):
+        self.model_name = model_name
+        self.budget = get_gemini_budget(model_name)
+        self.last_call: Optional[GeminiCallStats] = None
+        self.cache = get_gemini_cache()
+
+        api_key = api_key or settings.GEMINI_API_KEY
+        if not api_key:
             logger.warning("GEMINI_API_KEY is not set. AI features will be disabled.")
             self.model = None
         else:
             try:
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self.model = genai.GenerativeModel('gemini-2.0-flash')
-                logger.info("Gemini AI client initialized (gemini-2.0-flash)")
+                genai.configure(api_key=api_key)
+                self.model = genai.GenerativeModel(model_name)
+                logger.info(f"Gemini AI client initialized ({model_name})")
             except Exception as e:
                 logger.error(f"Failed to initialize Gemini AI client: {e}")
                 self.model = None
 
-    async def generate_content(self, prompt: str) -> Optional[str]:
-        """Generate content from a text prompt"""
+    def _backoff(self, attempt: int, hint: Optional[float]) -> float:
+        if hint is not None:
+            return hint + random.uniform(0, self.BACKOFF_BASE)
+        return random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt))
+
+    async def generate_content(
+        self,
+        prompt: str,
+        cache_ttl: Optional[Union[float, timedelta]] = None,
+        **kwargs
+    ) -> Optional[str]:
+        """
+        Generate content from a text prompt (non-blocking)
+
+        Args:
+            prompt: Prompt text
+            cache_ttl: Reuse a stored response for the same (model, prompt, kwargs)
+                within this TTL; None disables caching for the call
+            **kwargs: Passed to GenerativeModel.generate_content (generation_config 등)
+
+        Returns:
+            Response text, None if disabled or the call failed
+        """
         if not self.model:
             return None
 
-        try:
-            # Gemini API call (synchronous, but fast enough for now, or wrap in executor if needed)
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            logger.error(f"Gemini generation failed: {e}")
-            return None
+        cache_key = None
+        if cache_ttl is not None and self.cache is not None:
+            cache_key = self.cache.key(self.model_name, prompt, kwargs)
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                self._record('cached', 0.0, 0.0, 0, cached.prompt_tokens, cached.output_tokens)
+                return cached.text
+
+        budget = self.budget
+        config = kwargs.get('generation_config') or {}
+        max_output = config.get('max_output_tokens') if isinstance(config, dict) else None
+        estimate = estimate_tokens(prompt) + (max_output or budget.OUTPUT_TOKEN_ESTIMATE)
+        loop = asyncio.get_running_loop()
+        waited = 0.0
+        latency = 0.0
+        status = 'error'
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            delay = None
+            async with budget.slots():
+                waited += await budget.reserve(estimate)
+                started = time.monotonic()
+                try:
+                    response = await loop.run_in_executor(
+                        budget.executor, partial(self.model.generate_content, prompt, **kwargs)
+                    )
+                    text = response.text
+                except Exception as e:
+                    latency = (time.monotonic() - started) * 1000
+                    # 거부된 요청은 토큰을 쓰지 않음
+                    budget.tokens.adjust(estimate)
+                    if not _is_retryable(e):
+                        logger.error(f"Gemini generation failed: {e}")
+                        status = 'error'
+                        break
+                    status = 'rate_limited'
+                    if attempt == self.MAX_ATTEMPTS:
+                        logger.error(f"Gemini rate limited after {attempt} attempts: {e}")
+                        break
+                    hint = _retry_hint(e)
+                    if hint is not None:
+                        # 같은 모델의 다른 호출도 서버가 지정한 시간 동안 대기
+                        budget.requests.pause(hint)
+                    delay = self._backoff(attempt, hint)
+                    logger.warning(
+                        f"Gemini rate limited (attempt {attempt}/{self.MAX_ATTEMPTS}), "
+                        f"retrying in {delay:.1f}s"
+                    )
+                else:
+                    latency = (time.monotonic() - started) * 1000
+                    usage = getattr(response, 'usage_metadata', None)
+                    prompt_tokens = int(getattr(usage, 'prompt_token_count', 0) or 0)
+                    output_tokens = int(getattr(usage, 'candidates_token_count', 0) or 0)
+                    if prompt_tokens or output_tokens:
+                        budget.tokens.adjust(estimate - prompt_tokens - output_tokens)
+                    self._record('ok', latency, waited, attempt, prompt_tokens, output_tokens)
+                    if cache_key is not None and text:
+                        await asyncio.to_thread(
+                            self.cache.set, cache_key,
+                            CachedResponse(text, prompt_tokens, output_tokens), cache_ttl
+                        )
+                    return text
+
+            waited += delay
+            await asyncio.sleep(delay)
+
+        self._record(status, latency, waited, attempt)
+        return None
+
+    def _record(self, status: str, latency_ms: float, waited: float, attempts: int,
+                prompt_tokens: int = 0, output_tokens: int = 0):
+        stats = GeminiCallStats(
+            model=self.model_name,
+            status=status,
+            latency_ms=round(latency_ms, 1),
+            waited_ms=round(waited * 1000, 1),
+            attempts=attempts,
+            prompt_tokens=prompt_tokens,
+            output_tokens=output_tokens,
+        )
+        self.last_call = stats
+        self.budget.record(stats)
+        logger.debug(
+            f"Gemini call {status}: {stats.latency_ms:.0f}ms "
+            f"(waited {stats.waited_ms:.0f}ms, attempts {attempts}, "
+            f"tokens {prompt_tokens}+{output_tokens})"
+        )
 
     async def analyze_stock(self, stock_name: str, news_data: List[Dict[str, Any]], realtime_data: Dict[str, Any], history_data: List[Dict[str, Any]] = None) -> Dict[str, str]:
         """
@@ -153,7 +413,7 @@ class GeminiClient:
         ---
         """
 
-        response_text = await self.generate_content(prompt)
+        response_text = await self.generate_content(prompt, cache_ttl=self.ANALYSIS_CACHE_TTL)
         
         if not response_text:
              return {
@@ -0,0 +1,267 @@
+"""
+Async TTL/LRU Cache
+분석기/스캐너 공용 비동기 캐시
+
+- LRU 용량 제한 (maxsize 초과 시 가장 오래 안 쓴 항목 제거)
+- 키별 TTL (기본 TTL + 호출별 override)
+- single-flight: 같은 키의 동시 miss는 로더 1회 실행 결과를 공유
+- negative caching: 로더 실패 시 예외를 negative_ttl 동안 캐시 (재조회 폭주 방지)
+- hit / miss / eviction 등 카운터 (get_cache_stats()로 전체 조회)
+- 선택적 L2 (SQLiteCache): L1 miss 시 디스크 조회, 로드 결과는 디스크에도 저장
+
+Usage:
+    self._cache = AsyncTTLCache("supply", ttl=timedelta(minutes=10), maxsize=512)
+
+    result = await self._cache.get_or_load(
+        f"{ticker}_{days}", lambda: self._analyze_uncached(ticker, days)
+    )
+"""
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar, Union
+
+if TYPE_CHECKING:
+    from src.utils.sqlite_cache import SQLiteCache
+
+V = TypeVar("V")
+TTL = Union[float, timedelta]
+
+
+def _seconds(ttl: TTL) -> float:
+    return ttl.total_seconds() if isinstance(ttl, timedelta) else float(ttl)
+
+
+@dataclass
+class CacheStats:
+    """캐시 카운터"""
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0      # 캐시된 실패(예외) 반환
+    coalesced: int = 0          # 진행 중인 로드에 합류한 miss
+    evictions: int = 0          # LRU 용량 초과로 제거
+    expirations: int = 0        # TTL 만료로 제거
+    load_errors: int = 0
+    l2_hits: int = 0
+    l2_misses: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class _Entry:
+    __slots__ = ("expires_at", "value", "error")
+
+    def __init__(self, expires_at: float, value: Any = None, error: Optional[BaseException] = None):
+        self.expires_at = expires_at
+        self.value = value
+        self.error = error
+
+
+class AsyncTTLCache(Generic[V]):
+    """
+    Bounded async TTL/LRU cache with single-flight loading
+
+    로더는 별도 Task로 실행되므로 대기 중인 호출자 하나가 취소(타임아웃)되어도
+    로드는 계속 진행되어 캐시를 채우고, 나머지 대기자에게 결과가 전달됩니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: TTL,
+        maxsize: int = 1024,
+        negative_ttl: Optional[TTL] = 30.0,
+        timer: Callable[[], float] = time.monotonic,
+        l2: Optional["SQLiteCache"] = None,
+        l2_ttl: Optional[TTL] = None,
+        persist: Optional[Callable[[V], bool]] = None
+    ):
+        """
+        Args:
+            name: 캐시 이름 (통계 조회용)
+            ttl: 기본 TTL (초 또는 timedelta)
+            maxsize: 최대 항목 수
+            negative_ttl: 실패 캐시 TTL (None이면 실패는 캐시하지 않음)
+            timer: 단조 시계 (테스트용 교체 가능)
+            l2: 프로세스 간 공유 디스크 캐시 (name을 네임스페이스로 사용)
+            l2_ttl: L2 보관 기간 (기본: ttl)
+            persist: 값을 L2에 저장할지 판단 (False면 L1만, 예: 데이터 없음 대체값)
+        """
+        self.name = name
+        self.ttl = _seconds(ttl)
+        self.maxsize = maxsize
+        self.negative_ttl = _seconds(negative_ttl) if negative_ttl is not None else None
+        self._timer = timer
+        self.l2 = l2
+        self.l2_ttl = _seconds(l2_ttl) if l2_ttl is not None else None
+        self.persist = persist
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.stats = CacheStats()
+        _registry.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key) is not None
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._timer():
+            del self._entries[key]
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Hashable, entry: _Entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """캐시된 값 조회 (만료/실패 항목이면 default)"""
+        entry = self._lookup(key)
+        if entry is None or entry.error is not None:
+            return default
+        return entry.value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[TTL] = None):
+        """값 저장 (ttl 미지정 시 기본 TTL)"""
+        seconds = self.ttl if ttl is None else _seconds(ttl)
+        self._store(key, _Entry(self._timer() + seconds, value))
+
+    def invalidate(self, key: Hashable):
+        """키 제거 (진행 중인 로드는 유지, L2 포함)"""
+        self._entries.pop(key, None)
+        if self.l2 is not None:
+            self._l2_call(self.l2.delete, self.name, str(key))
+
+    def clear(self):
+        """전체 초기화 (카운터 유지, L2 네임스페이스 포함)"""
+        self._entries.clear()
+        if self.l2 is not None:
+            self._l2_call(self.l2.clear, self.name)
+
+    def purge_expired(self) -> int:
+        """만료 항목 일괄 제거"""
+        now = self._timer()
+        expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self.stats.expirations += len(expired)
+        return len(expired)
+
+    # ------------------------------------------------------------------
+    # Single-flight loading
+    # ------------------------------------------------------------------
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[V]],
+        ttl: Optional[TTL] = None
+    ) -> V:
+        """
+        캐시 조회, miss면 loader 실행 후 저장
+
+        같은 키로 진행 중인 로드가 있으면 새로 실행하지 않고 그 결과를 기다립니다.
+        loader 예외는 negative_ttl 동안 캐시되어 같은 예외로 재발생합니다.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            if entry.error is not None:
+                self.stats.negative_hits += 1
+                # 같은 예외 객체를 반복 raise하면 traceback이 계속 이어붙으므로 매번 비움
+                raise entry.error.with_traceback(None)
+            self.stats.hits += 1
+            return entry.value
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            future = asyncio.ensure_future(self._load(key, loader, ttl))
+            future.add_done_callback(_consume_exception)
+            self._inflight[key] = future
+        return await asyncio.shield(future)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[V]], ttl: Optional[TTL]) -> V:
+        seconds = self.ttl if ttl is None else _seconds(ttl)
+        try:
+            if self.l2 is not None:
+                found, value, expires_at = await asyncio.to_thread(
+                    self._l2_call, self.l2.get, self.name, str(key), default=(False, None, 0.0)
+                )
+                if found:
+                    self.stats.l2_hits += 1
+                    self.set(key, value, min(seconds, expires_at - time.time()))
+                    return value
+                self.stats.l2_misses += 1
+
+            value = await loader()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats.load_errors += 1
+            if self.negative_ttl:
+                self._store(key, _Entry(self._timer() + self.negative_ttl, error=e))
+            raise
+        else:
+            self.set(key, value, seconds)
+            if self.l2 is not None and (self.persist is None or self.persist(value)):
+                await asyncio.to_thread(
+                    self._l2_call, self.l2.set, self.name, str(key), value,
+                    self.l2_ttl if self.l2_ttl is not None else seconds
+                )
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _l2_call(self, method: Callable[..., Any], *args, default: Any = None) -> Any:
+        # 디스크 오류는 캐시 miss로 취급 (L1/로더 동작에는 영향 없음)
+        try:
+            return method(*args)
+        except Exception as e:
+            self.logger.warning(f"L2 cache error ({self.name}): {e}")
+            return default
+
+    def info(self) -> Dict[str, Any]:
+        """크기 + 카운터"""
+        return {
+            'name': self.name,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'inflight': len(self._inflight),
+            **self.stats.to_dict(),
+        }
+
+
+def _consume_exception(future: asyncio.Future):
+    # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고 방지
+    if not future.cancelled():
+        future.exception()
+
+
+_registry: "weakref.WeakSet[AsyncTTLCache]" = weakref.WeakSet()
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """살아있는 모든 AsyncTTLCache의 크기/카운터"""
+    return {cache.name: cache.info() for cache in list(_registry)}
@@ -0,0 +1,184 @@
+"""
+Aho-Corasick 키워드 매처
+뉴스/공시 키워드 테이블 전체를 하나의 오토마톤으로 컴파일해 텍스트당 1회 스캔으로 모든 매칭 반환
+
+- 키워드 수와 무관하게 텍스트 길이에 비례하는 비용 (키워드 추가가 채점 속도에 영향 없음)
+- 겹치는 매칭 모두 반환 ('상장폐지' + '상장폐지결정', '감소' + '자본감소')
+- 매칭마다 (키워드, 카테고리, 가중치, 테이블 순서) 포함 → 호출부가 우선순위/합산 결정
+- pyahocorasick(C 확장)이 설치되어 있으면 사용, 없으면 순수 Python DFA
+
+Usage:
+    matcher = KeywordMatcher.from_tables({
+        'positive': {2.0: ['공급계약'], 1.0: ['배당결정']},
+        'halt': ['횡령', '배임'],
+    }, normalize=compact_lower)
+    matcher.find_all("단일판매ㆍ공급계약체결")     # [KeywordMatch('공급계약', 'positive', 2.0, ...)]
+    matcher.scores(headlines)                      # np.ndarray, 텍스트별 가중치 합
+"""
+from collections import deque
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+Table = Union[Dict[float, List[str]], Sequence[str]]
+Normalizer = Callable[[str], str]
+
+
+def compact_lower(text: str) -> str:
+    """공백 제거 + 소문자 (공시 제목 비교 방식)"""
+    return text.replace(' ', '').lower()
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str          # 테이블에 등록된 원래 키워드
+    category: str
+    weight: float
+    order: int            # 등록 순서 (테이블 순회 순서, 우선순위 비교용)
+    end: int              # 정규화 텍스트에서 매칭 끝 위치 (포함)
+
+
+class KeywordMatcher:
+    """
+    다중 키워드 Aho-Corasick 매처
+
+    Args:
+        entries: (키워드, 카테고리, 가중치) 목록 - 같은 키워드를 여러 카테고리/여러 번 등록 가능
+        normalize: 키워드와 텍스트에 똑같이 적용할 정규화 (None이면 원문 그대로)
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, float]], normalize: Optional[Normalizer] = None):
+        self.normalize = normalize
+        self._outputs: Dict[str, List[KeywordMatch]] = {}   # 정규화 키워드 → 매칭 템플릿
+        for order, (keyword, category, weight) in enumerate(entries):
+            key = normalize(keyword) if normalize else keyword
+            if key:
+                self._outputs.setdefault(key, []).append(
+                    KeywordMatch(keyword, category, float(weight), order, -1)
+                )
+        self.size = sum(len(v) for v in self._outputs.values())
+        self._automaton = self._build_c() if ahocorasick is not None else None
+        if self._automaton is None:
+            self._build_dfa()
+
+    @classmethod
+    def from_tables(cls, tables: Dict[str, Table], normalize: Optional[Normalizer] = None) -> "KeywordMatcher":
+        """
+        카테고리별 키워드 테이블로 생성
+
+        Args:
+            tables: 카테고리 → {가중치: [키워드]} 또는 [키워드] (가중치 1.0)
+        """
+        entries = []
+        for category, table in tables.items():
+            if isinstance(table, dict):
+                entries.extend((kw, category, weight) for weight, keywords in table.items() for kw in keywords)
+            else:
+                entries.extend((kw, category, 1.0) for kw in table)
+        return cls(entries, normalize)
+
+    def __len__(self) -> int:
+        return self.size
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    def _build_c(self):
+        automaton = ahocorasick.Automaton()
+        for key, templates in self._outputs.items():
+            automaton.add_word(key, tuple(templates))
+        automaton.make_automaton()
+        return automaton
+
+    def _build_dfa(self):
+        """
+        순수 Python 오토마톤: 실패 링크를 미리 펼친 DFA
+        (상태별 전이 dict에 실패 상태의 전이를 병합 → 문자당 dict 조회 1회)
+        """
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[KeywordMatch, ...]] = [()]
+        for key, templates in self._outputs.items():
+            state = 0
+            for ch in key:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append(())
+                state = nxt
+            outputs[state] = outputs[state] + tuple(templates)
+
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # BFS 순서라 실패 상태의 delta/outputs는 이미 완성됨
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                queue.append(nxt)
+
+        self._delta = delta
+        self._dfa_outputs = outputs
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def _scan(self, text: str) -> List[Tuple[int, Tuple[KeywordMatch, ...]]]:
+        """(끝 위치, 매칭 템플릿들) 목록 - 텍스트 1회 스캔"""
+        if not text:
+            return []
+        if self.normalize:
+            text = self.normalize(text)
+        if self._automaton is not None:
+            return list(self._automaton.iter(text))
+
+        delta, outputs = self._delta, self._dfa_outputs
+        hits = []
+        state = 0
+        for end, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                hits.append((end, outputs[state]))
+        return hits
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """모든 매칭 (겹침 포함, 끝 위치 순)"""
+        return [m._replace(end=end) for end, templates in self._scan(text) for m in templates]
+
+    def find_many(self, texts: Iterable[str]) -> List[List[KeywordMatch]]:
+        return [self.find_all(text) for text in texts]
+
+    def unique(self, text: str, categories: Optional[Sequence[str]] = None) -> List[KeywordMatch]:
+        """
+        등록 항목별 1회 (텍스트에 여러 번 나와도 1건), 등록 순서 정렬
+
+        `keyword in text`를 테이블 순서대로 검사한 것과 같은 결과 (위치 정보 없음, end=-1).
+        """
+        seen = {}
+        for _, templates in self._scan(text):
+            for match in templates:
+                if categories is None or match.category in categories:
+                    seen.setdefault(match.order, match)
+        return [seen[order] for order in sorted(seen)]
+
+    def first(self, text: str, category: str) -> Optional[KeywordMatch]:
+        """카테고리에서 등록 순서가 가장 빠른 매칭"""
+        matches = self.unique(text, (category,))
+        return matches[0] if matches else None
+
+    def scores(self, texts: Sequence[str], categories: Optional[Sequence[str]] = None) -> np.ndarray:
+        """텍스트별 가중치 합 (등록 항목별 1회) - 대량 헤드라인 일괄 채점"""
+        return np.fromiter(
+            (sum(m.weight for m in self.unique(text, categories)) for text in texts),
+            dtype=float, count=len(texts)
+        )
@@ -0,0 +1,152 @@
+"""
+MinHash-LSH 근사 중복 탐지
+제목/본문이 조금씩 다른 같은 기사(통신사 전재, 언론사별 제목 수정)를 찾기 위한 색인
+
+- 정규화: [속보]/(종합) 같은 머리표, 문장부호, 공백 제거
+- 서명: 문자 n-gram 집합의 MinHash (num_perm개 해시 최솟값, numpy 벡터 연산)
+- 색인: 서명을 bands × rows로 나눈 LSH 버킷 → 후보만 Jaccard 추정치로 검증
+  (bands=16, rows=4 이면 Jaccard 약 0.5 이상이 후보가 될 확률이 높음)
+
+Usage:
+    hasher = MinHasher()
+    index = MinHashLSH(threshold=0.6)
+    index.add("story-1", hasher.signature(title))
+    index.nearest(hasher.signature(other_title))   # ("story-1", 0.72) or None
+"""
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+import numpy as np
+
+_PRIME = np.uint64((1 << 31) - 1)
+
+# [속보], (종합), <인터뷰>, 【서울=뉴시스】 등 머리표/꼬리표
+_TAG_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)|<[^>]*>|【[^】]*】')
+_NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def normalize_text(text: str) -> str:
+    """머리표/괄호/문장부호 제거, 소문자, 공백 정리"""
+    text = _TAG_RE.sub(' ', text or '')
+    text = _NON_WORD_RE.sub(' ', text.lower())
+    return ' '.join(text.split())
+
+
+def shingles(text: str, n: int = 2) -> Set[str]:
+    """공백을 뺀 정규화 텍스트의 문자 n-gram 집합 (한국어 제목은 2-gram이 안정적)"""
+    compact = normalize_text(text).replace(' ', '')
+    if len(compact) <= n:
+        return {compact} if compact else set()
+    return {compact[i:i + n] for i in range(len(compact) - n + 1)}
+
+
+def jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """두 MinHash 서명의 Jaccard 유사도 추정치"""
+    return float(np.mean(a == b))
+
+
+class MinHasher:
+    """문자 n-gram MinHash 서명 생성기 (seed가 같으면 프로세스 간 동일 서명)"""
+
+    def __init__(self, num_perm: int = 64, ngram: int = 2, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.ngram = ngram
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """uint32 서명 (num_perm,), 빈 텍스트는 최댓값으로 채운 서명"""
+        tokens = shingles(text, self.ngram)
+        if not tokens:
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(t.encode('utf-8'), digest_size=4).digest(), 'big')
+             for t in tokens),
+            dtype=np.uint64, count=len(tokens)
+        )
+        # (a * x + b) mod p - 31비트 값끼리 곱이라 uint64에서 넘치지 않음
+        permuted = (np.outer(self._a, hashes % _PRIME) + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+class MinHashLSH:
+    """
+    MinHash 서명 LSH 색인
+
+    Args:
+        threshold: 같은 항목으로 볼 최소 Jaccard 추정치
+        num_perm: 서명 길이 (MinHasher와 같아야 함)
+        bands: LSH 밴드 수 (num_perm / bands = 밴드당 행 수)
+        maxsize: 최대 항목 수 (초과 시 오래 추가된 순으로 제거, None이면 무제한)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        num_perm: int = 64,
+        bands: int = 16,
+        maxsize: Optional[int] = 10_000
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm}) must be divisible by bands({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.maxsize = maxsize
+        self._items: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()   # key → 서명
+        self._buckets: Dict[Tuple[int, bytes], List[Hashable]] = {}        # (밴드, 값) → keys
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def _bands(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(self, key: Hashable, signature: np.ndarray):
+        if key in self._items:
+            self.remove(key)
+        self._items[key] = signature
+        for bucket in self._bands(signature):
+            self._buckets.setdefault(bucket, []).append(key)
+        while self.maxsize is not None and len(self._items) > self.maxsize:
+            self.remove(next(iter(self._items)))
+
+    def remove(self, key: Hashable):
+        signature = self._items.pop(key, None)
+        if signature is None:
+            return
+        for bucket in self._bands(signature):
+            keys = self._buckets.get(bucket)
+            if keys is not None:
+                keys.remove(key)
+                if not keys:
+                    del self._buckets[bucket]
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        return self._items.get(key)
+
+    def candidates(self, signature: np.ndarray) -> List[Tuple[Hashable, float]]:
+        """threshold 이상인 항목 (Jaccard 추정치 내림차순)"""
+        seen = set()
+        matches = []
+        for bucket in self._bands(signature):
+            for key in self._buckets.get(bucket, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                similarity = jaccard(signature, self._items[key])
+                if similarity >= self.threshold:
+                    matches.append((key, similarity))
+        return sorted(matches, key=lambda m: -m[1])
+
+    def nearest(self, signature: np.ndarray) -> Optional[Tuple[Hashable, float]]:
+        """가장 유사한 (key, Jaccard 추정치), 없으면 None"""
+        matches = self.candidates(signature)
+        return matches[0] if matches else None
@@ -0,0 +1,256 @@
+"""
+SQLite L2 Cache
+프로세스 간 공유되는 디스크 캐시 (AsyncTTLCache의 L2 계층)
+
+cron 진입점(1min, 5min_dashboard, 1hour, run_market_scan)은 매번 새 프로세스라
+메모리 캐시가 항상 비어 있습니다. 분석 결과를 SQLite에 저장해 다음 프로세스가
+TTL 안의 결과를 재사용합니다.
+
+- WAL 모드: 여러 프로세스 동시 읽기 + 단일 쓰기
+- 값: pickle (+ 큰 값은 zlib 압축), 결과 dataclass/Enum 그대로 복원
+- 만료: 절대 시각(expires_at) 기준, 조회 시 만료 항목은 miss
+- 용량: 주기적으로 만료 항목 삭제 후 max_bytes 초과분을 오래된 순으로 삭제
+
+Usage:
+    l2 = get_l2_cache()
+    l2.set("fundamental", "005930", result, ttl_seconds=86400)
+    found, value = l2.get("fundamental", "005930")
+"""
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+_COMPRESS_THRESHOLD = 512   # bytes
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_FLAG_RAW = 0
+_FLAG_ZLIB = 1
+
+
+class SQLiteCache:
+    """Namespaced key-value cache with absolute expiry, shared across processes"""
+
+    # cron은 작업 디렉토리가 제각각이라 프로젝트 루트 기준 절대 경로
+    DEFAULT_PATH = _PROJECT_ROOT / "data" / "cache" / "analyzer_cache.sqlite3"
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        maintenance_interval: int = 200
+    ):
+        """
+        Args:
+            path: DB 파일 경로 (기본 <프로젝트 루트>/data/cache/analyzer_cache.sqlite3)
+            max_bytes: 값 총 크기 상한
+            maintenance_interval: 쓰기 N회마다 만료/용량 정리
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.max_bytes = max_bytes
+        self.maintenance_interval = maintenance_interval
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._writes = 0
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # fork된 자식 프로세스는 부모 연결을 공유하지 않고 새로 연다
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                flags INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache (expires_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_stored ON cache (stored_at)")
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _dumps(value: Any) -> Tuple[bytes, int]:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > _COMPRESS_THRESHOLD:
+            packed = zlib.compress(data, 6)
+            if len(packed) < len(data):
+                return packed, _FLAG_ZLIB
+        return data, _FLAG_RAW
+
+    @staticmethod
+    def _loads(data: bytes, flags: int) -> Any:
+        if flags & _FLAG_ZLIB:
+            data = zlib.decompress(data)
+        return pickle.loads(data)
+
+    # ------------------------------------------------------------------
+    # Public API (동기, 호출부에서 asyncio.to_thread 사용)
+    # ------------------------------------------------------------------
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any, float]:
+        """
+        Returns:
+            (found, value, expires_at) - 없거나 만료/복원 실패면 (False, None, 0.0)
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value, flags, expires_at FROM cache WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, key, time.time())
+            ).fetchone()
+        if row is None:
+            return False, None, 0.0
+        try:
+            return True, self._loads(row[0], row[1]), row[2]
+        except Exception as e:
+            # 클래스 구조 변경 등으로 복원 불가 → 삭제 후 miss
+            self.logger.debug(f"Dropping unreadable L2 entry {namespace}/{key}: {e}")
+            self.delete(namespace, key)
+            return False, None, 0.0
+
+    def set(self, namespace: str, key: str, value: Any, ttl_seconds: float):
+        """값 저장 (ttl_seconds 후 만료)"""
+        data, flags = self._dumps(value)
+        now = time.time()
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (namespace, key, data, flags, len(data), now, now + ttl_seconds)
+            )
+            self._writes += 1
+            due = self._writes % self.maintenance_interval == 0
+        if due:
+            self.maintain()
+
+    def set_many(self, namespace: str, values: Dict[str, Any], ttl_seconds: float):
+        """여러 값을 한 트랜잭션으로 저장 (ttl_seconds 후 만료)"""
+        if not values:
+            return
+        now = time.time()
+        rows = []
+        for key, value in values.items():
+            data, flags = self._dumps(value)
+            rows.append((namespace, key, data, flags, len(data), now, now + ttl_seconds))
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._writes += len(rows)
+            due = self._writes % self.maintenance_interval < len(rows)
+        if due:
+            self.maintain()
+
+    def items(self, namespace: str) -> Dict[str, Any]:
+        """네임스페이스의 만료되지 않은 전체 항목 {key: value} (복원 실패 항목은 제외)"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key, value, flags FROM cache WHERE namespace = ? AND expires_at > ?",
+                (namespace, time.time())
+            ).fetchall()
+        values = {}
+        for key, data, flags in rows:
+            try:
+                values[key] = self._loads(data, flags)
+            except Exception as e:
+                self.logger.debug(f"Skipping unreadable L2 entry {namespace}/{key}: {e}")
+        return values
+
+    def delete(self, namespace: str, key: str):
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+
+    def clear(self, namespace: Optional[str] = None):
+        """네임스페이스(없으면 전체) 삭제"""
+        with self._lock:
+            if namespace is None:
+                self._connect().execute("DELETE FROM cache")
+            else:
+                self._connect().execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+
+    def maintain(self) -> int:
+        """만료 항목 삭제 + 용량 초과 시 오래된 항목부터 삭제 (삭제 건수 반환)"""
+        with self._lock:
+            conn = self._connect()
+            removed = conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),)).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+            if total > self.max_bytes:
+                # 상한의 90%까지 줄여 매 쓰기마다 정리가 반복되지 않도록 함
+                excess = total - int(self.max_bytes * 0.9)
+                cutoff = conn.execute("""
+                    SELECT stored_at FROM (
+                        SELECT stored_at, SUM(size) OVER (ORDER BY stored_at) AS cum FROM cache
+                    ) WHERE cum >= ? ORDER BY stored_at LIMIT 1
+                """, (excess,)).fetchone()
+                if cutoff is not None:
+                    removed += conn.execute(
+                        "DELETE FROM cache WHERE stored_at <= ?", (cutoff[0],)
+                    ).rowcount
+        return removed
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) FROM cache GROUP BY namespace"
+            ).fetchall()
+        return {
+            'path': str(self.path),
+            'namespaces': {ns: {'entries': n, 'bytes': size} for ns, n, size in rows},
+            'bytes': sum(size for _, _, size in rows),
+            'max_bytes': self.max_bytes,
+        }
+
+
+# Singleton instance
+_l2_instance: Optional[SQLiteCache] = None
+_l2_failed = False
+
+
+def get_l2_cache() -> Optional[SQLiteCache]:
+    """
+    Get singleton SQLiteCache instance
+
+    AEGIS_L2_CACHE=0 이면 비활성화, AEGIS_L2_CACHE_PATH로 경로 지정.
+    DB를 열 수 없으면 None (메모리 캐시만 사용).
+    """
+    global _l2_instance, _l2_failed
+    if _l2_instance is None and not _l2_failed:
+        if os.getenv("AEGIS_L2_CACHE", "1") == "0":
+            _l2_failed = True
+            return None
+        try:
+            _l2_instance = SQLiteCache(os.getenv("AEGIS_L2_CACHE_PATH") or None)
+        except (sqlite3.Error, OSError) as e:
+            logging.getLogger("SQLiteCache").warning(f"L2 cache disabled: {e}")
+            _l2_failed = True
+    return _l2_instance